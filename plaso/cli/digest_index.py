@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""The digest index of exported content."""
+
+import os
+import sqlite3
+
+
+class DigestIndex(object):
+  """SQLite-based index of the digests of exported content.
+
+  The digest index is stored in the destination directory of an export and
+  is used to skip content that has already been exported by a previous run,
+  for example with a different filter or from another source.
+  """
+
+  _TABLE_SCHEMAS = {
+      'digests': (
+          'CREATE TABLE digests (sha256 TEXT PRIMARY KEY, '
+          'display_name TEXT, path TEXT)'),
+      'paths': (
+          'CREATE TABLE paths (sha256 TEXT, path TEXT, '
+          'PRIMARY KEY (sha256, path))'),
+      'sources': (
+          'CREATE TABLE sources (source TEXT PRIMARY KEY, size INTEGER, '
+          'modification_time TEXT, sha256 TEXT, path TEXT)')}
+
+  def __init__(self):
+    """Initializes a digest index."""
+    super(DigestIndex, self).__init__()
+    self._connection = None
+    self._cursor = None
+
+  def _HasTable(self, table_name):
+    """Determines if a specific table exists.
+
+    Args:
+      table_name (str): name of the table.
+
+    Returns:
+      bool: True if the table exists, False otherwise.
+    """
+    self._cursor.execute(
+        'SELECT name FROM sqlite_master WHERE type = "table" AND name = ?',
+        (table_name, ))
+    return bool(self._cursor.fetchone())
+
+  def AddDigest(self, digest, display_name, path):
+    """Adds the digest of exported content.
+
+    If the digest was already added, its display name and path are replaced,
+    for example when the content is exported again after the previously
+    exported file was removed.
+
+    Args:
+      digest (str): hexadecimal representation of the SHA-256 digest.
+      display_name (str): display name of the source of the content.
+      path (str): path of the exported content relative to the destination
+          directory.
+
+    Raises:
+      IOError: if the digest index is not opened.
+      OSError: if the digest index is not opened.
+    """
+    if not self._connection:
+      raise IOError('Digest index not opened.')
+
+    self._cursor.execute(
+        'INSERT OR REPLACE INTO digests VALUES (?, ?, ?)',
+        (digest, display_name, path))
+
+  def AddPath(self, digest, path):
+    """Adds the path of exported content.
+
+    Args:
+      digest (str): hexadecimal representation of the SHA-256 digest.
+      path (str): path of the content relative to the destination directory.
+
+    Raises:
+      IOError: if the digest index is not opened.
+      OSError: if the digest index is not opened.
+    """
+    if not self._connection:
+      raise IOError('Digest index not opened.')
+
+    self._cursor.execute(
+        'INSERT OR IGNORE INTO paths VALUES (?, ?)', (digest, path))
+
+  def AddSource(self, source, size, modification_time, digest, path):
+    """Adds a source of which the content has been exported.
+
+    Args:
+      source (str): identifier of the source, such as the comparable of
+          the path specification and the name of the data stream.
+      size (int): size of the source or None if not available.
+      modification_time (str): modification date and time of the source
+          or None if not available.
+      digest (str): hexadecimal representation of the SHA-256 digest.
+      path (str): path of the exported content relative to the destination
+          directory.
+
+    Raises:
+      IOError: if the digest index is not opened.
+      OSError: if the digest index is not opened.
+    """
+    if not self._connection:
+      raise IOError('Digest index not opened.')
+
+    self._cursor.execute(
+        'INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?)',
+        (source, size, modification_time, digest, path))
+
+  def Close(self):
+    """Closes the digest index.
+
+    Raises:
+      IOError: if the digest index is not opened.
+      OSError: if the digest index is not opened.
+    """
+    if not self._connection:
+      raise IOError('Digest index not opened.')
+
+    self._connection.commit()
+    self._connection.close()
+
+    self._connection = None
+    self._cursor = None
+
+  def Flush(self):
+    """Writes the changes to the digest index.
+
+    Raises:
+      IOError: if the digest index is not opened.
+      OSError: if the digest index is not opened.
+    """
+    if not self._connection:
+      raise IOError('Digest index not opened.')
+
+    self._connection.commit()
+
+  def GetDigests(self):
+    """Retrieves the digests of exported content.
+
+    Returns:
+      list[tuple[str, str, str]]: digest, display name of the source of
+          the content and path of the exported content relative to
+          the destination directory.
+
+    Raises:
+      IOError: if the digest index is not opened.
+      OSError: if the digest index is not opened.
+    """
+    if not self._connection:
+      raise IOError('Digest index not opened.')
+
+    self._cursor.execute('SELECT sha256, display_name, path FROM digests')
+    return self._cursor.fetchall()
+
+  def GetPaths(self):
+    """Retrieves the paths of exported content.
+
+    Returns:
+      list[tuple[str, str]]: digest and path of the content relative to
+          the destination directory.
+
+    Raises:
+      IOError: if the digest index is not opened.
+      OSError: if the digest index is not opened.
+    """
+    if not self._connection:
+      raise IOError('Digest index not opened.')
+
+    self._cursor.execute('SELECT sha256, path FROM paths ORDER BY rowid')
+    return self._cursor.fetchall()
+
+  def GetSource(self, source, size, modification_time):
+    """Retrieves a source of which the content has already been exported.
+
+    Args:
+      source (str): identifier of the source, such as the comparable of
+          the path specification and the name of the data stream.
+      size (int): size of the source or None if not available.
+      modification_time (str): modification date and time of the source
+          or None if not available.
+
+    Returns:
+      tuple[str, str]: hexadecimal representation of the SHA-256 digest and
+          path of the exported content relative to the destination directory
+          or (None, None) if the source has not been exported or has changed
+          since.
+
+    Raises:
+      IOError: if the digest index is not opened.
+      OSError: if the digest index is not opened.
+    """
+    if not self._connection:
+      raise IOError('Digest index not opened.')
+
+    self._cursor.execute(
+        'SELECT size, modification_time, sha256, path FROM sources '
+        'WHERE source = ?', (source, ))
+    row = self._cursor.fetchone()
+    if not row or row[0] != size or row[1] != modification_time:
+      return None, None
+
+    return row[2], row[3]
+
+  def Open(self, path):
+    """Opens the digest index.
+
+    The digest index is created if it does not exist.
+
+    Args:
+      path (str): path of the digest index.
+
+    Raises:
+      IOError: if the digest index is already opened or cannot be opened.
+      OSError: if the digest index is already opened or cannot be opened.
+    """
+    if self._connection:
+      raise IOError('Digest index already opened.')
+
+    path = os.path.abspath(path)
+
+    # Note that the connection is used by multiple worker threads, which
+    # must not use it at the same time.
+    try:
+      self._connection = sqlite3.connect(path, check_same_thread=False)
+      self._cursor = self._connection.cursor()
+
+      # Changes are written after every exported data stream, hence the
+      # changes are not synchronized to disk on every write.
+      self._cursor.execute('PRAGMA synchronous=OFF')
+
+      for table_name, table_schema in self._TABLE_SCHEMAS.items():
+        if not self._HasTable(table_name):
+          self._cursor.execute(table_schema)
+
+      self._connection.commit()
+
+    except sqlite3.DatabaseError as exception:
+      if self._connection:
+        self._connection.close()
+
+      self._connection = None
+      self._cursor = None
+
+      raise IOError(
+          'Unable to open digest index: {0:s} with error: {1!s}'.format(
+              path, exception))
@@ -53,6 +53,10 @@ class ExtractionTool(
 
   _PRESETS_FILE_NAME = 'presets.yaml'
 
+  # The size from which files are parsed in ranges, by separate tasks, when
+  # processing with multiple processes.
+  _SPLIT_FILE_SIZE = 64 * _BYTES_IN_A_MIB
+
   _SOURCE_TYPES_TO_PREPROCESS = frozenset([
       dfvfs_definitions.SOURCE_TYPE_DIRECTORY,
       dfvfs_definitions.SOURCE_TYPE_STORAGE_MEDIA_DEVICE,
@@ -88,11 +92,13 @@ class ExtractionTool(
     self._single_process_mode = False
     self._status_view_mode = status_view.StatusView.MODE_WINDOW
     self._status_view = status_view.StatusView(self._output_writer, self.NAME)
+    self._storage_compression_format = definitions.COMPRESSION_FORMAT_ZLIB
     self._storage_file_path = None
     self._storage_format = definitions.STORAGE_FORMAT_SQLITE
     self._task_storage_format = definitions.STORAGE_FORMAT_SQLITE
     self._temporary_directory = None
     self._text_prepend = None
+    self._worker_autoscaling = False
     self._worker_memory_limit = None
     self._worker_timeout = None
     self._yara_rules_string = None
@@ -171,6 +177,10 @@ class ExtractionTool(
     configuration.extraction.process_archives = self._process_archives
     configuration.extraction.process_compressed_streams = (
         self._process_compressed_streams)
+
+    if not self._single_process_mode:
+      configuration.extraction.split_file_size = self._SPLIT_FILE_SIZE
+
     configuration.extraction.yara_rules_string = self._yara_rules_string
     configuration.filter_file = self._filter_file
     configuration.log_filename = self._log_file
@@ -408,6 +418,7 @@ class ExtractionTool(
     else:
       extraction_engine = multi_extraction_engine.ExtractionMultiProcessEngine(
           number_of_worker_processes=self._number_of_extraction_workers,
+          worker_autoscaling=self._worker_autoscaling,
           worker_memory_limit=self._worker_memory_limit,
           worker_timeout=self._worker_timeout)
 
@@ -602,7 +613,8 @@ class ExtractionTool(
         text_prepend=self._text_prepend)
 
     storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
-        self._storage_format)
+        self._storage_format,
+        compression_format=self._storage_compression_format)
     if not storage_writer:
       raise errors.BadConfigOption('Unsupported storage format: {0:s}'.format(
           self._storage_format))
@@ -27,6 +27,7 @@ class ElasticSearchOutputArgumentsHelper(interface.ArgumentsHelper):
 
   _DEFAULT_FLUSH_INTERVAL = 1000
   _DEFAULT_INDEX_NAME = uuid4().hex
+  _DEFAULT_NUMBER_OF_BULK_REQUESTS = 2
   _DEFAULT_PORT = 9200
   _DEFAULT_SERVER = '127.0.0.1'
 
@@ -51,6 +52,13 @@ class ElasticSearchOutputArgumentsHelper(interface.ArgumentsHelper):
         action='store', default=cls._DEFAULT_FLUSH_INTERVAL, metavar='INTERVAL',
         help='Events to queue up before bulk insert to ElasticSearch.')
 
+    argument_group.add_argument(
+        '--elastic-bulk-requests', '--elastic_bulk_requests',
+        dest='elastic_bulk_requests', type=int, action='store',
+        default=cls._DEFAULT_NUMBER_OF_BULK_REQUESTS, metavar='NUMBER', help=(
+            'Number of bulk inserts to ElasticSearch that can be in flight '
+            'at the same time.'))
+
     default_fields = ', '.join(cls._DEFAULT_FIELDS)
     argument_group.add_argument(
         '--additional_fields', '--additional-fields', dest='additional_fields',
@@ -124,6 +132,13 @@ class ElasticSearchOutputArgumentsHelper(interface.ArgumentsHelper):
         options, 'index_name', default_value=cls._DEFAULT_INDEX_NAME)
     flush_interval = cls._ParseNumericOption(
         options, 'flush_interval', default_value=cls._DEFAULT_FLUSH_INTERVAL)
+    number_of_bulk_requests = cls._ParseNumericOption(
+        options, 'elastic_bulk_requests',
+        default_value=cls._DEFAULT_NUMBER_OF_BULK_REQUESTS)
+
+    if number_of_bulk_requests < 1:
+      raise errors.BadConfigOption(
+          'Invalid number of bulk requests value cannot be less than 1.')
 
     fields = ','.join(cls._DEFAULT_FIELDS)
     additional_fields = cls._ParseStringOption(options, 'additional_fields')
@@ -161,6 +176,7 @@ class ElasticSearchOutputArgumentsHelper(interface.ArgumentsHelper):
 
     output_module.SetIndexName(index_name)
     output_module.SetFlushInterval(flush_interval)
+    output_module.SetNumberOfBulkRequests(number_of_bulk_requests)
     output_module.SetFields([
         field_name.strip() for field_name in fields.split(',')])
 
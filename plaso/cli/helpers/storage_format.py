@@ -25,9 +25,20 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
       argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
           argparse group.
     """
+    compression_formats = sorted(definitions.COMPRESSION_FORMATS)
     session_storage_formats = sorted(definitions.SESSION_STORAGE_FORMATS)
     task_storage_formats = sorted(definitions.TASK_STORAGE_FORMATS)
 
+    argument_group.add_argument(
+        '--storage_compression', '--storage-compression', action='store',
+        choices=compression_formats, dest='storage_compression_format',
+        type=str, metavar='FORMAT',
+        default=definitions.COMPRESSION_FORMAT_ZLIB, help=(
+            'Compression format of the storage file, the default is: {0:s}. '
+            'Supported options: {1:s}'.format(
+                definitions.COMPRESSION_FORMAT_ZLIB,
+                ', '.join(compression_formats))))
+
     argument_group.add_argument(
         '--storage_format', '--storage-format', action='store',
         choices=session_storage_formats, dest='storage_format', type=str,
@@ -57,8 +68,8 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
 
     Raises:
       BadConfigObject: when the configuration object is of the wrong type.
-      BadConfigOption: if the storage format or task storage is not defined
-          or supported.
+      BadConfigOption: if the storage format, storage compression format or
+          task storage is not defined or supported.
     """
     if not isinstance(configuration_object, tools.CLITool):
       raise errors.BadConfigObject(
@@ -74,6 +85,18 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
 
     setattr(configuration_object, '_storage_format', storage_format)
 
+    compression_format = cls._ParseStringOption(
+        options, 'storage_compression_format',
+        default_value=definitions.COMPRESSION_FORMAT_ZLIB)
+    if compression_format not in definitions.COMPRESSION_FORMATS:
+      raise errors.BadConfigOption(
+          'Unsupported storage compression format: {0:s}'.format(
+              compression_format))
+
+    setattr(
+        configuration_object, '_storage_compression_format',
+        compression_format)
+
     task_storage_format = cls._ParseStringOption(options, 'task_storage_format')
     if not task_storage_format:
       raise errors.BadConfigOption('Unable to determine task storage format.')
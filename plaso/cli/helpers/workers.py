@@ -24,6 +24,14 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
       argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
           argparse group.
     """
+    argument_group.add_argument(
+        '--worker_autoscaling', '--worker-autoscaling',
+        dest='worker_autoscaling', action='store_true', default=False, help=(
+            'Add or retire worker processes during processing based on '
+            'the number of pending tasks, the number of tasks pending merge '
+            'and the available memory. The number of worker processes '
+            '(--workers) is used as the initial and minimum number.'))
+
     argument_group.add_argument(
         '--worker_memory_limit', '--worker-memory-limit',
         dest='worker_memory_limit', action='store', type=int,
@@ -71,6 +79,8 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
       raise errors.BadConfigOption(
           'Invalid number of extraction workers value cannot be less than 0.')
 
+    worker_autoscaling = getattr(options, 'worker_autoscaling', False)
+
     worker_memory_limit = cls._ParseNumericOption(
         options, 'worker_memory_limit')
 
@@ -87,6 +97,7 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
     setattr(
         configuration_object, '_number_of_extraction_workers',
         number_of_extraction_workers)
+    setattr(configuration_object, '_worker_autoscaling', worker_autoscaling)
     setattr(configuration_object, '_worker_memory_limit', worker_memory_limit)
     setattr(configuration_object, '_worker_timeout', worker_timeout)
 
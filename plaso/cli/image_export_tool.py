@@ -7,7 +7,10 @@ import collections
 import io
 import json
 import os
+import queue
+import tempfile
 import textwrap
+import threading
 
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.lib import errors as dfvfs_errors
@@ -15,6 +18,7 @@ from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
 
 from plaso.analyzers.hashers import manager as hashers_manager
+from plaso.cli import digest_index
 from plaso.cli import logger
 from plaso.cli import storage_media_tool
 from plaso.cli.helpers import manager as helpers_manager
@@ -56,9 +60,15 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
       os.path.sep, '!', '$', '%', '&', '*', '+', ':', ';', '<', '>',
       '?', '@', '|', '~', '\x7f'])
 
+  _DIGEST_INDEX_FILENAME = 'digests.db'
+
   _HASHES_FILENAME = 'hashes.json'
 
-  _READ_BUFFER_SIZE = 4096
+  # Maximum number of path specifications, per worker, that are queued for
+  # the worker threads.
+  _MAXIMUM_QUEUED_PATH_SPECS_PER_WORKER = 16
+
+  _TEMPORARY_FILE_PREFIX = '.image_export-'
 
   # TODO: remove this redirect.
   _SOURCE_OPTION = 'image'
@@ -87,10 +97,13 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     self._artifacts_registry = None
     self._custom_artifacts_path = None
     self._destination_path = None
+    self._digest_index = None
     self._digests = {}
+    self._digests_lock = threading.Lock()
     self._filter_collection = file_entry_filters.FileEntryFilterCollection()
     self._filter_file = None
     self._no_hashes = False
+    self._number_of_workers = 1
     self._path_spec_extractor = extractors.PathSpecExtractor()
     self._process_memory_limit = None
     self._paths_by_hash = collections.defaultdict(list)
@@ -100,33 +113,6 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     self.has_filters = False
     self.list_signature_identifiers = False
 
-  def _CalculateDigestHash(self, file_entry, data_stream_name):
-    """Calculates a SHA-256 digest of the contents of the file entry.
-
-    Args:
-      file_entry (dfvfs.FileEntry): file entry whose content will be hashed.
-      data_stream_name (str): name of the data stream whose content is to be
-          hashed.
-
-    Returns:
-      str: hexadecimal representation of the SHA-256 hash or None if the digest
-          cannot be determined.
-    """
-    file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
-    if not file_object:
-      return None
-
-    file_object.seek(0, os.SEEK_SET)
-
-    hasher_object = hashers_manager.HashersManager.GetHasher('sha256')
-
-    data = file_object.read(self._READ_BUFFER_SIZE)
-    while data:
-      hasher_object.Update(data)
-      data = file_object.read(self._READ_BUFFER_SIZE)
-
-    return hasher_object.GetStringDigest()
-
   def _CreateSanitizedDestination(
       self, source_file_entry, source_path_spec, source_data_stream_name,
       destination_path):
@@ -198,20 +184,6 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
         file_entry.path_spec)
 
-    try:
-      digest = self._CalculateDigestHash(file_entry, data_stream_name)
-    except (IOError, dfvfs_errors.BackEndError) as exception:
-      logger.error((
-          '[skipping] unable to read content of file entry: {0:s} '
-          'with error: {1!s}').format(display_name, exception))
-      return
-
-    if not digest:
-      logger.error(
-          '[skipping] unable to read content of file entry: {0:s}'.format(
-              display_name))
-      return
-
     target_directory, target_filename = self._CreateSanitizedDestination(
         file_entry, file_entry.path_spec, data_stream_name, destination_path)
 
@@ -223,7 +195,95 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     if target_path.startswith(destination_path):
       path = target_path[len(destination_path):]
 
-    self._paths_by_hash[digest].append(path)
+    source, source_size, source_modification_time = (
+        self._GetDigestIndexSource(file_entry, data_stream_name))
+
+    if self._digest_index:
+      with self._digests_lock:
+        digest, exported_path = self._digest_index.GetSource(
+            source, source_size, source_modification_time)
+
+      # The source is only skipped if the content exported by a previous run
+      # still exists.
+      if exported_path and os.path.exists(
+          os.path.join(destination_path, exported_path)):
+        logger.debug((
+            '[skipping] file entry: {0:s} with digest: {1:s} was exported '
+            'by a previous run.').format(display_name, digest))
+        return
+
+    # The content is written to a temporary file in the destination directory
+    # while the digest is calculated, so that the data stream is read only
+    # once. The temporary file is renamed to the target path or discarded
+    # if the content is a duplicate.
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        dir=destination_path, prefix=self._TEMPORARY_FILE_PREFIX)
+    os.close(file_descriptor)
+
+    try:
+      try:
+        digest = self._WriteFileEntry(
+            file_entry, data_stream_name, temporary_path)
+      except (IOError, dfvfs_errors.BackEndError) as exception:
+        logger.error((
+            '[skipping] unable to export contents of file entry: {0:s} '
+            'with error: {1!s}').format(display_name, exception))
+        return
+
+      if not digest:
+        logger.error(
+            '[skipping] unable to read content of file entry: {0:s}'.format(
+                display_name))
+        return
+
+      with self._digests_lock:
+        is_exported = self._ExportTemporaryFile(
+            temporary_path, target_path, path, display_name, digest,
+            skip_duplicates=skip_duplicates)
+
+        if self._digest_index:
+          # A source is only recorded when its content was written to
+          # the target path, so that a skipped duplicate or a target that
+          # already existed is exported again by a later run if needed.
+          if is_exported:
+            self._digest_index.AddSource(
+                source, source_size, source_modification_time, digest, path)
+          self._digest_index.Flush()
+
+    finally:
+      if os.path.exists(temporary_path):
+        try:
+          os.remove(temporary_path)
+        except (IOError, OSError):
+          pass
+
+  def _ExportTemporaryFile(
+      self, temporary_path, target_path, path, display_name, digest,
+      skip_duplicates=True):
+    """Moves a temporary file with exported content to its target path.
+
+    Note that the caller must hold the digests lock.
+
+    Args:
+      temporary_path (str): path of the temporary file.
+      target_path (str): path of the target file.
+      path (str): path of the target file relative to the destination
+          directory.
+      display_name (str): display name of the source of the content.
+      digest (str): hexadecimal representation of the SHA-256 digest of
+          the content.
+      skip_duplicates (Optional[bool]): True if files with duplicate content
+          should be skipped.
+
+    Returns:
+      bool: True if the content was written to the target path.
+    """
+    paths = self._paths_by_hash[digest]
+    if path not in paths:
+      paths.append(path)
+
+      if self._digest_index:
+        self._digest_index.AddPath(digest, path)
 
     if skip_duplicates:
       duplicate_display_name = self._digests.get(digest, None)
@@ -232,10 +292,9 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
             '[skipping] file entry: {0:s} is a duplicate of: {1:s} with '
             'digest: {2:s}').format(
                 display_name, duplicate_display_name, digest))
-        return
-
-      self._digests[digest] = display_name
+        return False
 
+    target_directory = os.path.dirname(target_path)
     if not os.path.isdir(target_directory):
       os.makedirs(target_directory)
 
@@ -244,19 +303,20 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
           '[skipping] unable to export contents of file entry: {0:s} '
           'because exported file: {1:s} already exists.').format(
               display_name, target_path))
-      return
+      return False
 
-    try:
-      self._WriteFileEntry(file_entry, data_stream_name, target_path)
-    except (IOError, dfvfs_errors.BackEndError) as exception:
-      logger.error((
-          '[skipping] unable to export contents of file entry: {0:s} '
-          'with error: {1!s}').format(display_name, exception))
+    os.rename(temporary_path, target_path)
 
-      try:
-        os.remove(target_path)
-      except (IOError, OSError):
-        pass
+    # The digest is only recorded once the content was written, so that
+    # later content with the same digest is not skipped as a duplicate of
+    # content that was not exported.
+    if digest not in self._digests:
+      self._digests[digest] = display_name
+
+      if self._digest_index:
+        self._digest_index.AddDigest(digest, display_name, path)
+
+    return True
 
   def _ExtractFileEntry(
       self, file_entry, destination_path, skip_duplicates=True):
@@ -340,30 +400,192 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
         source_path_specs, find_specs=included_find_specs,
         resolver_context=self._resolver_context)
 
-    for path_spec in path_spec_generator:
-      file_entry = path_spec_resolver.Resolver.OpenFileEntry(
-          path_spec, resolver_context=self._resolver_context)
-
-      if not file_entry:
-        path_spec_string = self._GetPathSpecificationString(path_spec)
-        logger.warning(
-            'Unable to open file entry for path specfication: {0:s}'.format(
-                path_spec_string))
-        continue
-
-      skip_file_entry = False
-      for find_spec in excluded_find_specs or []:
-        skip_file_entry = find_spec.CompareLocation(file_entry)
-        if skip_file_entry:
+    if self._number_of_workers <= 1:
+      for path_spec in path_spec_generator:
+        if self._abort:
           break
 
+        self._ExtractPathSpec(
+            path_spec, destination_path, excluded_find_specs,
+            self._resolver_context, skip_duplicates=skip_duplicates)
+
+    else:
+      self._ExtractWithWorkers(
+          path_spec_generator, destination_path, excluded_find_specs,
+          skip_duplicates=skip_duplicates)
+
+  def _ExtractPathSpec(
+      self, path_spec, destination_path, excluded_find_specs,
+      resolver_context, skip_duplicates=True):
+    """Extracts the file entry defined by a path specification.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the file entry.
+      destination_path (str): path where the extracted files should be stored.
+      excluded_find_specs (list[dfvfs.FindSpec]): find specifications of file
+          entries that should not be extracted or None if not set.
+      resolver_context (dfvfs.Context): resolver context.
+      skip_duplicates (Optional[bool]): True if files with duplicate content
+          should be skipped.
+    """
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+        path_spec, resolver_context=resolver_context)
+
+    if not file_entry:
+      path_spec_string = self._GetPathSpecificationString(path_spec)
+      logger.warning(
+          'Unable to open file entry for path specfication: {0:s}'.format(
+              path_spec_string))
+      return
+
+    skip_file_entry = False
+    for find_spec in excluded_find_specs or []:
+      skip_file_entry = find_spec.CompareLocation(file_entry)
       if skip_file_entry:
-        logger.info('Skipped: {0:s} because of exclusion filter.'.format(
-            file_entry.path_spec.location))
-        continue
+        break
 
-      self._ExtractFileEntry(
-          file_entry, destination_path, skip_duplicates=skip_duplicates)
+    if skip_file_entry:
+      logger.info('Skipped: {0:s} because of exclusion filter.'.format(
+          file_entry.path_spec.location))
+      return
+
+    self._ExtractFileEntry(
+        file_entry, destination_path, skip_duplicates=skip_duplicates)
+
+  def _ExtractPathSpecsWorker(
+      self, path_spec_queue, destination_path, excluded_find_specs,
+      skip_duplicates=True):
+    """Extracts the file entries of queued path specifications.
+
+    This method is run by the worker threads. Every worker thread uses its
+    own resolver context, since a resolver context cannot be shared between
+    threads. The worker stops when it dequeues None.
+
+    Args:
+      path_spec_queue (queue.Queue): queue of path specifications.
+      destination_path (str): path where the extracted files should be stored.
+      excluded_find_specs (list[dfvfs.FindSpec]): find specifications of file
+          entries that should not be extracted or None if not set.
+      skip_duplicates (Optional[bool]): True if files with duplicate content
+          should be skipped.
+    """
+    resolver_context = context.Context()
+
+    path_spec = path_spec_queue.get()
+    while path_spec:
+      if not self._abort:
+        try:
+          self._ExtractPathSpec(
+              path_spec, destination_path, excluded_find_specs,
+              resolver_context, skip_duplicates=skip_duplicates)
+
+        except Exception as exception:  # pylint: disable=broad-except
+          path_spec_string = self._GetPathSpecificationString(path_spec)
+          logger.exception((
+              '[skipping] unable to export path specification: {0:s} with '
+              'error: {1!s}').format(path_spec_string, exception))
+
+      path_spec = path_spec_queue.get()
+
+  def _ExtractWithWorkers(
+      self, path_spec_generator, destination_path, excluded_find_specs,
+      skip_duplicates=True):
+    """Extracts file entries with multiple worker threads.
+
+    The path specifications are generated in the calling thread and queued
+    for the worker threads, which read and write the file entries.
+
+    Args:
+      path_spec_generator (generator[dfvfs.PathSpec]): path specification
+          generator.
+      destination_path (str): path where the extracted files should be stored.
+      excluded_find_specs (list[dfvfs.FindSpec]): find specifications of file
+          entries that should not be extracted or None if not set.
+      skip_duplicates (Optional[bool]): True if files with duplicate content
+          should be skipped.
+    """
+    path_spec_queue = queue.Queue(maxsize=(
+        self._number_of_workers * self._MAXIMUM_QUEUED_PATH_SPECS_PER_WORKER))
+
+    worker_threads = []
+    for _ in range(self._number_of_workers):
+      worker_thread = threading.Thread(
+          target=self._ExtractPathSpecsWorker,
+          args=(path_spec_queue, destination_path, excluded_find_specs),
+          kwargs={'skip_duplicates': skip_duplicates})
+      worker_thread.daemon = True
+      worker_thread.start()
+      worker_threads.append(worker_thread)
+
+    try:
+      for path_spec in path_spec_generator:
+        if self._abort:
+          break
+
+        path_spec_queue.put(path_spec)
+
+    finally:
+      for _ in worker_threads:
+        path_spec_queue.put(None)
+
+      for worker_thread in worker_threads:
+        worker_thread.join()
+
+  def _GetDigestIndexSource(self, file_entry, data_stream_name):
+    """Retrieves the values that identify a data stream in the digest index.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry containing the data stream.
+      data_stream_name (str): name of the data stream.
+
+    Returns:
+      tuple[str, int, str]: identifier, size and modification date and time
+          of the data stream, where the size and modification date and time
+          are None if not available.
+    """
+    source = '{0:s}data stream: {1:s}\n'.format(
+        file_entry.path_spec.comparable, data_stream_name)
+
+    size = None
+    if not data_stream_name:
+      size = file_entry.size
+
+    modification_time = None
+    if file_entry.modification_time:
+      modification_time = (
+          file_entry.modification_time.CopyToDateTimeStringISO8601())
+
+    return source, size, modification_time
+
+  def _OpenDigestIndex(self, destination_path):
+    """Opens the digest index in the destination directory.
+
+    The digests and paths of content exported by previous runs are read
+    from the digest index. Content of which the exported file no longer
+    exists is not considered exported.
+
+    Args:
+      destination_path (str): path where the extracted files are stored.
+    """
+    path = os.path.join(destination_path, self._DIGEST_INDEX_FILENAME)
+
+    digest_index_object = digest_index.DigestIndex()
+    try:
+      digest_index_object.Open(path)
+    except IOError as exception:
+      logger.warning((
+          'Unable to open digest index: {0:s} with error: {1!s}, continuing '
+          'without.').format(path, exception))
+      return
+
+    for digest, display_name, path in digest_index_object.GetDigests():
+      if path and os.path.exists(os.path.join(destination_path, path)):
+        self._digests[digest] = display_name
+
+    for digest, path in digest_index_object.GetPaths():
+      self._paths_by_hash[digest].append(path)
+
+    self._digest_index = digest_index_object
 
   def _ParseExtensionsString(self, extensions_string):
     """Parses the extensions string.
@@ -540,6 +762,7 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
   def _WriteFileEntry(self, file_entry, data_stream_name, destination_file):
     """Writes the contents of the source file entry to a destination file.
 
+    The SHA-256 digest of the contents is calculated while it is written.
     Note that this function will overwrite an existing file.
 
     Args:
@@ -547,20 +770,29 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
       data_stream_name (str): name of the data stream whose content is to be
           written.
       destination_file (str): path of the destination file.
+
+    Returns:
+      str: hexadecimal representation of the SHA-256 hash of the contents or
+          None if the contents cannot be read.
     """
     source_file_object = file_entry.GetFileObject(
         data_stream_name=data_stream_name)
     if not source_file_object:
-      return
+      return None
+
+    hasher_object = hashers_manager.HashersManager.GetHasher('sha256')
 
     with open(destination_file, 'wb') as destination_file_object:
       source_file_object.seek(0, os.SEEK_SET)
 
       data = source_file_object.read(self._COPY_BUFFER_SIZE)
       while data:
+        hasher_object.Update(data)
         destination_file_object.write(data)
         data = source_file_object.read(self._COPY_BUFFER_SIZE)
 
+    return hasher_object.GetStringDigest()
+
   def AddFilterOptions(self, argument_group):
     """Adds the filter options to the argument group.
 
@@ -673,6 +905,12 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
         default=False, help=(
             'Do not generate the {0:s} file'.format(self._HASHES_FILENAME)))
 
+    argument_parser.add_argument(
+        '--workers', dest='workers', action='store', type=int, default=1,
+        metavar='NUMBER', help=(
+            'Number of worker threads that export file entries concurrently. '
+            'The default is 1.'))
+
     argument_parser.add_argument(
         self._SOURCE_OPTION, nargs='?', action='store', metavar='IMAGE',
         default=None, type=str, help=(
@@ -778,6 +1016,13 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
     self._no_hashes = getattr(options, 'no_hashes', False)
 
+    self._number_of_workers = getattr(options, 'workers', 1)
+    if self._number_of_workers is None:
+      self._number_of_workers = 1
+    elif self._number_of_workers < 1:
+      raise errors.BadConfigOption(
+          'Invalid number of workers value cannot be less than 1.')
+
     self._EnforceProcessMemoryLimit(self._process_memory_limit)
 
   def PrintFilterCollection(self):
@@ -799,11 +1044,19 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     if not os.path.isdir(self._destination_path):
       os.makedirs(self._destination_path)
 
-    self._Extract(
-        self._source_path_specs, self._destination_path,
-        self._output_writer, self._artifact_filters, self._filter_file,
-        self._artifact_definitions_path, self._custom_artifacts_path,
-        skip_duplicates=self._skip_duplicates)
+    self._OpenDigestIndex(self._destination_path)
+
+    try:
+      self._Extract(
+          self._source_path_specs, self._destination_path,
+          self._output_writer, self._artifact_filters, self._filter_file,
+          self._artifact_definitions_path, self._custom_artifacts_path,
+          skip_duplicates=self._skip_duplicates)
+
+    finally:
+      if self._digest_index:
+        self._digest_index.Close()
+        self._digest_index = None
 
     json_data = []
 
@@ -14,8 +14,26 @@ class EventSource(interface.AttributeContainer):
 
   Attributes:
     data_type (str): attribute container type indicator.
+    file_entropy (str): byte entropy value of the data stream of the file entry
+        to parse a range of.
     file_entry_type (str): dfVFS file entry type.
+    file_size (int): size of the data of the file entry in bytes, used to
+        prioritize the processing of larger files, or None if not available.
+    md5_hash (str): MD5 digest hash of the data stream of the file entry to
+        parse a range of.
+    parse_range_end (int): end of the range of the file entry to parse, where
+        the unit of the range is defined by the parser.
+    parse_range_start (int): start of the range of the file entry to parse,
+        where the unit of the range is defined by the parser.
+    parser_name (str): name of the parser to parse the range of the file entry
+        with or None if the file entry should be parsed as a whole.
     path_spec (dfvfs.PathSpec): path specification.
+    sha1_hash (str): SHA-1 digest hash of the data stream of the file entry to
+        parse a range of.
+    sha256_hash (str): SHA-256 digest hash of the data stream of the file entry
+        to parse a range of.
+    yara_match (list[str]): names of the Yara rules that matched the data
+        stream of the file entry to parse a range of.
   """
   CONTAINER_TYPE = 'event_source'
   DATA_TYPE = None
@@ -28,8 +46,17 @@ class EventSource(interface.AttributeContainer):
     """
     super(EventSource, self).__init__()
     self.data_type = self.DATA_TYPE
+    self.file_entropy = None
     self.file_entry_type = None
+    self.file_size = None
+    self.md5_hash = None
+    self.parse_range_end = None
+    self.parse_range_start = None
+    self.parser_name = None
     self.path_spec = path_spec
+    self.sha1_hash = None
+    self.sha256_hash = None
+    self.yara_match = None
 
   # This method is necessary for heap sort.
   def __lt__(self, other):
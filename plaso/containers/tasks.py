@@ -19,6 +19,8 @@ class Task(interface.AttributeContainer):
     aborted (bool): True if the session was aborted.
     completion_time (int): time that the task was completed. Contains the
         number of micro seconds since January 1, 1970, 00:00:00 UTC.
+    file_entropy (str): byte entropy value of the data stream of the file entry
+        to parse a range of.
     file_entry_type (str): dfVFS type of the file entry the path specification
         is referencing.
     has_retry (bool): True if the task was previously abandoned and a retry
@@ -26,14 +28,28 @@ class Task(interface.AttributeContainer):
     identifier (str): unique identifier of the task.
     last_processing_time (int): the last time the task was marked as being
         processed as number of milliseconds since January 1, 1970, 00:00:00 UTC.
+    md5_hash (str): MD5 digest hash of the data stream of the file entry to
+        parse a range of.
     merge_priority (int): priority used for the task storage file merge, where
         a lower value indicates a higher priority to merge.
+    parse_range_end (int): end of the range of the file entry to parse, where
+        the unit of the range is defined by the parser.
+    parse_range_start (int): start of the range of the file entry to parse,
+        where the unit of the range is defined by the parser.
+    parser_name (str): name of the parser to parse the range of the file entry
+        with or None if the file entry should be parsed as a whole.
     path_spec (dfvfs.PathSpec): path specification.
     session_identifier (str): the identifier of the session the task is part of.
+    sha1_hash (str): SHA-1 digest hash of the data stream of the file entry to
+        parse a range of.
+    sha256_hash (str): SHA-256 digest hash of the data stream of the file entry
+        to parse a range of.
     start_time (int): time that the task was started. Contains the number
         of micro seconds since January 1, 1970, 00:00:00 UTC.
     storage_file_size (int): size of the storage file in bytes.
     storage_format (str): the format the task results are to be stored in.
+    yara_match (list[str]): names of the Yara rules that matched the data
+        stream of the file entry to parse a range of.
   """
   CONTAINER_TYPE = 'task'
 
@@ -47,16 +63,24 @@ class Task(interface.AttributeContainer):
     super(Task, self).__init__()
     self.aborted = False
     self.completion_time = None
+    self.file_entropy = None
     self.file_entry_type = None
     self.has_retry = False
     self.identifier = '{0:s}'.format(uuid.uuid4().hex)
     self.last_processing_time = None
+    self.md5_hash = None
     self.merge_priority = None
+    self.parse_range_end = None
+    self.parse_range_start = None
+    self.parser_name = None
     self.path_spec = None
     self.session_identifier = session_identifier
+    self.sha1_hash = None
+    self.sha256_hash = None
     self.start_time = int(time.time() * definitions.MICROSECONDS_PER_SECOND)
     self.storage_file_size = None
     self.storage_format = None
+    self.yara_match = None
 
   # This method is necessary for heap sort.
   def __lt__(self, other):
@@ -80,11 +104,19 @@ class Task(interface.AttributeContainer):
       Task: a task to retry a previously abandoned task.
     """
     retry_task = Task(session_identifier=self.session_identifier)
+    retry_task.file_entropy = self.file_entropy
     retry_task.file_entry_type = self.file_entry_type
+    retry_task.md5_hash = self.md5_hash
     retry_task.merge_priority = self.merge_priority
+    retry_task.parse_range_end = self.parse_range_end
+    retry_task.parse_range_start = self.parse_range_start
+    retry_task.parser_name = self.parser_name
     retry_task.path_spec = self.path_spec
+    retry_task.sha1_hash = self.sha1_hash
+    retry_task.sha256_hash = self.sha256_hash
     retry_task.storage_file_size = self.storage_file_size
     retry_task.storage_format = self.storage_format
+    retry_task.yara_match = self.yara_match
 
     self.has_retry = True
 
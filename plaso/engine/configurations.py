@@ -60,6 +60,9 @@ class ExtractionConfiguration(interface.AttributeContainer):
         scanned for file entries.
     process_compressed_streams (bool): True if file content in
         compressed streams should be processed.
+    split_file_size (int): size in bytes from which files are parsed in
+        ranges, by the parsers that support it, where each range is parsed
+        by a separate task, or None to parse files in their entirety.
     yara_rules_string (str): Yara rule definitions.
   """
   CONTAINER_TYPE = 'extraction_configuration'
@@ -71,6 +74,7 @@ class ExtractionConfiguration(interface.AttributeContainer):
     self.hasher_names_string = None
     self.process_archives = False
     self.process_compressed_streams = True
+    self.split_file_size = None
     self.yara_rules_string = None
 
 
@@ -14,6 +14,7 @@ from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.resolver import resolver as path_spec_resolver
 
+from plaso.containers import event_sources
 from plaso.engine import logger
 from plaso.lib import errors
 from plaso.parsers import interface as parsers_interface
@@ -26,6 +27,10 @@ class EventExtractor(object):
   An event extractor extracts events from event sources.
   """
 
+  # The maximum number of bytes of the head of a file that is read to
+  # determine which parsers can parse the file.
+  _FILE_HEAD_SIZE = 64 * 1024
+
   _PARSE_RESULT_FAILURE = 1
   _PARSE_RESULT_SUCCESS = 2
   _PARSE_RESULT_UNSUPPORTED = 3
@@ -52,6 +57,7 @@ class EventExtractor(object):
     self._non_sigscan_parser_names = None
     self._parsers = None
     self._parsers_profiler = None
+    self._split_file_size = None
     self._usnjrnl_parser = None
 
     self._InitializeParserObjects(
@@ -73,6 +79,74 @@ class EventExtractor(object):
 
     return False
 
+  def _GetFileHeadMatchParserNames(
+      self, parser_mediator, parser_names, file_entry, file_object):
+    """Determines which parsers can possibly parse a file based on its head.
+
+    The head of the file is read once and shared by the parsers, so that
+    parsers that cannot parse the file are ruled out without each of them
+    reading the file.
+
+    Args:
+      parser_mediator (ParserMediator): parser mediator.
+      parser_names (list[str]): names of parsers.
+      file_entry (dfvfs.FileEntry): file entry.
+      file_object (file): file-like object to parse.
+
+    Returns:
+      list[str]: names of the parsers that can possibly parse the file.
+    """
+    try:
+      file_head = parsers_interface.FileHead(file_object, self._FILE_HEAD_SIZE)
+
+    except (IOError, dfvfs_errors.BackEndError) as exception:
+      display_name = parser_mediator.GetDisplayName(file_entry)
+      logger.warning(
+          'unable to read head of file: {0:s} with error: {1!s}'.format(
+              display_name, exception))
+      return parser_names
+
+    file_head_match_parser_names = []
+    for parser_name in parser_names:
+      parser = self._parsers.get(parser_name, None)
+      if (isinstance(parser, parsers_interface.FileObjectParser) and
+          not parser.CheckFileHead(parser_mediator, file_head)):
+        continue
+
+      file_head_match_parser_names.append(parser_name)
+
+    return file_head_match_parser_names
+
+  def _GetParseRanges(self, parser_mediator, parser, file_entry, file_object):
+    """Retrieves the ranges in which a parser can parse a file entry.
+
+    Args:
+      parser_mediator (ParserMediator): parser mediator.
+      parser (BaseParser): parser.
+      file_entry (dfvfs.FileEntry): file entry.
+      file_object (file): file-like object to parse.
+
+    Returns:
+      list[tuple[int, int]]: start and end of the ranges, as defined by
+          the parser, or None if the file entry should not be parsed in
+          ranges.
+    """
+    if (not self._split_file_size or not file_object or
+        not isinstance(parser, parsers_interface.FileObjectParser)):
+      return None
+
+    try:
+      return parser.GetParseRanges(
+          parser_mediator, file_object, self._split_file_size)
+
+    except (IOError, dfvfs_errors.BackEndError) as exception:
+      display_name = parser_mediator.GetDisplayName(file_entry)
+      logger.warning((
+          '{0:s} unable to determine parse ranges of file: {1:s} with error: '
+          '{2!s}').format(parser.NAME, display_name, exception))
+
+    return None
+
   def _GetSignatureMatchParserNames(self, file_object):
     """Determines if a file-like object matches one of the known signatures.
 
@@ -215,13 +289,17 @@ class EventExtractor(object):
     return result
 
   def _ParseFileEntryWithParsers(
-      self, parser_mediator, parser_names, file_entry, file_object=None):
+      self, parser_mediator, parser_names, file_entry, data_stream_name=None,
+      file_object=None):
     """Parses a file entry with a specific parsers.
 
     Args:
       parser_mediator (ParserMediator): parser mediator.
       parser_names (list[str]): names of parsers.
       file_entry (dfvfs.FileEntry): file entry.
+      data_stream_name (Optional[str]): name of the data stream of which
+          file_object is the content. If not set the file entry will not be
+          split into parse ranges.
       file_object (Optional[file]): file-like object to parse.
           If not set the parser will use the parser mediator to open
           the file entry's default data stream as a file-like object.
@@ -252,8 +330,29 @@ class EventExtractor(object):
           '[ParseFileEntryWithParsers] parsing file: {0:s} with parser: '
           '{1:s}').format(display_name, parser_name))
 
-      parse_result = self._ParseFileEntryWithParser(
-          parser_mediator, parser, file_entry, file_object=file_object)
+      parse_ranges = None
+      if data_stream_name is not None:
+        parse_ranges = self._GetParseRanges(
+            parser_mediator, parser, file_entry, file_object)
+
+      if not parse_ranges:
+        parse_result = self._ParseFileEntryWithParser(
+            parser_mediator, parser, file_entry, file_object=file_object)
+
+      else:
+        # Only the first range is parsed here, the remaining ranges are
+        # parsed separately, such as by other worker processes.
+        parser_mediator.SetParseRange(parse_ranges[0])
+        try:
+          parse_result = self._ParseFileEntryWithParser(
+              parser_mediator, parser, file_entry, file_object=file_object)
+        finally:
+          parser_mediator.SetParseRange(None)
+
+        if parse_result == self._PARSE_RESULT_SUCCESS:
+          self._ProduceParseRangeEventSources(
+              parser_mediator, parser, file_entry, data_stream_name,
+              parse_ranges[1:])
 
       if parse_result == self._PARSE_RESULT_FAILURE:
         return self._PARSE_RESULT_FAILURE
@@ -263,6 +362,44 @@ class EventExtractor(object):
 
     return parse_results
 
+  def _ProduceParseRangeEventSources(
+      self, parser_mediator, parser, file_entry, data_stream_name,
+      parse_ranges):
+    """Produces event sources for ranges of a file entry to parse.
+
+    Args:
+      parser_mediator (ParserMediator): parser mediator.
+      parser (BaseParser): parser.
+      file_entry (dfvfs.FileEntry): file entry.
+      data_stream_name (str): data stream name.
+      parse_ranges (list[tuple[int, int]]): start and end of the ranges,
+          as defined by the parser.
+    """
+    path_spec = copy.deepcopy(file_entry.path_spec)
+    if data_stream_name:
+      path_spec.data_stream = data_stream_name
+
+    # The analyzers, such as hashing, only run on the data stream as a whole,
+    # hence their results are passed on with the ranges.
+    event_data_stream = parser_mediator.GetEventDataStream()
+
+    for parse_range_start, parse_range_end in parse_ranges:
+      event_source = event_sources.FileEntryEventSource(path_spec=path_spec)
+      event_source.file_entry_type = dfvfs_definitions.FILE_ENTRY_TYPE_FILE
+      event_source.file_size = file_entry.size
+      event_source.parse_range_end = parse_range_end
+      event_source.parse_range_start = parse_range_start
+      event_source.parser_name = parser.NAME
+
+      if event_data_stream:
+        event_source.file_entropy = event_data_stream.file_entropy
+        event_source.md5_hash = event_data_stream.md5_hash
+        event_source.sha1_hash = event_data_stream.sha1_hash
+        event_source.sha256_hash = event_data_stream.sha256_hash
+        event_source.yara_match = event_data_stream.yara_match
+
+      parser_mediator.ProduceEventSource(event_source)
+
   def ParseDataStream(self, parser_mediator, file_entry, data_stream_name):
     """Parses a data stream of a file entry with the enabled parsers.
 
@@ -284,15 +421,20 @@ class EventExtractor(object):
     parse_with_non_sigscan_parsers = True
     if parser_names:
       parse_result = self._ParseFileEntryWithParsers(
-          parser_mediator, parser_names, file_entry, file_object=file_object)
+          parser_mediator, parser_names, file_entry,
+          data_stream_name=data_stream_name, file_object=file_object)
       if parse_result in (
           self._PARSE_RESULT_FAILURE, self._PARSE_RESULT_SUCCESS):
         parse_with_non_sigscan_parsers = False
 
     if parse_with_non_sigscan_parsers:
-      self._ParseFileEntryWithParsers(
+      parser_names = self._GetFileHeadMatchParserNames(
           parser_mediator, self._non_sigscan_parser_names, file_entry,
-          file_object=file_object)
+          file_object)
+
+      self._ParseFileEntryWithParsers(
+          parser_mediator, parser_names, file_entry,
+          data_stream_name=data_stream_name, file_object=file_object)
 
     if self._force_parser and self._usnjrnl_parser:
       # TODO: the usnjrnl needs to be adjusted to be used on an export of
@@ -301,6 +443,39 @@ class EventExtractor(object):
           parser_mediator, self._usnjrnl_parser, file_entry,
           file_object=file_object)
 
+  def ParseDataStreamRange(
+      self, parser_mediator, file_entry, data_stream_name, parser_name,
+      parse_range):
+    """Parses a range of a data stream of a file entry with a specific parser.
+
+    Args:
+      parser_mediator (ParserMediator): parser mediator.
+      file_entry (dfvfs.FileEntry): file entry.
+      data_stream_name (str): data stream name.
+      parser_name (str): name of the parser.
+      parse_range (tuple[int, int]): start and end of the range, as defined
+          by the parser.
+
+    Raises:
+      RuntimeError: if the file-like object or the parser object is missing.
+    """
+    parser = self._parsers.get(parser_name, None)
+    if not parser:
+      raise RuntimeError(
+          'Parser object missing for parser: {0:s}'.format(parser_name))
+
+    file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
+    if not file_object:
+      raise RuntimeError(
+          'Unable to retrieve file-like object from file entry.')
+
+    parser_mediator.SetParseRange(parse_range)
+    try:
+      self._ParseFileEntryWithParser(
+          parser_mediator, parser, file_entry, file_object=file_object)
+    finally:
+      parser_mediator.SetParseRange(None)
+
   def ParseFileEntryMetadata(self, parser_mediator, file_entry):
     """Parses the file entry metadata such as file system data.
 
@@ -339,6 +514,16 @@ class EventExtractor(object):
           parser_mediator, self._usnjrnl_parser, file_entry,
           file_object=volume_file_object)
 
+  def SetSplitFileSize(self, split_file_size):
+    """Sets the size from which files are parsed in ranges.
+
+    Args:
+      split_file_size (int): size in bytes from which files are parsed in
+          ranges, by the parsers that support it, where each range is parsed
+          separately, or None to parse files in their entirety.
+    """
+    self._split_file_size = split_file_size
+
 
 class PathSpecExtractor(object):
   """Path specification extractor.
@@ -151,6 +151,46 @@ class MemoryProfiler(SampleFileProfiler):
     self._WritesString(sample)
 
 
+class ParsedItemsProfiler(SampleFileProfiler):
+  """The parsed items profiler."""
+
+  _FILENAME_PREFIX = 'parsed_items'
+
+  _FILE_HEADER = (
+      'Time\tName\tNumber of items\tProcessing time\tItems per second\n')
+
+  def StartTiming(self, profile_name):
+    """Starts timing CPU time.
+
+    Args:
+      profile_name (str): name of the profile to sample.
+    """
+    if profile_name not in self._profile_measurements:
+      self._profile_measurements[profile_name] = CPUTimeMeasurement()
+
+    self._profile_measurements[profile_name].SampleStart()
+
+  def StopTiming(self, profile_name, number_of_items):
+    """Stops timing CPU time.
+
+    Args:
+      profile_name (str): name of the profile to sample.
+      number_of_items (int): number of items parsed, such as cache entries.
+    """
+    measurements = self._profile_measurements.get(profile_name)
+    if measurements:
+      measurements.SampleStop()
+
+      items_per_second = 0.0
+      if measurements.total_cpu_time > 0:
+        items_per_second = number_of_items / measurements.total_cpu_time
+
+      sample = '{0:f}\t{1:s}\t{2:d}\t{3:f}\t{4:f}\n'.format(
+          measurements.start_sample_time, profile_name, number_of_items,
+          measurements.total_cpu_time, items_per_second)
+      self._WritesString(sample)
+
+
 class AnalyzersProfiler(CPUTimeProfiler):
   """The analyzers profiler."""
 
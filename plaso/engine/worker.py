@@ -643,6 +643,7 @@ class EventExtractionWorker(object):
       stat_object = sub_file_entry.GetStat()
       if stat_object:
         event_source.file_entry_type = stat_object.type
+        event_source.file_size = getattr(stat_object, 'size', None)
 
       mediator.ProduceEventSource(event_source)
 
@@ -776,6 +777,59 @@ class EventExtractionWorker(object):
       self._ExtractContentFromDataStream(
           mediator, file_entry, data_stream.name)
 
+  def _ProcessFileEntryRange(
+      self, mediator, file_entry, parser_name, parse_range,
+      event_data_stream=None):
+    """Processes a range of the data stream of a file entry.
+
+    The file entry metadata and archive or compressed stream content are
+    processed with the first range of the data stream, as part of processing
+    the file entry, so only the range itself is parsed. The analyzers, such
+    as hashing, are also only run when processing the file entry, since they
+    read the entire data stream. Their results are passed on to the range by
+    the event data stream.
+
+    Args:
+      mediator (ParserMediator): mediates the interactions between
+          parsers and other components, such as storage and abort signals.
+      file_entry (dfvfs.FileEntry): file entry containing the data stream.
+      parser_name (str): name of the parser to parse the range with.
+      parse_range (tuple[int, int]): start and end of the range to parse,
+          as defined by the parser.
+      event_data_stream (Optional[EventDataStream]): event data stream of
+          the range, that contains the results of the analyzers of the file
+          entry.
+    """
+    display_name = mediator.GetDisplayName()
+    data_stream_name = getattr(file_entry.path_spec, 'data_stream', '') or ''
+    logger.debug((
+        '[ProcessFileEntryRange] processing range: {0:d} - {1:d} of data '
+        'stream: "{2:s}" of file entry: {3:s} with parser: {4:s}').format(
+            parse_range[0], parse_range[1], data_stream_name, display_name,
+            parser_name))
+
+    if not event_data_stream:
+      event_data_stream = events.EventDataStream()
+
+    event_data_stream.path_spec = file_entry.path_spec
+
+    mediator.ProduceEventDataStream(event_data_stream)
+
+    self.processing_status = definitions.STATUS_INDICATOR_EXTRACTING
+
+    if self._processing_profiler:
+      self._processing_profiler.StartTiming('extracting')
+
+    self._event_extractor.ParseDataStreamRange(
+        mediator, file_entry, data_stream_name, parser_name, parse_range)
+
+    if self._processing_profiler:
+      self._processing_profiler.StopTiming('extracting')
+
+    self.processing_status = definitions.STATUS_INDICATOR_RUNNING
+
+    self.last_activity_timestamp = time.time()
+
   def _ProcessMetadataFile(self, mediator, file_entry):
     """Processes a metadata file.
 
@@ -842,7 +896,9 @@ class EventExtractionWorker(object):
     """
     return [analyzer_instance.NAME for analyzer_instance in self._analyzers]
 
-  def ProcessPathSpec(self, mediator, path_spec, excluded_find_specs=None):
+  def ProcessPathSpec(
+      self, mediator, path_spec, excluded_find_specs=None, parser_name=None,
+      parse_range=None, event_data_stream=None):
     """Processes a path specification.
 
     Args:
@@ -851,6 +907,14 @@ class EventExtractionWorker(object):
       path_spec (dfvfs.PathSpec): path specification.
       excluded_find_specs (Optional[list[dfvfs.FindSpec]]): find specifications
          that are excluded from processing.
+      parser_name (Optional[str]): name of the parser to parse the range of
+         the file entry with.
+      parse_range (Optional[tuple[int, int]]): start and end of the range of
+         the file entry to parse, as defined by the parser. If not set the file
+         entry is processed in its entirety.
+      event_data_stream (Optional[EventDataStream]): event data stream of
+         the range of the file entry to parse, that contains the results of
+         the analyzers of the file entry.
     """
     self.last_activity_timestamp = time.time()
     self.processing_status = definitions.STATUS_INDICATOR_RUNNING
@@ -876,9 +940,15 @@ class EventExtractionWorker(object):
     mediator.SetFileEntry(file_entry)
 
     try:
-      if file_entry.IsDirectory():
-        self._ProcessDirectory(mediator, file_entry)
-      self._ProcessFileEntry(mediator, file_entry)
+      if parser_name and parse_range:
+        self._ProcessFileEntryRange(
+            mediator, file_entry, parser_name, parse_range,
+            event_data_stream=event_data_stream)
+
+      else:
+        if file_entry.IsDirectory():
+          self._ProcessDirectory(mediator, file_entry)
+        self._ProcessFileEntry(mediator, file_entry)
 
     finally:
       mediator.ResetFileEntry()
@@ -899,6 +969,8 @@ class EventExtractionWorker(object):
     self._process_compressed_streams = configuration.process_compressed_streams
     self._SetYaraRules(configuration.yara_rules_string)
 
+    self._event_extractor.SetSplitFileSize(configuration.split_file_size)
+
   def SetAnalyzersProfiler(self, analyzers_profiler):
     """Sets the analyzers profiler.
 
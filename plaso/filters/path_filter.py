@@ -551,6 +551,59 @@ class PathFilterScanTree(object):
     filter_path_segments = scan_object.split(self._path_segment_separator)
     return filter_path_segments == path_segments
 
+  def CheckPathPrefix(self, path, path_segment_separator=None):
+    """Checks if a path is a prefix of a path in the scan tree.
+
+    A path is considered a prefix if its path segments are equal to the first
+    path segments of a path in the scan tree. This can be used to determine
+    if the paths that start with the path can match the filter.
+
+    Args:
+      path (str): path.
+      path_segment_separator (Optional[str]): path segment separator, where
+          None defaults to the path segment separator that was set when
+          the path filter scan tree was initialized.
+
+    Returns:
+      bool: True if the path is a prefix of a path in the scan tree, False
+          otherwise.
+    """
+    if not self._case_sensitive:
+      path = path.lower()
+
+    if path_segment_separator is None:
+      path_segment_separator = self._path_segment_separator
+
+    path_segments = path.split(path_segment_separator)
+    number_of_path_segments = len(path_segments)
+
+    scan_objects = [self._root_node]
+    while scan_objects:
+      scan_object = scan_objects.pop()
+      if not scan_object:
+        continue
+
+      if isinstance(scan_object, str):
+        filter_path_segments = scan_object.split(self._path_segment_separator)
+        if filter_path_segments[:number_of_path_segments] == path_segments:
+          return True
+        continue
+
+      scan_objects.append(scan_object.default_value)
+
+      if scan_object.path_segment_index >= number_of_path_segments:
+        # The path does not contain the path segment the node scans for,
+        # hence every path segment of the node could follow the path.
+        scan_objects.extend([
+            scan_object.GetScanObject(path_segment)
+            for path_segment in scan_object.path_segments])
+      else:
+        path_segment = path_segments[scan_object.path_segment_index]
+        if path_segment in scan_object.path_segments:
+          scan_objects.append(scan_object.GetScanObject(path_segment))
+
+    return False
+
 
 class PathFilterScanTreeNode(object):
   """Class that implements a path filter scan tree node.
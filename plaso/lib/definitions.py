@@ -8,10 +8,12 @@ NANOSECONDS_PER_SECOND = 1000000000
 
 SOURCE_TYPE_ARCHIVE = 'archive'
 
+COMPRESSION_FORMAT_LZ4_DICTIONARY = 'lz4_dictionary'
 COMPRESSION_FORMAT_NONE = 'none'
 COMPRESSION_FORMAT_ZLIB = 'zlib'
 
 COMPRESSION_FORMATS = frozenset([
+    COMPRESSION_FORMAT_LZ4_DICTIONARY,
     COMPRESSION_FORMAT_NONE,
     COMPRESSION_FORMAT_ZLIB])
 
@@ -2,6 +2,7 @@
 """The dtFabric helper mix-in."""
 
 import os
+import weakref
 
 from dtfabric import errors as dtfabric_errors
 from dtfabric.runtime import data_maps as dtfabric_data_maps
@@ -55,11 +56,18 @@ class DtFabricHelper(object):
   # The dtFabric definition file, which must be overwritten by a subclass.
   _DEFINITION_FILE = None
 
+  # Size of the blocks that are read from the file-like object and buffered,
+  # where 0 disables buffering.
+  _READ_BUFFER_SIZE = 64 * 1024
+
   def __init__(self):
     """Initializes the ESE database plugin."""
     super(DtFabricHelper, self).__init__()
     self._data_type_maps = {}
     self._fabric = self._ReadDefinitionFile(self._DEFINITION_FILE)
+    self._read_buffer = b''
+    self._read_buffer_file_object = None
+    self._read_buffer_offset = 0
 
   def _FormatPackedIPv4Address(self, packed_ip_address):
     """Formats a packed IPv4 address as a human readable string.
@@ -128,6 +136,11 @@ class DtFabricHelper(object):
     if not file_object:
       raise ValueError('Missing file-like object.')
 
+    if 0 < data_size <= self._READ_BUFFER_SIZE:
+      data = self._ReadDataFromBuffer(file_object, file_offset, data_size)
+      if data is not None:
+        return data
+
     file_object.seek(file_offset, os.SEEK_SET)
 
     read_error = ''
@@ -148,6 +161,62 @@ class DtFabricHelper(object):
 
     return data
 
+  def _ReadDataFromBuffer(self, file_object, file_offset, data_size):
+    """Reads data from the read buffer.
+
+    The file-like object is read in blocks of _READ_BUFFER_SIZE bytes, such
+    that consecutive reads of small structures do not each require a read of
+    the file-like object.
+
+    Args:
+      file_object (dvfvs.FileIO): a file-like object to read.
+      file_offset (int): offset of the data relative to the start of
+          the file-like object.
+      data_size (int): size of the data.
+
+    Returns:
+      bytes: byte stream containing the data or None if the data could not be
+          read from the read buffer.
+    """
+    read_buffer_file_object = None
+    if self._read_buffer_file_object:
+      read_buffer_file_object = self._read_buffer_file_object()
+
+    buffer_offset = file_offset - self._read_buffer_offset
+    if (read_buffer_file_object is not file_object or buffer_offset < 0 or
+        buffer_offset + data_size > len(self._read_buffer)):
+      # Read the block that contains the start of the data, or a block that
+      # starts at the data if the data crosses the end of the block.
+      block_offset = file_offset - (file_offset % self._READ_BUFFER_SIZE)
+      if file_offset + data_size > block_offset + self._READ_BUFFER_SIZE:
+        block_offset = file_offset
+
+      try:
+        file_object.seek(block_offset, os.SEEK_SET)
+        read_buffer = file_object.read(self._READ_BUFFER_SIZE)
+        read_buffer_file_object = weakref.ref(file_object)
+      except (IOError, TypeError):
+        # The data is read without buffering, for example to report
+        # the read error, or if the file-like object does not support weak
+        # references.
+        self._read_buffer = b''
+        self._read_buffer_file_object = None
+        return None
+
+      self._read_buffer = read_buffer
+      self._read_buffer_file_object = read_buffer_file_object
+      self._read_buffer_offset = block_offset
+
+      buffer_offset = file_offset - block_offset
+      if buffer_offset + data_size > len(read_buffer):
+        return None
+
+    # Set the current offset of the file-like object as if the data was read
+    # without buffering.
+    file_object.seek(file_offset + data_size, os.SEEK_SET)
+
+    return self._read_buffer[buffer_offset:buffer_offset + data_size]
+
   def _ReadDefinitionFile(self, path):
     """Reads a dtFabric definition file.
 
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-"""Binary line reader file-like object."""
+"""Line reader file-like objects."""
 
 import os
 
@@ -208,3 +208,241 @@ class BinaryDSVReader(object):
       fields[-1] = fields[-1].strip(self._line_reader.end_of_line)
 
       yield fields
+
+
+class TextLineReader(object):
+  """Buffered line reader for text file-like objects.
+
+  The line reader reads large blocks of data at once, decodes a block at once
+  where possible and splits it into lines in bulk. The offset of the lines is
+  tracked arithmetically based on the size of the encoded lines.
+  """
+
+  # The size of the blocks of data that are read at once.
+  _READ_BUFFER_SIZE = 1024 * 1024
+
+  def __init__(
+      self, file_object, encoding='utf-8', encoding_errors='strict',
+      end_of_line='\n', maximum_line_length=None):
+    """Initializes the line reader.
+
+    Args:
+      file_object (FileIO): a file-like object to read from.
+      encoding (Optional[str]): text encoding.
+      encoding_errors (Optional[str]): text encoding errors handler.
+      end_of_line (Optional[str]): end of line indicator.
+      maximum_line_length (Optional[int]): maximum size of a line in bytes,
+          including the end-of-line indicator, where longer lines are split
+          into multiple lines. None represents no maximum.
+    """
+    super(TextLineReader, self).__init__()
+    self._current_offset = 0
+    self._encoded_end_of_line = end_of_line.encode(encoding)
+    self._encoding = encoding
+    self._encoding_errors = encoding_errors
+    self._end_of_line = end_of_line
+    self._file_object = file_object
+    self._file_object_size = file_object.get_size()
+    self._lines_generator = None
+    self._maximum_line_length = maximum_line_length
+
+    # A block of lines can only be decoded at once if the end-of-line
+    # indicator is encoded as in UTF-8, such as for ASCII compatible
+    # encodings, and as such cannot be part of another encoded character.
+    self._supports_block_decoding = (
+        self._encoded_end_of_line == end_of_line.encode('utf-8'))
+
+  def __iter__(self):
+    """Returns the lines of text.
+
+    Returns:
+      generator[str]: lines of text.
+    """
+    if not self._lines_generator:
+      self._lines_generator = self._ReadLines()
+
+    return self._lines_generator
+
+  def _DecodeLine(self, encoded_line):
+    """Decodes a line of text.
+
+    Lines that exceed the maximum line length are split into multiple lines
+    of the maximum line length.
+
+    Args:
+      encoded_line (bytes): encoded line of text.
+
+    Yields:
+      str: line of text.
+
+    Raises:
+      UnicodeDecodeError: if the line cannot be decoded and encoding errors
+          is set to strict.
+    """
+    encoded_line_size = len(encoded_line)
+    maximum_line_length = self._maximum_line_length or encoded_line_size
+
+    for line_offset in range(0, encoded_line_size, maximum_line_length):
+      encoded_line_part = encoded_line[
+          line_offset:line_offset + maximum_line_length]
+      line = encoded_line_part.decode(self._encoding, self._encoding_errors)
+
+      # Remove a byte-order mark at the start of the file.
+      if self._current_offset == 0 and line[:1] == '\ufeff':
+        line = line[1:]
+
+      self._current_offset += len(encoded_line_part)
+      yield line
+
+  def _DecodeLines(self, encoded_lines_data):
+    """Decodes lines of text.
+
+    Args:
+      encoded_lines_data (bytes): encoded lines of text, where only the last
+          line can be without end-of-line indicator.
+
+    Yields:
+      str: line of text.
+
+    Raises:
+      UnicodeDecodeError: if a line cannot be decoded and encoding errors is
+          set to strict.
+    """
+    encoded_end_of_line_size = len(self._encoded_end_of_line)
+    encoded_lines = encoded_lines_data.split(self._encoded_end_of_line)
+
+    lines = None
+    if self._supports_block_decoding:
+      # If the block cannot be decoded strictly the lines are decoded one
+      # by one, so that the encoding errors handler is invoked per line.
+      try:
+        lines = encoded_lines_data.decode(self._encoding).split(
+            self._end_of_line)
+      except UnicodeDecodeError:
+        pass
+
+      if lines and len(lines) != len(encoded_lines):
+        lines = None
+
+    # Lines that exceed the maximum line length are split by _DecodeLine.
+    if lines and self._maximum_line_length:
+      maximum_encoded_line_size = max(map(len, encoded_lines))
+      if (maximum_encoded_line_size + encoded_end_of_line_size >
+          self._maximum_line_length):
+        lines = None
+
+    last_encoded_line = encoded_lines.pop()
+
+    if lines is None:
+      for encoded_line in encoded_lines:
+        yield from self._DecodeLine(
+            b''.join([encoded_line, self._encoded_end_of_line]))
+
+      if last_encoded_line:
+        yield from self._DecodeLine(last_encoded_line)
+
+      return
+
+    last_line = lines.pop()
+
+    # Remove a byte-order mark at the start of the file.
+    if self._current_offset == 0:
+      if lines and lines[0][:1] == '\ufeff':
+        lines[0] = lines[0][1:]
+      elif not lines and last_line[:1] == '\ufeff':
+        last_line = last_line[1:]
+
+    for line, encoded_line in zip(lines, encoded_lines):
+      self._current_offset += len(encoded_line) + encoded_end_of_line_size
+      yield line + self._end_of_line
+
+    if last_encoded_line:
+      self._current_offset += len(last_encoded_line)
+      yield last_line
+
+  def _ReadLines(self):
+    """Reads lines of text.
+
+    Yields:
+      str: line of text, which includes the end-of-line indicator except for
+          a last line without one.
+
+    Raises:
+      UnicodeDecodeError: if a line cannot be decoded and encoding errors is
+          set to strict.
+    """
+    encoded_end_of_line_size = len(self._encoded_end_of_line)
+    lines_buffer = b''
+    read_offset = 0
+
+    while read_offset < self._file_object_size:
+      read_size = min(
+          self._READ_BUFFER_SIZE, self._file_object_size - read_offset)
+
+      self._file_object.seek(read_offset, os.SEEK_SET)
+      read_buffer = self._file_object.read(read_size)
+      if not read_buffer:
+        break
+
+      read_offset += len(read_buffer)
+
+      if lines_buffer:
+        read_buffer = b''.join([lines_buffer, read_buffer])
+
+      # Keep the partial line at the end of the read buffer in the lines
+      # buffer, to be completed by the next read.
+      lines_buffer_offset = read_buffer.rfind(self._encoded_end_of_line)
+      if lines_buffer_offset == -1:
+        lines_buffer = read_buffer
+      else:
+        lines_buffer_offset += encoded_end_of_line_size
+        lines_buffer = read_buffer[lines_buffer_offset:]
+
+        yield from self._DecodeLines(read_buffer[:lines_buffer_offset])
+
+      # Split off parts of a partial line that exceed the maximum line length.
+      if (self._maximum_line_length and
+          len(lines_buffer) >= self._maximum_line_length):
+        lines_buffer_size = len(lines_buffer)
+        lines_buffer_size -= lines_buffer_size % self._maximum_line_length
+
+        yield from self._DecodeLine(lines_buffer[:lines_buffer_size])
+
+        lines_buffer = lines_buffer[lines_buffer_size:]
+
+    if lines_buffer:
+      yield from self._DecodeLines(lines_buffer)
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the readline file-like object interface.
+  # pylint: disable=invalid-name
+
+  def get_offset(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: offset directly after the last line read.
+    """
+    return self._current_offset
+
+  def readline(self):
+    """Reads a single line of text.
+
+    Returns:
+      str: line of text, which includes the end-of-line indicator except for
+          a last line without one, or an empty string if all lines have been
+          read.
+
+    Raises:
+      UnicodeDecodeError: if a line cannot be decoded and encoding errors is
+          set to strict.
+    """
+    return next(iter(self), '')
+
+  def tell(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: offset directly after the last line read.
+    """
+    return self._current_offset
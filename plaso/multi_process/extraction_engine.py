@@ -9,6 +9,8 @@ import re
 import time
 import traceback
 
+import psutil
+
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.resolver import context
 
@@ -55,7 +57,7 @@ class _EventSourceHeap(object):
       EventSource: an event source or None on if no event source is available.
     """
     try:
-      _, _, event_source = heapq.heappop(self._heap)
+      _, _, _, event_source = heapq.heappop(self._heap)
 
     except IndexError:
       return None
@@ -65,6 +67,11 @@ class _EventSourceHeap(object):
   def PushEventSource(self, event_source):
     """Pushes an event source onto the heap.
 
+    Directories are popped first, so that event sources are discovered early,
+    followed by files in order of decreasing size, so that the largest files,
+    which take the longest to process, do not end up being processed last
+    while the other worker processes are idle.
+
     Args:
       event_source (EventSource): event source.
     """
@@ -74,7 +81,9 @@ class _EventSourceHeap(object):
     else:
       weight = 100
 
-    heap_values = (weight, time.time(), event_source)
+    file_size = event_source.file_size or 0
+
+    heap_values = (weight, -file_size, time.time(), event_source)
     heapq.heappush(self._heap, heap_values)
 
 
@@ -92,6 +101,18 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
   _WORKER_PROCESSES_MINIMUM = 2
   _WORKER_PROCESSES_MAXIMUM = 15
 
+  # Minimum number of seconds between adding or retiring worker processes
+  # when autoscaling.
+  _AUTOSCALING_INTERVAL = 10.0
+
+  # Minimum amount of available memory, in bytes, to keep free for the main
+  # process and the rest of the system when autoscaling.
+  _AUTOSCALING_MINIMUM_AVAILABLE_MEMORY = 512 * 1024 * 1024
+
+  # Number of tasks pending merge per worker process above which the main
+  # process is considered unable to keep up with merging when autoscaling.
+  _AUTOSCALING_TASKS_PENDING_MERGE_PER_WORKER = 2
+
   _TASK_QUEUE_TIMEOUT_SECONDS = 2
 
   _UNICODE_SURROGATES_RE = re.compile('[\ud800-\udfff]')
@@ -100,13 +121,18 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
   def __init__(
       self, maximum_number_of_tasks=None, number_of_worker_processes=0,
-      worker_memory_limit=None, worker_timeout=None):
+      worker_autoscaling=False, worker_memory_limit=None, worker_timeout=None):
     """Initializes an engine.
 
     Args:
       maximum_number_of_tasks (Optional[int]): maximum number of concurrent
           tasks, where 0 represents no limit.
       number_of_worker_processes (Optional[int]): number of worker processes.
+      worker_autoscaling (Optional[bool]): True if worker processes should be
+          added or retired during processing based on the number of pending
+          tasks, the number of tasks pending merge and the available memory.
+          A number of worker processes, other than 0, is used as the initial
+          and minimum number.
       worker_memory_limit (Optional[int]): maximum amount of memory a worker is
           allowed to consume, where None represents the default memory limit
           and 0 represents no limit.
@@ -117,30 +143,16 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     if maximum_number_of_tasks is None:
       maximum_number_of_tasks = self._MAXIMUM_NUMBER_OF_TASKS
 
-    if number_of_worker_processes < 1:
-      # One worker for each "available" CPU (minus other processes).
-      # The number here is derived from the fact that the engine starts up:
-      # * A main process.
-      #
-      # If we want to utilize all CPUs on the system we therefore need to start
-      # up workers that amounts to the total number of CPUs - the other
-      # processes.
-      try:
-        cpu_count = multiprocessing.cpu_count() - 1
-
-        if cpu_count <= self._WORKER_PROCESSES_MINIMUM:
-          cpu_count = self._WORKER_PROCESSES_MINIMUM
+    default_number_of_worker_processes = (
+        self._GetDefaultNumberOfWorkerProcesses())
 
-        elif cpu_count >= self._WORKER_PROCESSES_MAXIMUM:
-          cpu_count = self._WORKER_PROCESSES_MAXIMUM
-
-      except NotImplementedError:
-        logger.error((
-            'Unable to determine number of CPUs defaulting to {0:d} worker '
-            'processes.').format(self._WORKER_PROCESSES_MINIMUM))
-        cpu_count = self._WORKER_PROCESSES_MINIMUM
-
-      number_of_worker_processes = cpu_count
+    if number_of_worker_processes < 1:
+      number_of_worker_processes = default_number_of_worker_processes
+      minimum_number_of_worker_processes = self._WORKER_PROCESSES_MINIMUM
+    else:
+      # Autoscaling does not retire worker processes below an explicitly
+      # requested number of worker processes.
+      minimum_number_of_worker_processes = number_of_worker_processes
 
     if worker_memory_limit is None:
       worker_memory_limit = definitions.DEFAULT_WORKER_MEMORY_LIMIT
@@ -149,6 +161,7 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       worker_timeout = definitions.DEFAULT_WORKER_TIMEOUT
 
     super(ExtractionMultiProcessEngine, self).__init__()
+    self._autoscaling_timestamp = 0.0
     self._enable_sigsegv_handler = False
     self._last_worker_number = 0
     self._maximum_number_of_containers = 50
@@ -165,6 +178,11 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._number_of_produced_extraction_warnings = 0
     self._number_of_produced_reports = 0
     self._number_of_produced_sources = 0
+    self._maximum_number_of_worker_processes = max(
+        number_of_worker_processes, default_number_of_worker_processes)
+    self._minimum_number_of_worker_processes = (
+        minimum_number_of_worker_processes)
+    self._number_of_retiring_worker_processes = 0
     self._number_of_worker_processes = number_of_worker_processes
     self._path_spec_extractor = extractors.PathSpecExtractor()
     self._resolver_context = context.Context()
@@ -176,9 +194,104 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._task_queue = None
     self._task_queue_port = None
     self._task_storage_format = None
+    self._worker_autoscaling = worker_autoscaling
     self._worker_memory_limit = worker_memory_limit
     self._worker_timeout = worker_timeout
 
+  def _AutoscaleWorkerProcesses(self, tasks_status):
+    """Adds or retires a worker process based on the processing status.
+
+    Args:
+      tasks_status (TasksStatus): status information about tasks.
+    """
+    current_timestamp = time.time()
+    if current_timestamp < (
+        self._autoscaling_timestamp + self._AUTOSCALING_INTERVAL):
+      return
+
+    workers_status = [
+        worker_status
+        for worker_status in self._processing_status.workers_status
+        if worker_status.pid in self._process_information_per_pid]
+
+    number_of_pending_tasks = tasks_status.number_of_queued_tasks + max(
+        self._number_of_produced_sources - self._number_of_consumed_sources, 0)
+
+    worker_used_memory = 0
+    for worker_status in workers_status:
+      worker_used_memory = max(
+          worker_used_memory, worker_status.used_memory or 0)
+
+    number_of_workers = (
+        len(self._process_information_per_pid) -
+        self._number_of_retiring_worker_processes)
+
+    adjustment = self._GetAutoscalingAdjustment(
+        number_of_workers, number_of_pending_tasks,
+        tasks_status.number_of_tasks_pending_merge, worker_used_memory,
+        psutil.virtual_memory().available)
+
+    if adjustment > 0:
+      process_name = 'Worker_{0:02d}'.format(self._last_worker_number)
+      if not self._StartWorkerProcess(process_name):
+        logger.error('Unable to create worker process: {0:s}'.format(
+            process_name))
+        return
+
+      logger.info('Added worker process: {0:s}'.format(process_name))
+      self._number_of_worker_processes += 1
+
+    elif adjustment < 0:
+      # A worker process is retired by scheduling a queue abort. The worker
+      # process that dequeues it has completed its previous task and exits
+      # instead of requesting another task, so that no task is abandoned.
+      try:
+        self._task_queue.PushItem(plaso_queue.QueueAbort(), block=False)
+      except errors.QueueFull:
+        return
+
+      logger.info('Retiring a worker process.')
+      self._number_of_retiring_worker_processes += 1
+
+    self._autoscaling_timestamp = current_timestamp
+
+  def _CheckRetiredWorkerProcess(self, pid):
+    """Checks if a worker process has exited after it was retired.
+
+    Args:
+      pid (int): process identifier (PID) of a registered worker process.
+
+    Returns:
+      bool: True if the worker process has exited after it was retired.
+    """
+    if not self._number_of_retiring_worker_processes:
+      return False
+
+    process = self._processes_per_pid.get(pid, None)
+    if not process or process.is_alive() or process.exitcode != 0:
+      return False
+
+    for worker_status in self._processing_status.workers_status:
+      if worker_status.pid == pid:
+        if worker_status.status in definitions.ERROR_STATUS_INDICATORS:
+          return False
+
+        worker_status.status = definitions.STATUS_INDICATOR_COMPLETED
+        break
+
+    logger.info('Retired worker process: {0:s} (PID: {1:d})'.format(
+        process.name, pid))
+
+    process.join(timeout=self._PROCESS_JOIN_TIMEOUT)
+
+    self._StopMonitoringProcess(process)
+    del self._processes_per_pid[pid]
+
+    self._number_of_retiring_worker_processes -= 1
+    self._number_of_worker_processes -= 1
+
+    return True
+
   def _FillEventSourceHeap(
       self, storage_writer, event_source_heap, start_with_first=False):
     """Fills the event source heap with the available written event sources.
@@ -220,6 +333,78 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     if self._processing_profiler:
       self._processing_profiler.StopTiming('fill_event_source_heap')
 
+  def _GetAutoscalingAdjustment(
+      self, number_of_workers, number_of_pending_tasks,
+      number_of_tasks_pending_merge, worker_used_memory, available_memory):
+    """Determines if a worker process should be added or retired.
+
+    A worker process is retired when the main process cannot keep up with
+    merging the task results or when the system is low on memory. A worker
+    process is added when there are more pending tasks than worker processes
+    and there is sufficient memory for another worker process.
+
+    Args:
+      number_of_workers (int): number of active worker processes.
+      number_of_pending_tasks (int): number of tasks and event sources
+          waiting to be processed.
+      number_of_tasks_pending_merge (int): number of tasks pending merge.
+      worker_used_memory (int): largest size of used memory of a worker
+          process in bytes.
+      available_memory (int): size of the memory available on the system in
+          bytes.
+
+    Returns:
+      int: 1 if a worker process should be added, -1 if a worker process
+          should be retired or 0 otherwise.
+    """
+    maximum_number_of_tasks_pending_merge = (
+        number_of_workers * self._AUTOSCALING_TASKS_PENDING_MERGE_PER_WORKER)
+
+    if (number_of_tasks_pending_merge > maximum_number_of_tasks_pending_merge or
+        available_memory < self._AUTOSCALING_MINIMUM_AVAILABLE_MEMORY):
+      if number_of_workers > self._minimum_number_of_worker_processes:
+        return -1
+      return 0
+
+    if (number_of_workers < self._maximum_number_of_worker_processes and
+        number_of_pending_tasks > number_of_workers and
+        number_of_tasks_pending_merge < number_of_workers and
+        available_memory - worker_used_memory >=
+        self._AUTOSCALING_MINIMUM_AVAILABLE_MEMORY):
+      return 1
+
+    return 0
+
+  def _GetDefaultNumberOfWorkerProcesses(self):
+    """Determines the default number of worker processes.
+
+    Returns:
+      int: default number of worker processes.
+    """
+    # One worker for each "available" CPU (minus other processes).
+    # The number here is derived from the fact that the engine starts up:
+    # * A main process.
+    #
+    # If we want to utilize all CPUs on the system we therefore need to start
+    # up workers that amounts to the total number of CPUs - the other
+    # processes.
+    try:
+      cpu_count = multiprocessing.cpu_count() - 1
+
+      if cpu_count <= self._WORKER_PROCESSES_MINIMUM:
+        cpu_count = self._WORKER_PROCESSES_MINIMUM
+
+      elif cpu_count >= self._WORKER_PROCESSES_MAXIMUM:
+        cpu_count = self._WORKER_PROCESSES_MAXIMUM
+
+    except NotImplementedError:
+      logger.error((
+          'Unable to determine number of CPUs defaulting to {0:d} worker '
+          'processes.').format(self._WORKER_PROCESSES_MINIMUM))
+      cpu_count = self._WORKER_PROCESSES_MINIMUM
+
+    return cpu_count
+
   def _GetPathSpecificationString(self, path_spec):
     """Retrieves a printable string representation of the path specification.
 
@@ -513,8 +698,16 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         if not task and event_source:
           task = self._task_manager.CreateTask(
               session_identifier, storage_format=self._task_storage_format)
+          task.file_entropy = event_source.file_entropy
           task.file_entry_type = event_source.file_entry_type
+          task.md5_hash = event_source.md5_hash
+          task.parse_range_end = event_source.parse_range_end
+          task.parse_range_start = event_source.parse_range_start
+          task.parser_name = event_source.parser_name
           task.path_spec = event_source.path_spec
+          task.sha1_hash = event_source.sha1_hash
+          task.sha256_hash = event_source.sha256_hash
+          task.yara_match = event_source.yara_match
           event_source = None
 
           self._number_of_consumed_sources += 1
@@ -781,7 +974,8 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     # Make a local copy of the PIDs in case the dict is changed by
     # the main thread.
     for pid in list(self._process_information_per_pid.keys()):
-      self._CheckStatusWorkerProcess(pid)
+      if not self._CheckRetiredWorkerProcess(pid):
+        self._CheckStatusWorkerProcess(pid)
 
     self._UpdateForemanProcessStatus()
 
@@ -791,6 +985,11 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     self._processing_status.UpdateTasksStatus(tasks_status)
 
+    if self._worker_autoscaling and not self._abort and self._status in (
+        definitions.STATUS_INDICATOR_MERGING,
+        definitions.STATUS_INDICATOR_RUNNING):
+      self._AutoscaleWorkerProcesses(tasks_status)
+
     if self._status_update_callback:
       self._status_update_callback(self._processing_status)
 
@@ -852,6 +1051,9 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         logger.error('Unable to create worker process: {0:d}'.format(
             worker_number))
 
+    self._autoscaling_timestamp = time.time()
+    self._number_of_retiring_worker_processes = 0
+
     self._StartProfiling(self._processing_configuration.profiling)
     self._task_manager.StartProfiling(
         self._processing_configuration.profiling, self._name)
@@ -6,6 +6,7 @@ from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver
 
+from plaso.containers import events
 from plaso.engine import plaso_queue
 from plaso.engine import worker
 from plaso.lib import definitions
@@ -248,13 +249,22 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     except errors.QueueAlreadyClosed:
       logger.error('Queue for {0:s} was already closed.'.format(self.name))
 
-  def _ProcessPathSpec(self, extraction_worker, parser_mediator, path_spec):
+  def _ProcessPathSpec(
+      self, extraction_worker, parser_mediator, path_spec, parser_name=None,
+      parse_range=None, event_data_stream=None):
     """Processes a path specification.
 
     Args:
       extraction_worker (worker.ExtractionWorker): extraction worker.
       parser_mediator (ParserMediator): parser mediator.
       path_spec (dfvfs.PathSpec): path specification.
+      parser_name (Optional[str]): name of the parser to parse the range of
+          the file entry with.
+      parse_range (Optional[tuple[int, int]]): start and end of the range of
+          the file entry to parse, as defined by the parser.
+      event_data_stream (Optional[EventDataStream]): event data stream of
+          the range of the file entry to parse, that contains the results of
+          the analyzers of the file entry.
     """
     excluded_find_specs = None
     if self._collection_filters_helper:
@@ -268,7 +278,9 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
       self._CacheFileSystem(path_spec)
 
       extraction_worker.ProcessPathSpec(
-          parser_mediator, path_spec, excluded_find_specs=excluded_find_specs)
+          parser_mediator, path_spec, excluded_find_specs=excluded_find_specs,
+          parser_name=parser_name, parse_range=parse_range,
+          event_data_stream=event_data_stream)
 
     except dfvfs_errors.CacheFullError:
       # TODO: signal engine of failure.
@@ -323,9 +335,23 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     try:
       task_storage_writer.WriteTaskStart(task)
 
+      event_data_stream = None
+      parse_range = None
+      if task.parser_name:
+        parse_range = (task.parse_range_start, task.parse_range_end)
+
+        event_data_stream = events.EventDataStream()
+        event_data_stream.file_entropy = task.file_entropy
+        event_data_stream.md5_hash = task.md5_hash
+        event_data_stream.sha1_hash = task.sha1_hash
+        event_data_stream.sha256_hash = task.sha256_hash
+        event_data_stream.yara_match = task.yara_match
+
       # TODO: add support for more task types.
       self._ProcessPathSpec(
-          self._extraction_worker, self._parser_mediator, task.path_spec)
+          self._extraction_worker, self._parser_mediator, task.path_spec,
+          parser_name=task.parser_name, parse_range=parse_range,
+          event_data_stream=event_data_stream)
       self._number_of_consumed_sources += 1
 
     finally:
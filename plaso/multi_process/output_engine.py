@@ -4,12 +4,12 @@
 import collections
 import heapq
 
-from plaso.containers import events
 from plaso.engine import processing_status
 from plaso.lib import bufferlib
 from plaso.lib import definitions
 from plaso.multi_process import engine
 from plaso.multi_process import logger
+from plaso.storage import event_prefetcher
 from plaso.storage import event_tag_index
 from plaso.storage import time_range as storage_time_range
 
@@ -42,7 +42,9 @@ class PsortEventHeap(object):
 
     Args:
       event_data (EventData): event data.
-      event_data_stream (EventDataStream): event data stream.
+      event_data_stream (EventDataStream): event data stream or None if the
+          event data stream was not read, in which case the identifier only
+          contains the event data content.
 
     Returns:
       str: identifier of the event data content.
@@ -236,7 +238,7 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
 
   def _ExportEvent(
       self, storage_reader, output_module, event, event_data, event_data_stream,
-      deduplicate_events=True):
+      deduplicate_events=True, read_event_tags=True):
     """Exports an event using an output module.
 
     Args:
@@ -247,11 +249,13 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
       event_data_stream (EventDataStream): event data stream.
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
+      read_event_tags (Optional[bool]): True if the event tags should be read.
     """
     if (event.timestamp != self._export_event_timestamp or
         self._export_event_heap.number_of_events > self._HEAP_MAXIMUM_EVENTS):
       self._FlushExportBuffer(
-          storage_reader, output_module, deduplicate_events=deduplicate_events)
+          storage_reader, output_module, deduplicate_events=deduplicate_events,
+          read_event_tags=read_event_tags)
       self._export_event_timestamp = event.timestamp
 
     self._export_event_heap.PushEvent(event, event_data, event_data_stream)
@@ -292,26 +296,27 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     self._events_status.number_of_filtered_events = 0
     self._events_status.number_of_events_from_time_slice = 0
 
-    for event in storage_reader.GetSortedEvents(time_range=time_slice_range):
-      event_data_identifier = event.GetEventDataIdentifier()
-      event_data = storage_reader.GetAttributeContainerByIdentifier(
-          events.EventData.CONTAINER_TYPE, event_data_identifier)
-
-      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
-      if event_data_stream_identifier:
-        event_data_stream = storage_reader.GetAttributeContainerByIdentifier(
-            events.EventDataStream.CONTAINER_TYPE, event_data_stream_identifier)
-      else:
-        event_data_stream = None
+    # Event data streams and event tags are only read when the output module
+    # or the event filter uses them. Events are deduplicated without their
+    # event data streams if these are not read, since events that only differ
+    # in their event data streams are output identically.
+    read_event_data_streams = bool(
+        event_filter or output_module.RequiresEventDataStream())
+    read_event_tags = bool(event_filter or output_module.RequiresEventTag())
 
-      event_identifier = event.GetIdentifier()
-      event_tag = self._event_tag_index.GetEventTagByIdentifier(
-          storage_reader, event_identifier)
+    prefetcher = event_prefetcher.EventPrefetcher(
+        storage_reader, read_event_data_streams=read_event_data_streams)
 
+    for event, event_data, event_data_stream in prefetcher.GetEvents(
+        time_range=time_slice_range):
       if time_slice_range and event.timestamp != time_slice.event_timestamp:
         self._events_status.number_of_events_from_time_slice += 1
 
       if event_filter:
+        event_identifier = event.GetIdentifier()
+        event_tag = self._event_tag_index.GetEventTagByIdentifier(
+            storage_reader, event_identifier)
+
         filter_match = event_filter.Match(
             event, event_data, event_data_stream, event_tag)
       else:
@@ -323,13 +328,17 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
           self._events_status.number_of_filtered_events += 1
 
         elif forward_entries == 0:
-          time_slice_buffer.Append((event, event_data))
+          # Only the identifier of the event is buffered, the event, event
+          # data and event data stream are read again if the buffer is
+          # flushed.
+          time_slice_buffer.Append(event.GetIdentifier())
           self._events_status.number_of_filtered_events += 1
 
         elif forward_entries <= time_slice_buffer.size:
           self._ExportEvent(
               storage_reader, output_module, event, event_data,
-              event_data_stream, deduplicate_events=deduplicate_events)
+              event_data_stream, deduplicate_events=deduplicate_events,
+              read_event_tags=read_event_tags)
           self._number_of_consumed_events += 1
           self._events_status.number_of_events_from_time_slice += 1
           forward_entries += 1
@@ -344,12 +353,15 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
         # pylint: disable=singleton-comparison
         if filter_match == True and time_slice_buffer:
           # Empty the time slice buffer.
-          for event_in_buffer, event_data_in_buffer in (
-              time_slice_buffer.Flush()):
+          event_identifiers = list(time_slice_buffer.Flush())
+          for (event_in_buffer, event_data_in_buffer,
+               event_data_stream_in_buffer) in (
+                   prefetcher.GetEventsByIdentifiers(event_identifiers)):
             self._ExportEvent(
                 storage_reader, output_module, event_in_buffer,
-                event_data_in_buffer, event_data_stream,
-                deduplicate_events=deduplicate_events)
+                event_data_in_buffer, event_data_stream_in_buffer,
+                deduplicate_events=deduplicate_events,
+                read_event_tags=read_event_tags)
             self._number_of_consumed_events += 1
             self._events_status.number_of_filtered_events += 1
             self._events_status.number_of_events_from_time_slice += 1
@@ -358,7 +370,8 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
 
         self._ExportEvent(
             storage_reader, output_module, event, event_data, event_data_stream,
-            deduplicate_events=deduplicate_events)
+            deduplicate_events=deduplicate_events,
+            read_event_tags=read_event_tags)
         self._number_of_consumed_events += 1
 
         # pylint: disable=singleton-comparison
@@ -366,10 +379,12 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
             filter_limit == self._number_of_consumed_events):
           break
 
-    self._FlushExportBuffer(storage_reader, output_module)
+    self._FlushExportBuffer(
+        storage_reader, output_module, read_event_tags=read_event_tags)
 
   def _FlushExportBuffer(
-      self, storage_reader, output_module, deduplicate_events=True):
+      self, storage_reader, output_module, deduplicate_events=True,
+      read_event_tags=True):
     """Flushes buffered events and writes them to the output module.
 
     Args:
@@ -377,6 +392,7 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
       output_module (OutputModule): output module.
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
+      read_event_tags (Optional[bool]): True if the event tags should be read.
     """
     last_macb_group_identifier = None
     last_content_identifier = None
@@ -390,9 +406,11 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
         self._events_status.number_of_duplicate_events += 1
         continue
 
-      event_identifier = event.GetIdentifier()
-      event_tag = self._event_tag_index.GetEventTagByIdentifier(
-          storage_reader, event_identifier)
+      event_tag = None
+      if read_event_tags:
+        event_identifier = event.GetIdentifier()
+        event_tag = self._event_tag_index.GetEventTagByIdentifier(
+            storage_reader, event_identifier)
 
       if macb_group_identifier is None:
         if macb_group:
@@ -41,6 +41,22 @@ class EventFormattingHelper(object):
       str: string representation of the event.
     """
 
+  def RequiresEventDataStream(self):
+    """Determines if the event data stream is used to format events.
+
+    Returns:
+      bool: True if the event data stream is used to format events.
+    """
+    return True
+
+  def RequiresEventTag(self):
+    """Determines if the event tag is used to format events.
+
+    Returns:
+      bool: True if the event tag is used to format events.
+    """
+    return True
+
 
 class FieldFormattingHelper(object):
   """Output module field formatting helper."""
@@ -48,6 +64,27 @@ class FieldFormattingHelper(object):
   # Maps the name of a field to callback function that formats the field value.
   _FIELD_FORMAT_CALLBACKS = {}
 
+  # Names of the callback functions that do not use the event data stream.
+  _EVENT_DATA_STREAM_INDEPENDENT_CALLBACKS = frozenset([
+      '_FormatDate',
+      '_FormatDateTime',
+      '_FormatHostname',
+      '_FormatMACB',
+      '_FormatParser',
+      '_FormatSource',
+      '_FormatSourceShort',
+      '_FormatTag',
+      '_FormatTime',
+      '_FormatTimestamp',
+      '_FormatTimestampDescription',
+      '_FormatTimeZone',
+      '_FormatType',
+      '_FormatUsername',
+      '_FormatVersion'])
+
+  # Maximum number of date and time values in the cache.
+  _MAXIMUM_CACHED_DATE_TIME_VALUES = 64 * 1024
+
   def __init__(self, output_mediator):
     """Initializes a field formatting helper.
 
@@ -58,6 +95,8 @@ class FieldFormattingHelper(object):
 
     super(FieldFormattingHelper, self).__init__()
     self._callback_functions = {}
+    self._date_time_values_cache = {}
+    self._date_time_values_cache_timezone = None
     self._event_data_stream_field_names = event_data_stream.GetAttributeNames()
     self._event_tag_field_names = []
     self._output_mediator = output_mediator
@@ -138,25 +177,8 @@ class FieldFormattingHelper(object):
       if not self._output_mediator.dynamic_time and not event.timestamp:
         return '0000-00-00T00:00:00.000000+00:00'
 
-      date_time = event.date_time
-      if not date_time or date_time.is_local_time:
-        date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
-            timestamp=event.timestamp)
-
-      # Note that GetDateWithTimeOfDay will return the date and time in UTC,
-      # so no adjustment for date_time.time_zone_offset is needed.
-      year, month, day_of_month, hours, minutes, seconds = (
-          date_time.GetDateWithTimeOfDay())
-
       try:
-        datetime_object = datetime.datetime(
-            year, month, day_of_month, hours, minutes, seconds,
-            tzinfo=pytz.UTC)
-
-        datetime_object = datetime_object.astimezone(
-            self._output_mediator.timezone)
-
-        iso8601_string = datetime_object.isoformat(timespec='microseconds')
+        _, _, _, _, _, _, iso8601_string = self._GetDateTimeValues(event)
 
       except (OverflowError, TypeError, ValueError) as exception:
         iso8601_string = '0000-00-00T00:00:00.000000+00:00'
@@ -439,33 +461,10 @@ class FieldFormattingHelper(object):
     if not event.timestamp:
       return '--:--:--'
 
-    date_time = event.date_time
-    if not date_time or date_time.is_local_time:
-      date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
-          timestamp=event.timestamp)
-
-    # Note that GetDateWithTimeOfDay will return the date and time in UTC,
-    # so no adjustment for date_time.time_zone_offset is needed.
-    year, month, day_of_month, hours, minutes, seconds = (
-        date_time.GetDateWithTimeOfDay())
-
-    if self._output_mediator.timezone != pytz.UTC:
-      try:
-        datetime_object = datetime.datetime(
-            year, month, day_of_month, hours, minutes, seconds,
-            tzinfo=pytz.UTC)
-
-        datetime_object = datetime_object.astimezone(
-            self._output_mediator.timezone)
-
-        hours, minutes, seconds = (
-            datetime_object.hour, datetime_object.minute,
-            datetime_object.second)
-
-      except (OverflowError, TypeError, ValueError):
-        hours, minutes, seconds = (None, None, None)
+    try:
+      _, _, _, hours, minutes, seconds, _ = self._GetDateTimeValues(event)
 
-    if None in (hours, minutes, seconds):
+    except (OverflowError, TypeError, ValueError):
       self._ReportEventError(event, event_data, (
           'unable to copy timestamp: {0!s} to a human readable time. '
           'Defaulting to: "--:--:--"').format(event.timestamp))
@@ -556,6 +555,84 @@ class FieldFormattingHelper(object):
 
   # pylint: enable=unused-argument
 
+  def _GetDateTimeValues(self, event):
+    """Retrieves the date and time values of an event in the output time zone.
+
+    Events are typically output in chronological order hence consecutive
+    events often share the same date and time in seconds. To prevent
+    converting the same date and time to the output time zone for every
+    event and field the date and time values are cached per second.
+
+    Args:
+      event (EventObject): event.
+
+    Returns:
+      tuple[int, int, int, int, int, int, str]: year, month, day of month,
+          hours, minutes, seconds and date and time in ISO 8601 format with
+          time zone offset, in the output time zone.
+
+    Raises:
+      OverflowError: if the date and time values are out of bounds.
+      TypeError: if the date and time values are missing.
+      ValueError: if the date and time values are out of bounds.
+    """
+    timezone = self._output_mediator.timezone
+    if timezone != self._date_time_values_cache_timezone:
+      self._date_time_values_cache = {}
+      self._date_time_values_cache_timezone = timezone
+
+    date_time = event.date_time
+    if not date_time or date_time.is_local_time:
+      lookup_key, _ = divmod(event.timestamp, 1000000)
+      date_time = None
+    else:
+      # Note that GetDateWithTimeOfDay will return the date and time in UTC,
+      # so no adjustment for date_time.time_zone_offset is needed.
+      lookup_key = date_time.GetDateWithTimeOfDay()
+
+    date_time_values = self._date_time_values_cache.get(lookup_key, None)
+    if date_time_values:
+      return date_time_values
+
+    if date_time:
+      year, month, day_of_month, hours, minutes, seconds = lookup_key
+    else:
+      date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
+          timestamp=event.timestamp)
+      year, month, day_of_month, hours, minutes, seconds = (
+          date_time.GetDateWithTimeOfDay())
+
+    if None in (year, month, day_of_month, hours, minutes, seconds):
+      raise TypeError('Missing date and time values.')
+
+    if timezone == pytz.UTC:
+      iso8601_string = (
+          '{0:04d}-{1:02d}-{2:02d}T{3:02d}:{4:02d}:{5:02d}.000000'
+          '+00:00').format(year, month, day_of_month, hours, minutes, seconds)
+    else:
+      datetime_object = datetime.datetime(
+          year, month, day_of_month, hours, minutes, seconds,
+          tzinfo=pytz.UTC)
+
+      datetime_object = datetime_object.astimezone(timezone)
+
+      year, month, day_of_month, hours, minutes, seconds = (
+          datetime_object.year, datetime_object.month, datetime_object.day,
+          datetime_object.hour, datetime_object.minute,
+          datetime_object.second)
+
+      iso8601_string = datetime_object.isoformat(timespec='microseconds')
+
+    if len(self._date_time_values_cache) >= (
+        self._MAXIMUM_CACHED_DATE_TIME_VALUES):
+      self._date_time_values_cache = {}
+
+    date_time_values = (
+        year, month, day_of_month, hours, minutes, seconds, iso8601_string)
+    self._date_time_values_cache[lookup_key] = date_time_values
+
+    return date_time_values
+
   def _ReadSourceMappings(self):
     """Reads the source mappings from the sources.config data file."""
     self._source_mappings = {}
@@ -629,3 +706,39 @@ class FieldFormattingHelper(object):
       output_value = '{0!s}'.format(output_value)
 
     return output_value
+
+  def RequiresEventDataStream(self, field_names):
+    """Determines if the event data stream is used to format specific fields.
+
+    Args:
+      field_names (list[str]): names of the fields.
+
+    Returns:
+      bool: True if the event data stream is used to format one or more of
+          the fields.
+    """
+    for field_name in field_names:
+      callback_name = self._FIELD_FORMAT_CALLBACKS.get(field_name, None)
+      if callback_name:
+        if callback_name not in self._EVENT_DATA_STREAM_INDEPENDENT_CALLBACKS:
+          return True
+
+      elif field_name in self._event_data_stream_field_names:
+        return True
+
+    return False
+
+  def RequiresEventTag(self, field_names):
+    """Determines if the event tag is used to format specific fields.
+
+    Args:
+      field_names (list[str]): names of the fields.
+
+    Returns:
+      bool: True if the event tag is used to format one or more of the fields.
+    """
+    for field_name in field_names:
+      if field_name in self._event_tag_field_names:
+        return True
+
+    return False
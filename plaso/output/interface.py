@@ -63,6 +63,28 @@ class OutputModule(object):
     """Opens the output."""
     return
 
+  def RequiresEventDataStream(self):
+    """Determines if the output module requires event data streams.
+
+    Output modules that do not use the event data stream can be passed None
+    instead, which allows the event data streams not to be read from storage.
+
+    Returns:
+      bool: True if the output module requires event data streams.
+    """
+    return True
+
+  def RequiresEventTag(self):
+    """Determines if the output module requires event tags.
+
+    Output modules that do not use the event tag can be passed None instead,
+    which allows the event tags not to be read from storage.
+
+    Returns:
+      bool: True if the output module requires event tags.
+    """
+    return True
+
   def WriteEvent(self, event, event_data, event_data_stream, event_tag):
     """Writes the event to the output.
 
@@ -177,6 +199,22 @@ class TextFileOutputModule(OutputModule):
 
     self._file_object = open(path, 'wt', encoding=self._ENCODING)
 
+  def RequiresEventDataStream(self):
+    """Determines if the output module requires event data streams.
+
+    Returns:
+      bool: True if the output module requires event data streams.
+    """
+    return self._event_formatting_helper.RequiresEventDataStream()
+
+  def RequiresEventTag(self):
+    """Determines if the output module requires event tags.
+
+    Returns:
+      bool: True if the output module requires event tags.
+    """
+    return self._event_formatting_helper.RequiresEventTag()
+
   def WriteEventBody(self, event, event_data, event_data_stream, event_tag):
     """Writes event values to the output.
 
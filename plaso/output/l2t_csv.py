@@ -5,11 +5,6 @@ For documentation on the L2T CSV format see:
 https://forensicswiki.xyz/wiki/index.php?title=L2T_CSV
 """
 
-import datetime
-import pytz
-
-from dfdatetime import posix_time as dfdatetime_posix_time
-
 from plaso.lib import definitions
 from plaso.lib import errors
 from plaso.output import formatting_helper
@@ -101,33 +96,10 @@ class L2TCSVFieldFormattingHelper(formatting_helper.FieldFormattingHelper):
     if not event.timestamp:
       return '00/00/0000'
 
-    date_time = event.date_time
-    if not date_time or date_time.is_local_time:
-      date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
-          timestamp=event.timestamp)
-
-    # Note that GetDateWithTimeOfDay will return the date and time in UTC,
-    # so no adjustment for date_time.time_zone_offset is needed.
-    year, month, day_of_month, hours, minutes, seconds = (
-        date_time.GetDateWithTimeOfDay())
-
-    if self._output_mediator.timezone != pytz.UTC:
-      try:
-        datetime_object = datetime.datetime(
-            year, month, day_of_month, hours, minutes, seconds,
-            tzinfo=pytz.UTC)
-
-        datetime_object = datetime_object.astimezone(
-            self._output_mediator.timezone)
-
-        year = datetime_object.year
-        month = datetime_object.month
-        day_of_month = datetime_object.day
-
-      except (OverflowError, TypeError, ValueError):
-        year, month, day_of_month = (None, None, None)
+    try:
+      year, month, day_of_month, _, _, _, _ = self._GetDateTimeValues(event)
 
-    if None in (year, month, day_of_month):
+    except (OverflowError, TypeError, ValueError):
       self._ReportEventError(event, event_data, (
           'unable to copy timestamp: {0!s} to a human readable date. '
           'Defaulting to: "00/00/0000"').format(event.timestamp))
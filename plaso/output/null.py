@@ -11,6 +11,22 @@ class NullOutputModule(interface.OutputModule):
   NAME = 'null'
   DESCRIPTION = 'Output module that does not output anything.'
 
+  def RequiresEventDataStream(self):
+    """Determines if the output module requires event data streams.
+
+    Returns:
+      bool: True if the output module requires event data streams.
+    """
+    return False
+
+  def RequiresEventTag(self):
+    """Determines if the output module requires event tags.
+
+    Returns:
+      bool: True if the output module requires event tags.
+    """
+    return False
+
   # pylint: disable=unused-argument
   def WriteEventBody(self, event, event_data, event_data_stream, event_tag):
     """Writes event values to the output.
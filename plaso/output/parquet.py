@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""Output module for the Apache Parquet columnar output format."""
+
+import json
+import os
+
+try:
+  import pyarrow
+  from pyarrow import parquet as pyarrow_parquet
+except ImportError:
+  pyarrow = None
+  pyarrow_parquet = None
+
+from plaso.lib import errors
+from plaso.output import dynamic
+from plaso.output import interface
+from plaso.output import manager
+from plaso.serializer import json_serializer
+
+
+class ParquetOutputModule(interface.OutputModule):
+  """Output module for the Apache Parquet columnar output format.
+
+  Events are buffered and written to the output file in row groups, which
+  bounds the memory usage to that of a single row group. Event data
+  attributes that do not have a column of their own are stored as a JSON
+  string in the "attributes" column.
+  """
+
+  NAME = 'parquet'
+  DESCRIPTION = 'Saves the events into an Apache Parquet columnar file.'
+
+  WRITES_OUTPUT_FILE = True
+
+  # Names of the columns with values that repeat frequently and hence are
+  # stored dictionary encoded.
+  _DICTIONARY_COLUMN_NAMES = frozenset([
+      'data_type', 'display_name', 'parser', 'timestamp_desc'])
+
+  # Names of the columns in the order they are written.
+  _COLUMN_NAMES = [
+      'timestamp', 'timestamp_desc', 'data_type', 'parser', 'display_name',
+      'message', 'tag', 'attributes']
+
+  # Event data attributes that are not stored in the "attributes" column.
+  _EXCLUDED_ATTRIBUTE_NAMES = frozenset([
+      '__container_type__', '__type__', 'data_type', 'display_name',
+      'message', 'parser'])
+
+  _JSON_SERIALIZER = json_serializer.JSONAttributeContainerSerializer
+
+  # Number of events per row group.
+  _ROW_GROUP_SIZE = 64 * 1024
+
+  def __init__(self, output_mediator):
+    """Initializes an Apache Parquet output module.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfvfs.
+    """
+    super(ParquetOutputModule, self).__init__(output_mediator)
+    self._column_values = {}
+    self._field_formatting_helper = dynamic.DynamicFieldFormattingHelper(
+        output_mediator)
+    self._number_of_buffered_events = 0
+    self._schema = None
+    self._writer = None
+
+    self._ResetColumnValues()
+
+  def _FlushRowGroup(self):
+    """Writes the buffered events as a row group."""
+    if not self._number_of_buffered_events:
+      return
+
+    arrays = []
+    for column_name in self._COLUMN_NAMES:
+      column_type = self._schema.field(column_name).type
+      column_values = self._column_values[column_name]
+
+      if column_name in self._DICTIONARY_COLUMN_NAMES:
+        array = pyarrow.array(
+            column_values, type=pyarrow.string()).dictionary_encode()
+      else:
+        array = pyarrow.array(column_values, type=column_type)
+
+      arrays.append(array)
+
+    table = pyarrow.Table.from_arrays(arrays, schema=self._schema)
+    self._writer.write_table(table)
+
+    self._ResetColumnValues()
+
+  def _GetColumnValues(self, event, event_data, event_data_stream, event_tag):
+    """Retrieves the column values of an event.
+
+    Args:
+      event (EventObject): event.
+      event_data (EventData): event data.
+      event_data_stream (EventDataStream): event data stream.
+      event_tag (EventTag): event tag.
+
+    Returns:
+      dict[str, object]: values per column name.
+    """
+    display_name = self._field_formatting_helper.GetFormattedField(
+        'display_name', event, event_data, event_data_stream, event_tag)
+
+    try:
+      message = self._field_formatting_helper.GetFormattedField(
+          'message', event, event_data, event_data_stream, event_tag)
+    except (errors.NoFormatterFound, errors.WrongFormatter):
+      message = None
+
+    attributes = self._JSON_SERIALIZER.WriteSerializedDict(event_data)
+
+    if event_data_stream:
+      event_data_stream_json_dict = self._JSON_SERIALIZER.WriteSerializedDict(
+          event_data_stream)
+
+      path_spec = event_data_stream_json_dict.pop('path_spec', None)
+      if path_spec:
+        event_data_stream_json_dict['pathspec'] = path_spec
+
+      attributes.update(event_data_stream_json_dict)
+
+    for attribute_name in self._EXCLUDED_ATTRIBUTE_NAMES:
+      attributes.pop(attribute_name, None)
+
+    labels = getattr(event_tag, 'labels', None) or None
+
+    return {
+        'attributes': json.dumps(attributes, sort_keys=True),
+        'data_type': event_data.data_type,
+        'display_name': display_name,
+        'message': message,
+        'parser': getattr(event_data, 'parser', None),
+        'tag': labels,
+        'timestamp': event.timestamp,
+        'timestamp_desc': event.timestamp_desc}
+
+  def _ResetColumnValues(self):
+    """Resets the buffered column values."""
+    self._column_values = {
+        column_name: [] for column_name in self._COLUMN_NAMES}
+    self._number_of_buffered_events = 0
+
+  def Close(self):
+    """Writes the remaining buffered events and closes the output file."""
+    if self._writer:
+      self._FlushRowGroup()
+      self._writer.close()
+
+    self._writer = None
+
+  def Open(self, path=None, **kwargs):  # pylint: disable=arguments-differ
+    """Opens the output file.
+
+    Args:
+      path (Optional[str]): path of the output file.
+
+    Raises:
+      IOError: if the specified output file already exists.
+      OSError: if the specified output file already exists.
+      ValueError: if path is not set.
+    """
+    if not path:
+      raise ValueError('Missing filename.')
+
+    if os.path.isfile(path):
+      raise IOError((
+          'Unable to use an already existing file for output '
+          '[{0:s}]').format(path))
+
+    dictionary_type = pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+
+    self._schema = pyarrow.schema([
+        ('timestamp', pyarrow.int64()),
+        ('timestamp_desc', dictionary_type),
+        ('data_type', dictionary_type),
+        ('parser', dictionary_type),
+        ('display_name', dictionary_type),
+        ('message', pyarrow.string()),
+        ('tag', pyarrow.list_(pyarrow.string())),
+        ('attributes', pyarrow.string())])
+
+    self._writer = pyarrow_parquet.ParquetWriter(
+        path, self._schema, compression='snappy')
+
+    self._ResetColumnValues()
+
+  def WriteEventBody(self, event, event_data, event_data_stream, event_tag):
+    """Writes event values to the output.
+
+    Args:
+      event (EventObject): event.
+      event_data (EventData): event data.
+      event_data_stream (EventDataStream): event data stream.
+      event_tag (EventTag): event tag.
+    """
+    column_values = self._GetColumnValues(
+        event, event_data, event_data_stream, event_tag)
+
+    for column_name, value in column_values.items():
+      self._column_values[column_name].append(value)
+
+    self._number_of_buffered_events += 1
+
+    if self._number_of_buffered_events >= self._ROW_GROUP_SIZE:
+      self._FlushRowGroup()
+
+
+manager.OutputManager.RegisterOutput(
+    ParquetOutputModule, disabled=pyarrow is None)
@@ -69,6 +69,25 @@ class DSVEventFormattingHelper(formatting_helper.EventFormattingHelper):
     """
     return self._field_delimiter.join(self._field_names)
 
+  def RequiresEventDataStream(self):
+    """Determines if the event data stream is used to format events.
+
+    Returns:
+      bool: True if the event data stream is used to format one or more of
+          the fields to output.
+    """
+    return self._field_formatting_helper.RequiresEventDataStream(
+        self._field_names)
+
+  def RequiresEventTag(self):
+    """Determines if the event tag is used to format events.
+
+    Returns:
+      bool: True if the event tag is used to format one or more of the fields
+          to output.
+    """
+    return self._field_formatting_helper.RequiresEventTag(self._field_names)
+
   def SetFieldDelimiter(self, field_delimiter):
     """Sets the field delimiter.
 
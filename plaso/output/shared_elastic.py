@@ -3,6 +3,9 @@
 
 import logging
 import os
+import queue
+import threading
+import time
 
 from dfdatetime import posix_time as dfdatetime_posix_time
 from dfvfs.serializer.json_serializer import JsonPathSpecSerializer
@@ -140,9 +143,24 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
 
   _DEFAULT_FLUSH_INTERVAL = 1000
 
+  # Number of bulk requests that can be in flight at the same time.
+  _DEFAULT_NUMBER_OF_BULK_REQUESTS = 2
+
   # Number of seconds to wait before a request to Elasticsearch is timed out.
   _DEFAULT_REQUEST_TIMEOUT = 300
 
+  # Maximum number of times a bulk request, or the documents rejected by
+  # a bulk request, is retried.
+  _MAXIMUM_NUMBER_OF_RETRIES = 5
+
+  # Number of seconds to wait before the first retry, which is doubled for
+  # every subsequent retry.
+  _RETRY_WAIT_TIME = 1.0
+
+  # HTTP status codes of requests and documents that Elasticsearch rejected
+  # temporarily, such as when its write queue is full.
+  _RETRY_STATUS_CODES = frozenset([429, 502, 503, 504])
+
   _DEFAULT_FIELD_NAMES = [
       'datetime',
       'display_name',
@@ -161,6 +179,9 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
           modules and other components, such as storage and dfvfs.
     """
     super(SharedElasticsearchOutputModule, self).__init__(output_mediator)
+    self._bulk_request_queue = None
+    self._bulk_request_threads = []
+    self._bulk_requests_start_time = None
     self._client = None
     self._event_documents = []
     self._field_names = self._DEFAULT_FIELD_NAMES
@@ -171,7 +192,15 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
     self._index_name = None
     self._mappings = None
     self._number_of_buffered_events = 0
+    self._number_of_bulk_requests = self._DEFAULT_NUMBER_OF_BULK_REQUESTS
     self._password = None
+    self._retry_wait_time = self._RETRY_WAIT_TIME
+    self._statistics_lock = threading.Lock()
+    self._statistics = {
+        'failed_events': 0,
+        'indexed_events': 0,
+        'bulk_requests': 0,
+        'retried_events': 0}
     self._port = None
     self._username = None
     self._use_ssl = None
@@ -198,11 +227,14 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
     if self._username is not None:
       elastic_http_auth = (self._username, self._password)
 
+    # Note that the connection pool needs a connection per concurrent bulk
+    # request.
     self._client = elasticsearch.Elasticsearch(
         [elastic_host],
         http_auth=elastic_http_auth,
         use_ssl=self._use_ssl,
-        ca_certs=self._ca_certs)
+        ca_certs=self._ca_certs,
+        maxsize=max(self._number_of_bulk_requests, 10))
 
     logger.debug((
         'Connected to Elasticsearch server: {0:s} port: {1:d} URL prefix: '
@@ -228,26 +260,124 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
           'Unable to create Elasticsearch index with error: {0!s}'.format(
               exception))
 
-  def _FlushEvents(self):
-    """Inserts the buffered event documents into Elasticsearch."""
-    try:
-      # pylint: disable=unexpected-keyword-arg
-      bulk_arguments = {
-          'body': self._event_documents,
-          'index': self._index_name,
-          'request_timeout': self._DEFAULT_REQUEST_TIMEOUT}
+  def _BulkIndexEvents(self, event_documents):
+    """Inserts event documents into Elasticsearch with a bulk request.
+
+    Bulk requests that failed and documents that were rejected temporarily,
+    for example because the write queue of Elasticsearch is full, are
+    retried with an exponential back-off.
+
+    Args:
+      event_documents (list[dict[str, object]]): event documents, as pairs of
+          action and event values.
+    """
+    number_of_failed_events = 0
+    number_of_indexed_events = 0
+    number_of_retried_events = 0
+    number_of_retries = 0
+
+    while event_documents:
+      retry_event_documents = []
+
+      try:
+        # pylint: disable=unexpected-keyword-arg
+        response = self._client.bulk(
+            body=event_documents, index=self._index_name,
+            request_timeout=self._DEFAULT_REQUEST_TIMEOUT)
+
+      except elasticsearch.exceptions.TransportError as exception:
+        if (isinstance(exception, elasticsearch.exceptions.ConnectionError) or
+            exception.status_code in self._RETRY_STATUS_CODES):
+          retry_event_documents = event_documents
+        else:
+          logger.warning('Unable to bulk insert with error: {0!s}'.format(
+              exception))
+          number_of_failed_events += len(event_documents) // 2
+
+      except (
+          ValueError,
+          elasticsearch.exceptions.ElasticsearchException) as exception:
+        logger.warning('Unable to bulk insert with error: {0!s}'.format(
+            exception))
+        number_of_failed_events += len(event_documents) // 2
+
+      else:
+        if not response.get('errors', False):
+          number_of_indexed_events += len(event_documents) // 2
+
+        else:
+          for item_index, item in enumerate(response.get('items', [])):
+            item_values = next(iter(item.values()), {})
+            status_code = item_values.get('status', 200)
+
+            if status_code < 300:
+              number_of_indexed_events += 1
+
+            elif status_code in self._RETRY_STATUS_CODES:
+              document_index = item_index * 2
+              retry_event_documents.extend(
+                  event_documents[document_index:document_index + 2])
+
+            else:
+              logger.warning((
+                  'Unable to insert event with status: {0:d} and error: '
+                  '{1!s}').format(status_code, item_values.get('error', None)))
+              number_of_failed_events += 1
+
+      if retry_event_documents:
+        if number_of_retries >= self._MAXIMUM_NUMBER_OF_RETRIES:
+          logger.warning((
+              'Unable to insert {0:d} events after {1:d} retries.').format(
+                  len(retry_event_documents) // 2, number_of_retries))
+          number_of_failed_events += len(retry_event_documents) // 2
+          break
+
+        time.sleep(self._retry_wait_time * (2 ** number_of_retries))
+
+        number_of_retried_events += len(retry_event_documents) // 2
+        number_of_retries += 1
 
-      self._client.bulk(**bulk_arguments)
+      event_documents = retry_event_documents
 
-    except (
-        ValueError,
-        elasticsearch.exceptions.ElasticsearchException) as exception:
-      # Ignore problematic events
-      logger.warning('Unable to bulk insert with error: {0!s}'.format(
-          exception))
+    with self._statistics_lock:
+      self._statistics['bulk_requests'] += number_of_retries + 1
+      self._statistics['failed_events'] += number_of_failed_events
+      self._statistics['indexed_events'] += number_of_indexed_events
+      self._statistics['retried_events'] += number_of_retried_events
 
     logger.debug('Inserted {0:d} events into Elasticsearch'.format(
-        self._number_of_buffered_events))
+        number_of_indexed_events))
+
+  def _BulkIndexEventsThread(self):
+    """Inserts event documents from the bulk request queue.
+
+    The thread stops when it dequeues None.
+    """
+    event_documents = self._bulk_request_queue.get()
+    while event_documents:
+      try:
+        self._BulkIndexEvents(event_documents)
+
+      except Exception as exception:  # pylint: disable=broad-except
+        logger.exception('Unable to bulk insert with error: {0!s}'.format(
+            exception))
+
+        with self._statistics_lock:
+          self._statistics['failed_events'] += len(event_documents) // 2
+
+      event_documents = self._bulk_request_queue.get()
+
+  def _FlushEvents(self):
+    """Queues the buffered event documents for insertion into Elasticsearch.
+
+    The event documents are inserted by bulk request threads. To bound
+    the memory usage, this method blocks when the bulk request queue is full.
+    """
+    if self._event_documents:
+      if not self._bulk_request_threads:
+        self._StartBulkRequestThreads()
+
+      self._bulk_request_queue.put(self._event_documents)
 
     self._event_documents = []
     self._number_of_buffered_events = 0
@@ -352,6 +482,33 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
 
     return field
 
+  def _StartBulkRequestThreads(self):
+    """Starts the bulk request threads."""
+    # Every bulk request thread can have a bulk request in flight and one
+    # queued.
+    self._bulk_request_queue = queue.Queue(
+        maxsize=self._number_of_bulk_requests)
+    self._bulk_requests_start_time = time.time()
+
+    for _ in range(self._number_of_bulk_requests):
+      bulk_request_thread = threading.Thread(
+          name='elasticsearch_bulk_request',
+          target=self._BulkIndexEventsThread)
+      bulk_request_thread.daemon = True
+      bulk_request_thread.start()
+      self._bulk_request_threads.append(bulk_request_thread)
+
+  def _StopBulkRequestThreads(self):
+    """Stops the bulk request threads after the queue has been processed."""
+    for _ in self._bulk_request_threads:
+      self._bulk_request_queue.put(None)
+
+    for bulk_request_thread in self._bulk_request_threads:
+      bulk_request_thread.join()
+
+    self._bulk_request_queue = None
+    self._bulk_request_threads = []
+
   def Close(self):
     """Closes connection to Elasticsearch.
 
@@ -359,6 +516,24 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
     """
     self._FlushEvents()
 
+    if self._bulk_request_threads:
+      self._StopBulkRequestThreads()
+
+      elapsed_time = time.time() - self._bulk_requests_start_time
+
+      events_per_second = 0.0
+      if elapsed_time > 0.0:
+        events_per_second = self._statistics['indexed_events'] / elapsed_time
+
+      logger.info((
+          'Inserted {0:d} events into Elasticsearch with {1:d} bulk requests '
+          'at {2:.1f} events per second, {3:d} events were retried and {4:d} '
+          'events failed.').format(
+              self._statistics['indexed_events'],
+              self._statistics['bulk_requests'], events_per_second,
+              self._statistics['retried_events'],
+              self._statistics['failed_events']))
+
     self._client = None
 
   def SetFields(self, field_names):
@@ -396,6 +571,17 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
     """
     self._mappings = mappings
 
+  def SetNumberOfBulkRequests(self, number_of_bulk_requests):
+    """Sets the number of concurrent bulk requests.
+
+    Args:
+      number_of_bulk_requests (int): number of bulk requests that can be in
+          flight at the same time.
+    """
+    self._number_of_bulk_requests = number_of_bulk_requests
+    logger.debug('Elasticsearch number of bulk requests: {0:d}'.format(
+        number_of_bulk_requests))
+
   def SetPassword(self, password):
     """Sets the password.
 
@@ -56,6 +56,8 @@ class ApacheAccessParser(text_parser.PyparsingSingleLineTextParser):
   NAME = 'apache_access'
   DATA_FORMAT = 'Apache access log (access.log) file'
 
+  _PARSE_RANGES_SUPPORTED = True
+
   MAX_LINE_LENGTH = 2048
 
   # Date format [18/Sep/2011:19:18:28 -0400]
@@ -163,6 +165,63 @@ class ApacheAccessParser(text_parser.PyparsingSingleLineTextParser):
 
   _SUPPORTED_KEYS = frozenset([key for key, _ in LINE_STRUCTURES])
 
+  _DATE_TIME_REGULAR_EXPRESSION = (
+      r'\[(?P<day>[0-9]{2})/(?P<month>[A-Za-z]{3})/(?P<year>[0-9]{4}):'
+      r'(?P<hours>[0-9]{2}):(?P<minutes>[0-9]{2}):(?P<seconds>[0-9]{2}) '
+      r'(?P<time_offset>[-+][0-9]{4})\]')
+
+  _IP_ADDRESS_REGULAR_EXPRESSION = (
+      r'(?P<ip_address>(?:25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})'
+      r'(?:\.(?:25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})){3})')
+
+  # The quoted strings match up to the first occurrence of the end quote,
+  # equivalent to pyparsing.SkipTo.
+  _COMMON_LOG_FORMAT_REGULAR_EXPRESSION = (
+      _IP_ADDRESS_REGULAR_EXPRESSION +
+      r' (?P<remote_name>[A-Za-z0-9]+|-) (?P<user_name>[A-Za-z0-9]+|-) ' +
+      _DATE_TIME_REGULAR_EXPRESSION +
+      r' "[ \t\r\n]*(?P<http_request>(?:[^"]|"(?! ))*)" '
+      r'(?P<response_code>[0-9]+) (?P<response_bytes>-|[0-9]+)')
+
+  _COMBINED_LOG_FORMAT_REGULAR_EXPRESSION = (
+      _COMMON_LOG_FORMAT_REGULAR_EXPRESSION +
+      r' "[ \t\r\n]*(?P<referer>(?:[^"]|"(?! ))*)" '
+      r'"[ \t\r\n]*(?P<user_agent>[^"]*)"')
+
+  _VHOST_COMBINED_LOG_FORMAT_REGULAR_EXPRESSION = (
+      r'(?P<server_name>[A-Za-z0-9.-]+):(?P<port_number>[0-9]+) ' +
+      _COMBINED_LOG_FORMAT_REGULAR_EXPRESSION)
+
+  _LINE_END_REGULAR_EXPRESSION = r'[ \t\r]*(?:\n|\Z)'
+
+  _CONVERTERS = {
+      'day': int,
+      'hours': int,
+      'minutes': int,
+      'port_number': int,
+      'response_bytes': lambda value: value if value == '-' else int(value),
+      'response_code': int,
+      'seconds': int,
+      'year': int}
+
+  _GROUPS = {
+      'date_time': [
+          'day', 'month', 'year', 'hours', 'minutes', 'seconds',
+          'time_offset']}
+
+  _LINE_STRUCTURE_REGULAR_EXPRESSIONS = {
+      'combined_log_format': text_parser.LineStructureRegularExpression(
+          _COMBINED_LOG_FORMAT_REGULAR_EXPRESSION +
+          _LINE_END_REGULAR_EXPRESSION,
+          converters=_CONVERTERS, groups=_GROUPS),
+      'common_log_format': text_parser.LineStructureRegularExpression(
+          _COMMON_LOG_FORMAT_REGULAR_EXPRESSION + _LINE_END_REGULAR_EXPRESSION,
+          converters=_CONVERTERS, groups=_GROUPS),
+      'vhost_combined_log_format': text_parser.LineStructureRegularExpression(
+          _VHOST_COMBINED_LOG_FORMAT_REGULAR_EXPRESSION +
+          _LINE_END_REGULAR_EXPRESSION,
+          converters=_CONVERTERS, groups=_GROUPS)}
+
   def _GetDateTime(self, structure):
     """Retrieves the date and time from a date and time values structure.
 
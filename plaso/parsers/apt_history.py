@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Parser for Advanced Packaging Tool (APT) History log files."""
 
+import re
+
 import pyparsing
 
 from dfdatetime import time_elements as dfdatetime_time_elements
@@ -47,6 +49,8 @@ class APTHistoryLogParser(text_parser.PyparsingSingleLineTextParser):
 
   _ENCODING = 'utf-8'
 
+  _VERIFICATION_REGEX = re.compile(r'\s*Start-Date:')
+
   _HYPHEN = text_parser.PyparsingConstants.HYPHEN
 
   _FOUR_DIGITS = text_parser.PyparsingConstants.FOUR_DIGITS
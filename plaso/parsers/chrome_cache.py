@@ -332,43 +332,82 @@ class ChromeCacheParser(interface.FileEntryParser):
       data_block_files (dict[str: file]): look up table for the data block
           file-like object handles.
     """
-    # Parse the cache entries in the data block files.
-    for cache_address in index_table:
-      cache_address_chain_length = 0
-      while cache_address.value != 0:
-        if cache_address_chain_length >= 64:
-          parser_mediator.ProduceExtractionWarning(
-              'Maximum allowed cache address chain length reached.')
-          break
-
-        data_block_file_object = data_block_files.get(
-            cache_address.filename, None)
-        if not data_block_file_object:
-          message = 'Cache address: 0x{0:08x} missing data file.'.format(
-              cache_address.value)
-          parser_mediator.ProduceExtractionWarning(message)
-          break
+    # The cache entries are parsed in rounds, where a round contains the
+    # cache entries referenced by the index table or by the cache entries
+    # of the previous round. Within a round the cache entries are parsed in
+    # order of data block file and offset, such that the data block files
+    # are read sequentially instead of following each hash chain.
+    pending_cache_addresses = [
+        (cache_address, 0) for cache_address in index_table
+        if cache_address.value != 0]
 
-        try:
-          cache_entry = self._data_block_file_parser.ParseCacheEntry(
-              data_block_file_object, cache_address.block_offset)
-        except (IOError, errors.ParseError) as exception:
-          parser_mediator.ProduceExtractionWarning(
-              'Unable to parse cache entry with error: {0!s}'.format(
-                  exception))
-          break
-
-        event_data = ChromeCacheEntryEventData()
-        event_data.original_url = cache_entry.original_url
-
-        date_time = dfdatetime_webkit_time.WebKitTime(
-            timestamp=cache_entry.creation_time)
-        event = time_events.DateTimeValuesEvent(
-            date_time, definitions.TIME_DESCRIPTION_LAST_VISITED)
-        parser_mediator.ProduceEventWithEventData(event, event_data)
-
-        cache_address = cache_entry.next
-        cache_address_chain_length += 1
+    number_of_cache_entries = 0
+
+    parser_mediator.SampleStartItemsTiming(self.NAME)
+
+    try:
+      while pending_cache_addresses:
+        pending_cache_addresses.sort(key=self._GetCacheAddressSortKey)
+
+        next_cache_addresses = []
+        for cache_address, cache_address_chain_length in (
+            pending_cache_addresses):
+          if cache_address_chain_length >= 64:
+            parser_mediator.ProduceExtractionWarning(
+                'Maximum allowed cache address chain length reached.')
+            continue
+
+          data_block_file_object = data_block_files.get(
+              cache_address.filename, None)
+          if not data_block_file_object:
+            message = 'Cache address: 0x{0:08x} missing data file.'.format(
+                cache_address.value)
+            parser_mediator.ProduceExtractionWarning(message)
+            continue
+
+          try:
+            cache_entry = self._data_block_file_parser.ParseCacheEntry(
+                data_block_file_object, cache_address.block_offset)
+          except (IOError, errors.ParseError) as exception:
+            parser_mediator.ProduceExtractionWarning(
+                'Unable to parse cache entry with error: {0!s}'.format(
+                    exception))
+            continue
+
+          event_data = ChromeCacheEntryEventData()
+          event_data.original_url = cache_entry.original_url
+
+          date_time = dfdatetime_webkit_time.WebKitTime(
+              timestamp=cache_entry.creation_time)
+          event = time_events.DateTimeValuesEvent(
+              date_time, definitions.TIME_DESCRIPTION_LAST_VISITED)
+          parser_mediator.ProduceEventWithEventData(event, event_data)
+
+          number_of_cache_entries += 1
+
+          if cache_entry.next.value != 0:
+            next_cache_addresses.append(
+                (cache_entry.next, cache_address_chain_length + 1))
+
+        pending_cache_addresses = next_cache_addresses
+
+    finally:
+      parser_mediator.SampleStopItemsTiming(
+          self.NAME, number_of_cache_entries)
+
+  def _GetCacheAddressSortKey(self, pending_cache_address):
+    """Retrieves the key to sort a pending cache address.
+
+    Args:
+      pending_cache_address (tuple[CacheAddress, int]): cache address and
+          its hash chain length.
+
+    Returns:
+      tuple[str, int]: name of the data block file and offset within the data
+          block file.
+    """
+    cache_address = pending_cache_address[0]
+    return cache_address.filename or '', cache_address.block_offset or 0
 
   def _ParseIndexTable(
       self, parser_mediator, file_system, file_entry, index_table):
@@ -60,6 +60,8 @@ class DpkgParser(text_parser.PyparsingSingleLineTextParser):
 
   _ENCODING = 'utf-8'
 
+  _PARSE_RANGES_SUPPORTED = True
+
   _DPKG_STARTUP = 'startup'
   _DPKG_STATUS = 'status'
   _DPKG_CONFFILE = 'conffile'
@@ -125,6 +127,30 @@ class DpkgParser(text_parser.PyparsingSingleLineTextParser):
 
   LINE_STRUCTURES = [('line', _DPKG_LOG_LINE)]
 
+  _DPKG_LOG_LINE_REGULAR_EXPRESSION = (
+      r'(?P<year>[0-9]{4})-(?P<month>[0-9]{2})-(?P<day_of_month>[0-9]{2}) '
+      r'(?P<hours>[0-9]{2}):(?P<minutes>[0-9]{2}):(?P<seconds>[0-9]{2}) '
+      r'(?P<body>'
+      r'startup (?:archives|packages) '
+      r'(?:unpack|install|configure|triggers-only|remove|purge)|'
+      r'status [!-~]+ [!-~]+ [!-~]+|'
+      r'(?:install|upgrade|configure|trigproc|disappear|remove|purge) '
+      r'[!-~]+ [!-~]+ [!-~]+|'
+      r'conffile [!-~]+ (?:install|keep))')
+
+  _LINE_STRUCTURE_REGULAR_EXPRESSIONS = {
+      'line': text_parser.LineStructureRegularExpression(
+          _DPKG_LOG_LINE_REGULAR_EXPRESSION, converters={
+              'day_of_month': int,
+              'hours': int,
+              'minutes': int,
+              'month': int,
+              'seconds': int,
+              'year': int},
+          groups={'date_time': [
+              'year', 'month', 'day_of_month', 'hours', 'minutes',
+              'seconds']})}
+
   def ParseRecord(self, parser_mediator, key, structure):
     """Parses a structure of tokens derived from a line of a text file.
 
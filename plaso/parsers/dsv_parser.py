@@ -5,9 +5,8 @@ import abc
 import csv
 import os
 
-from dfvfs.helpers import text_file
-
 from plaso.lib import errors
+from plaso.lib import line_reader_file
 from plaso.lib import specification
 from plaso.parsers import interface
 
@@ -47,13 +46,17 @@ class DSVParser(interface.FileObjectParser):
 
   _ENCODING = None
 
+  # The maximum line length, which is limited so that a file without lines,
+  # such as a binary file, is not read into memory at once.
+  _MAXIMUM_LINE_LENGTH = 16 * 1024 * 1024 - 1
+
   def __init__(self):
     """Initializes a delimiter separated values (DSV) parser."""
     super(DSVParser, self).__init__()
     self._encoding = self._ENCODING
     self._end_of_line = '\n'
-    self._maximum_line_length = (
-        len(self._end_of_line) +
+    self._maximum_line_length = min(
+        self._MAXIMUM_LINE_LENGTH, len(self._end_of_line) +
         len(self.COLUMNS) * (self.FIELD_SIZE_LIMIT + len(self.DELIMITER)))
 
   def _CreateDictReader(self, line_reader):
@@ -83,7 +86,8 @@ class DSVParser(interface.FileObjectParser):
 
     return csv_dict_reader
 
-  def _CreateLineReader(self, file_object, encoding=None):
+  def _CreateLineReader(
+      self, file_object, encoding=None, maximum_line_length=None):
     """Creates an object that reads lines from a text file.
 
     The line reader is advanced to the beginning of the DSV content, skipping
@@ -93,29 +97,25 @@ class DSVParser(interface.FileObjectParser):
       file_object (dfvfs.FileIO): file-like object.
       encoding (Optional[str]): encoding used in the DSV file, where None
           indicates the codepage of the parser mediator should be used.
+      maximum_line_length (Optional[int]): maximum size of a line in bytes,
+          where longer lines are split into multiple lines. None represents
+          no maximum.
 
     Returns:
-      TextFile: an object that implements an iterator over lines in a text file.
+      TextLineReader: an object that implements an iterator over lines in
+          a text file.
 
     Raises:
       UnicodeDecodeError: if the file cannot be read with the specified
           encoding.
     """
-    line_reader = text_file.TextFile(
-        file_object, encoding=encoding, end_of_line=self._end_of_line)
-
-    # pylint: disable=protected-access
-    maximum_read_buffer_size = line_reader._MAXIMUM_READ_BUFFER_SIZE
-
-    # Line length is one less than the maximum read buffer size so that we
-    # tell if there's a line that doesn't end at the end before the end of
-    # the file.
-    if self._maximum_line_length > maximum_read_buffer_size:
-      self._maximum_line_length = maximum_read_buffer_size - 1
+    line_reader = line_reader_file.TextLineReader(
+        file_object, encoding=encoding, end_of_line=self._end_of_line,
+        maximum_line_length=maximum_line_length)
 
     # If we specifically define a number of lines we should skip, do that here.
     for _ in range(0, self.NUMBER_OF_HEADER_LINES):
-      line_reader.readline(self._maximum_line_length)
+      line_reader.readline()
     return line_reader
 
   def _HasExpectedLineLength(self, file_object, encoding=None):
@@ -138,10 +138,12 @@ class DSVParser(interface.FileObjectParser):
 
     # Attempt to read a line that is longer than any line that should be in
     # the file.
-    line_reader = self._CreateLineReader(file_object, encoding=encoding)
+    line_reader = self._CreateLineReader(
+        file_object, encoding=encoding,
+        maximum_line_length=self._maximum_line_length + 1)
 
     for _ in range(0, 20):
-      sample_line = line_reader.readline(self._maximum_line_length + 1)
+      sample_line = line_reader.readline()
       if len(sample_line) > self._maximum_line_length:
         result = False
         break
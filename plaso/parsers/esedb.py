@@ -17,6 +17,7 @@ class ESEDatabase(object):
     """Initializes a Extensible Storage Engine (ESE) database."""
     super(ESEDatabase, self).__init__()
     self._esedb_file = None
+    self._table_indexes = {}
     self._table_names = []
 
   @property
@@ -33,6 +34,23 @@ class ESEDatabase(object):
     self._esedb_file.close()
     self._esedb_file = None
 
+  def GetTableIndexByName(self, name):
+    """Retrieves the index of a table by its name.
+
+    Args:
+      name (str): name of the table.
+
+    Returns:
+      int: index of the table with the corresponding name or None if there is
+          no table with the name.
+    """
+    if not self._table_indexes:
+      self._table_indexes = {
+          table_name: table_index
+          for table_index, table_name in enumerate(self.tables)}
+
+    return self._table_indexes.get(name, None)
+
   def GetTableByName(self, name):
     """Retrieves a table by its name.
 
@@ -97,6 +115,75 @@ class ESEDBParser(interface.FileObjectParser):
     format_specification.AddNewSignature(b'\xef\xcd\xab\x89', offset=4)
     return format_specification
 
+  def GetParseRanges(self, parser_mediator, file_object, maximum_range_size):
+    """Retrieves ranges of the file that can be parsed independently.
+
+    A range consists of consecutive tables of the database, where the ranges
+    are determined such that they contain a similar number of records.
+
+    Args:
+      parser_mediator (ParserMediator): a parser mediator.
+      file_object (dvfvs.FileIO): a file-like object.
+      maximum_range_size (int): maximum size of a range in bytes.
+
+    Returns:
+      list[tuple[int, int]]: first and last (exclusive) table index of
+          the ranges or None if the file should not be parsed in ranges.
+    """
+    file_size = file_object.get_size()
+    if not maximum_range_size or file_size <= maximum_range_size:
+      return None
+
+    database = ESEDatabase()
+
+    try:
+      database.Open(file_object)
+    except (IOError, ValueError):
+      return None
+
+    try:
+      if not any(plugin.CheckRequiredTables(database)
+                 for plugin in self._plugins):
+        return None
+
+      number_of_records_per_table = [
+          database.GetTableByName(table_name).number_of_records
+          for table_name in database.tables]
+
+    finally:
+      database.Close()
+
+    number_of_tables = len(number_of_records_per_table)
+    number_of_records = sum(number_of_records_per_table)
+
+    number_of_ranges = min(
+        (file_size + maximum_range_size - 1) // maximum_range_size,
+        number_of_tables)
+    if number_of_ranges < 2 or not number_of_records:
+      return None
+
+    parse_ranges = []
+    first_table_index = 0
+    cumulative_number_of_records = 0
+    for table_index, number_of_table_records in enumerate(
+        number_of_records_per_table):
+      cumulative_number_of_records += number_of_table_records
+
+      range_index = len(parse_ranges)
+      if (range_index < number_of_ranges - 1 and
+          cumulative_number_of_records * number_of_ranges >= (
+              number_of_records * (range_index + 1))):
+        parse_ranges.append((first_table_index, table_index + 1))
+        first_table_index = table_index + 1
+
+    if first_table_index < number_of_tables:
+      parse_ranges.append((first_table_index, number_of_tables))
+
+    if len(parse_ranges) < 2:
+      return None
+
+    return parse_ranges
+
   def ParseFileObject(self, parser_mediator, file_object):
     """Parses an ESE database file-like object.
 
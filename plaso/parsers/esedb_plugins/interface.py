@@ -44,6 +44,12 @@ class ESEDBPlugin(plugins.BasePlugin, dtfabric_helper.DtFabricHelper):
   REQUIRED_TABLES = {}
   OPTIONAL_TABLES = {}
 
+  # Names of the tables of which the callback method is called regardless
+  # of the parse range, for example when the table references other tables
+  # that can be in the parse range. The callback method is responsible for
+  # checking the parse range.
+  _PARSE_RANGE_INDEPENDENT_TABLES = frozenset()
+
   # The dtFabric definition file.
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'types.yaml')
@@ -257,6 +263,29 @@ class ESEDBPlugin(plugins.BasePlugin, dtfabric_helper.DtFabricHelper):
 
     return record_values
 
+  def _IsTableInParseRange(self, parser_mediator, database, table_name):
+    """Determines if a table is in the parse range.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      database (ESEDatabase): ESE database.
+      table_name (str): name of the table.
+
+    Returns:
+      bool: True if the table is in the parse range or if no parse range is
+          set, False otherwise.
+    """
+    if not parser_mediator.parse_range:
+      return True
+
+    table_index = database.GetTableIndexByName(table_name)
+    if table_index is None:
+      return False
+
+    first_table_index, last_table_index = parser_mediator.parse_range
+    return first_table_index <= table_index < last_table_index
+
   def _ParseESEDatabase(
       self, parser_mediator, cache=None, database=None, **kwargs):
     """Extracts event objects from the database.
@@ -296,6 +325,10 @@ class ESEDBPlugin(plugins.BasePlugin, dtfabric_helper.DtFabricHelper):
               self.NAME, table_name))
         continue
 
+      if (table_name not in self._PARSE_RANGE_INDEPENDENT_TABLES and
+          not self._IsTableInParseRange(parser_mediator, database, table_name)):
+        continue
+
       # The database is passed in case the database contains table names
       # that are assigned dynamically and cannot be defined by
       # the table name-callback mechanism.
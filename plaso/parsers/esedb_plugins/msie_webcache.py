@@ -133,6 +133,9 @@ class MsieWebCacheESEDBPlugin(interface.ESEDBPlugin):
       'Partitions': 'ParsePartitionsTable',
       'PartitionsEx': 'ParsePartitionsTable'}
 
+  # The Containers table references the Container_# tables.
+  _PARSE_RANGE_INDEPENDENT_TABLES = frozenset(['Containers'])
+
   _CONTAINER_TABLE_VALUE_MAPPINGS = {
       'RequestHeaders': '_ConvertHeadersValues',
       'ResponseHeaders': '_ConvertHeadersValues'}
@@ -280,6 +283,34 @@ class MsieWebCacheESEDBPlugin(interface.ESEDBPlugin):
               date_time, 'Post check time')
           parser_mediator.ProduceEventWithEventData(event, event_data)
 
+  def _ParseContainersRecord(self, parser_mediator, record_values):
+    """Parses a Containers table record.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      record_values (dict[str,object]): values per column name.
+    """
+    event_data = MsieWebCacheContainersEventData()
+    event_data.container_identifier = record_values.get('ContainerId', None)
+    event_data.directory = record_values.get('Directory', None)
+    event_data.name = record_values.get('Name', None)
+    event_data.set_identifier = record_values.get('SetId', None)
+
+    timestamp = record_values.get('LastScavengeTime', None)
+    if timestamp:
+      date_time = dfdatetime_filetime.Filetime(timestamp=timestamp)
+      event = time_events.DateTimeValuesEvent(
+          date_time, 'Last Scavenge Time')
+      parser_mediator.ProduceEventWithEventData(event, event_data)
+
+    timestamp = record_values.get('LastAccessTime', None)
+    if timestamp:
+      date_time = dfdatetime_filetime.Filetime(timestamp=timestamp)
+      event = time_events.DateTimeValuesEvent(
+          date_time, definitions.TIME_DESCRIPTION_LAST_ACCESS)
+      parser_mediator.ProduceEventWithEventData(event, event_data)
+
   def ParseContainersTable(
       self, parser_mediator, database=None, table=None, **unused_kwargs):
     """Parses a Containers table.
@@ -299,6 +330,12 @@ class MsieWebCacheESEDBPlugin(interface.ESEDBPlugin):
     if table is None:
       raise ValueError('Missing table value.')
 
+    # The Containers table is parsed regardless of the parse range to
+    # determine the Container_# tables, but its events are only produced
+    # when it is in the parse range.
+    produce_events = self._IsTableInParseRange(
+        parser_mediator, database, table.name)
+
     for record_index, esedb_record in enumerate(table.records):
       if parser_mediator.abort:
         break
@@ -306,25 +343,8 @@ class MsieWebCacheESEDBPlugin(interface.ESEDBPlugin):
       record_values = self._GetRecordValues(
           parser_mediator, table.name, record_index, esedb_record)
 
-      event_data = MsieWebCacheContainersEventData()
-      event_data.container_identifier = record_values.get('ContainerId', None)
-      event_data.directory = record_values.get('Directory', None)
-      event_data.name = record_values.get('Name', None)
-      event_data.set_identifier = record_values.get('SetId', None)
-
-      timestamp = record_values.get('LastScavengeTime', None)
-      if timestamp:
-        date_time = dfdatetime_filetime.Filetime(timestamp=timestamp)
-        event = time_events.DateTimeValuesEvent(
-            date_time, 'Last Scavenge Time')
-        parser_mediator.ProduceEventWithEventData(event, event_data)
-
-      timestamp = record_values.get('LastAccessTime', None)
-      if timestamp:
-        date_time = dfdatetime_filetime.Filetime(timestamp=timestamp)
-        event = time_events.DateTimeValuesEvent(
-            date_time, definitions.TIME_DESCRIPTION_LAST_ACCESS)
-        parser_mediator.ProduceEventWithEventData(event, event_data)
+      if produce_events:
+        self._ParseContainersRecord(parser_mediator, record_values)
 
       container_identifier = record_values.get('ContainerId', None)
       container_name = record_values.get('Name', None)
@@ -333,12 +353,16 @@ class MsieWebCacheESEDBPlugin(interface.ESEDBPlugin):
         continue
 
       if container_name in self._IGNORED_CONTAINER_NAMES:
-        parser_mediator.ProduceExtractionWarning(
-            'Skipped container (ContainerId: {0:d}, Name: {1:s})'.format(
-                container_identifier, container_name))
+        if produce_events:
+          parser_mediator.ProduceExtractionWarning(
+              'Skipped container (ContainerId: {0:d}, Name: {1:s})'.format(
+                  container_identifier, container_name))
         continue
 
       table_name = 'Container_{0:d}'.format(container_identifier)
+      if not self._IsTableInParseRange(parser_mediator, database, table_name):
+        continue
+
       esedb_table = database.GetTableByName(table_name)
       if esedb_table:
         self._ParseContainerTable(parser_mediator, esedb_table, container_name)
@@ -350,17 +350,28 @@ class FirefoxCacheParser(
 
     file_object.seek(firefox_config.first_record_offset)
 
-    while file_object.get_offset() < file_object.get_size():
-      try:
-        self._ParseCacheEntry(
-            parser_mediator, file_object, display_name,
-            firefox_config.block_size)
+    number_of_cache_entries = 0
 
-      except IOError:
-        file_offset = file_object.get_offset() - self._MINIMUM_BLOCK_SIZE
-        logger.debug((
-            '[{0:s}] Invalid cache record in file: {1:s} at offset: '
-            '{2:d}.').format(self.NAME, display_name, file_offset))
+    parser_mediator.SampleStartItemsTiming(self.NAME)
+
+    try:
+      while file_object.get_offset() < file_object.get_size():
+        try:
+          self._ParseCacheEntry(
+              parser_mediator, file_object, display_name,
+              firefox_config.block_size)
+
+          number_of_cache_entries += 1
+
+        except IOError:
+          file_offset = file_object.get_offset() - self._MINIMUM_BLOCK_SIZE
+          logger.debug((
+              '[{0:s}] Invalid cache record in file: {1:s} at offset: '
+              '{2:d}.').format(self.NAME, display_name, file_offset))
+
+    finally:
+      parser_mediator.SampleStopItemsTiming(
+          self.NAME, number_of_cache_entries)
 
 
 class FirefoxCache2Parser(
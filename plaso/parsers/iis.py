@@ -5,6 +5,8 @@ More documentation on fields can be found here:
 https://msdn.microsoft.com/en-us/library/ms525807(v=vs.90).aspx
 """
 
+import re
+
 import pyparsing
 
 from dfdatetime import time_elements as dfdatetime_time_elements
@@ -192,6 +194,9 @@ class WinIISParser(text_parser.PyparsingSingleLineTextParser):
   # Define a signature value for the log file.
   _SIGNATURE = '#Software: Microsoft Internet Information Services'
 
+  _VERIFICATION_REGEX = re.compile(
+      '.*{0:s}'.format(re.escape(_SIGNATURE)), re.DOTALL)
+
   # Per https://msdn.microsoft.com/en-us/library/ms525807(v=vs.90).aspx:
   # "log file format(s) are all ASCII text formats (unless UTF-8 is enabled for
   #  your Web sites)
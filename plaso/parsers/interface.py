@@ -51,6 +51,109 @@ class FileNameFileEntryFilter(BaseFileEntryFilter):
     return filename == self._filename
 
 
+class FileHead(object):
+  """The head of a file.
+
+  The head of a file is read once and shared by parsers to cheaply determine
+  if they can parse the file. The head behaves like a file-like object of
+  which only the first bytes are available.
+
+  Attributes:
+    cached_values (dict[object, object]): values that parsers derived from
+        the head, such as the first line, which can be reused by parsers
+        that derive the same value.
+  """
+
+  def __init__(self, file_object, maximum_size):
+    """Initializes the head of a file.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object.
+      maximum_size (int): maximum number of bytes to read from the start of
+          the file.
+
+    Raises:
+      IOError: if the head of the file cannot be read.
+      OSError: if the head of the file cannot be read.
+    """
+    super(FileHead, self).__init__()
+    self._current_offset = 0
+    self._size = file_object.get_size()
+
+    file_object.seek(0, os.SEEK_SET)
+    self._data = file_object.read(min(maximum_size, self._size))
+
+    self.cached_values = {}
+
+  def get_offset(self):
+    """Retrieves the current offset into the file.
+
+    Returns:
+      int: current offset into the file.
+    """
+    return self._current_offset
+
+  def get_size(self):
+    """Retrieves the size of the file.
+
+    Returns:
+      int: size of the file, which can be larger than the size of the head.
+    """
+    return self._size
+
+  def read(self, size=None):
+    """Reads a byte string from the head of the file.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None represents
+          all remaining bytes.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the data to read extends beyond the head of the file.
+      OSError: if the data to read extends beyond the head of the file.
+    """
+    if size is None or size < 0:
+      size = self._size - self._current_offset
+
+    end_offset = min(self._current_offset + size, self._size)
+    if end_offset <= self._current_offset:
+      return b''
+
+    if end_offset > len(self._data):
+      raise IOError('Unable to read beyond the head of the file.')
+
+    data = self._data[self._current_offset:end_offset]
+    self._current_offset = end_offset
+    return data
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the file.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an
+          absolute or relative position within the file.
+
+    Raises:
+      IOError: if the seek failed.
+      OSError: if the seek failed.
+    """
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._size
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+
 class BaseParser(object):
   """The parser interface."""
 
@@ -84,7 +187,7 @@ class BaseParser(object):
     the names of the plugins to enable.
 
     The default plugin, named "{self.NAME:s}_default", if it exists,
-    is always enabled and cannot be disabled.
+    is always enabled unless it is explicitly excluded.
     """
     super(BaseParser, self).__init__()
     self._default_plugin = None
@@ -111,20 +214,28 @@ class BaseParser(object):
 
     del cls._plugin_classes[plugin_name]
 
-  def EnablePlugins(self, plugin_includes):
+  def EnablePlugins(self, plugin_includes, plugin_excludes=None):
     """Enables parser plugins.
 
     Args:
       plugin_includes (set[str]): names of the plugins to enable, where
           set(['*']) represents all plugins. Note the default plugin, if
-          it exists, is always enabled and cannot be disabled.
+          it exists, is always enabled unless it is explicitly excluded.
+      plugin_excludes (Optional[set[str]]): names of the plugins to disable,
+          where exclusion takes precedence over inclusion.
     """
+    self._default_plugin = None
     self._plugins = []
     if not self._plugin_classes:
       return
 
+    plugin_excludes = plugin_excludes or set()
+
     default_plugin_name = '{0:s}_default'.format(self.NAME)
     for plugin_name, plugin_class in self._plugin_classes.items():
+      if plugin_name in plugin_excludes:
+        continue
+
       if plugin_name == default_plugin_name:
         self._default_plugin = plugin_class()
         continue
@@ -267,6 +378,40 @@ class FileObjectParser(BaseParser):
   # file offset seek needs to be performed.
   _INITIAL_FILE_OFFSET = 0
 
+  # pylint: disable=unused-argument
+  def CheckFileHead(self, parser_mediator, file_head):
+    """Determines if the parser can possibly parse a file based on its head.
+
+    Parsers that can cheaply rule out files, should override this method.
+    The check must not be stricter than the checks of ParseFileObject.
+
+    Args:
+      parser_mediator (ParserMediator): a parser mediator.
+      file_head (FileHead): head of the file.
+
+    Returns:
+      bool: False if the parser cannot parse the file, True otherwise.
+    """
+    return True
+
+  def GetParseRanges(self, parser_mediator, file_object, maximum_range_size):
+    """Retrieves ranges of the file that can be parsed independently.
+
+    Parsers that support parsing ranges of a file, should override this
+    method and parse only the range defined by parser_mediator.parse_range,
+    when it is set.
+
+    Args:
+      parser_mediator (ParserMediator): a parser mediator.
+      file_object (dvfvs.FileIO): a file-like object.
+      maximum_range_size (int): maximum size of a range in bytes.
+
+    Returns:
+      list[tuple[int, int]]: start and end of the ranges, as defined by
+          the parser, or None if the file should not be parsed in ranges.
+    """
+    return None
+
   def Parse(self, parser_mediator, file_object):
     """Parses a single file-like object.
 
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Parser for MacOS Application firewall log (appfirewall.log) files."""
 
+import re
+
 import pyparsing
 
 from dfdatetime import time_elements as dfdatetime_time_elements
@@ -45,6 +47,9 @@ class MacAppFirewallParser(text_parser.PyparsingSingleLineTextParser):
 
   _ENCODING = 'utf-8'
 
+  _VERIFICATION_REGEX = re.compile(
+      r'(?=.*Error)(?=.*creating[ \t]/var/log/appfirewall\.log)', re.DOTALL)
+
   # Define how a log line should look like.
   # Example: 'Nov  2 04:07:35 DarkTemplar-2.local socketfilterfw[112] '
   #          '<Info>: Dropbox: Allow (in:0 out:2)'
@@ -306,7 +306,9 @@ class ParsersManager(object):
       parser_object = parser_class()
       if parser_class.SupportsPlugins():
         plugin_includes = includes.get(parser_name, cls.ALL_PLUGINS)
-        parser_object.EnablePlugins(plugin_includes)
+        plugin_excludes = excludes.get(parser_name, None)
+        parser_object.EnablePlugins(
+            plugin_includes, plugin_excludes=plugin_excludes)
 
       parser_objects[parser_name] = parser_object
 
@@ -52,6 +52,7 @@ class ParserMediator(object):
     self._abort = False
     self._cached_parser_chain = None
     self._cpu_time_profiler = None
+    self._event_data_stream = None
     self._event_data_stream_identifier = None
     self._file_entry = None
     self._knowledge_base = knowledge_base
@@ -62,6 +63,8 @@ class ParserMediator(object):
     self._number_of_events = 0
     self._number_of_extraction_warnings = 0
     self._number_of_recovery_warnings = 0
+    self._parse_range = None
+    self._parsed_items_profiler = None
     self._parser_chain_components = []
     self._preferred_year = preferred_year
     self._process_information = None
@@ -98,6 +101,12 @@ class ParserMediator(object):
     """int: number of produced extraction warnings."""
     return self._number_of_extraction_warnings
 
+  @property
+  def parse_range(self):
+    """tuple[int, int]: start and end of the range of the file to parse or
+        None if the entire file should be parsed."""
+    return self._parse_range
+
   @property
   def resolver_context(self):
     """dfvfs.Context: resolver context."""
@@ -230,6 +239,14 @@ class ParserMediator(object):
     return path_helper.PathHelper.GetDisplayNameForPathSpec(
         path_spec, mount_path=mount_path, text_prepend=text_prepend)
 
+  def GetEventDataStream(self):
+    """Retrieves the active event data stream.
+
+    Returns:
+      EventDataStream: event data stream or None if not available.
+    """
+    return self._event_data_stream
+
   def GetEstimatedYear(self):
     """Retrieves an estimate of the year.
 
@@ -363,6 +380,8 @@ class ParserMediator(object):
     if not self._storage_writer:
       raise RuntimeError('Storage writer not set.')
 
+    self._event_data_stream = event_data_stream
+
     if not event_data_stream:
       self._event_data_stream_identifier = None
     else:
@@ -522,6 +541,15 @@ class ParserMediator(object):
       used_memory = self._process_information.GetUsedMemory() or 0
       self._memory_profiler.Sample(parser_name, used_memory)
 
+  def SampleStartItemsTiming(self, parser_name):
+    """Starts timing the parsing of items for profiling.
+
+    Args:
+      parser_name (str): name of the parser.
+    """
+    if self._parsed_items_profiler:
+      self._parsed_items_profiler.StartTiming(parser_name)
+
   def SampleStartTiming(self, parser_name):
     """Starts timing a CPU time sample for profiling.
 
@@ -540,6 +568,16 @@ class ParserMediator(object):
     if self._cpu_time_profiler:
       self._cpu_time_profiler.StopTiming(parser_name)
 
+  def SampleStopItemsTiming(self, parser_name, number_of_items):
+    """Stops timing the parsing of items for profiling.
+
+    Args:
+      parser_name (str): name of the parser.
+      number_of_items (int): number of items parsed, such as cache entries.
+    """
+    if self._parsed_items_profiler:
+      self._parsed_items_profiler.StopTiming(parser_name, number_of_items)
+
   def SetFileEntry(self, file_entry):
     """Sets the active file entry.
 
@@ -547,8 +585,19 @@ class ParserMediator(object):
       file_entry (dfvfs.FileEntry): file entry.
     """
     self._file_entry = file_entry
+    self._event_data_stream = None
     self._event_data_stream_identifier = None
 
+  def SetParseRange(self, parse_range):
+    """Sets the range of the file to parse.
+
+    Args:
+      parse_range (tuple[int, int]): start and end of the range of the file
+          to parse, as defined by the parser, or None to parse the entire
+          file.
+    """
+    self._parse_range = parse_range
+
   def SetStorageWriter(self, storage_writer):
     """Sets the storage writer.
 
@@ -589,6 +638,10 @@ class ParserMediator(object):
           identifier, configuration)
       self._memory_profiler.Start()
 
+      self._parsed_items_profiler = profilers.ParsedItemsProfiler(
+          identifier, configuration)
+      self._parsed_items_profiler.Start()
+
     self._process_information = process_information
 
   def StopProfiling(self):
@@ -601,4 +654,8 @@ class ParserMediator(object):
       self._memory_profiler.Stop()
       self._memory_profiler = None
 
+    if self._parsed_items_profiler:
+      self._parsed_items_profiler.Stop()
+      self._parsed_items_profiler = None
+
     self._process_information = None
@@ -134,6 +134,8 @@ class SantaParser(text_parser.PyparsingSingleLineTextParser):
 
   _ENCODING = 'utf-8'
 
+  _PARSE_RANGES_SUPPORTED = True
+
   MAX_LINE_LENGTH = 16384
 
   _SEP_TOKEN = pyparsing.Suppress('|')
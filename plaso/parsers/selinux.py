@@ -56,6 +56,8 @@ class SELinuxParser(text_parser.PyparsingSingleLineTextParser):
 
   _ENCODING = 'utf-8'
 
+  _PARSE_RANGES_SUPPORTED = True
+
   _SELINUX_KEY_VALUE_GROUP = pyparsing.Group(
       pyparsing.Word(pyparsing.alphanums).setResultsName('key') +
       pyparsing.Suppress('=') + (
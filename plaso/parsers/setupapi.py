@@ -5,6 +5,8 @@ The format is documented at:
 https://docs.microsoft.com/en-us/windows-hardware/drivers/install/setupapi-text-logs
 """
 
+import re
+
 import pyparsing
 
 from dfdatetime import time_elements as dfdatetime_time_elements
@@ -45,6 +47,8 @@ class SetupapiLogParser(text_parser.PyparsingSingleLineTextParser):
 
   _ENCODING = 'utf-8'
 
+  _VERIFICATION_REGEX = re.compile(r'\s*\[Device Install Log\]')
+
   _SLASH = pyparsing.Literal('/').suppress()
 
   _FOUR_DIGITS = text_parser.PyparsingConstants.FOUR_DIGITS
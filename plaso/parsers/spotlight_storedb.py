@@ -2,6 +2,7 @@
 """Parser for Apple Spotlight store database files."""
 
 from collections import abc as collections
+from concurrent import futures
 
 import os
 import zlib
@@ -129,6 +130,14 @@ class SpotlightStoreDatabaseParser(
       ('kMDItemContentType', 'content_type'),
       ('kMDItemKind', 'kind')]
 
+  # The maximum number of record pages that are read ahead of the record
+  # parser, which bounds the memory used for pending page data.
+  _MAXIMUM_NUMBER_OF_PENDING_RECORD_PAGES = 16
+
+  # The number of threads used to decompress record pages. Note that zlib and
+  # LZ4 release the GIL while decompressing.
+  _NUMBER_OF_DECOMPRESSION_THREADS = 2
+
   def __init__(self):
     """Initializes a Apple Spotlight store database parser."""
     super(SpotlightStoreDatabaseParser, self).__init__()
@@ -927,6 +936,30 @@ class SpotlightStoreDatabaseParser(
 
     return page_data
 
+  def _DecompressRecordPageData(self, page_header, page_data, file_offset):
+    """Decompresses record page data.
+
+    Args:
+      page_header (spotlight_store_db_property_page_header): page header.
+      page_data (bytes): compressed page data.
+      file_offset (int): file offset of the page data.
+
+    Returns:
+      bytes: uncompressed page data.
+
+    Raises:
+      ParseError: if the page data cannot be decompressed.
+    """
+    if (page_header.property_table_type == 0x00000009 and
+        page_data[0] == 0x78):
+      return zlib.decompress(page_data)
+
+    if (page_header.property_table_type == 0x00001009 and
+        page_data[0:4] == b'bv41'):
+      return self._DecompressLZ4PageData(page_data, file_offset)
+
+    raise errors.ParseError('Unsupported compression type')
+
   def _ReadRecordPage(self, file_object, file_offset):
     """Reads a record page.
 
@@ -935,8 +968,8 @@ class SpotlightStoreDatabaseParser(
       file_offset (int): file offset.
 
     Returns:
-      tuple[spotlight_store_db_property_page_header, bytes]: page header and
-          page data.
+      tuple[spotlight_store_db_property_page_header, bytes, int]: page header,
+          page data and file offset of the page data.
 
     Raises:
       ParseError: if the property page cannot be read.
@@ -951,24 +984,53 @@ class SpotlightStoreDatabaseParser(
 
     page_data = file_object.read(page_header.page_size - bytes_read)
 
-    file_offset += bytes_read
+    return page_header, page_data, file_offset + bytes_read
 
-    if page_header.uncompressed_page_size > 0:
-      compressed_page_data = page_data
+  def _ReadRecordPages(self, file_object):
+    """Reads the record pages.
 
-      if (page_header.property_table_type == 0x00000009 and
-          compressed_page_data[0] == 0x78):
-        page_data = zlib.decompress(compressed_page_data)
+    The record pages are read sequentially and decompressed by a pool of
+    threads ahead of the record parser. The number of pages that are read
+    ahead is bounded to limit memory usage.
+
+    Args:
+      file_object (file): file-like object.
+
+    Yields:
+      tuple[int, concurrent.futures.Future]: file offset of the record page
+          and future of its uncompressed page data.
+    """
+    pending_pages = []
 
-      elif (page_header.property_table_type == 0x00001009 and
-            compressed_page_data[0:4] == b'bv41'):
-        page_data = self._DecompressLZ4PageData(
-            compressed_page_data, file_offset)
+    with futures.ThreadPoolExecutor(
+        max_workers=self._NUMBER_OF_DECOMPRESSION_THREADS) as executor:
+      for map_value in self._map_values:
+        file_offset = map_value.block_number * 0x1000
 
-      else:
-        raise errors.ParseError('Unsupported compression type')
+        try:
+          page_header, page_data, page_data_offset = self._ReadRecordPage(
+              file_object, file_offset)
 
-    return page_header, page_data
+        except errors.ParseError as exception:
+          future = futures.Future()
+          future.set_exception(exception)
+
+        else:
+          if page_header.uncompressed_page_size > 0:
+            future = executor.submit(
+                self._DecompressRecordPageData, page_header, page_data,
+                page_data_offset)
+          else:
+            future = futures.Future()
+            future.set_result(page_data)
+
+        pending_pages.append((file_offset, future))
+
+        if len(pending_pages) >= self._MAXIMUM_NUMBER_OF_PENDING_RECORD_PAGES:
+          yield pending_pages.pop(0)
+
+      while pending_pages:
+        yield pending_pages.pop(0)
 
   def _ReadVariableSizeInteger(self, data):
     """Reads a variable size integer.
@@ -1090,11 +1152,9 @@ class SpotlightStoreDatabaseParser(
               exception))
       return
 
-    for map_value in self._map_values:
-      file_offset = map_value.block_number * 0x1000
-
+    for file_offset, future in self._ReadRecordPages(file_object):
       try:
-        _, page_data = self._ReadRecordPage(file_object, file_offset)
+        page_data = future.result()
 
         self._ParseRecordPageValues(parser_mediator, page_data)
 
@@ -1102,7 +1162,6 @@ class SpotlightStoreDatabaseParser(
         parser_mediator.ProduceExtractionWarning((
             'unable to read record page at offset: 0x{0:08x} with error: '
             '{1!s}').format(file_offset, exception))
-        continue
 
 
 manager.ParsersManager.RegisterParser(SpotlightStoreDatabaseParser)
@@ -8,6 +8,8 @@ import tempfile
 from dfvfs.path import factory as dfvfs_factory
 
 from plaso.containers import events
+from plaso.lib import dtfabric_helper
+from plaso.lib import errors
 from plaso.lib import specification
 from plaso.parsers import interface
 from plaso.parsers import logger
@@ -86,6 +88,18 @@ class SQLiteCache(plugins.BasePluginCache):
 
     setattr(self, attribute_name, attribute_value)
 
+  def CopyRowCaches(self, cache):
+    """Copies the row caches of another cache.
+
+    This is used to skip rows that were parsed from the database, when the
+    database is parsed again with its WAL file.
+
+    Args:
+      cache (SQLiteCache): cache to copy the row caches from.
+    """
+    for query_hash, row_cache in cache._row_caches.items():
+      self._row_caches[query_hash] = set(row_cache)
+
   def GetRowCache(self, query):
     """Retrieves the row cache for a specific query.
 
@@ -157,32 +171,132 @@ class SQLiteDatabase(object):
       temporary_file.write(data)
       data = file_object.read(self._READ_BUFFER_SIZE)
 
+  def _Connect(self):
+    """Connects to the temporary copy of the database and reads its schema.
+
+    Raises:
+      sqlite3.DatabaseError: if the database cannot be parsed.
+    """
+    self._database = sqlite3.connect(self._temp_db_file_path)
+    try:
+      self._database.row_factory = sqlite3.Row
+      cursor = self._database.cursor()
+
+      sql_results = cursor.execute(self.SCHEMA_QUERY)
+
+      self.schema = {
+          table_name: ' '.join(query.split())
+          for table_name, query in sql_results}
+      self.columns_per_table = {}
+
+      for table_name in self.schema.keys():
+        self.columns_per_table.setdefault(table_name, [])
+
+        # The table name needs to be enclosed in quotes in case it contains
+        # special characters like a dot.
+        pragma_results = cursor.execute(
+            'PRAGMA table_info("{0:s}")'.format(table_name))
+
+        for pragma_result in pragma_results:
+          self.columns_per_table[table_name].append(pragma_result['name'])
+
+    except sqlite3.DatabaseError as exception:
+      self._database.close()
+      self._database = None
+
+      self._RemoveTemporaryFiles()
+
+      logger.debug(
+          'Unable to parse SQLite database: {0:s} with error: {1!s}'.format(
+              self._filename, exception))
+      raise
+
+  def _CopyWALFileObject(self, wal_file_object):
+    """Copies the Write-Ahead Log (WAL) next to the temporary database copy.
+
+    Args:
+      wal_file_object (dfvfs.FileIO): file-like object for the Write-Ahead
+          Log (WAL) file.
+
+    Raises:
+      IOError: if the file-like object cannot be read.
+      OSError: if the file-like object cannot be read.
+    """
+    # Create WAL file using same filename so it is available for
+    # sqlite3.connect()
+    temporary_filename = '{0:s}-wal'.format(self._temp_db_file_path)
+    temporary_file = open(temporary_filename, 'wb')
+    try:
+      self._CopyFileObjectToTemporaryFile(wal_file_object, temporary_file)
+      self._temp_wal_file_path = temporary_filename
+
+    except IOError:
+      os.remove(temporary_filename)
+      raise
+
+    finally:
+      temporary_file.close()
+
+  def _RemoveTemporaryFiles(self):
+    """Removes the temporary copies of the database and WAL file."""
+    for path in (self._temp_db_file_path, self._temp_wal_file_path):
+      if path and os.path.exists(path):
+        try:
+          os.remove(path)
+        except (OSError, IOError) as exception:
+          logger.warning((
+              'Unable to remove temporary copy: {0:s} of SQLite database: '
+              '{1:s} with error: {2!s}').format(
+                  path, self._filename, exception))
+
+    self._temp_db_file_path = ''
+    self._temp_wal_file_path = ''
+
   def Close(self):
     """Closes the database connection and cleans up the temporary file."""
     self.schema = {}
-    self._database = None
 
-    if os.path.exists(self._temp_db_file_path):
-      try:
-        os.remove(self._temp_db_file_path)
-      except (OSError, IOError) as exception:
-        logger.warning((
-            'Unable to remove temporary copy: {0:s} of SQLite database: '
-            '{1:s} with error: {2!s}').format(
-                self._temp_db_file_path, self._filename, exception))
+    if self._database:
+      self._database.close()
+      self._database = None
 
-    self._temp_db_file_path = ''
+    self._RemoveTemporaryFiles()
 
-    if os.path.exists(self._temp_wal_file_path):
-      try:
-        os.remove(self._temp_wal_file_path)
-      except (OSError, IOError) as exception:
-        logger.warning((
-            'Unable to remove temporary copy: {0:s} of SQLite database: '
-            '{1:s} with error: {2!s}').format(
-                self._temp_wal_file_path, self._filename, exception))
+  def GetTableNamesOfPages(self, page_numbers):
+    """Retrieves the names of the tables stored in specific pages.
 
-    self._temp_wal_file_path = ''
+    This function requires the SQLite dbstat virtual table.
+
+    Args:
+      page_numbers (set[int]): page numbers.
+
+    Returns:
+      set[str]: names of the tables, including those of which an index is
+          stored in the pages, or None if not available.
+    """
+    if not self._database:
+      return None
+
+    try:
+      cursor = self._database.cursor()
+
+      sql_results = cursor.execute(
+          'SELECT name, tbl_name FROM sqlite_master')
+      table_name_per_name = dict(sql_results)
+
+      table_names = set()
+      for name, page_number in cursor.execute(
+          'SELECT name, pageno FROM dbstat'):
+        if page_number in page_numbers:
+          table_names.add(table_name_per_name.get(name, name))
+
+    except sqlite3.DatabaseError as exception:
+      logger.debug((
+          'Unable to determine tables of pages of SQLite database: {0:s} '
+          'with error: {1!s}').format(self._filename, exception))
+      return None
+
+    return table_names
 
   def Open(self, file_object, wal_file_object=None):
     """Opens a SQLite database file.
@@ -206,13 +320,6 @@ class SQLiteDatabase(object):
     if not file_object:
       raise ValueError('Missing file object.')
 
-    # TODO: Current design copies the entire file into a buffer
-    # that is parsed by each SQLite parser. This is not very efficient,
-    # especially when many SQLite parsers are ran against a relatively
-    # large SQLite database. This temporary file that is created should
-    # be usable by all SQLite parsers so the file should only be read
-    # once in memory and then deleted when all SQLite parsers have completed.
-
     # TODO: Change this into a proper implementation using APSW
     # and virtual filesystems when that will be available.
     # Info: http://apidoc.apsw.googlecode.com/hg/vfs.html#vfs and
@@ -234,58 +341,52 @@ class SQLiteDatabase(object):
       temporary_file.close()
 
     if wal_file_object:
-      # Create WAL file using same filename so it is available for
-      # sqlite3.connect()
-      temporary_filename = '{0:s}-wal'.format(self._temp_db_file_path)
-      temporary_file = open(temporary_filename, 'wb')
       try:
-        self._CopyFileObjectToTemporaryFile(wal_file_object, temporary_file)
-        self._temp_wal_file_path = temporary_filename
-
+        self._CopyWALFileObject(wal_file_object)
       except IOError:
-        os.remove(temporary_filename)
+        self._RemoveTemporaryFiles()
         raise
 
-      finally:
-        temporary_file.close()
+    self._Connect()
 
-    self._database = sqlite3.connect(self._temp_db_file_path)
-    try:
-      self._database.row_factory = sqlite3.Row
-      cursor = self._database.cursor()
+  def ReopenWithWAL(self, wal_file_object):
+    """Reopens the SQLite database file with its Write-Ahead Log (WAL).
 
-      sql_results = cursor.execute(self.SCHEMA_QUERY)
+    The temporary copy of the database file made by Open is reused, hence
+    the database file is only read once to parse it both without and with
+    its WAL file. Note that the temporary copy of the database file can be
+    changed when the WAL file is committed, hence the database cannot be
+    reopened without its WAL file afterwards.
 
-      self.schema = {
-          table_name: ' '.join(query.split())
-          for table_name, query in sql_results}
-
-      for table_name in self.schema.keys():
-        self.columns_per_table.setdefault(table_name, [])
+    Args:
+      wal_file_object (dfvfs.FileIO): file-like object for the Write-Ahead
+          Log (WAL) file.
 
-        # The table name needs to be enclosed in quotes in case it contains
-        # special characters like a dot.
-        pragma_results = cursor.execute(
-            'PRAGMA table_info("{0:s}")'.format(table_name))
+    Raises:
+      IOError: if the database is not opened, already has a WAL file or
+          the file-like object cannot be read.
+      OSError: if the database is not opened, already has a WAL file or
+          the file-like object cannot be read.
+      sqlite3.DatabaseError: if the database cannot be parsed.
+    """
+    if not self._database:
+      raise IOError('Database not opened.')
 
-        for pragma_result in pragma_results:
-          self.columns_per_table[table_name].append(pragma_result['name'])
+    if self._temp_wal_file_path:
+      raise IOError('Database already opened with WAL file.')
 
-    except sqlite3.DatabaseError as exception:
-      self._database.close()
-      self._database = None
-
-      os.remove(self._temp_db_file_path)
-      self._temp_db_file_path = ''
-      if self._temp_wal_file_path:
-        os.remove(self._temp_wal_file_path)
-        self._temp_wal_file_path = ''
+    self._database.close()
+    self._database = None
+    self.schema = {}
 
-      logger.debug(
-          'Unable to parse SQLite database: {0:s} with error: {1!s}'.format(
-              self._filename, exception))
+    try:
+      self._CopyWALFileObject(wal_file_object)
+    except IOError:
+      self._RemoveTemporaryFiles()
       raise
 
+    self._Connect()
+
   def Query(self, query):
     """Queries the database.
 
@@ -303,35 +404,100 @@ class SQLiteDatabase(object):
     return cursor
 
 
-class SQLiteParser(interface.FileEntryParser):
+class SQLiteParser(interface.FileEntryParser, dtfabric_helper.DtFabricHelper):
   """Parses SQLite database files."""
 
   NAME = 'sqlite'
   DATA_FORMAT = 'SQLite database file'
 
+  _DEFINITION_FILE = os.path.join(
+      os.path.dirname(__file__), 'sqlite.yaml')
+
+  _WAL_FILE_SIGNATURES = frozenset([0x377f0682, 0x377f0683])
+
+  _WAL_FILE_HEADER_SIZE = 32
+
+  _WAL_FRAME_HEADER_SIZE = 24
+
   _plugin_classes = {}
 
-  def _OpenDatabaseWithWAL(
-      self, parser_mediator, database_file_entry, database_file_object,
-      filename):
-    """Opens a database with its Write-Ahead Log (WAL) committed.
+  def _GetWALCommittedPageNumbers(self, wal_file_object):
+    """Retrieves the numbers of the pages changed by committed WAL frames.
+
+    Only frames that belong to the current WAL, with the same salt values as
+    the WAL file header, and that are followed by a commit frame are used by
+    SQLite, hence only the page numbers of these frames are returned.
 
     Args:
-      parser_mediator (ParserMediator): parser mediator.
-      database_file_entry (dfvfs.FileEntry): file entry of the database.
-      database_file_object (dfvfs.FileIO): file-like object of the database.
-      filename (str): name of the database file entry.
+      wal_file_object (dfvfs.FileIO): file-like object for the Write-Ahead
+          Log (WAL) file.
 
     Returns:
-      tuple: contains:
+      set[int]: numbers of the pages changed by committed WAL frames.
+
+    Raises:
+      ParseError: if the WAL file header cannot be read.
+    """
+    file_header_map = self._GetDataTypeMap('sqlite_wal_file_header')
+    frame_header_map = self._GetDataTypeMap('sqlite_wal_frame_header')
+
+    try:
+      file_header, _ = self._ReadStructureFromFileObject(
+          wal_file_object, 0, file_header_map)
+    except (ValueError, errors.ParseError) as exception:
+      raise errors.ParseError(
+          'Unable to parse WAL file header with error: {0!s}'.format(
+              exception))
+
+    if file_header.signature not in self._WAL_FILE_SIGNATURES:
+      raise errors.ParseError('Unsupported WAL file signature.')
+
+    if file_header.page_size < 512:
+      raise errors.ParseError('Unsupported WAL page size: {0:d}'.format(
+          file_header.page_size))
+
+    wal_file_size = wal_file_object.get_size()
+    frame_size = self._WAL_FRAME_HEADER_SIZE + file_header.page_size
+
+    committed_page_numbers = set()
+    page_numbers = set()
+
+    frame_offset = self._WAL_FILE_HEADER_SIZE
+    while frame_offset + frame_size <= wal_file_size:
+      try:
+        frame_header, _ = self._ReadStructureFromFileObject(
+            wal_file_object, frame_offset, frame_header_map)
+      except (ValueError, errors.ParseError):
+        break
+
+      if (frame_header.salt1 != file_header.salt1 or
+          frame_header.salt2 != file_header.salt2):
+        break
+
+      page_numbers.add(frame_header.page_number)
+
+      # A frame with a database size marks the end of a transaction.
+      if frame_header.database_size:
+        committed_page_numbers.update(page_numbers)
+        page_numbers = set()
+
+      frame_offset += frame_size
+
+    return committed_page_numbers
+
+  def _GetWALFileEntry(self, database_file_entry):
+    """Retrieves the Write-Ahead Log (WAL) file entry of a database.
 
-        SQLiteDatabase: a database object with WAL file committed or None
-        dfvfs.FileEntry: a file entry object of WAL file or None
+    Args:
+      database_file_entry (dfvfs.FileEntry): file entry of the database.
+
+    Returns:
+      dfvfs.FileEntry: file entry of the WAL file or None if not available.
     """
     path_spec = database_file_entry.path_spec
     location = getattr(path_spec, 'location', None)
     if not path_spec or not location:
-      return None, None
+      return None
 
     location_wal = '{0:s}-wal'.format(location)
     file_system = database_file_entry.GetFileSystem()
@@ -339,31 +505,43 @@ class SQLiteParser(interface.FileEntryParser):
         file_system.type_indicator, parent=path_spec.parent,
         location=location_wal)
 
-    wal_file_entry = file_system.GetFileEntryByPathSpec(wal_path_spec)
-    if not wal_file_entry:
-      return None, None
+    return file_system.GetFileEntryByPathSpec(wal_path_spec)
 
-    wal_file_object = wal_file_entry.GetFileObject()
-    if not wal_file_object:
-      return None, None
+  def _GetPluginsWithRequiredTables(self, database):
+    """Retrieves the plugins of which the required tables are in a database.
 
-    database_wal = SQLiteDatabase(
-        filename, temporary_directory=parser_mediator.temporary_directory)
+    Args:
+      database (SQLiteDatabase): database.
 
-    try:
-      database_wal.Open(database_file_object, wal_file_object=wal_file_object)
+    Returns:
+      list[SQLitePlugin]: SQLite parser plugins, in the order they are
+          enabled, of which the required tables exist in the database.
+    """
+    table_names = set(database.tables)
 
-    except (IOError, ValueError, sqlite3.DatabaseError) as exception:
-      parser_mediator.ProduceExtractionWarning((
-          'unable to open SQLite database and WAL with error: '
-          '{0!s}').format(exception))
+    plugin_names = set()
+    for table_name in table_names:
+      for plugin in self._plugins_per_required_table.get(table_name, []):
+        if table_names.issuperset(plugin.REQUIRED_STRUCTURE.keys()):
+          plugin_names.add(plugin.NAME)
 
-      return None, None
+    return [plugin for plugin in self._plugins if plugin.NAME in plugin_names]
 
-    return database_wal, wal_file_entry
+  def _GetSchemaKey(self, schema):
+    """Retrieves a key that uniquely identifies a schema.
+
+    Args:
+      schema (dict[str, str]): schema as an SQL query per table name.
+
+    Returns:
+      frozenset[tuple[str, str]]: key of the schema, which is equal for
+          schemas that are equal.
+    """
+    return frozenset(schema.items())
 
   def _ParseFileEntryWithPlugin(
-      self, parser_mediator, plugin, database, display_name, cache):
+      self, parser_mediator, plugin, database, display_name, cache,
+      schema_match):
     """Parses a SQLite database file entry with a specific plugin.
 
     Args:
@@ -372,6 +550,8 @@ class SQLiteParser(interface.FileEntryParser):
       database (SQLiteDatabase): database.
       display_name (str): display name.
       cache (SQLiteCache): cache.
+      schema_match (bool): True if the schema of the database matches one
+          of the schemas defined by the plugin.
     """
     required_tables_and_column_exist = plugin.CheckRequiredTablesAndColumns(
         database)
@@ -384,7 +564,6 @@ class SQLiteParser(interface.FileEntryParser):
     logger.debug('Parsing file: {0:s} with plugin: {1:s}'.format(
         display_name, plugin.NAME))
 
-    schema_match = plugin.CheckSchema(database)
     if plugin.REQUIRES_SCHEMA_MATCH and not schema_match:
       parser_mediator.ProduceExtractionWarning((
           'plugin: {0:s} found required tables but not a matching '
@@ -400,6 +579,42 @@ class SQLiteParser(interface.FileEntryParser):
           'plugin: {0:s} unable to parse SQLite database with error: '
           '{1!s}').format(plugin.NAME, exception))
 
+  def EnablePlugins(self, plugin_includes, plugin_excludes=None):
+    """Enables parser plugins.
+
+    Besides enabling the plugins, this function indexes the plugins by their
+    required tables and schemas, so that the plugins that apply to a database
+    can be determined without checking every plugin.
+
+    Args:
+      plugin_includes (set[str]): names of the plugins to enable, where
+          set(['*']) represents all plugins. Note the default plugin, if
+          it exists, is always enabled unless it is explicitly excluded.
+      plugin_excludes (Optional[set[str]]): names of the plugins to disable,
+          where exclusion takes precedence over inclusion.
+    """
+    super(SQLiteParser, self).EnablePlugins(
+        plugin_includes, plugin_excludes=plugin_excludes)
+
+    self._plugin_names_per_schema = {}
+    self._plugins_per_required_table = {}
+
+    for plugin in self._plugins:
+      # Plugins without required tables are never used.
+      if not plugin.REQUIRED_STRUCTURE:
+        continue
+
+      # It suffices to index a plugin by one of its required tables, since
+      # all of its required tables must be present in the database.
+      table_name = min(plugin.REQUIRED_STRUCTURE.keys())
+      self._plugins_per_required_table.setdefault(table_name, []).append(
+          plugin)
+
+      for schema in plugin.SCHEMAS:
+        schema_key = self._GetSchemaKey(schema)
+        self._plugin_names_per_schema.setdefault(schema_key, set()).add(
+            plugin.NAME)
+
   @classmethod
   def GetFormatSpecification(cls):
     """Retrieves the format specification.
@@ -434,44 +649,97 @@ class SQLiteParser(interface.FileEntryParser):
           'unable to open SQLite database with error: {0!s}'.format(exception))
       return
 
-    # Create a cache in which the resulting tables are cached.
-    cache = SQLiteCache()
+    try:
+      # Create a cache in which the resulting tables are cached.
+      cache = SQLiteCache()
 
-    display_name = parser_mediator.GetDisplayName(file_entry)
+      display_name = parser_mediator.GetDisplayName(file_entry)
 
-    try:
-      for plugin in self._plugins:
+      schema_key = self._GetSchemaKey(database.schema)
+      plugin_names_with_schema = self._plugin_names_per_schema.get(
+          schema_key, set())
+
+      for plugin in self._GetPluginsWithRequiredTables(database):
+        schema_match = plugin.NAME in plugin_names_with_schema
         self._ParseFileEntryWithPlugin(
-            parser_mediator, plugin, database, display_name, cache)
-    finally:
-      database.Close()
+            parser_mediator, plugin, database, display_name, cache,
+            schema_match)
 
-    database_wal, wal_file_entry = self._OpenDatabaseWithWAL(
-        parser_mediator, file_entry, file_object, filename)
+      wal_file_entry = self._GetWALFileEntry(file_entry)
+      wal_file_object = None
+      if wal_file_entry:
+        wal_file_object = wal_file_entry.GetFileObject()
 
-    if not database_wal:
-      return
+      if not wal_file_object:
+        return
 
-    # Note that SetFileEntry will reset the current event data stream in
-    # the parser mediator.
-    parser_mediator.SetFileEntry(wal_file_entry)
+      try:
+        page_numbers = self._GetWALCommittedPageNumbers(wal_file_object)
 
-    event_data_stream = events.EventDataStream()
-    event_data_stream.path_spec = wal_file_entry.path_spec
+      except errors.ParseError as exception:
+        parser_mediator.ProduceExtractionWarning(
+            'unable to parse SQLite WAL with error: {0!s}'.format(exception))
+        return
 
-    parser_mediator.ProduceEventDataStream(event_data_stream)
+      # If the WAL contains no committed changes the database with its WAL
+      # is the same as without.
+      if not page_numbers:
+        return
 
-    # Create a cache in which the resulting tables are cached.
-    cache = SQLiteCache()
+      schema = database.schema
 
-    display_name = parser_mediator.GetDisplayName(wal_file_entry)
+      # The temporary copy of the database is reused to parse the database
+      # with its WAL file.
+      try:
+        database.ReopenWithWAL(wal_file_object)
 
-    try:
-      for plugin in self._plugins:
+      except (IOError, sqlite3.DatabaseError) as exception:
+        parser_mediator.ProduceExtractionWarning((
+            'unable to open SQLite database and WAL with error: '
+            '{0!s}').format(exception))
+        return
+
+      # Only plugins that use tables that are changed by the WAL need to
+      # parse the database again, unless the schema was changed.
+      changed_table_names = None
+      if database.schema == schema:
+        changed_table_names = database.GetTableNamesOfPages(page_numbers)
+
+      # Note that SetFileEntry will reset the current event data stream in
+      # the parser mediator.
+      parser_mediator.SetFileEntry(wal_file_entry)
+
+      event_data_stream = events.EventDataStream()
+      event_data_stream.path_spec = wal_file_entry.path_spec
+
+      parser_mediator.ProduceEventDataStream(event_data_stream)
+
+      # Create a cache in which the resulting tables are cached. Rows that
+      # were already parsed from the database without its WAL are skipped.
+      wal_cache = SQLiteCache()
+      wal_cache.CopyRowCaches(cache)
+
+      display_name = parser_mediator.GetDisplayName(wal_file_entry)
+
+      schema_key = self._GetSchemaKey(database.schema)
+      plugin_names_with_schema = self._plugin_names_per_schema.get(
+          schema_key, set())
+
+      for plugin in self._GetPluginsWithRequiredTables(database):
+        if changed_table_names is not None and changed_table_names.isdisjoint(
+            plugin.REQUIRED_STRUCTURE.keys()):
+          logger.debug((
+              'Skipped parsing file: {0:s} with plugin: {1:s} since WAL does '
+              'not change required tables').format(display_name, plugin.NAME))
+          continue
+
+        schema_match = plugin.NAME in plugin_names_with_schema
         self._ParseFileEntryWithPlugin(
-            parser_mediator, plugin, database_wal, display_name, cache)
+            parser_mediator, plugin, database, display_name, wal_cache,
+            schema_match)
+
     finally:
-      database_wal.Close()
+      database.Close()
 
 
 manager.ParsersManager.RegisterParser(SQLiteParser)
@@ -74,20 +74,9 @@ class SQLitePlugin(plugins.BasePlugin):
     Returns:
       int: hash value of the given row.
     """
-    values = []
-    for value in row:
-      try:
-        value = '{0!s}'.format(value)
-      except UnicodeDecodeError:
-        # In Python 2, blobs are "read-write buffer" and will cause a
-        # UnicodeDecodeError exception if we try format it as a string.
-        # Since Python 3 does not support the buffer type we cannot check
-        # the type of value.
-        value = repr(value)
-
-      values.append(value)
-
-    return hash(' '.join(values))
+    # Note that the values of a row are of a hashable type: None, int, float,
+    # str or bytes.
+    return hash(tuple(row))
 
   def _ParseSQLiteDatabase(
       self, parser_mediator, database, query, callback, cache):
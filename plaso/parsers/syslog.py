@@ -324,15 +324,18 @@ class SyslogParser(text_parser.PyparsingMultiLineTextParser):
     severity = self._SYSLOG_SEVERITY[priority % 8]
     return severity
 
-  def EnablePlugins(self, plugin_includes):
+  def EnablePlugins(self, plugin_includes, plugin_excludes=None):
     """Enables parser plugins.
 
     Args:
       plugin_includes (list[str]): names of the plugins to enable, where None
           or an empty list represents all plugins. Note that the default plugin
           is handled separately.
+      plugin_excludes (Optional[set[str]]): names of the plugins to disable,
+          where exclusion takes precedence over inclusion.
     """
-    super(SyslogParser, self).EnablePlugins(plugin_includes)
+    super(SyslogParser, self).EnablePlugins(
+        plugin_includes, plugin_excludes=plugin_excludes)
 
     self._plugin_by_reporter = {}
     for plugin in self._plugins:
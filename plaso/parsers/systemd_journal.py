@@ -63,9 +63,13 @@ class SystemdJournalParser(
 
   _SUPPORTED_FILE_HEADER_SIZES = frozenset([208, 224, 240])
 
+  # Maximum number of fields of data objects that are cached.
+  _MAXIMUM_CACHED_FIELDS = 64 * 1024
+
   def __init__(self):
     """Initializes a parser."""
     super(SystemdJournalParser, self).__init__()
+    self._fields_cache = {}
     self._maximum_journal_file_offset = 0
 
   def _ParseDataObject(self, file_object, file_offset):
@@ -255,9 +259,21 @@ class SystemdJournalParser(
             'object offset should be after hash tables ({0:d} < {1:d})'.format(
                 entry_item.object_offset, self._maximum_journal_file_offset))
 
-      event_data = self._ParseDataObject(file_object, entry_item.object_offset)
-      event_string = event_data.decode('utf-8')
-      key, value = event_string.split('=', 1)
+      # Data objects, such as _HOSTNAME=, are shared by multiple entries
+      # hence their fields are cached by the offset of the data object.
+      field = self._fields_cache.get(entry_item.object_offset, None)
+      if not field:
+        event_data = self._ParseDataObject(
+            file_object, entry_item.object_offset)
+        event_string = event_data.decode('utf-8')
+        field = tuple(event_string.split('=', 1))
+
+        if len(self._fields_cache) >= self._MAXIMUM_CACHED_FIELDS:
+          self._fields_cache = {}
+
+        self._fields_cache[entry_item.object_offset] = field
+
+      key, value = field
       fields[key] = value
 
     return fields
@@ -310,32 +326,40 @@ class SystemdJournalParser(
     entry_object_offsets = self._ParseEntryObjectOffsets(
         file_object, file_header.entry_array_offset)
 
-    for entry_object_offset in entry_object_offsets:
-      if entry_object_offset == 0:
-        continue
+    # The cached fields are only valid for the current file.
+    self._fields_cache = {}
 
-      try:
-        fields = self._ParseJournalEntry(file_object, entry_object_offset)
-      except errors.ParseError as exception:
-        parser_mediator.ProduceExtractionWarning((
-            'Unable to parse journal entry at offset: 0x{0:08x} with '
-            'error: {1!s}').format(entry_object_offset, exception))
-        return
-
-      event_data = SystemdJournalEventData()
-
-      event_data.body = fields.get('MESSAGE', None)
-      event_data.hostname = fields.get('_HOSTNAME', None)
-      event_data.reporter = fields.get('SYSLOG_IDENTIFIER', None)
-
-      if event_data.reporter and event_data.reporter != 'kernel':
-        event_data.pid = fields.get('_PID', fields.get('SYSLOG_PID', None))
-
-      date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
-          timestamp=fields['real_time'])
-      event = time_events.DateTimeValuesEvent(
-          date_time, definitions.TIME_DESCRIPTION_WRITTEN)
-      parser_mediator.ProduceEventWithEventData(event, event_data)
+    try:
+      for entry_object_offset in entry_object_offsets:
+        if entry_object_offset == 0:
+          continue
+
+        try:
+          fields = self._ParseJournalEntry(file_object, entry_object_offset)
+        except errors.ParseError as exception:
+          parser_mediator.ProduceExtractionWarning((
+              'Unable to parse journal entry at offset: 0x{0:08x} with '
+              'error: {1!s}').format(entry_object_offset, exception))
+          return
+
+        event_data = SystemdJournalEventData()
+
+        event_data.body = fields.get('MESSAGE', None)
+        event_data.hostname = fields.get('_HOSTNAME', None)
+        event_data.reporter = fields.get('SYSLOG_IDENTIFIER', None)
+
+        if event_data.reporter and event_data.reporter != 'kernel':
+          event_data.pid = fields.get('_PID', fields.get('SYSLOG_PID', None))
+
+        date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
+            timestamp=fields['real_time'])
+        event = time_events.DateTimeValuesEvent(
+            date_time, definitions.TIME_DESCRIPTION_WRITTEN)
+        parser_mediator.ProduceEventWithEventData(event, event_data)
+
+    finally:
+      # Release the cached fields when the file has been parsed.
+      self._fields_cache = {}
 
 
 manager.ParsersManager.RegisterParser(SystemdJournalParser)
@@ -8,12 +8,15 @@ parser.
 
 import abc
 import codecs
+import os
+import re
 
 import pyparsing
 
 from dfvfs.helpers import text_file
 
 from plaso.lib import errors
+from plaso.lib import line_reader_file
 from plaso.parsers import interface
 from plaso.parsers import logger
 
@@ -140,6 +143,193 @@ class PyparsingConstants(object):
       pyparsing.nums, min=1, max=5).setParseAction(PyParseIntCast)
 
 
+class LineStructureGroup(tuple):
+  """Group of values of a line structure regular expression.
+
+  The group is the equivalent of a pyparsing.Group, which can be iterated
+  over and of which the values can be retrieved by name.
+  """
+
+  def __new__(cls, names, values):
+    """Creates a group of values.
+
+    Args:
+      names (list[str]): names of the values.
+      values (list[object]): values.
+
+    Returns:
+      LineStructureGroup: group of values.
+    """
+    group = super(LineStructureGroup, cls).__new__(cls, values)
+    group._values_per_name = dict(zip(names, values))
+    return group
+
+  def get(self, name, default_value=None):
+    """Retrieves a value by name.
+
+    Args:
+      name (str): name of the value.
+      default_value (Optional[object]): default value.
+
+    Returns:
+      object: value or default value if the value is not available.
+    """
+    return self._values_per_name.get(name, default_value)
+
+
+class LineStructureRegularExpression(object):
+  """Regular expression equivalent of a pyparsing line structure.
+
+  Matching a compiled regular expression is significantly faster than
+  parsing the same line with pyparsing. The regular expression must only
+  match lines that the corresponding pyparsing line structure also parses
+  and produce the same values, lines that it does not match are parsed with
+  the pyparsing line structure.
+
+  Named groups of which the name starts with an underscore are not part of
+  the structure, which allows, for example, to emulate atomic groups.
+  """
+
+  def __init__(self, expression, converters=None, groups=None):
+    """Initializes a line structure regular expression.
+
+    Args:
+      expression (str): regular expression with a named group for every
+          value of the pyparsing line structure.
+      converters (Optional[dict[str, function]]): functions per named group,
+          that convert the matched string into the value that the pyparsing
+          line structure produces, such as int.
+      groups (Optional[dict[str, list[str]]]): names of the named groups per
+          name of a group of values, the equivalent of a pyparsing.Group.
+    """
+    super(LineStructureRegularExpression, self).__init__()
+    self._converters = converters or {}
+    self._groups = groups or {}
+    self._regular_expression = re.compile(expression)
+
+  def Match(self, line):
+    """Matches a line.
+
+    Args:
+      line (str): line.
+
+    Returns:
+      dict[str, object]: values of the structure per name or None if the line
+          does not match the regular expression.
+
+    Raises:
+      ValueError: if a converter cannot convert a matched string.
+    """
+    # Pyparsing expands tabs before parsing a line, which is not supported
+    # by the regular expression.
+    if '\t' in line:
+      return None
+
+    match = self._regular_expression.match(line)
+    if not match:
+      return None
+
+    structure = {}
+    for name, value in match.groupdict().items():
+      if value is None or name[0] == '_':
+        continue
+
+      converter = self._converters.get(name, None)
+      if converter:
+        value = converter(value)
+
+      structure[name] = value
+
+    for group_name, names in self._groups.items():
+      values = [structure.pop(name, None) for name in names]
+      structure[group_name] = LineStructureGroup(names, values)
+
+    return structure
+
+
+class FileObjectRange(object):
+  """File-like object of a range of another file-like object."""
+
+  def __init__(self, file_object, range_offset, range_size):
+    """Initializes a file-like object of a range.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object that contains the range.
+      range_offset (int): offset of the range in the file-like object.
+      range_size (int): size of the range.
+    """
+    super(FileObjectRange, self).__init__()
+    self._current_offset = 0
+    self._file_object = file_object
+    self._range_offset = range_offset
+    self._range_size = range_size
+
+  def get_offset(self):
+    """Retrieves the current offset into the range.
+
+    Returns:
+      int: current offset into the range.
+    """
+    return self._current_offset
+
+  def get_size(self):
+    """Retrieves the size of the range.
+
+    Returns:
+      int: size of the range.
+    """
+    return self._range_size
+
+  def read(self, size=None):
+    """Reads a byte string from the range.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+    """
+    remaining_size = max(self._range_size - self._current_offset, 0)
+    if size is None or size > remaining_size:
+      size = remaining_size
+
+    if size <= 0:
+      return b''
+
+    self._file_object.seek(
+        self._range_offset + self._current_offset, os.SEEK_SET)
+    data = self._file_object.read(size)
+    self._current_offset += len(data)
+    return data
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the range.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an
+          absolute or relative position within the range.
+
+    Raises:
+      IOError: if the seek failed.
+      OSError: if the seek failed.
+    """
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._range_size
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+  tell = get_offset
+
+
 class PyparsingSingleLineTextParser(interface.FileObjectParser):
   """Single line text parser interface based on pyparsing."""
 
@@ -155,6 +345,12 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
   # The value is the actual pyparsing structure.
   LINE_STRUCTURES = []
 
+  # Regular expressions that are equivalent to the line structures, per key
+  # of the line structure. Define regular expressions for line structures
+  # that are commonly matched to improve parsing performance. Lines that
+  # do not match the regular expression are parsed by the line structure.
+  _LINE_STRUCTURE_REGULAR_EXPRESSIONS = {}
+
   # In order for the tool to not read too much data into a buffer to evaluate
   # whether or not the parser is the right one for this file or not we
   # specifically define a maximum amount of bytes a single line can occupy. This
@@ -168,6 +364,20 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
 
   _ENCODING = None
 
+  # Regular expression that the first line of a file must match for the file
+  # to be verified by VerifyStructure. The regular expression is used to rule
+  # out files without reading them and must not be stricter than
+  # VerifyStructure.
+  _VERIFICATION_REGEX = None
+
+  # Set this value to True if the lines of the format can be parsed
+  # independently of one another, such that a large file can be parsed
+  # in ranges.
+  _PARSE_RANGES_SUPPORTED = False
+
+  # The number of bytes to read at once when searching for the end of a line.
+  _PARSE_RANGE_READ_SIZE = 4096
+
   _EMPTY_LINES = frozenset(['\n', '\r', '\r\n'])
 
   # Allow for a maximum of 40 empty lines before we bail out.
@@ -194,6 +404,8 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
     # TODO: self._line_structures is a work-around and this needs
     # a structural fix.
     self._line_structures = list(self.LINE_STRUCTURES)
+    self._line_structure_regular_expressions = dict(
+        self._LINE_STRUCTURE_REGULAR_EXPRESSIONS)
     self._parser_mediator = None
 
     codecs.register_error('text_parser_handler', self._EncodingErrorHandler)
@@ -339,6 +551,166 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
 
     return line
 
+  def _ReadLines(self, line_reader):
+    """Reads lines from a text file.
+
+    Args:
+      line_reader (TextLineReader): text line reader.
+
+    Yields:
+      str: single line read from the file-like object, or the maximum number of
+          characters, if the line is longer than the maximum line length.
+
+    Raises:
+      UnicodeDecodeError: if the text cannot be decoded using the specified
+          encoding and encoding errors is set to strict.
+    """
+    number_of_empty_lines = 0
+    for line in line_reader:
+      if line in self._EMPTY_LINES:
+        if number_of_empty_lines == self._MAXIMUM_DEPTH:
+          break
+
+        number_of_empty_lines += 1
+        continue
+
+      number_of_empty_lines = 0
+      yield line
+
+  def _GetEndOfLineOffset(self, file_object, offset, file_size):
+    """Retrieves the offset of the end of the line that contains an offset.
+
+    The search is limited to the maximum line length, such that a large file
+    without end-of-line characters is not read entirely, for example by
+    a parser that has not yet verified the file.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object.
+      offset (int): offset in the file-like object.
+      file_size (int): size of the file-like object.
+
+    Returns:
+      int: offset directly after the end-of-line character, the size of
+          the file-like object if there is no end-of-line character before
+          the end of the file or None if there is no end-of-line character
+          within the maximum line length.
+    """
+    maximum_offset = min(offset + self.MAX_LINE_LENGTH, file_size)
+
+    file_object.seek(offset, os.SEEK_SET)
+    while offset < maximum_offset:
+      read_size = min(self._PARSE_RANGE_READ_SIZE, maximum_offset - offset)
+      data = file_object.read(read_size)
+      if not data:
+        break
+
+      data_offset = data.find(b'\n')
+      if data_offset != -1:
+        return offset + data_offset + 1
+
+      offset += len(data)
+
+    if offset < file_size:
+      return None
+
+    return file_size
+
+  def CheckFileHead(self, parser_mediator, file_head):
+    """Determines if the parser can possibly parse a file based on its head.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      file_head (FileHead): head of the file.
+
+    Returns:
+      bool: False if the parser cannot parse the file, True otherwise.
+    """
+    encoding = self._ENCODING or parser_mediator.codepage
+
+    # The first line is shared by parsers with the same encoding and maximum
+    # line length.
+    lookup_key = ('first_line', encoding, self.MAX_LINE_LENGTH)
+    if lookup_key in file_head.cached_values:
+      line = file_head.cached_values[lookup_key]
+
+    else:
+      file_head.seek(0, os.SEEK_SET)
+
+      try:
+        text_file_object = text_file.TextFile(file_head, encoding=encoding)
+        line = self._ReadLine(text_file_object, max_len=self.MAX_LINE_LENGTH)
+      except UnicodeDecodeError:
+        line = ''
+      except (IOError, LookupError):
+        # The first line extends beyond the head of the file or the encoding
+        # is not supported, which is left to ParseFileObject to determine.
+        line = None
+
+      file_head.cached_values[lookup_key] = line
+
+    if line is None:
+      return True
+
+    if not line:
+      return False
+
+    if self._VERIFICATION_REGEX and not self._VERIFICATION_REGEX.match(line):
+      return False
+
+    return True
+
+  def GetParseRanges(self, parser_mediator, file_object, maximum_range_size):
+    """Retrieves ranges of the file that can be parsed independently.
+
+    Args:
+      parser_mediator (ParserMediator): a parser mediator.
+      file_object (dvfvs.FileIO): a file-like object.
+      maximum_range_size (int): maximum size of a range in bytes.
+
+    Returns:
+      list[tuple[int, int]]: start and end offset of the ranges, where
+          every range starts at the beginning of a line, or None if the file
+          should not be parsed in ranges.
+    """
+    if not self._PARSE_RANGES_SUPPORTED or not maximum_range_size:
+      return None
+
+    file_size = file_object.get_size()
+    if file_size <= maximum_range_size:
+      return None
+
+    # Ranges are aligned on the end-of-line character, which is only
+    # supported for encodings where the end-of-line character is a single
+    # byte.
+    encoding = self._ENCODING or parser_mediator.codepage
+    try:
+      if len('\n'.encode(encoding)) != 1:
+        return None
+    except LookupError:
+      return None
+
+    parse_ranges = []
+    range_start = 0
+    while range_start < file_size:
+      range_end = range_start + maximum_range_size
+      if range_end < file_size:
+        range_end = self._GetEndOfLineOffset(
+            file_object, range_end - 1, file_size)
+        if range_end is None:
+          return None
+
+      else:
+        range_end = file_size
+
+      parse_ranges.append((range_start, range_end))
+      range_start = range_end
+
+    if len(parse_ranges) < 2:
+      return None
+
+    return parse_ranges
+
   def ParseFileObject(self, parser_mediator, file_object):
     """Parses a text file-like object using a pyparsing definition.
 
@@ -358,44 +730,57 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
 
     encoding = self._ENCODING or parser_mediator.codepage
 
-    # Use strict encoding error handling in the verification step so that
-    # a text parser does not generate extraction warning for encoding errors
-    # of unsupported files.
-    text_file_object = text_file.TextFile(file_object, encoding=encoding)
+    range_start = 0
+    if self._PARSE_RANGES_SUPPORTED and parser_mediator.parse_range:
+      range_start, range_end = parser_mediator.parse_range
+      file_object = FileObjectRange(
+          file_object, range_start, range_end - range_start)
 
-    try:
-      line = self._ReadLine(text_file_object, max_len=self.MAX_LINE_LENGTH)
-    except UnicodeDecodeError:
-      raise errors.UnableToParseFile(
-          'Not a text file or encoding not supported.')
+    # The structure of the file is only verified at the start of the file,
+    # subsequent ranges are part of a file that has already been verified.
+    if range_start == 0:
+      # Use strict encoding error handling in the verification step so that
+      # a text parser does not generate extraction warning for encoding errors
+      # of unsupported files.
+      text_file_object = text_file.TextFile(file_object, encoding=encoding)
 
-    if not line:
-      raise errors.UnableToParseFile('Not a text file.')
+      try:
+        line = self._ReadLine(text_file_object, max_len=self.MAX_LINE_LENGTH)
+      except UnicodeDecodeError:
+        raise errors.UnableToParseFile(
+            'Not a text file or encoding not supported.')
 
-    if len(line) == self.MAX_LINE_LENGTH or len(
-        line) == self.MAX_LINE_LENGTH - 1:
-      logger.debug((
-          'Trying to read a line and reached the maximum allowed length of '
-          '{0:d}. The last few bytes of the line are: {1:s} [parser '
-          '{2:s}]').format(
-              self.MAX_LINE_LENGTH, repr(line[-10:]), self.NAME))
+      if not line:
+        raise errors.UnableToParseFile('Not a text file.')
 
-    if not self._IsText(line):
-      raise errors.UnableToParseFile('Not a text file, unable to proceed.')
+      if len(line) == self.MAX_LINE_LENGTH or len(
+          line) == self.MAX_LINE_LENGTH - 1:
+        logger.debug((
+            'Trying to read a line and reached the maximum allowed length of '
+            '{0:d}. The last few bytes of the line are: {1:s} [parser '
+            '{2:s}]').format(
+                self.MAX_LINE_LENGTH, repr(line[-10:]), self.NAME))
 
-    if not self.VerifyStructure(parser_mediator, line):
-      raise errors.UnableToParseFile('Wrong file structure.')
+      if not self._IsText(line):
+        raise errors.UnableToParseFile('Not a text file, unable to proceed.')
+
+      if not self.VerifyStructure(parser_mediator, line):
+        raise errors.UnableToParseFile('Wrong file structure.')
 
     self._parser_mediator = parser_mediator
 
-    text_file_object = text_file.TextFile(
-        file_object, encoding=encoding, encoding_errors='text_parser_handler')
-    line = self._ReadLine(text_file_object, max_len=self.MAX_LINE_LENGTH)
+    # Set the offset to the beginning of the file or range.
+    self._current_offset = range_start
+
+    line_reader = line_reader_file.TextLineReader(
+        file_object, encoding=encoding, encoding_errors='text_parser_handler',
+        maximum_line_length=self.MAX_LINE_LENGTH)
+    lines = self._ReadLines(line_reader)
+
+    line = next(lines, '')
 
     consecutive_line_failures = 0
     index = None
-    # Set the offset to the beginning of the file.
-    self._current_offset = 0
     # Read every line in the text file.
     while line:
       if parser_mediator.abort:
@@ -404,10 +789,20 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
       use_key = None
       # Try to parse the line using all the line structures.
       for index, (key, structure) in enumerate(self._line_structures):
-        try:
-          parsed_structure = structure.parseString(line)
-        except pyparsing.ParseException:
-          pass
+        regular_expression = self._line_structure_regular_expressions.get(
+            key, None)
+        if regular_expression:
+          try:
+            parsed_structure = regular_expression.Match(line)
+          except ValueError:
+            pass
+
+        if not parsed_structure:
+          try:
+            parsed_structure = structure.parseString(line)
+          except pyparsing.ParseException:
+            pass
+
         if parsed_structure:
           use_key = key
           break
@@ -431,10 +826,10 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
               'more than {0:d} consecutive failures to parse lines.'.format(
                   self.MAXIMUM_CONSECUTIVE_LINE_FAILURES))
 
-      self._current_offset = text_file_object.get_offset()
+      self._current_offset = range_start + line_reader.get_offset()
 
       try:
-        line = self._ReadLine(text_file_object, max_len=self.MAX_LINE_LENGTH)
+        line = next(lines, '')
       except UnicodeDecodeError:
         parser_mediator.ProduceExtractionWarning(
             'unable to read and decode log line at offset {0:d}'.format(
@@ -591,6 +986,53 @@ class PyparsingMultiLineTextParser(PyparsingSingleLineTextParser):
     super(PyparsingMultiLineTextParser, self).__init__()
     self._buffer_size = self.BUFFER_SIZE
 
+  def CheckFileHead(self, parser_mediator, file_head):
+    """Determines if the parser can possibly parse a file based on its head.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      file_head (FileHead): head of the file.
+
+    Returns:
+      bool: False if the parser cannot parse the file, True otherwise.
+    """
+    encoding = self._ENCODING or parser_mediator.codepage
+
+    # The first lines are shared by parsers with the same encoding and buffer
+    # size.
+    lookup_key = ('first_lines', encoding, self.BUFFER_SIZE)
+    if lookup_key in file_head.cached_values:
+      lines = file_head.cached_values[lookup_key]
+
+    else:
+      file_head.seek(0, os.SEEK_SET)
+
+      text_reader = EncodedTextReader(encoding, buffer_size=self.BUFFER_SIZE)
+
+      try:
+        text_reader.ReadLines(file_head)
+        lines = text_reader.lines
+      except UnicodeDecodeError:
+        lines = False
+      except (IOError, LookupError):
+        # The first lines extend beyond the head of the file or the encoding
+        # is not supported, which is left to ParseFileObject to determine.
+        lines = None
+
+      file_head.cached_values[lookup_key] = lines
+
+    if lines is None:
+      return True
+
+    if lines is False:
+      return False
+
+    if self._VERIFICATION_REGEX and not self._VERIFICATION_REGEX.match(lines):
+      return False
+
+    return True
+
   def ParseFileObject(self, parser_mediator, file_object):
     """Parses a text file-like object using a pyparsing definition.
 
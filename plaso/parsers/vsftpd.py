@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Parser for vsftpd Logs."""
 
+import re
+
 import pyparsing
 from dfdatetime import time_elements as dfdatetime_time_elements
 
@@ -34,6 +36,11 @@ class VsftpdLogParser(text_parser.PyparsingSingleLineTextParser):
   NAME = 'vsftpd'
   DATA_FORMAT = 'vsftpd log file'
 
+  _PARSE_RANGES_SUPPORTED = True
+
+  _VERIFICATION_REGEX = re.compile(
+      r'(?=.* \[pid )(?=.*: Client )', re.DOTALL)
+
   _DATETIME_ELEMENTS = (
       text_parser.PyparsingConstants.THREE_LETTERS.setResultsName('day') +
       text_parser.PyparsingConstants.THREE_LETTERS.setResultsName('month') +
@@ -57,6 +64,24 @@ class VsftpdLogParser(text_parser.PyparsingSingleLineTextParser):
       ('logline', _LOG_LINE),
   ]
 
+  _LOG_LINE_REGULAR_EXPRESSION = (
+      r'(?P<day>[A-Za-z]{3}) +(?P<month>[A-Za-z]{3}) +'
+      r'(?P<day_of_month>[0-9]{1,2}) +'
+      r'(?P<hours>[0-9]{2}):(?P<minutes>[0-9]{2}):(?P<seconds>[0-9]{2}) +'
+      r'(?P<year>[0-9]{4})(?![0-9])[ \t\r]*(?P<text>[^\n]*)')
+
+  _LINE_STRUCTURE_REGULAR_EXPRESSIONS = {
+      'logline': text_parser.LineStructureRegularExpression(
+          _LOG_LINE_REGULAR_EXPRESSION, converters={
+              'day_of_month': int,
+              'hours': int,
+              'minutes': int,
+              'seconds': int,
+              'year': int},
+          groups={'date_time': [
+              'day', 'month', 'day_of_month', 'hours', 'minutes', 'seconds',
+              'year']})}
+
   def _GetTimeElementsTuple(self, structure):
     """Retrieves a time elements tuple from the structure.
 
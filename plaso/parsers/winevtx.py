@@ -202,7 +202,15 @@ class WinEvtxParser(interface.FileObjectParser):
     # The call to evt_file.get_record() and access to members of evt_record
     # should be called within a try-except.
 
-    for record_index in range(evtx_file.number_of_records):
+    number_of_records = evtx_file.number_of_records
+
+    # The parse range defines a range of record indexes, where recovered
+    # records are only parsed as part of the last range.
+    first_record_index, last_record_index = (
+        parser_mediator.parse_range or (0, number_of_records))
+    last_record_index = min(last_record_index, number_of_records)
+
+    for record_index in range(first_record_index, last_record_index):
       if parser_mediator.abort:
         break
 
@@ -215,6 +223,9 @@ class WinEvtxParser(interface.FileObjectParser):
             'unable to parse event record: {0:d} with error: {1!s}'.format(
                 record_index, exception))
 
+    if last_record_index < number_of_records:
+      return
+
     for record_index in range(evtx_file.number_of_recovered_records):
       if parser_mediator.abort:
         break
@@ -240,6 +251,55 @@ class WinEvtxParser(interface.FileObjectParser):
     format_specification.AddNewSignature(b'ElfFile\x00', offset=0)
     return format_specification
 
+  def GetParseRanges(self, parser_mediator, file_object, maximum_range_size):
+    """Retrieves ranges of the file that can be parsed independently.
+
+    Args:
+      parser_mediator (ParserMediator): a parser mediator.
+      file_object (dvfvs.FileIO): a file-like object.
+      maximum_range_size (int): maximum size of a range in bytes.
+
+    Returns:
+      list[tuple[int, int]]: first and last (exclusive) record index of
+          the ranges or None if the file should not be parsed in ranges.
+    """
+    file_size = file_object.get_size()
+    if not maximum_range_size or file_size <= maximum_range_size:
+      return None
+
+    evtx_file = pyevtx.file()
+    evtx_file.set_ascii_codepage(parser_mediator.codepage)
+
+    try:
+      evtx_file.open_file_object(file_object)
+    except IOError:
+      return None
+
+    try:
+      number_of_records = evtx_file.number_of_records
+    finally:
+      evtx_file.close()
+
+    number_of_ranges = min(
+        (file_size + maximum_range_size - 1) // maximum_range_size,
+        number_of_records)
+    if number_of_ranges < 2:
+      return None
+
+    range_size, remainder = divmod(number_of_records, number_of_ranges)
+
+    parse_ranges = []
+    first_record_index = 0
+    for range_index in range(number_of_ranges):
+      last_record_index = first_record_index + range_size
+      if range_index < remainder:
+        last_record_index += 1
+
+      parse_ranges.append((first_record_index, last_record_index))
+      first_record_index = last_record_index
+
+    return parse_ranges
+
   def ParseFileObject(self, parser_mediator, file_object):
     """Parses a Windows XML EventLog (EVTX) file-like object.
 
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Parser for Windows Firewall Log file."""
 
+import re
+
 import pytz
 
 import pyparsing
@@ -66,6 +68,8 @@ class WinFirewallParser(text_parser.PyparsingSingleLineTextParser):
 
   _ENCODING = 'ascii'
 
+  _VERIFICATION_REGEX = re.compile(r'#Version: 1\.5\s*$')
+
   # TODO: Add support for custom field names. Currently this parser only
   # supports the default fields, which are:
   #   date time action protocol src-ip dst-ip src-port dst-port size
@@ -35,20 +35,82 @@ class WinRegistryParser(interface.FileObjectParser):
   _NORMALIZED_CONTROL_SET_PREFIX = (
       'HKEY_LOCAL_MACHINE\\System\\CurrentControlSet').lower()
 
+  # The position of a Registry key within a parse range is represented by
+  # the subkey indexes of its first 4 path segments, stored as 15-bit values.
+  _PARSE_RANGE_INDEX_BITS = 15
+  _PARSE_RANGE_MAXIMUM_DEPTH = 4
+  _PARSE_RANGE_MAXIMUM_NUMBER_OF_SUBKEYS = (1 << _PARSE_RANGE_INDEX_BITS) - 2
+
+  _PARSE_RANGE_END = 1 << (
+      _PARSE_RANGE_INDEX_BITS * _PARSE_RANGE_MAXIMUM_DEPTH)
+
   def __init__(self):
     """Initializes a parser."""
-    super(WinRegistryParser, self).__init__()
+    self._path_filter = None
     self._plugin_per_key_path = {}
     self._plugins_without_key_paths = []
+    super(WinRegistryParser, self).__init__()
 
-    default_plugin_list_index = None
-    key_paths = []
+  def _CanProcessKeyWithPlugin(self, registry_key, plugin):
+    """Determines if a plugin can process a Windows Registry key or its values.
+
+    Args:
+      registry_key (dfwinreg.WinRegistryKey): Windows Registry key.
+      plugin (WindowsRegistryPlugin): Windows Registry plugin.
 
-    for list_index, plugin in enumerate(self._plugins):
-      if plugin.NAME == 'winreg_default':
-        default_plugin_list_index = list_index
+    Returns:
+      bool: True if the Registry key can be processed with the plugin.
+    """
+    for registry_key_filter in plugin.FILTERS:
+      # Skip filters that define key paths since they are already
+      # checked by the path filter.
+      if getattr(registry_key_filter, 'key_paths', []):
         continue
 
+      if registry_key_filter.Match(registry_key):
+        return True
+
+    return False
+
+  def _CanProcessSubkeys(self, registry_key):
+    """Determines if the subkeys of a Windows Registry key can be processed.
+
+    Args:
+      registry_key (dfwinreg.WinRegistryKey): Windows Registry key.
+
+    Returns:
+      bool: True if a subkey of the Registry key, or one of its subkeys, can
+          be processed by a plugin.
+    """
+    # The default plugin and plugins without key paths can process any key.
+    if self._default_plugin or self._plugins_without_key_paths:
+      return True
+
+    normalized_key_path = self._NormalizeKeyPath(registry_key.path)
+    return self._path_filter.CheckPathPrefix(normalized_key_path)
+
+  def EnablePlugins(self, plugin_includes, plugin_excludes=None):
+    """Enables parser plugins.
+
+    Besides enabling the plugins, this function indexes the plugins by their
+    key paths.
+
+    Args:
+      plugin_includes (set[str]): names of the plugins to enable, where
+          set(['*']) represents all plugins. Note the default plugin, if
+          it exists, is always enabled unless it is explicitly excluded.
+      plugin_excludes (Optional[set[str]]): names of the plugins to disable,
+          where exclusion takes precedence over inclusion.
+    """
+    super(WinRegistryParser, self).EnablePlugins(
+        plugin_includes, plugin_excludes=plugin_excludes)
+
+    self._plugin_per_key_path = {}
+    self._plugins_without_key_paths = []
+
+    key_paths = []
+
+    for plugin in self._plugins:
       for registry_key_filter in plugin.FILTERS:
         plugin_key_paths = getattr(registry_key_filter, 'key_paths', [])
         if (not plugin_key_paths and
@@ -70,33 +132,9 @@ class WinRegistryParser(interface.FileObjectParser):
 
           key_paths.append(plugin_key_path)
 
-    if default_plugin_list_index is not None:
-      self._default_plugin = self._plugins.pop(default_plugin_list_index)
-
     self._path_filter = path_filter.PathFilterScanTree(
         key_paths, case_sensitive=False, path_segment_separator='\\')
 
-  def _CanProcessKeyWithPlugin(self, registry_key, plugin):
-    """Determines if a plugin can process a Windows Registry key or its values.
-
-    Args:
-      registry_key (dfwinreg.WinRegistryKey): Windows Registry key.
-      plugin (WindowsRegistryPlugin): Windows Registry plugin.
-
-    Returns:
-      bool: True if the Registry key can be processed with the plugin.
-    """
-    for registry_key_filter in plugin.FILTERS:
-      # Skip filters that define key paths since they are already
-      # checked by the path filter.
-      if getattr(registry_key_filter, 'key_paths', []):
-        continue
-
-      if registry_key_filter.Match(registry_key):
-        return True
-
-    return False
-
   @classmethod
   def GetFormatSpecification(cls):
     """Retrieves the format specification."""
@@ -179,7 +217,25 @@ class WinRegistryParser(interface.FileObjectParser):
 
     self._ParseKey(parser_mediator, registry_key)
 
-    for subkey_index in range(registry_key.number_of_subkeys):
+    self._ParseRecurseSubkeys(
+        parser_mediator, registry_key, 0, registry_key.number_of_subkeys)
+
+  def _ParseRecurseSubkeys(
+      self, parser_mediator, registry_key, first_subkey_index,
+      last_subkey_index):
+    """Parses a range of subkeys of a Registry key recursively.
+
+    Args:
+      parser_mediator (ParserMediator): parser mediator.
+      registry_key (dfwinreg.WinRegistryKey): Windows Registry key.
+      first_subkey_index (int): index of the first subkey to parse.
+      last_subkey_index (int): index of the last subkey to parse (exclusive).
+    """
+    # Skip the subkeys if none of them can be processed by a plugin.
+    if not self._CanProcessSubkeys(registry_key):
+      return
+
+    for subkey_index in range(first_subkey_index, last_subkey_index):
       if parser_mediator.abort:
         break
 
@@ -191,6 +247,72 @@ class WinRegistryParser(interface.FileObjectParser):
         parser_mediator.ProduceExtractionWarning(
             'in key: {0:s} error: {1!s}'.format(registry_key.path, exception))
 
+  def _ParseRootKey(self, parser_mediator, root_key):
+    """Parses the root key and its subkeys recursively.
+
+    Args:
+      parser_mediator (ParserMediator): parser mediator.
+      root_key (dfwinreg.WinRegistryKey): root Windows Registry key.
+    """
+    parse_range = parser_mediator.parse_range
+    if not parse_range:
+      self._ParseRecurseKeys(parser_mediator, root_key)
+    else:
+      self._ParseSubtreeInRange(parser_mediator, root_key, (), parse_range)
+
+  def _ParseSubtreeInRange(
+      self, parser_mediator, registry_key, subkey_indexes, parse_range):
+    """Parses the Registry keys of a subtree that are in a parse range.
+
+    Args:
+      parser_mediator (ParserMediator): parser mediator.
+      registry_key (dfwinreg.WinRegistryKey): Windows Registry key.
+      subkey_indexes (tuple[int]): subkey indexes of the path of the Registry
+          key relative to the root key.
+      parse_range (tuple[int, int]): first and last (exclusive) position of
+          the parse range.
+    """
+    range_start, range_end = parse_range
+    subtree_start, subtree_end = self._GetSubtreePositions(subkey_indexes)
+
+    number_of_subkeys = registry_key.number_of_subkeys
+
+    # A subtree that is not split is parsed as part of the range that contains
+    # its first position.
+    if ((range_start <= subtree_start and subtree_end <= range_end) or
+        not self._CanSplitSubtree(subkey_indexes, number_of_subkeys)):
+      if range_start <= subtree_start < range_end:
+        self._ParseRecurseKeys(parser_mediator, registry_key)
+      return
+
+    if range_start <= subtree_start:
+      self._ParseKey(parser_mediator, registry_key)
+
+    # Skip the subkeys if none of them can be processed by a plugin.
+    if not self._CanProcessSubkeys(registry_key):
+      return
+
+    for subkey_index in range(number_of_subkeys):
+      if parser_mediator.abort:
+        break
+
+      subkey_subtree_indexes = subkey_indexes + (subkey_index, )
+      subkey_start, subkey_end = self._GetSubtreePositions(
+          subkey_subtree_indexes)
+      if subkey_end <= range_start:
+        continue
+      if subkey_start >= range_end:
+        break
+
+      try:
+        subkey = registry_key.GetSubkeyByIndex(subkey_index)
+        self._ParseSubtreeInRange(
+            parser_mediator, subkey, subkey_subtree_indexes, parse_range)
+
+      except IOError as exception:
+        parser_mediator.ProduceExtractionWarning(
+            'in key: {0:s} error: {1!s}'.format(registry_key.path, exception))
+
   def _ParseKeysFromFindSpecs(self, parser_mediator, win_registry, find_specs):
     """Parses the Registry keys from FindSpecs.
 
@@ -207,6 +329,198 @@ class WinRegistryParser(interface.FileObjectParser):
       registry_key = searcher.GetKeyByPath(registry_key_path)
       self._ParseKey(parser_mediator, registry_key)
 
+  def _CanSplitSubtree(self, subkey_indexes, number_of_subkeys):
+    """Determines if a subtree can be split over multiple parse ranges.
+
+    Args:
+      subkey_indexes (tuple[int]): subkey indexes of the path of the Registry
+          key relative to the root key.
+      number_of_subkeys (int): number of subkeys of the Registry key.
+
+    Returns:
+      bool: True if the positions of the subkeys of the Registry key can be
+          represented.
+    """
+    return bool(
+        len(subkey_indexes) < self._PARSE_RANGE_MAXIMUM_DEPTH and
+        number_of_subkeys <= self._PARSE_RANGE_MAXIMUM_NUMBER_OF_SUBKEYS)
+
+  def _GetSubtreePositions(self, subkey_indexes):
+    """Retrieves the first and last position of a subtree.
+
+    The position of a Registry key is an integer that represents its subkey
+    indexes relative to the root key, such that the positions are ordered in
+    the same way as a pre-order traversal of the Registry keys.
+
+    Args:
+      subkey_indexes (tuple[int]): subkey indexes of the path of the Registry
+          key relative to the root key.
+
+    Returns:
+      tuple[int, int]: first and last (exclusive) position of the subtree.
+    """
+    if not subkey_indexes:
+      return 0, self._PARSE_RANGE_END
+
+    first_position = 0
+    last_position = 0
+    last_depth = len(subkey_indexes) - 1
+    for depth, subkey_index in enumerate(subkey_indexes):
+      shift = self._PARSE_RANGE_INDEX_BITS * (
+          self._PARSE_RANGE_MAXIMUM_DEPTH - depth - 1)
+      first_position |= (subkey_index + 1) << shift
+      if depth == last_depth:
+        subkey_index += 1
+      last_position |= (subkey_index + 1) << shift
+
+    return first_position, last_position
+
+  def _GetSubtreeWeights(self, registry_key, subkey_indexes):
+    """Retrieves the weights of a subtree.
+
+    The weight of a subtree is the number of Registry keys and values it
+    contains, where the subkeys of subtrees that cannot be split are counted
+    without their values and subkeys.
+
+    Args:
+      registry_key (dfwinreg.WinRegistryKey): Windows Registry key.
+      subkey_indexes (tuple[int]): subkey indexes of the path of the Registry
+          key relative to the root key.
+
+    Returns:
+      tuple[int, list[tuple[int, list]]]: weight of the subtree and weights of
+          the subtrees of its subkeys or None if the subtree cannot be split.
+
+    Raises:
+      IOError: if a subkey cannot be read.
+    """
+    number_of_subkeys = registry_key.number_of_subkeys
+    weight = 1 + registry_key.number_of_values
+
+    if not self._CanSplitSubtree(subkey_indexes, number_of_subkeys):
+      return weight + number_of_subkeys, None
+
+    subkey_weights = []
+    for subkey_index in range(number_of_subkeys):
+      subkey = registry_key.GetSubkeyByIndex(subkey_index)
+      subtree_weights = self._GetSubtreeWeights(
+          subkey, subkey_indexes + (subkey_index, ))
+
+      weight += subtree_weights[0]
+      subkey_weights.append(subtree_weights)
+
+    return weight, subkey_weights
+
+  def _GetParseRangeUnits(
+      self, subtree_weights, subkey_indexes, maximum_weight, units):
+    """Retrieves the units a subtree is split in for determining parse ranges.
+
+    Subtrees that are heavier than the maximum weight are descended into, such
+    that a Registry key that contains most of the Registry keys, such as the
+    "Root" key of an AMCache.hve file, is split over multiple parse ranges.
+
+    Args:
+      subtree_weights (tuple[int, list[tuple[int, list]]]): weight of the
+          subtree and weights of the subtrees of its subkeys.
+      subkey_indexes (tuple[int]): subkey indexes of the path of the Registry
+          key relative to the root key.
+      maximum_weight (int): maximum weight of a unit.
+      units (list[tuple[int, int]]): first position and weight of the units,
+          to which the units of the subtree are appended.
+    """
+    weight, subkey_weights = subtree_weights
+    first_position, _ = self._GetSubtreePositions(subkey_indexes)
+
+    if weight <= maximum_weight or subkey_weights is None:
+      units.append((first_position, weight))
+      return
+
+    # The Registry key itself, without its subkeys, is a separate unit.
+    for subkey_subtree_weights in subkey_weights:
+      weight -= subkey_subtree_weights[0]
+
+    units.append((first_position, weight))
+
+    for subkey_index, subkey_subtree_weights in enumerate(subkey_weights):
+      self._GetParseRangeUnits(
+          subkey_subtree_weights, subkey_indexes + (subkey_index, ),
+          maximum_weight, units)
+
+  def GetParseRanges(self, parser_mediator, file_object, maximum_range_size):
+    """Retrieves ranges of the file that can be parsed independently.
+
+    A range consists of consecutive subtrees of Registry keys, that are
+    balanced by the number of Registry keys and values they contain, such that
+    large Windows Registry files are parsed as multiple subtrees.
+
+    Args:
+      parser_mediator (ParserMediator): a parser mediator.
+      file_object (dvfvs.FileIO): a file-like object.
+      maximum_range_size (int): maximum size of a range in bytes.
+
+    Returns:
+      list[tuple[int, int]]: first and last (exclusive) position of the
+          ranges or None if the file should not be parsed in ranges.
+    """
+    file_size = file_object.get_size()
+    if not maximum_range_size or file_size <= maximum_range_size:
+      return None
+
+    # Keys are selected by the artifact filters instead of recursion.
+    registry_find_specs = getattr(
+        parser_mediator.collection_filters_helper, 'registry_find_specs', None)
+    if registry_find_specs:
+      return None
+
+    registry_file = dfwinreg_regf.REGFWinRegistryFile(
+        ascii_codepage=parser_mediator.codepage, emulate_virtual_keys=False)
+
+    try:
+      registry_file.Open(file_object)
+    except IOError:
+      return None
+
+    try:
+      root_key = registry_file.GetRootKey()
+      if not root_key:
+        return None
+
+      subtree_weights = self._GetSubtreeWeights(root_key, ())
+
+    except IOError:
+      return None
+
+    finally:
+      registry_file.Close()
+
+    number_of_ranges = (
+        file_size + maximum_range_size - 1) // maximum_range_size
+    range_weight = (subtree_weights[0] + number_of_ranges - 1) // (
+        number_of_ranges)
+
+    # Use units smaller than a range to be able to balance the ranges.
+    units = []
+    self._GetParseRangeUnits(
+        subtree_weights, (), max(range_weight // 4, 1), units)
+
+    parse_ranges = []
+    first_position = 0
+    weight = 0
+    for position, unit_weight in units:
+      if weight >= range_weight:
+        parse_ranges.append((first_position, position))
+        first_position = position
+        weight = 0
+
+      weight += unit_weight
+
+    if not parse_ranges:
+      return None
+
+    parse_ranges.append((first_position, self._PARSE_RANGE_END))
+
+    return parse_ranges
+
   def ParseFileObject(self, parser_mediator, file_object):
     """Parses a Windows Registry file-like object.
 
@@ -237,10 +551,10 @@ class WinRegistryParser(interface.FileObjectParser):
       if root_key:
         # For now treat AMCache.hve seperately.
         if root_key.name.lower() in self._AMCACHE_ROOT_KEY_NAMES:
-          self._ParseRecurseKeys(parser_mediator, root_key)
+          self._ParseRootKey(parser_mediator, root_key)
 
         elif not registry_find_specs:
-          self._ParseRecurseKeys(parser_mediator, root_key)
+          self._ParseRootKey(parser_mediator, root_key)
 
         elif not self._ARTIFACTS_FILTER_HELPER.CheckKeyCompatibility(
             key_path_prefix):
@@ -52,6 +52,8 @@ References
 http://xchat.org
 """
 
+import re
+
 import pyparsing
 
 from dfdatetime import time_elements as dfdatetime_time_elements
@@ -90,6 +92,8 @@ class XChatLogParser(text_parser.PyparsingSingleLineTextParser):
 
   _ENCODING = 'utf-8'
 
+  _VERIFICATION_REGEX = re.compile(r'\s*\*\*\*\*')
+
   # Common (header/footer/body) pyparsing structures.
   # TODO: Only English ASCII timestamp supported ATM, add support for others.
 
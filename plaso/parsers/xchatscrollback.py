@@ -35,6 +35,8 @@ References
 http://xchat.org
 """
 
+import re
+
 import pyparsing
 
 from dfdatetime import posix_time as dfdatetime_posix_time
@@ -72,6 +74,8 @@ class XChatScrollbackParser(text_parser.PyparsingSingleLineTextParser):
 
   _ENCODING = 'utf-8'
 
+  _VERIFICATION_REGEX = re.compile(r'\s*T\s*\d')
+
   # Define how a log line should look like.
   LOG_LINE = (
       pyparsing.Literal('T').suppress() +
@@ -11,6 +11,7 @@ from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.resolver import resolver
 
 from plaso.containers import event_sources
+from plaso.containers import events
 from plaso.engine import engine
 from plaso.engine import extractors
 from plaso.engine import logger
@@ -71,13 +72,22 @@ class SingleProcessEngine(engine.BaseEngine):
         self._file_system_cache.remove(file_system)
         self._file_system_cache.append(file_system)
 
-  def _ProcessPathSpec(self, extraction_worker, parser_mediator, path_spec):
+  def _ProcessPathSpec(
+      self, extraction_worker, parser_mediator, path_spec, parser_name=None,
+      parse_range=None, event_data_stream=None):
     """Processes a path specification.
 
     Args:
       extraction_worker (worker.ExtractionWorker): extraction worker.
       parser_mediator (ParserMediator): parser mediator.
       path_spec (dfvfs.PathSpec): path specification.
+      parser_name (Optional[str]): name of the parser to parse the range of
+          the file entry with.
+      parse_range (Optional[tuple[int, int]]): start and end of the range of
+          the file entry to parse, as defined by the parser.
+      event_data_stream (Optional[EventDataStream]): event data stream of
+          the range of the file entry to parse, that contains the results of
+          the analyzers of the file entry.
     """
     self._current_display_name = parser_mediator.GetDisplayNameForPathSpec(
         path_spec)
@@ -91,7 +101,9 @@ class SingleProcessEngine(engine.BaseEngine):
 
     try:
       extraction_worker.ProcessPathSpec(
-          parser_mediator, path_spec, excluded_find_specs=excluded_find_specs)
+          parser_mediator, path_spec, excluded_find_specs=excluded_find_specs,
+          parser_name=parser_name, parse_range=parse_range,
+          event_data_stream=event_data_stream)
 
     except KeyboardInterrupt:
       self._abort = True
@@ -179,8 +191,23 @@ class SingleProcessEngine(engine.BaseEngine):
       if self._abort:
         break
 
+      event_data_stream = None
+      parse_range = None
+      if event_source.parser_name:
+        parse_range = (
+            event_source.parse_range_start, event_source.parse_range_end)
+
+        event_data_stream = events.EventDataStream()
+        event_data_stream.file_entropy = event_source.file_entropy
+        event_data_stream.md5_hash = event_source.md5_hash
+        event_data_stream.sha1_hash = event_source.sha1_hash
+        event_data_stream.sha256_hash = event_source.sha256_hash
+        event_data_stream.yara_match = event_source.yara_match
+
       self._ProcessPathSpec(
-          self._extraction_worker, parser_mediator, event_source.path_spec)
+          self._extraction_worker, parser_mediator, event_source.path_spec,
+          parser_name=event_source.parser_name, parse_range=parse_range,
+          event_data_stream=event_data_stream)
 
       self._number_of_consumed_sources += 1
 
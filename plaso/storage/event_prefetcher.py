@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""The event prefetcher."""
+
+import queue
+import threading
+
+from plaso.containers import events
+from plaso.storage import logger
+
+
+class EventPrefetcher(object):
+  """Event prefetcher.
+
+  The event prefetcher reads events in increasing chronological order and
+  looks ahead a number of events to retrieve their event data and event data
+  streams in batches, instead of one by one.
+
+  If the storage reader supports concurrent storage readers, the batches are
+  read on a background thread, so that reading the storage overlaps with
+  processing the events, such as formatting them.
+  """
+
+  _CONTAINER_TYPE_EVENT = events.EventObject.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
+
+  # The default number of events to look ahead.
+  _DEFAULT_BATCH_SIZE = 512
+
+  # The maximum number of batches that are read ahead by the background
+  # thread.
+  _MAXIMUM_NUMBER_OF_QUEUED_BATCHES = 8
+
+  # The timeout, in seconds, of waiting on the queue of batches, after which
+  # the background thread checks if it should stop.
+  _QUEUE_TIMEOUT = 1.0
+
+  def __init__(
+      self, storage_reader, batch_size=None, read_event_data_streams=True):
+    """Initializes an event prefetcher.
+
+    Args:
+      storage_reader (StorageReader): storage reader.
+      batch_size (Optional[int]): number of events to look ahead, where None
+          represents the default batch size.
+      read_event_data_streams (Optional[bool]): True if the event data streams
+          should be read. If False None is returned instead of the event data
+          stream.
+    """
+    super(EventPrefetcher, self).__init__()
+    self._abort = False
+    self._batch_size = batch_size or self._DEFAULT_BATCH_SIZE
+    self._batches_queue = None
+    self._exception = None
+    self._read_event_data_streams = read_event_data_streams
+    self._storage_reader = storage_reader
+
+  def _GetBatches(self, storage_reader, time_range):
+    """Retrieves batches of events with their event data and streams.
+
+    Args:
+      storage_reader (StorageReader): storage reader.
+      time_range (TimeRange): time range used to filter events that fall in
+          a specific period or None if not set.
+
+    Yields:
+      list[tuple[EventObject, EventData, EventDataStream]]: events with their
+          event data and event data streams.
+    """
+    batch = []
+    for event in storage_reader.GetSortedEvents(time_range=time_range):
+      batch.append(event)
+      if len(batch) >= self._batch_size:
+        yield self._ReadBatch(storage_reader, batch)
+        batch = []
+
+    if batch:
+      yield self._ReadBatch(storage_reader, batch)
+
+  def _PrefetchThreadMain(self, storage_reader, time_range):
+    """The prefetch thread main function.
+
+    Args:
+      storage_reader (StorageReader): concurrent storage reader, which is
+          closed when the thread stops.
+      time_range (TimeRange): time range used to filter events that fall in
+          a specific period or None if not set.
+    """
+    try:
+      for batch in self._GetBatches(storage_reader, time_range):
+        if not self._PutBatch(batch):
+          break
+
+    except Exception as exception:  # pylint: disable=broad-except
+      logger.error('Unable to prefetch events with error: {0!s}'.format(
+          exception))
+      self._exception = exception
+
+    finally:
+      storage_reader.Close()
+
+      # None signals the end of the batches.
+      self._PutBatch(None)
+
+  def _PutBatch(self, batch):
+    """Puts a batch on the queue of batches.
+
+    Args:
+      batch (list[tuple[EventObject, EventData, EventDataStream]]): events
+          with their event data and event data streams or None to signal
+          the end of the batches.
+
+    Returns:
+      bool: True if the batch was put on the queue or False if the prefetcher
+          was aborted.
+    """
+    while not self._abort:
+      try:
+        self._batches_queue.put(batch, timeout=self._QUEUE_TIMEOUT)
+        return True
+      except queue.Full:
+        pass
+
+    return False
+
+  def _ReadBatch(self, storage_reader, batch):
+    """Reads the event data and event data streams of a batch of events.
+
+    Args:
+      storage_reader (StorageReader): storage reader.
+      batch (list[EventObject]): events.
+
+    Returns:
+      list[tuple[EventObject, EventData, EventDataStream]]: events with their
+          event data and event data streams.
+    """
+    event_data_identifiers = [
+        event.GetEventDataIdentifier() for event in batch]
+    event_data_list = storage_reader.GetAttributeContainersByIdentifiers(
+        self._CONTAINER_TYPE_EVENT_DATA, event_data_identifiers)
+
+    if not self._read_event_data_streams:
+      return [
+          (event, event_data, None)
+          for event, event_data in zip(batch, event_data_list)]
+
+    event_data_stream_identifiers = []
+    for event_data in event_data_list:
+      if event_data:
+        event_data_stream_identifier = (
+            event_data.GetEventDataStreamIdentifier())
+        if event_data_stream_identifier:
+          event_data_stream_identifiers.append(event_data_stream_identifier)
+
+    event_data_streams = iter(
+        storage_reader.GetAttributeContainersByIdentifiers(
+            self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+            event_data_stream_identifiers))
+
+    events_with_event_data = []
+    for event, event_data in zip(batch, event_data_list):
+      event_data_stream = None
+      if event_data and event_data.GetEventDataStreamIdentifier():
+        event_data_stream = next(event_data_streams)
+
+      events_with_event_data.append((event, event_data, event_data_stream))
+
+    return events_with_event_data
+
+  def GetEventsByIdentifiers(self, event_identifiers):
+    """Retrieves events with their event data and streams by identifiers.
+
+    This function reads from the storage reader of the prefetcher, not from
+    the concurrent storage reader, hence it should be called from the thread
+    that consumes the events.
+
+    Args:
+      event_identifiers (list[AttributeContainerIdentifier]): event attribute
+          container identifiers.
+
+    Returns:
+      list[tuple[EventObject, EventData, EventDataStream]]: events with their
+          event data and event data streams, in the same order as the
+          identifiers.
+    """
+    if not event_identifiers:
+      return []
+
+    batch = self._storage_reader.GetAttributeContainersByIdentifiers(
+        self._CONTAINER_TYPE_EVENT, event_identifiers)
+
+    return self._ReadBatch(self._storage_reader, batch)
+
+  def GetEvents(self, time_range=None):
+    """Retrieves the events in increasing chronological order.
+
+    Args:
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+
+    Yields:
+      tuple: containing:
+
+        EventObject: event.
+        EventData: event data.
+        EventDataStream: event data stream or None if not available.
+
+    Raises:
+      IOError: if the events could not be prefetched.
+      OSError: if the events could not be prefetched.
+    """
+    concurrent_storage_reader = (
+        self._storage_reader.CreateConcurrentStorageReader())
+
+    if not concurrent_storage_reader:
+      for batch in self._GetBatches(self._storage_reader, time_range):
+        for event, event_data, event_data_stream in batch:
+          yield event, event_data, event_data_stream
+
+      return
+
+    self._abort = False
+    self._batches_queue = queue.Queue(
+        maxsize=self._MAXIMUM_NUMBER_OF_QUEUED_BATCHES)
+    self._exception = None
+
+    prefetch_thread = threading.Thread(
+        name='EventPrefetcher', target=self._PrefetchThreadMain,
+        args=(concurrent_storage_reader, time_range))
+    prefetch_thread.daemon = True
+    prefetch_thread.start()
+
+    try:
+      batch = self._batches_queue.get()
+      while batch is not None:
+        for event, event_data, event_data_stream in batch:
+          yield event, event_data, event_data_stream
+
+        batch = self._batches_queue.get()
+
+    finally:
+      # Stop the prefetch thread in case the consumer stopped before all
+      # the events were retrieved.
+      self._abort = True
+      prefetch_thread.join()
+
+      self._batches_queue = None
+
+    if self._exception:
+      raise IOError('Unable to prefetch events with error: {0!s}'.format(
+          self._exception))
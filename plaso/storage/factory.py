@@ -62,18 +62,22 @@ class StorageFactory(object):
     return None
 
   @classmethod
-  def CreateStorageWriter(cls, storage_format):
+  def CreateStorageWriter(cls, storage_format, compression_format=None):
     """Creates a storage writer.
 
     Args:
       storage_format (str): storage format.
+      compression_format (Optional[str]): compression format of newly created
+          storage files, where None represents the default compression format
+          of the storage format.
 
     Returns:
       StorageWriter: a storage writer or None if the storage file cannot be
           opened or the storage format is not supported.
     """
     if storage_format == definitions.STORAGE_FORMAT_SQLITE:
-      return sqlite_writer.SQLiteStorageFileWriter()
+      return sqlite_writer.SQLiteStorageFileWriter(
+          compression_format=compression_format)
 
     if storage_format == definitions.STORAGE_FORMAT_REDIS:
       return redis_writer.RedisStorageWriter()
@@ -252,6 +252,30 @@ class BaseStore(object):
           provided.
     """
 
+  def GetAttributeContainersByIdentifiers(
+      self, container_type, container_identifiers):
+    """Retrieves a specific type of containers with specific identifiers.
+
+    Args:
+      container_type (str): container type.
+      container_identifiers (list[AttributeContainerIdentifier]): attribute
+          container identifiers.
+
+    Returns:
+      list[AttributeContainer]: attribute containers, in the same order as
+          the identifiers, where None represents a container that is not
+          available.
+
+    Raises:
+      IOError: when the store is closed or if an unsupported identifier is
+          provided.
+      OSError: when the store is closed or if an unsupported identifier is
+          provided.
+    """
+    return [
+        self.GetAttributeContainerByIdentifier(container_type, identifier)
+        for identifier in container_identifiers]
+
   @abc.abstractmethod
   def GetAttributeContainers(self, container_type):
     """Retrieves a specific type of attribute containers.
@@ -24,6 +24,18 @@ class StorageReader(object):
     self._store.Close()
     self._store = None
 
+  def CreateConcurrentStorageReader(self):
+    """Creates a concurrent storage reader.
+
+    The concurrent storage reader reads the same storage as this storage
+    reader but is independent of it, so that it can be used from another
+    thread.
+
+    Returns:
+      StorageReader: storage reader or None if not supported.
+    """
+    return None
+
   def GetAttributeContainerByIdentifier(self, container_type, identifier):
     """Retrieves a specific type of container with a specific identifier.
 
@@ -37,6 +49,23 @@ class StorageReader(object):
     return self._store.GetAttributeContainerByIdentifier(
         container_type, identifier)
 
+  def GetAttributeContainersByIdentifiers(
+      self, container_type, container_identifiers):
+    """Retrieves a specific type of containers with specific identifiers.
+
+    Args:
+      container_type (str): container type.
+      container_identifiers (list[AttributeContainerIdentifier]): attribute
+          container identifiers.
+
+    Returns:
+      list[AttributeContainer]: attribute containers, in the same order as
+          the identifiers, where None represents a container that is not
+          available.
+    """
+    return self._store.GetAttributeContainersByIdentifiers(
+        container_type, container_identifiers)
+
   def GetAttributeContainers(self, container_type):
     """Retrieves a specific type of attribute containers.
 
@@ -18,3 +18,15 @@ class SQLiteStorageFileReader(reader.StorageReader):
     self._path = path
     self._store = sqlite_file.SQLiteStorageFile()
     self._store.Open(path=path)
+
+  def CreateConcurrentStorageReader(self):
+    """Creates a concurrent storage reader.
+
+    The concurrent storage reader reads the same storage as this storage
+    reader but is independent of it, so that it can be used from another
+    thread.
+
+    Returns:
+      SQLiteStorageFileReader: storage reader.
+    """
+    return SQLiteStorageFileReader(self._path)
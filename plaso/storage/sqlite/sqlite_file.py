@@ -7,6 +7,8 @@ import pathlib
 import sqlite3
 import zlib
 
+import lz4.block
+
 from plaso.containers import manager as containers_manager
 from plaso.lib import definitions
 from plaso.serializer import json_serializer
@@ -76,8 +78,17 @@ class SQLiteStorageFile(interface.BaseStore):
 
       'event_source': {
           'data_type': 'str',
+          'file_entropy': 'str',
           'file_entry_type': 'str',
-          'path_spec': 'dfvfs.PathSpec'},
+          'file_size': 'int',
+          'md5_hash': 'str',
+          'parse_range_end': 'int',
+          'parse_range_start': 'int',
+          'parser_name': 'str',
+          'path_spec': 'dfvfs.PathSpec',
+          'sha1_hash': 'str',
+          'sha256_hash': 'str',
+          'yara_match': 'str'},
 
       'event_tag': {
           '_event_row_identifier': 'AttributeContainerIdentifier',
@@ -106,9 +117,29 @@ class SQLiteStorageFile(interface.BaseStore):
       'str': 'TEXT',
       'timestamp': 'BIGINT'}
 
+  # Prefix of the metadata keys that store the compression dictionaries.
+  _COMPRESSION_DICTIONARY_KEY_PREFIX = 'compression_dictionary.'
+
+  # The maximum size of a compression dictionary, which is the maximum
+  # distance LZ4 can reference data at.
+  _COMPRESSION_DICTIONARY_MAXIMUM_SIZE = 64 * 1024
+
+  # The number of serialized attribute containers per container type used
+  # to train a compression dictionary.
+  _COMPRESSION_DICTIONARY_NUMBER_OF_SAMPLES = 256
+
+  # Header of LZ4 compressed data that indicates if the data was compressed
+  # without or with a compression dictionary.
+  _COMPRESSION_HEADER_WITHOUT_DICTIONARY = b'\x00'
+  _COMPRESSION_HEADER_WITH_DICTIONARY = b'\x01'
+
   _CREATE_METADATA_TABLE_QUERY = (
       'CREATE TABLE metadata (key TEXT, value TEXT);')
 
+  _ADD_COLUMN_QUERY = 'ALTER TABLE {0:s} ADD COLUMN {1:s} {2:s}'
+
+  _GET_COLUMN_NAMES_QUERY = 'PRAGMA table_info({0:s})'
+
   _HAS_TABLE_QUERY = (
       'SELECT name FROM sqlite_master '
       'WHERE type = "table" AND name = "{0:s}"')
@@ -119,19 +150,35 @@ class SQLiteStorageFile(interface.BaseStore):
   # The maximum number of cached attribute containers
   _MAXIMUM_CACHED_CONTAINERS = 32 * 1024
 
-  def __init__(self, storage_type=definitions.STORAGE_TYPE_SESSION):
+  def __init__(
+      self, storage_type=definitions.STORAGE_TYPE_SESSION,
+      compression_format=None):
     """Initializes a SQLite storage file.
 
     Args:
       storage_type (Optional[str]): storage type.
+      compression_format (Optional[str]): compression format of newly created
+          storage files, where None represents the default compression format
+          of the storage type.
+
+    Raises:
+      ValueError: if the compression format is not supported.
     """
-    if storage_type == definitions.STORAGE_TYPE_SESSION:
-      compression_format = definitions.COMPRESSION_FORMAT_ZLIB
-    else:
-      compression_format = definitions.COMPRESSION_FORMAT_NONE
+    if compression_format is None:
+      if storage_type == definitions.STORAGE_TYPE_SESSION:
+        compression_format = definitions.COMPRESSION_FORMAT_ZLIB
+      else:
+        compression_format = definitions.COMPRESSION_FORMAT_NONE
+
+    elif compression_format not in definitions.COMPRESSION_FORMATS:
+      raise ValueError('Unsupported compression format: {0!s}'.format(
+          compression_format))
 
     super(SQLiteStorageFile, self).__init__(storage_type=storage_type)
     self._attribute_container_cache = collections.OrderedDict()
+    self._column_names_per_container_type = {}
+    self._compression_dictionaries = {}
+    self._compression_dictionary_samples = collections.defaultdict(list)
     self._connection = None
     self._cursor = None
     self._is_open = False
@@ -163,6 +210,49 @@ class SQLiteStorageFile(interface.BaseStore):
     self._attribute_container_cache[lookup_key] = attribute_container
     self._attribute_container_cache.move_to_end(lookup_key, last=False)
 
+  def _CheckAttributeContainerTableColumns(self):
+    """Checks the columns of the attribute container tables.
+
+    Columns that were added to the schema after a table was created are
+    added to the table if the storage file is writable and otherwise are
+    not read.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    self._column_names_per_container_type = {}
+
+    for container_type, schema in self._CONTAINER_SCHEMAS.items():
+      if not self._HasTable(container_type):
+        continue
+
+      query = self._GET_COLUMN_NAMES_QUERY.format(container_type)
+
+      try:
+        self._cursor.execute(query)
+        table_column_names = set(row[1] for row in self._cursor.fetchall())
+
+        column_names = []
+        for name, data_type in sorted(schema.items()):
+          if name not in table_column_names:
+            if self._read_only:
+              continue
+
+            data_type = self._CONTAINER_SCHEMA_TO_SQLITE_TYPE_MAPPINGS.get(
+                data_type, 'TEXT')
+            query = self._ADD_COLUMN_QUERY.format(
+                container_type, name, data_type)
+            self._cursor.execute(query)
+
+          column_names.append(name)
+
+      except sqlite3.OperationalError as exception:
+        raise IOError('Unable to query storage file with error: {0!s}'.format(
+            exception))
+
+      self._column_names_per_container_type[container_type] = column_names
+
   @classmethod
   def _CheckStorageMetadata(cls, metadata_values, check_readable_only=False):
     """Checks the storage metadata.
@@ -220,6 +310,47 @@ class SQLiteStorageFile(interface.BaseStore):
       raise IOError('Unsupported storage type: {0!s}'.format(
           storage_type))
 
+  def _CompressData(self, container_type, data):
+    """Compresses serialized attribute container data.
+
+    Args:
+      container_type (str): attribute container type.
+      data (bytes): serialized attribute container data.
+
+    Returns:
+      bytes: compressed data.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
+      return zlib.compress(data)
+
+    compression_dictionary = self._compression_dictionaries.get(
+        container_type, None)
+    if compression_dictionary is None:
+      samples = self._compression_dictionary_samples[container_type]
+      samples.append(data)
+
+      if len(samples) >= self._COMPRESSION_DICTIONARY_NUMBER_OF_SAMPLES:
+        compression_dictionary = self._TrainCompressionDictionary(samples)
+        self._WriteMetadataValue(
+            ''.join([self._COMPRESSION_DICTIONARY_KEY_PREFIX, container_type]),
+            sqlite3.Binary(compression_dictionary))
+
+        self._compression_dictionaries[container_type] = compression_dictionary
+        del self._compression_dictionary_samples[container_type]
+
+    if not compression_dictionary:
+      return b''.join([
+          self._COMPRESSION_HEADER_WITHOUT_DICTIONARY,
+          lz4.block.compress(data)])
+
+    return b''.join([
+        self._COMPRESSION_HEADER_WITH_DICTIONARY,
+        lz4.block.compress(data, dict=compression_dictionary)])
+
   def _CreateAttributeContainerTable(self, container_type):
     """Creates a table for a specific attribute container type.
 
@@ -240,10 +371,10 @@ class SQLiteStorageFile(interface.BaseStore):
         column_definitions.append('{0:s} {1:s}'.format(name, data_type))
 
     else:
-      if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
-        data_column_type = 'BLOB'
-      else:
+      if self.compression_format == definitions.COMPRESSION_FORMAT_NONE:
         data_column_type = 'TEXT'
+      else:
+        data_column_type = 'BLOB'
 
       if container_type == self._CONTAINER_TYPE_EVENT:
         column_definitions.append('_timestamp BIGINT')
@@ -295,12 +426,12 @@ class SQLiteStorageFile(interface.BaseStore):
         setattr(container, name, attribute_value)
 
     else:
-      if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
-        compressed_data = row[first_column_index]
-        serialized_data = zlib.decompress(compressed_data)
-      else:
+      if self.compression_format == definitions.COMPRESSION_FORMAT_NONE:
         compressed_data = b''
         serialized_data = row[first_column_index]
+      else:
+        compressed_data = row[first_column_index]
+        serialized_data = self._DecompressData(container_type, compressed_data)
 
       if self._storage_profiler:
         self._storage_profiler.Sample(
@@ -312,6 +443,45 @@ class SQLiteStorageFile(interface.BaseStore):
 
     return container
 
+  def _DecompressData(self, container_type, compressed_data):
+    """Decompresses serialized attribute container data.
+
+    Args:
+      container_type (str): attribute container type.
+      compressed_data (bytes): compressed data.
+
+    Returns:
+      bytes: serialized attribute container data.
+
+    Raises:
+      IOError: if the data cannot be decompressed.
+      OSError: if the data cannot be decompressed.
+    """
+    if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
+      return zlib.decompress(compressed_data)
+
+    compression_header = compressed_data[:1]
+    if compression_header == self._COMPRESSION_HEADER_WITHOUT_DICTIONARY:
+      compression_dictionary = None
+
+    elif compression_header == self._COMPRESSION_HEADER_WITH_DICTIONARY:
+      compression_dictionary = self._compression_dictionaries.get(
+          container_type, None)
+      if not compression_dictionary:
+        raise IOError('Missing compression dictionary of: {0:s}'.format(
+            container_type))
+
+    else:
+      raise IOError('Unsupported compression header: 0x{0:s}'.format(
+          compression_header.hex()))
+
+    try:
+      return lz4.block.decompress(
+          compressed_data[1:], dict=compression_dictionary)
+    except lz4.block.LZ4BlockError as exception:
+      raise IOError('Unable to decompress data with error: {0!s}'.format(
+          exception))
+
   def _GetAttributeContainersWithFilter(
       self, container_type, column_names=None, filter_expression=None,
       order_by=None):
@@ -398,6 +568,24 @@ class SQLiteStorageFile(interface.BaseStore):
       self._attribute_container_cache.move_to_end(lookup_key, last=False)
     return attribute_container
 
+  def _GetSchemaColumnNames(self, container_type):
+    """Retrieves the names of the schema columns of an attribute container type.
+
+    Args:
+      container_type (str): attribute container type.
+
+    Returns:
+      list[str]: names of the columns, in the order of the schema, that are
+          stored in the table of the attribute container type.
+    """
+    column_names = self._column_names_per_container_type.get(
+        container_type, None)
+    if column_names is None:
+      schema = self._CONTAINER_SCHEMAS.get(container_type, {})
+      column_names = sorted(schema.keys())
+
+    return column_names
+
   def _HasTable(self, table_name):
     """Determines if a specific table exists.
 
@@ -474,6 +662,12 @@ class SQLiteStorageFile(interface.BaseStore):
     self.serialization_format = metadata_values['serialization_format']
     self.storage_type = metadata_values['storage_type']
 
+    self._compression_dictionaries = {}
+    for key, value in metadata_values.items():
+      if key.startswith(self._COMPRESSION_DICTIONARY_KEY_PREFIX):
+        container_type = key[len(self._COMPRESSION_DICTIONARY_KEY_PREFIX):]
+        self._compression_dictionaries[container_type] = bytes(value)
+
     self._use_schema = bool(
         self.format_version >= self._WITH_SCHEMA_FORMAT_VERSION)
 
@@ -511,6 +705,47 @@ class SQLiteStorageFile(interface.BaseStore):
 
     return attribute_container_data
 
+  @classmethod
+  def _TrainCompressionDictionary(cls, samples):
+    """Trains a compression dictionary on serialized attribute containers.
+
+    The dictionary consists of the segments of the serialized attribute
+    containers, such as JSON key and value pairs, that are shared by multiple
+    samples. Segments that save the most data are stored at the end of the
+    dictionary, where they are the cheapest to reference.
+
+    Args:
+      samples (list[bytes]): serialized attribute containers.
+
+    Returns:
+      bytes: compression dictionary or an empty byte string if the samples
+          share no segments.
+    """
+    segments_counter = collections.Counter()
+    for sample in samples:
+      segments_counter.update(set(sample.split(b', ')))
+
+    segments = [
+        segment for segment, number_of_samples in segments_counter.items()
+        if number_of_samples > 1]
+    segments.sort(key=lambda segment: (
+        segments_counter[segment] * len(segment), segment), reverse=True)
+
+    dictionary_segments = []
+    dictionary_size = 0
+    for segment in segments:
+      segment_size = len(segment) + 2
+      if dictionary_size + segment_size > (
+          cls._COMPRESSION_DICTIONARY_MAXIMUM_SIZE):
+        continue
+
+      dictionary_segments.append(segment)
+      dictionary_size += segment_size
+
+    dictionary_segments.reverse()
+    return b''.join([
+        b''.join([segment, b', ']) for segment in dictionary_segments])
+
   def _UpdateAttributeContainerAfterDeserialize(self, container):
     """Updates an attribute container after deserialization.
 
@@ -749,11 +984,12 @@ class SQLiteStorageFile(interface.BaseStore):
     else:
       serialized_data = self._SerializeAttributeContainer(container)
 
-      if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
-        compressed_data = zlib.compress(serialized_data)
-        serialized_data = sqlite3.Binary(compressed_data)
-      else:
+      if self.compression_format == definitions.COMPRESSION_FORMAT_NONE:
         compressed_data = ''
+      else:
+        compressed_data = self._CompressData(
+            container.CONTAINER_TYPE, serialized_data)
+        serialized_data = sqlite3.Binary(compressed_data)
 
       if self._storage_profiler:
         self._storage_profiler.Sample(
@@ -899,7 +1135,7 @@ class SQLiteStorageFile(interface.BaseStore):
     schema = self._CONTAINER_SCHEMAS.get(container_type, {})
 
     if self._use_schema and schema:
-      column_names = sorted(schema.keys())
+      column_names = self._GetSchemaColumnNames(container_type)
     else:
       column_names = ['_data']
 
@@ -937,6 +1173,67 @@ class SQLiteStorageFile(interface.BaseStore):
     self._CacheAttributeContainerByIndex(container, index)
     return container
 
+  def GetAttributeContainersByIdentifiers(
+      self, container_type, container_identifiers):
+    """Retrieves a specific type of containers with specific identifiers.
+
+    The containers that are not cached are retrieved with a single query.
+
+    Args:
+      container_type (str): container type.
+      container_identifiers (list[SQLTableIdentifier]): attribute container
+          identifiers.
+
+    Returns:
+      list[AttributeContainer]: attribute containers, in the same order as
+          the identifiers, where None represents a container that is not
+          available.
+
+    Raises:
+      IOError: when the store is closed, when there is an error querying
+          the storage file or if an unsupported identifier is provided.
+      OSError: when the store is closed, when there is an error querying
+          the storage file or if an unsupported identifier is provided.
+    """
+    containers_per_row_number = {}
+    for identifier in container_identifiers:
+      if not isinstance(identifier, identifiers.SQLTableIdentifier):
+        raise IOError(
+            'Unsupported attribute container identifier type: {0!s}'.format(
+                type(identifier)))
+
+      row_number = identifier.sequence_number
+      if row_number not in containers_per_row_number:
+        containers_per_row_number[row_number] = (
+            self._GetCachedAttributeContainer(container_type, row_number - 1))
+
+    uncached_row_numbers = [
+        row_number for row_number, container in (
+            containers_per_row_number.items()) if container is None]
+
+    if uncached_row_numbers:
+      schema = self._CONTAINER_SCHEMAS.get(container_type, {})
+
+      if self._use_schema and schema:
+        column_names = self._GetSchemaColumnNames(container_type)
+      else:
+        column_names = ['_data']
+
+      filter_expression = '_identifier IN ({0:s})'.format(', '.join([
+          '{0:d}'.format(row_number) for row_number in uncached_row_numbers]))
+
+      for container in self._GetAttributeContainersWithFilter(
+          container_type, column_names=column_names,
+          filter_expression=filter_expression):
+        row_number = container.GetIdentifier().sequence_number
+        containers_per_row_number[row_number] = container
+
+        self._CacheAttributeContainerByIndex(container, row_number - 1)
+
+    return [
+        containers_per_row_number[identifier.sequence_number]
+        for identifier in container_identifiers]
+
   def GetAttributeContainers(self, container_type):
     """Retrieves a specific type of stored attribute containers.
 
@@ -953,7 +1250,7 @@ class SQLiteStorageFile(interface.BaseStore):
     schema = self._CONTAINER_SCHEMAS.get(container_type, {})
 
     if self._use_schema and schema:
-      column_names = sorted(schema.keys())
+      column_names = self._GetSchemaColumnNames(container_type)
     else:
       column_names = ['_data']
 
@@ -979,7 +1276,7 @@ class SQLiteStorageFile(interface.BaseStore):
     if not self._use_schema or not schema:
       return None
 
-    column_names = sorted(schema.keys())
+    column_names = self._GetSchemaColumnNames(self._CONTAINER_TYPE_EVENT_TAG)
 
     filter_expression = '_event_row_identifier = {0:d}'.format(
         event_identifier.sequence_number)
@@ -1045,7 +1342,7 @@ class SQLiteStorageFile(interface.BaseStore):
     schema = self._CONTAINER_SCHEMAS.get(self._CONTAINER_TYPE_EVENT, {})
     if self._use_schema and schema:
       filter_column_name = 'timestamp'
-      column_names = sorted(schema.keys())
+      column_names = self._GetSchemaColumnNames(self._CONTAINER_TYPE_EVENT)
     else:
       filter_column_name = '_timestamp'
       column_names = ['_data']
@@ -1115,11 +1412,16 @@ class SQLiteStorageFile(interface.BaseStore):
 
     detect_types = sqlite3.PARSE_DECLTYPES|sqlite3.PARSE_COLNAMES
 
+    # Note that the connection is allowed to be handed over to another thread,
+    # such as the thread of the event prefetcher, but must not be used by
+    # multiple threads at the same time.
     if path_uri:
       connection = sqlite3.connect(
-          path_uri, detect_types=detect_types, uri=True)
+          path_uri, check_same_thread=False, detect_types=detect_types,
+          uri=True)
     else:
-      connection = sqlite3.connect(path, detect_types=detect_types)
+      connection = sqlite3.connect(
+          path, check_same_thread=False, detect_types=detect_types)
 
     cursor = connection.cursor()
     if not cursor:
@@ -1167,6 +1469,10 @@ class SQLiteStorageFile(interface.BaseStore):
         if not self._HasTable(container_type):
           self._CreateAttributeContainerTable(container_type)
 
+    if self._use_schema:
+      self._CheckAttributeContainerTableColumns()
+
+    if not read_only:
       self._connection.commit()
 
     last_session_start = self.GetNumberOfAttributeContainers(
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Storage writer for SQLite storage files."""
 
+from plaso.lib import definitions
 from plaso.storage import writer
 from plaso.storage.sqlite import sqlite_file
 
@@ -8,6 +9,20 @@ from plaso.storage.sqlite import sqlite_file
 class SQLiteStorageFileWriter(writer.StorageWriter):
   """SQLite-based storage file writer."""
 
+  def __init__(
+      self, storage_type=definitions.STORAGE_TYPE_SESSION,
+      compression_format=None):
+    """Initializes a SQLite-based storage file writer.
+
+    Args:
+      storage_type (Optional[str]): storage type.
+      compression_format (Optional[str]): compression format of newly created
+          storage files, where None represents the default compression format
+          of the storage type.
+    """
+    super(SQLiteStorageFileWriter, self).__init__(storage_type=storage_type)
+    self._compression_format = compression_format
+
   def GetFirstWrittenEventSource(self):
     """Retrieves the first event source that was written after open.
 
@@ -66,7 +81,9 @@ class SQLiteStorageFileWriter(writer.StorageWriter):
     if self._store:
       raise IOError('Storage writer already opened.')
 
-    self._store = sqlite_file.SQLiteStorageFile(storage_type=self._storage_type)
+    self._store = sqlite_file.SQLiteStorageFile(
+        compression_format=self._compression_format,
+        storage_type=self._storage_type)
 
     if self._serializers_profiler:
       self._store.SetSerializersProfiler(self._serializers_profiler)
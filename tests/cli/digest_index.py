@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the digest index of exported content."""
+
+import os
+import unittest
+
+from plaso.cli import digest_index
+
+from tests import test_lib as shared_test_lib
+
+
+class DigestIndexTest(shared_test_lib.BaseTestCase):
+  """Tests for the digest index of exported content."""
+
+  _TEST_DIGEST = (
+      'c7fbc0e821c0871805a99584c6a384533909f68a6bbe9a2a687d28d9f3b10c16')
+
+  def testAddDigest(self):
+    """Tests the AddDigest and GetDigests functions."""
+    test_index = digest_index.DigestIndex()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'digests.db')
+      test_index.Open(test_path)
+
+      try:
+        test_index.AddDigest(
+            self._TEST_DIGEST, 'TSK:/another_file', 'another_file')
+        test_index.AddDigest(
+            self._TEST_DIGEST, 'TSK:/a_directory/another_file',
+            'a_directory/another_file')
+
+        digests = test_index.GetDigests()
+
+      finally:
+        test_index.Close()
+
+    self.assertEqual(digests, [
+        (self._TEST_DIGEST, 'TSK:/a_directory/another_file',
+         'a_directory/another_file')])
+
+    with self.assertRaises(IOError):
+      test_index.AddDigest(
+          self._TEST_DIGEST, 'TSK:/another_file', 'another_file')
+
+  def testAddPath(self):
+    """Tests the AddPath and GetPaths functions."""
+    test_index = digest_index.DigestIndex()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'digests.db')
+      test_index.Open(test_path)
+
+      try:
+        test_index.AddPath(self._TEST_DIGEST, 'a_directory/another_file')
+        test_index.AddPath(self._TEST_DIGEST, 'another_file')
+        test_index.AddPath(self._TEST_DIGEST, 'a_directory/another_file')
+
+        paths = test_index.GetPaths()
+
+      finally:
+        test_index.Close()
+
+    self.assertEqual(paths, [
+        (self._TEST_DIGEST, 'a_directory/another_file'),
+        (self._TEST_DIGEST, 'another_file')])
+
+  def testAddSource(self):
+    """Tests the AddSource and GetSource functions."""
+    test_index = digest_index.DigestIndex()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'digests.db')
+      test_index.Open(test_path)
+
+      try:
+        test_index.AddSource(
+            'test_source', 22, '2012-05-25T15:59:23+00:00', self._TEST_DIGEST,
+            'another_file')
+
+      finally:
+        test_index.Close()
+
+      # Reopen the index to determine the source was persisted.
+      test_index.Open(test_path)
+
+      try:
+        digest, path = test_index.GetSource(
+            'test_source', 22, '2012-05-25T15:59:23+00:00')
+        self.assertEqual(digest, self._TEST_DIGEST)
+        self.assertEqual(path, 'another_file')
+
+        digest, path = test_index.GetSource(
+            'test_source', 23, '2012-05-25T15:59:23+00:00')
+        self.assertIsNone(digest)
+        self.assertIsNone(path)
+
+        digest, path = test_index.GetSource('test_source', 22, None)
+        self.assertIsNone(digest)
+        self.assertIsNone(path)
+
+        digest, path = test_index.GetSource(
+            'bogus', 22, '2012-05-25T15:59:23+00:00')
+        self.assertIsNone(digest)
+        self.assertIsNone(path)
+
+      finally:
+        test_index.Close()
+
+  def testOpenClose(self):
+    """Tests the Open and Close functions."""
+    test_index = digest_index.DigestIndex()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'digests.db')
+      test_index.Open(test_path)
+
+      with self.assertRaises(IOError):
+        test_index.Open(test_path)
+
+      test_index.Close()
+
+      with self.assertRaises(IOError):
+        test_index.Close()
+
+      test_path = os.path.join(temp_directory, 'bogus.db')
+      with open(test_path, 'wb') as file_object:
+        file_object.write(b'This is not a SQLite database file.' * 128)
+
+      with self.assertRaises(IOError):
+        test_index.Open(test_path)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -38,7 +38,7 @@ Test argument parser.
     _EXPECTED_PROCESSING_OPTIONS = """\
 usage: extraction_tool_test.py [--single_process]
                                [--temporary_directory DIRECTORY]
-                               [--vfs_back_end TYPE]
+                               [--vfs_back_end TYPE] [--worker_autoscaling]
                                [--worker_memory_limit SIZE]
                                [--worker_timeout MINUTES] [--workers WORKERS]
 
@@ -53,6 +53,12 @@ Test argument parser.
   --vfs_back_end TYPE, --vfs-back-end TYPE
                         The preferred dfVFS back-end: "auto", "fsext",
                         "fshfs", "fsntfs", "tsk" or "vsgpt".
+  --worker_autoscaling, --worker-autoscaling
+                        Add or retire worker processes during processing based
+                        on the number of pending tasks, the number of tasks
+                        pending merge and the available memory. The number of
+                        worker processes (--workers) is used as the initial
+                        and minimum number.
   --worker_memory_limit SIZE, --worker-memory-limit SIZE
                         Maximum amount of memory (data segment and shared
                         memory) a worker process is allowed to consume in
@@ -75,7 +81,7 @@ Test argument parser.
 usage: extraction_tool_test.py [--single_process]
                                [--process_memory_limit SIZE]
                                [--temporary_directory DIRECTORY]
-                               [--vfs_back_end TYPE]
+                               [--vfs_back_end TYPE] [--worker_autoscaling]
                                [--worker_memory_limit SIZE]
                                [--worker_timeout MINUTES] [--workers WORKERS]
 
@@ -98,6 +104,12 @@ Test argument parser.
   --vfs_back_end TYPE, --vfs-back-end TYPE
                         The preferred dfVFS back-end: "auto", "fsext",
                         "fshfs", "fsntfs", "tsk" or "vsgpt".
+  --worker_autoscaling, --worker-autoscaling
+                        Add or retire worker processes during processing based
+                        on the number of pending tasks, the number of tasks
+                        pending merge and the available memory. The number of
+                        worker processes (--workers) is used as the initial
+                        and minimum number.
   --worker_memory_limit SIZE, --worker-memory-limit SIZE
                         Maximum amount of memory (data segment and shared
                         memory) a worker process is allowed to consume in
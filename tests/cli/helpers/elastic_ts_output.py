@@ -22,6 +22,7 @@ class ElasticTimesketchOutputArgumentsHelperTest(
 
   _EXPECTED_OUTPUT = """\
 usage: cli_helper.py [--index_name NAME] [--flush_interval INTERVAL]
+                     [--elastic-bulk-requests NUMBER]
                      [--additional_fields ADDITIONAL_FIELDS]
                      [--elastic-server HOSTNAME] [--elastic-port PORT]
                      [--elastic-user USERNAME] [--elastic-password PASSWORD]
@@ -41,6 +42,9 @@ Test argument parser.
   --ca_certificates_file_path PATH, --ca-certificates-file-path PATH
                         Path to a file containing a list of root certificates
                         to trust.
+  --elastic-bulk-requests NUMBER, --elastic_bulk_requests NUMBER
+                        Number of bulk inserts to ElasticSearch that can be in
+                        flight at the same time.
   --elastic-mappings PATH, --elastic_mappings PATH
                         Path to a file containing mappings for Elasticsearch
                         indexing.
@@ -18,11 +18,16 @@ class StorageFormatArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--storage_format FORMAT] [--task_storage_format FORMAT]
+usage: cli_helper.py [--storage_compression FORMAT] [--storage_format FORMAT]
+                     [--task_storage_format FORMAT]
 
 Test argument parser.
 
 {0:s}:
+  --storage_compression FORMAT, --storage-compression FORMAT
+                        Compression format of the storage file, the default
+                        is: zlib. Supported options: lz4_dictionary, none,
+                        zlib
   --storage_format FORMAT, --storage-format FORMAT
                         Format of the storage file, the default is: sqlite.
                         Supported options: sqlite
@@ -46,12 +51,16 @@ Test argument parser.
   def testParseOptions(self):
     """Tests the ParseOptions function."""
     options = cli_test_lib.TestOptions()
+    options.storage_compression_format = 'lz4_dictionary'
     options.storage_format = 'sqlite'
     options.task_storage_format = 'sqlite'
 
     test_tool = tools.CLITool()
     storage_format.StorageFormatArgumentsHelper.ParseOptions(options, test_tool)
 
+    self.assertEqual(
+        test_tool._storage_compression_format,
+        options.storage_compression_format)
     self.assertEqual(test_tool._storage_format, options.storage_format)
     self.assertEqual(
         test_tool._task_storage_format, options.task_storage_format)
@@ -64,6 +73,13 @@ Test argument parser.
       storage_format.StorageFormatArgumentsHelper.ParseOptions(
           options, test_tool)
 
+    options.storage_format = 'sqlite'
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.storage_compression_format = 'bogus'
+      storage_format.StorageFormatArgumentsHelper.ParseOptions(
+          options, test_tool)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -18,12 +18,18 @@ class WorkersArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
-                     [--workers WORKERS]
+usage: cli_helper.py [--worker_autoscaling] [--worker_memory_limit SIZE]
+                     [--worker_timeout MINUTES] [--workers WORKERS]
 
 Test argument parser.
 
 {0:s}:
+  --worker_autoscaling, --worker-autoscaling
+                        Add or retire worker processes during processing based
+                        on the number of pending tasks, the number of tasks
+                        pending merge and the available memory. The number of
+                        worker processes (--workers) is used as the initial
+                        and minimum number.
   --worker_memory_limit SIZE, --worker-memory-limit SIZE
                         Maximum amount of memory (data segment and shared
                         memory) a worker process is allowed to consume in
@@ -62,6 +68,11 @@ Test argument parser.
     workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
 
     self.assertEqual(test_tool._number_of_extraction_workers, options.workers)
+    self.assertFalse(test_tool._worker_autoscaling)
+
+    options.worker_autoscaling = True
+    workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
+    self.assertTrue(test_tool._worker_autoscaling)
 
     with self.assertRaises(errors.BadConfigObject):
       workers.WorkersArgumentsHelper.ParseOptions(options, None)
@@ -7,6 +7,8 @@ import json
 import os
 import unittest
 
+from unittest import mock
+
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.path import factory as path_spec_factory
@@ -61,35 +63,6 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
 
     return results
 
-  def testCalculateDigestHash(self):
-    """Tests the _CalculateDigestHash function."""
-    test_file_path = self._GetTestFilePath(['ímynd.dd'])
-    self._SkipIfPathNotExists(test_file_path)
-
-    test_tool = image_export_tool.ImageExportTool()
-
-    os_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
-    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=16,
-        location='/a_directory/another_file', parent=os_path_spec)
-
-    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
-    digest_hash = test_tool._CalculateDigestHash(file_entry, '')
-    expected_digest_hash = (
-        'c7fbc0e821c0871805a99584c6a384533909f68a6bbe9a2a687d28d9f3b10c16')
-    self.assertEqual(digest_hash, expected_digest_hash)
-
-    os_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
-    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=12,
-        location='/a_directory', parent=os_path_spec)
-
-    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
-    with self.assertRaises(dfvfs_errors.BackEndError):
-      test_tool._CalculateDigestHash(file_entry, '')
-
   # TODO: add tests for _CreateSanitizedDestination.
   # TODO: add tests for _Extract.
 
@@ -112,6 +85,23 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
       test_tool._ExtractDataStream(
           file_entry, '', temp_directory, output_writer)
 
+      # The second extraction is a duplicate and should be discarded.
+      test_tool._ExtractDataStream(
+          file_entry, '', temp_directory, output_writer)
+
+      extracted_files = self._RecursiveList(temp_directory)
+
+    expected_extracted_files = sorted([
+        os.path.join(temp_directory, 'a_directory'),
+        os.path.join(temp_directory, 'a_directory', 'another_file')])
+    self.assertEqual(sorted(extracted_files), expected_extracted_files)
+
+    expected_paths_by_hash = {
+        'c7fbc0e821c0871805a99584c6a384533909f68a6bbe9a2a687d28d9f3b10c16': [
+            os.path.join('a_directory', 'another_file')]}
+    self.assertEqual(
+        dict(test_tool._paths_by_hash), expected_paths_by_hash)
+
   def testExtractFileEntry(self):
     """Tests the _ExtractFileEntry function."""
     test_file_path = self._GetTestFilePath(['ímynd.dd'])
@@ -179,7 +169,28 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
     file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
     with shared_test_lib.TempDirectory() as temp_directory:
       destination_path = os.path.join(temp_directory, 'another_file')
-      test_tool._WriteFileEntry(file_entry, '', destination_path)
+      digest_hash = test_tool._WriteFileEntry(
+          file_entry, '', destination_path)
+
+      with open(destination_path, 'rb') as file_object:
+        data = file_object.read()
+
+    expected_digest_hash = (
+        'c7fbc0e821c0871805a99584c6a384533909f68a6bbe9a2a687d28d9f3b10c16')
+    self.assertEqual(digest_hash, expected_digest_hash)
+    self.assertEqual(data, b'This is another file.\n')
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=12,
+        location='/a_directory', parent=os_path_spec)
+
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
+    with shared_test_lib.TempDirectory() as temp_directory:
+      destination_path = os.path.join(temp_directory, 'a_directory')
+      with self.assertRaises(dfvfs_errors.BackEndError):
+        test_tool._WriteFileEntry(file_entry, '', destination_path)
 
   # TODO: add tests for AddFilterOptions.
 
@@ -330,6 +341,7 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
       expected_extracted_files = sorted([
           os.path.join(temp_directory, 'a_directory'),
           os.path.join(temp_directory, 'a_directory', 'a_file'),
+          os.path.join(temp_directory, 'digests.db'),
           os.path.join(temp_directory, 'hashes.json')])
 
       extracted_files = self._RecursiveList(temp_directory)
@@ -361,6 +373,7 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
 
       expected_extracted_files = sorted([
           os.path.join(temp_directory, 'passwords.txt'),
+          os.path.join(temp_directory, 'digests.db'),
           os.path.join(temp_directory, 'hashes.json')])
 
       extracted_files = self._RecursiveList(temp_directory)
@@ -393,6 +406,7 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
       expected_extracted_files = sorted([
           os.path.join(temp_directory, 'a_directory'),
           os.path.join(temp_directory, 'a_directory', 'another_file'),
+          os.path.join(temp_directory, 'digests.db'),
           os.path.join(temp_directory, 'hashes.json')])
 
       extracted_files = self._RecursiveList(temp_directory)
@@ -432,6 +446,7 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
           os.path.join(temp_directory, 'a_directory'),
           os.path.join(temp_directory, 'a_directory', 'another_file'),
           os.path.join(temp_directory, 'a_directory', 'a_file'),
+          os.path.join(temp_directory, 'digests.db'),
           os.path.join(temp_directory, 'hashes.json')])
 
       extracted_files = self._RecursiveList(temp_directory)
@@ -466,6 +481,7 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
           os.path.join(temp_directory, 'a_directory'),
           os.path.join(temp_directory, 'a_directory', 'another_file'),
           os.path.join(temp_directory, 'a_directory', 'a_file'),
+          os.path.join(temp_directory, 'digests.db'),
           os.path.join(temp_directory, 'hashes.json')])
 
       extracted_files = self._RecursiveList(temp_directory)
@@ -501,6 +517,7 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
           os.path.join(temp_directory, 'a_directory', 'another_file'),
           os.path.join(temp_directory, 'a_directory', 'a_file'),
           os.path.join(temp_directory, 'passwords.txt'),
+          os.path.join(temp_directory, 'digests.db'),
           os.path.join(temp_directory, 'hashes.json')])
 
       extracted_files = self._RecursiveList(temp_directory)
@@ -534,12 +551,132 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
       expected_extracted_files = sorted([
           os.path.join(temp_directory, 'logs'),
           os.path.join(temp_directory, 'logs', 'sys.tgz'),
+          os.path.join(temp_directory, 'digests.db'),
           os.path.join(temp_directory, 'hashes.json')])
 
       extracted_files = self._RecursiveList(temp_directory)
 
       self.assertEqual(sorted(extracted_files), expected_extracted_files)
 
+  def testProcessSourcesExtractWithWorkers(self):
+    """Tests the ProcessSources function with multiple workers."""
+    test_artifacts_path = self._GetTestFilePath(['artifacts'])
+    self._SkipIfPathNotExists(test_artifacts_path)
+
+    test_file_path = self._GetTestFilePath(['image.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+    test_tool = image_export_tool.ImageExportTool(output_writer=output_writer)
+
+    options = test_lib.TestOptions()
+    options.artifact_definitions_path = test_artifacts_path
+    options.image = test_file_path
+    options.include_duplicates = True
+    options.quiet = True
+    options.workers = 4
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      options.path = temp_directory
+
+      test_tool.ParseOptions(options)
+
+      test_tool.ProcessSources()
+
+      extracted_files = self._RecursiveList(temp_directory)
+
+      with open(os.path.join(temp_directory, 'hashes.json')) as json_file:
+        json_data = json.load(json_file)
+
+    expected_extracted_files = sorted([
+        os.path.join(temp_directory, 'a_directory'),
+        os.path.join(temp_directory, 'a_directory', 'another_file'),
+        os.path.join(temp_directory, 'a_directory', 'a_file'),
+        os.path.join(temp_directory, 'passwords.txt'),
+        os.path.join(temp_directory, 'digests.db'),
+        os.path.join(temp_directory, 'hashes.json')])
+    self.assertEqual(sorted(extracted_files), expected_extracted_files)
+
+    self.assertEqual(len(json_data), 3)
+
+    options.workers = 0
+
+    with self.assertRaises(errors.BadConfigOption):
+      test_tool.ParseOptions(options)
+
+  def testProcessSourcesWithDigestIndex(self):
+    """Tests the ProcessSources function with a previous export."""
+    test_artifacts_path = self._GetTestFilePath(['artifacts'])
+    self._SkipIfPathNotExists(test_artifacts_path)
+
+    test_file_path = self._GetTestFilePath(['image.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    options = test_lib.TestOptions()
+    options.artifact_definitions_path = test_artifacts_path
+    options.image = test_file_path
+    options.quiet = True
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      options.path = temp_directory
+
+      output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+      test_tool = image_export_tool.ImageExportTool(
+          output_writer=output_writer)
+
+      options.names_string = 'another_file'
+      test_tool.ParseOptions(options)
+      test_tool.ProcessSources()
+
+      output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+      test_tool = image_export_tool.ImageExportTool(
+          output_writer=output_writer)
+
+      options.names_string = 'a_file,another_file'
+      test_tool.ParseOptions(options)
+
+      with mock.patch.object(
+          test_tool, '_WriteFileEntry',
+          wraps=test_tool._WriteFileEntry) as write_file_entry:
+        test_tool.ProcessSources()
+
+      # The data stream exported by the previous run is not read again.
+      self.assertEqual(write_file_entry.call_count, 1)
+
+      os.remove(os.path.join(temp_directory, 'a_directory', 'a_file'))
+
+      output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+      test_tool = image_export_tool.ImageExportTool(
+          output_writer=output_writer)
+
+      test_tool.ParseOptions(options)
+
+      with mock.patch.object(
+          test_tool, '_WriteFileEntry',
+          wraps=test_tool._WriteFileEntry) as write_file_entry:
+        test_tool.ProcessSources()
+
+      # The data stream of which the exported file was removed is read again.
+      self.assertEqual(write_file_entry.call_count, 1)
+
+      extracted_files = self._RecursiveList(temp_directory)
+
+      with open(os.path.join(temp_directory, 'hashes.json')) as json_file:
+        json_data = json.load(json_file)
+
+    expected_extracted_files = sorted([
+        os.path.join(temp_directory, 'a_directory'),
+        os.path.join(temp_directory, 'a_directory', 'another_file'),
+        os.path.join(temp_directory, 'a_directory', 'a_file'),
+        os.path.join(temp_directory, 'digests.db'),
+        os.path.join(temp_directory, 'hashes.json')])
+    self.assertEqual(sorted(extracted_files), expected_extracted_files)
+
+    paths = sorted([values['paths'] for values in json_data])
+    self.assertEqual(paths, [
+        [os.path.join('a_directory', 'a_file')],
+        [os.path.join('a_directory', 'another_file')]])
+
   def testOutputJsonFile(self):
     """Tests the content of the output JSON file."""
     test_artifacts_path = self._GetTestFilePath(['artifacts'])
@@ -509,6 +509,41 @@ class Log2TimelineToolTest(test_lib.CLIToolTestCase):
       output = output_writer.ReadOutput()
       self._CheckOutput(output, expected_output)
 
+  def testExtractEventsFromSourcesWithStorageCompression(self):
+    """Tests the ExtractEventsFromSources function with storage compression."""
+    test_file_path = self._GetTestFilePath(['System.evtx'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    options = self._CreateExtractionOptions(test_file_path)
+
+    output_writer = test_lib.TestOutputWriter(encoding=self._OUTPUT_ENCODING)
+    test_tool = log2timeline_tool.Log2TimelineTool(output_writer=output_writer)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      options.storage_compression_format = (
+          definitions.COMPRESSION_FORMAT_LZ4_DICTIONARY)
+      options.storage_file = os.path.join(temp_directory, 'storage.plaso')
+      options.storage_format = definitions.STORAGE_FORMAT_SQLITE
+      options.task_storage_format = definitions.STORAGE_FORMAT_SQLITE
+
+      test_tool.ParseOptions(options)
+
+      test_tool.ExtractEventsFromSources()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=options.storage_file, read_only=True)
+
+      try:
+        self.assertEqual(
+            storage_file.compression_format,
+            definitions.COMPRESSION_FORMAT_LZ4_DICTIONARY)
+
+        number_of_events = storage_file.GetNumberOfAttributeContainers('event')
+        self.assertGreater(number_of_events, 0)
+
+      finally:
+        storage_file.Close()
+
   def testExtractEventsFromSourcesWithFilestat(self):
     """Tests the ExtractEventsFromSources function with filestat parser."""
     output_writer = test_lib.TestOutputWriter(encoding=self._OUTPUT_ENCODING)
@@ -17,7 +17,9 @@ class EventSourceTest(shared_test_lib.BaseTestCase):
     attribute_container = event_sources.EventSource()
 
     expected_attribute_names = [
-        'data_type', 'file_entry_type', 'path_spec']
+        'data_type', 'file_entropy', 'file_entry_type', 'file_size',
+        'md5_hash', 'parse_range_end', 'parse_range_start', 'parser_name',
+        'path_spec', 'sha1_hash', 'sha256_hash', 'yara_match']
 
     attribute_names = sorted(attribute_container.GetAttributeNames())
 
@@ -32,7 +34,9 @@ class FileEntryEventSourceTest(shared_test_lib.BaseTestCase):
     attribute_container = event_sources.FileEntryEventSource()
 
     expected_attribute_names = [
-        'data_type', 'file_entry_type', 'path_spec']
+        'data_type', 'file_entropy', 'file_entry_type', 'file_size',
+        'md5_hash', 'parse_range_end', 'parse_range_start', 'parser_name',
+        'path_spec', 'sha1_hash', 'sha256_hash', 'yara_match']
 
     attribute_names = sorted(attribute_container.GetAttributeNames())
 
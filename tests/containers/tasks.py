@@ -39,12 +39,20 @@ class TaskTest(shared_test_lib.BaseTestCase):
     """Tests the CreateRetryTask function."""
     session_identifier = '{0:s}'.format(uuid.uuid4().hex)
     task = tasks.Task(session_identifier=session_identifier)
+    task.md5_hash = '4f0e46d4bf6d7ee1b2e1bfbf1b1d2ad4'
+    task.parse_range_end = 10
+    task.parse_range_start = 5
+    task.parser_name = 'winevtx'
     task.path_spec = 'test_path_spec'
 
     retry_task = task.CreateRetryTask()
     self.assertNotEqual(retry_task.identifier, task.identifier)
     self.assertTrue(task.has_retry)
     self.assertFalse(retry_task.has_retry)
+    self.assertEqual(retry_task.md5_hash, task.md5_hash)
+    self.assertEqual(retry_task.parse_range_end, 10)
+    self.assertEqual(retry_task.parse_range_start, 5)
+    self.assertEqual(retry_task.parser_name, 'winevtx')
     self.assertEqual(retry_task.path_spec, task.path_spec)
 
   def testCreateTaskCompletion(self):
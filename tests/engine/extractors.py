@@ -12,6 +12,7 @@ from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
 
+from plaso.containers import events
 from plaso.containers import sessions
 from plaso.engine import extractors
 from plaso.engine import knowledge_base
@@ -24,6 +25,8 @@ from tests import test_lib as shared_test_lib
 class EventExtractorTest(shared_test_lib.BaseTestCase):
   """Tests for the event extractor."""
 
+  # pylint: disable=protected-access
+
   def _CreateParserMediator(
       self, session, storage_writer, collection_filters_helper=None,
       file_entry=None, knowledge_base_values=None, parser_chain=None,
@@ -76,6 +79,32 @@ class EventExtractorTest(shared_test_lib.BaseTestCase):
     return storage_writer
 
   # TODO: add test for _CheckParserCanProcessFileEntry
+
+  def testGetFileHeadMatchParserNames(self):
+    """Tests the _GetFileHeadMatchParserNames function."""
+    test_file_path = self._GetTestFilePath(['firewall.log'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    test_extractor = extractors.EventExtractor(
+        parser_filter_expression='selinux,syslog,winfirewall,xchatlog')
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+    file_object = file_entry.GetFileObject()
+
+    session = sessions.Session()
+
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(
+        session, storage_writer, file_entry=file_entry)
+
+    parser_names = test_extractor._GetFileHeadMatchParserNames(
+        parser_mediator, ['selinux', 'syslog', 'winfirewall', 'xchatlog'],
+        file_entry, file_object)
+
+    self.assertEqual(parser_names, ['selinux', 'winfirewall'])
+
   # TODO: add test for _GetSignatureMatchParserNames
   # TODO: add test for _InitializeParserObjects
   # TODO: add test for _ParseDataStreamWithParser
@@ -130,6 +159,64 @@ class EventExtractorTest(shared_test_lib.BaseTestCase):
     self.assertEqual(storage_writer.number_of_extraction_warnings, 1)
     self.assertEqual(storage_writer.number_of_recovery_warnings, 0)
 
+  def testParseDataStreamWithSplitFileSize(self):
+    """Tests the ParseDataStream function with a split file size."""
+    test_file_path = self._GetTestFilePath(['System.evtx'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    test_extractor = extractors.EventExtractor(
+        parser_filter_expression='winevtx')
+    test_extractor.SetSplitFileSize(512 * 1024)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+    session = sessions.Session()
+
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(
+        session, storage_writer, file_entry=file_entry)
+
+    event_data_stream = events.EventDataStream()
+    event_data_stream.md5_hash = '4f0e46d4bf6d7ee1b2e1bfbf1b1d2ad4'
+    parser_mediator.ProduceEventDataStream(event_data_stream)
+
+    test_extractor.ParseDataStream(parser_mediator, file_entry, '')
+
+    self.assertEqual(storage_writer.number_of_events, 1068)
+    self.assertEqual(storage_writer.number_of_extraction_warnings, 0)
+    self.assertEqual(storage_writer.number_of_recovery_warnings, 0)
+    self.assertIsNone(parser_mediator.parse_range)
+
+    event_sources = list(storage_writer.GetAttributeContainers('event_source'))
+    self.assertEqual(len(event_sources), 2)
+
+    event_source = event_sources[0]
+    self.assertEqual(event_source.parser_name, 'winevtx')
+    self.assertEqual(event_source.parse_range_start, 534)
+    self.assertEqual(event_source.parse_range_end, 1068)
+    self.assertEqual(event_source.path_spec, path_spec)
+    self.assertEqual(event_source.file_size, os.path.getsize(test_file_path))
+    self.assertEqual(event_source.md5_hash, '4f0e46d4bf6d7ee1b2e1bfbf1b1d2ad4')
+
+    number_of_events = storage_writer.number_of_events
+    for event_source in event_sources:
+      storage_writer = self._CreateStorageWriter()
+      parser_mediator = self._CreateParserMediator(
+          session, storage_writer, file_entry=file_entry)
+
+      test_extractor.ParseDataStreamRange(
+          parser_mediator, file_entry, '', event_source.parser_name,
+          (event_source.parse_range_start, event_source.parse_range_end))
+
+      self.assertEqual(storage_writer.number_of_extraction_warnings, 0)
+      self.assertIsNone(parser_mediator.parse_range)
+
+      number_of_events += storage_writer.number_of_events
+
+    self.assertEqual(number_of_events, 3202)
+
   # TODO: add test for ParseFileEntryMetadata
   # TODO: add test for ParseMetadataFile
 
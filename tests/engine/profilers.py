@@ -96,6 +96,29 @@ class MemoryProfilerTest(shared_test_lib.BaseTestCase):
       test_profiler.Stop()
 
 
+class ParsedItemsProfilerTest(shared_test_lib.BaseTestCase):
+  """Tests for the parsed items profiler."""
+
+  def testStartStopTiming(self):
+    """Tests the StartTiming and StopTiming functions."""
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      test_profiler = profilers.ParsedItemsProfiler(
+          'test', profiling_configuration)
+
+      test_profiler.Start()
+
+      for _ in range(5):
+        test_profiler.StartTiming('test_profile')
+        time.sleep(0.01)
+        test_profiler.StopTiming('test_profile', 10)
+
+      test_profiler.Stop()
+
+
 class AnalyzersProfilerTest(shared_test_lib.BaseTestCase):
   """Tests for the analyzers CPU time profiler."""
 
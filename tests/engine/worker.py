@@ -5,6 +5,8 @@
 import collections
 import unittest
 
+from unittest import mock
+
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.resolver import context
 from dfvfs.path import factory as path_spec_factory
@@ -118,7 +120,14 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
       extraction_worker.ProcessPathSpec(mediator, path_spec)
       event_source = storage_writer.GetFirstWrittenEventSource()
       while event_source:
-        extraction_worker.ProcessPathSpec(mediator, event_source.path_spec)
+        parse_range = None
+        if event_source.parser_name:
+          parse_range = (
+              event_source.parse_range_start, event_source.parse_range_end)
+
+        extraction_worker.ProcessPathSpec(
+            mediator, event_source.path_spec,
+            parser_name=event_source.parser_name, parse_range=parse_range)
         event_source = storage_writer.GetNextWrittenEventSource()
 
       storage_writer.WriteSessionCompletion(session)
@@ -453,6 +462,83 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
         storage_writer, path_spec, expected_event_counters,
         knowledge_base_values=knowledge_base_values)
 
+  def testProcessPathSpecFileWithSplitFileSize(self):
+    """Tests the ProcessPathSpec function on a file parsed in ranges."""
+    path_spec = self._GetTestFilePathSpec(['System.evtx'])
+    storage_writer = fake_writer.FakeStorageWriter()
+
+    configuration = configurations.ExtractionConfiguration()
+    configuration.split_file_size = 512 * 1024
+
+    extraction_worker = worker.EventExtractionWorker(
+        parser_filter_expression='filestat,winevtx')
+    extraction_worker.SetExtractionConfiguration(configuration)
+
+    # Typically there are 3 filestat events, but there can be 4 on platforms
+    # that support os.stat_result st_birthtime.
+    expected_event_counters = {
+        'fs:stat': [3, 4],
+        'windows:evtx:record': 3202}
+
+    self._TestProcessPathSpec(
+        storage_writer, path_spec, expected_event_counters,
+        extraction_worker=extraction_worker)
+
+    self.assertEqual(storage_writer.number_of_event_sources, 2)
+
+  def testProcessPathSpecFileWithSplitFileSizeAndHashing(self):
+    """Tests the ProcessPathSpec function on a file parsed in ranges."""
+    path_spec = self._GetTestFilePathSpec(['System.evtx'])
+    storage_writer = fake_writer.FakeStorageWriter()
+
+    configuration = configurations.ExtractionConfiguration()
+    configuration.split_file_size = 512 * 1024
+
+    extraction_worker = worker.EventExtractionWorker(
+        parser_filter_expression='filestat,winevtx')
+    extraction_worker.SetExtractionConfiguration(configuration)
+    extraction_worker._SetHashers('md5')
+
+    session = sessions.Session()
+    mediator = parsers_mediator.ParserMediator(
+        session, storage_writer, knowledge_base.KnowledgeBase(),
+        resolver_context=context.Context())
+
+    storage_writer.Open()
+
+    try:
+      extraction_worker.ProcessPathSpec(mediator, path_spec)
+
+      event_source = storage_writer.GetFirstWrittenEventSource()
+
+      event_data_stream = events.EventDataStream()
+      event_data_stream.md5_hash = event_source.md5_hash
+
+      with mock.patch.object(
+          extraction_worker, '_AnalyzeDataStream',
+          wraps=extraction_worker._AnalyzeDataStream) as analyze_data_stream:
+        extraction_worker.ProcessPathSpec(
+            mediator, event_source.path_spec,
+            parser_name=event_source.parser_name, parse_range=(
+                event_source.parse_range_start, event_source.parse_range_end),
+            event_data_stream=event_data_stream)
+
+      md5_hashes = [
+          getattr(event_data_stream, 'md5_hash', None)
+          for event_data_stream in storage_writer.GetAttributeContainers(
+              events.EventDataStream.CONTAINER_TYPE)]
+
+    finally:
+      storage_writer.Close()
+
+    # The data stream is only hashed when processing the file entry and the
+    # hash is passed on to the remaining range by the event source.
+    self.assertEqual(analyze_data_stream.call_count, 0)
+    self.assertEqual(len(md5_hashes), 2)
+    self.assertIsNotNone(md5_hashes[0])
+    self.assertEqual(event_source.md5_hash, md5_hashes[0])
+    self.assertEqual(md5_hashes[1], md5_hashes[0])
+
   def testProcessPathSpecCompressedFileGZIP(self):
     """Tests the ProcessPathSpec function on a gzip compressed file."""
     knowledge_base_values = {'year': 2016}
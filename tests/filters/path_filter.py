@@ -112,6 +112,42 @@ class PathFilterScanTreeTest(test_lib.FilterTestCase):
         'Session Manager/AppCompatCache')
     self.assertTrue(scan_tree.CheckPath(path, path_segment_separator='/'))
 
+  def testCheckPathPrefix(self):
+    """Tests the CheckPathPrefix function."""
+    paths = [
+        'HKEY_CURRENT_USER\\Software\\WinRAR\\ArcHistory',
+        'HKEY_CURRENT_USER\\Software\\WinRAR\\DialogEditHistory\\ArcName',
+        'HKEY_CURRENT_USER\\Software\\WinRAR\\DialogEditHistory\\ExtrPath',
+        ('HKEY_CURRENT_USER\\Software\\Microsoft\\Internet Explorer\\'
+         'TypedURLs'),
+        ('HKEY_LOCAL_MACHINE\\System\\CurrentControlSet\\Control\\'
+         'Session Manager\\AppCompatCache'),
+        'HKEY_LOCAL_MACHINE\\SAM\\Domains\\Account\\Users']
+
+    scan_tree = path_filter.PathFilterScanTree(
+        paths, case_sensitive=False, path_segment_separator='\\')
+
+    self.assertTrue(scan_tree.CheckPathPrefix('HKEY_CURRENT_USER'))
+    self.assertTrue(scan_tree.CheckPathPrefix(
+        'HKEY_CURRENT_USER\\Software\\WinRAR'))
+    self.assertTrue(scan_tree.CheckPathPrefix(
+        'HKEY_CURRENT_USER\\Software\\WinRAR\\DialogEditHistory'))
+    self.assertTrue(scan_tree.CheckPathPrefix(
+        'HKEY_CURRENT_USER\\Software\\WinRAR\\ArcHistory'))
+    self.assertTrue(scan_tree.CheckPathPrefix(
+        'HKEY_LOCAL_MACHINE\\SYSTEM\\CurrentControlSet'))
+
+    self.assertFalse(scan_tree.CheckPathPrefix('HKEY_USERS'))
+    self.assertFalse(scan_tree.CheckPathPrefix(
+        'HKEY_CURRENT_USER\\Software\\Google'))
+    self.assertFalse(scan_tree.CheckPathPrefix(
+        'HKEY_CURRENT_USER\\Software\\WinRAR\\ArcHistory\\Subkey'))
+    self.assertFalse(scan_tree.CheckPathPrefix(
+        'HKEY_LOCAL_MACHINE\\SAM\\Domains\\Builtin'))
+
+    scan_tree = path_filter.PathFilterScanTree([])
+    self.assertFalse(scan_tree.CheckPathPrefix('HKEY_CURRENT_USER'))
+
 
 if __name__ == '__main__':
   unittest.main()
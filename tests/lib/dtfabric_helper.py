@@ -154,6 +154,43 @@ members:
     with self.assertRaises(errors.ParseError):
       test_helper._ReadData(file_object, 0, self._POINT3D_SIZE)
 
+  def testReadDataFromBuffer(self):
+    """Tests the _ReadDataFromBuffer function."""
+    test_helper = dtfabric_helper.DtFabricHelper()
+    test_helper._READ_BUFFER_SIZE = 8
+
+    file_object = io.BytesIO(
+        b'\x01\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00')
+
+    data = test_helper._ReadDataFromBuffer(file_object, 4, 4)
+    self.assertEqual(data, b'\x02\x00\x00\x00')
+    self.assertEqual(file_object.tell(), 8)
+    self.assertEqual(test_helper._read_buffer_offset, 0)
+
+    # Test with data that crosses the end of the buffered block.
+    data = test_helper._ReadDataFromBuffer(file_object, 6, 4)
+    self.assertEqual(data, b'\x00\x00\x03\x00')
+    self.assertEqual(file_object.tell(), 10)
+    self.assertEqual(test_helper._read_buffer_offset, 6)
+
+    # Test with data that is not fully available.
+    data = test_helper._ReadDataFromBuffer(file_object, 8, 8)
+    self.assertIsNone(data)
+
+    # Test with a different file-like object.
+    file_object = io.BytesIO(
+        b'\x04\x00\x00\x00\x05\x00\x00\x00\x06\x00\x00\x00')
+
+    data = test_helper._ReadDataFromBuffer(file_object, 8, 4)
+    self.assertEqual(data, b'\x06\x00\x00\x00')
+
+    # Test with file-like object that raises an IOError.
+    file_object = ErrorBytesIO(
+        b'\x01\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00')
+
+    data = test_helper._ReadDataFromBuffer(file_object, 0, 4)
+    self.assertIsNone(data)
+
   # TODO: add tests for _ReadDefinitionFile
 
   def testReadStructureFromByteStream(self):
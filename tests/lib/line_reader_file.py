@@ -4,6 +4,8 @@
 
 import unittest
 
+from dfvfs.file_io import fake_file_io
+from dfvfs.path import fake_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
@@ -191,5 +193,119 @@ class BinaryDSVReaderTest(shared_test_lib.BaseTestCase):
     self.assertEqual(rows[4], [b'uber secret laire', b'admin', b'admin'])
 
 
+class TextLineReaderTest(shared_test_lib.BaseTestCase):
+  """Tests for the text line reader."""
+
+  # pylint: disable=protected-access
+
+  def _CreateFileObject(self, data):
+    """Creates a file-like object.
+
+    Args:
+      data (bytes): data of the file.
+
+    Returns:
+      dfvfs.FakeFile: file-like object.
+    """
+    resolver_context = context.Context()
+
+    test_path_spec = fake_path_spec.FakePathSpec(location='/file.txt')
+    file_object = fake_file_io.FakeFile(resolver_context, test_path_spec, data)
+    file_object.Open()
+
+    return file_object
+
+  def testIterator(self):
+    """Tests the iterator functionality."""
+    test_file_path = self._GetTestFilePath(['password.csv'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    resolver_context = context.Context()
+
+    test_path_spec = os_path_spec.OSPathSpec(location=test_file_path)
+    file_object = path_spec_resolver.Resolver.OpenFileObject(
+        test_path_spec, resolver_context=resolver_context)
+
+    line_reader = line_reader_file.TextLineReader(file_object)
+
+    lines = []
+    offsets = []
+    for line in line_reader:
+      lines.append(line)
+      offsets.append(line_reader.tell())
+
+    self.assertEqual(len(lines), 5)
+    self.assertEqual(lines[0], 'place,user,password\n')
+    self.assertEqual(lines[4], 'uber secret laire,admin,admin\n')
+    self.assertEqual(offsets, [20, 44, 64, 86, 116])
+
+  def testReadline(self):
+    """Tests the readline function."""
+    file_object = self._CreateFileObject(
+        b'\xef\xbb\xbfFirst line.\nSecond line \xc3\xa9\xc3\xa9n.\nLast line')
+
+    line_reader = line_reader_file.TextLineReader(file_object)
+    line_reader._READ_BUFFER_SIZE = 8
+
+    line = line_reader.readline()
+    self.assertEqual(line, 'First line.\n')
+    self.assertEqual(line_reader.get_offset(), 15)
+
+    line = line_reader.readline()
+    self.assertEqual(line, 'Second line \xe9\xe9n.\n')
+    self.assertEqual(line_reader.get_offset(), 34)
+
+    line = line_reader.readline()
+    self.assertEqual(line, 'Last line')
+    self.assertEqual(line_reader.get_offset(), 43)
+
+    line = line_reader.readline()
+    self.assertEqual(line, '')
+
+  def testReadlineWithEncodingErrors(self):
+    """Tests the readline function with encoding errors."""
+    file_object = self._CreateFileObject(b'First line.\nSec\xbad line.\n')
+
+    line_reader = line_reader_file.TextLineReader(file_object)
+
+    line = line_reader.readline()
+    self.assertEqual(line, 'First line.\n')
+
+    with self.assertRaises(UnicodeDecodeError):
+      line_reader.readline()
+
+    line_reader = line_reader_file.TextLineReader(
+        file_object, encoding_errors='replace')
+
+    lines = list(line_reader)
+    self.assertEqual(lines, ['First line.\n', 'Sec\ufffdd line.\n'])
+    self.assertEqual(line_reader.get_offset(), 24)
+
+  def testReadlineWithMaximumLineLength(self):
+    """Tests the readline function with a maximum line length."""
+    file_object = self._CreateFileObject(b'First line.\n0123456789\nLast\n')
+
+    line_reader = line_reader_file.TextLineReader(
+        file_object, maximum_line_length=4)
+    line_reader._READ_BUFFER_SIZE = 6
+
+    lines = list(line_reader)
+    self.assertEqual(lines, [
+        'Firs', 't li', 'ne.\n', '0123', '4567', '89\n', 'Last', '\n'])
+    self.assertEqual(line_reader.get_offset(), 28)
+
+  def testReadlineWithUTF16(self):
+    """Tests the readline function with UTF-16 little-endian encoded text."""
+    file_object = self._CreateFileObject(
+        'First line.\nLast line.\n'.encode('utf-16-le'))
+
+    line_reader = line_reader_file.TextLineReader(
+        file_object, encoding='utf-16-le')
+
+    lines = list(line_reader)
+    self.assertEqual(lines, ['First line.\n', 'Last line.\n'])
+    self.assertEqual(line_reader.get_offset(), 46)
+
+
 if __name__ == '__main__':
   unittest.main()
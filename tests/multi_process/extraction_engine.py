@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Tests the multi-process processing engine."""
 
+import multiprocessing
 import os
 import unittest
 
@@ -10,6 +11,7 @@ from artifacts import registry as artifacts_registry
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 
+from plaso.containers import event_sources
 from plaso.containers import sessions
 from plaso.lib import definitions
 from plaso.engine import configurations
@@ -19,9 +21,141 @@ from plaso.storage.sqlite import writer as sqlite_writer
 from tests import test_lib as shared_test_lib
 
 
+class EventSourceHeapTest(shared_test_lib.BaseTestCase):
+  """Tests for the event source heap."""
+
+  # pylint: disable=protected-access
+
+  def _CreateEventSource(self, location, file_entry_type):
+    """Creates an event source for testing.
+
+    Args:
+      location (str): location of the event source.
+      file_entry_type (str): dfVFS file entry type.
+
+    Returns:
+      EventSource: event source.
+    """
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=location)
+    event_source = event_sources.FileEntryEventSource(path_spec=path_spec)
+    event_source.file_entry_type = file_entry_type
+    return event_source
+
+  def testPushAndPopEventSource(self):
+    """Tests the PushEventSource and PopEventSource functions."""
+    event_source_heap = extraction_engine._EventSourceHeap()
+
+    event_source = self._CreateEventSource(
+        '/small', dfvfs_definitions.FILE_ENTRY_TYPE_FILE)
+    event_source.file_size = 10
+    event_source_heap.PushEventSource(event_source)
+
+    event_source = self._CreateEventSource(
+        '/unknown', dfvfs_definitions.FILE_ENTRY_TYPE_FILE)
+    event_source_heap.PushEventSource(event_source)
+
+    event_source = self._CreateEventSource(
+        '/large', dfvfs_definitions.FILE_ENTRY_TYPE_FILE)
+    event_source.file_size = 1000
+    event_source_heap.PushEventSource(event_source)
+
+    event_source = self._CreateEventSource(
+        '/directory', dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    event_source_heap.PushEventSource(event_source)
+
+    locations = []
+    event_source = event_source_heap.PopEventSource()
+    while event_source:
+      locations.append(event_source.path_spec.location)
+      event_source = event_source_heap.PopEventSource()
+
+    self.assertEqual(locations, ['/directory', '/large', '/small', '/unknown'])
+
+
 class ExtractionMultiProcessEngineTest(shared_test_lib.BaseTestCase):
   """Tests for the task-based multi-process extraction engine."""
 
+  # pylint: disable=protected-access
+
+  def testCheckRetiredWorkerProcess(self):
+    """Tests the _CheckRetiredWorkerProcess function."""
+    test_engine = extraction_engine.ExtractionMultiProcessEngine(
+        number_of_worker_processes=3)
+
+    process = multiprocessing.Process(target=os.getpid)
+    process.start()
+    process.join()
+
+    test_engine._process_information_per_pid[process.pid] = None
+    test_engine._processes_per_pid[process.pid] = process
+
+    # No worker process is being retired.
+    result = test_engine._CheckRetiredWorkerProcess(process.pid)
+    self.assertFalse(result)
+
+    test_engine._number_of_retiring_worker_processes = 1
+
+    result = test_engine._CheckRetiredWorkerProcess(process.pid)
+    self.assertTrue(result)
+
+    self.assertNotIn(process.pid, test_engine._processes_per_pid)
+    self.assertNotIn(process.pid, test_engine._process_information_per_pid)
+    self.assertEqual(test_engine._number_of_retiring_worker_processes, 0)
+    self.assertEqual(test_engine._number_of_worker_processes, 2)
+
+  def testGetAutoscalingAdjustment(self):
+    """Tests the _GetAutoscalingAdjustment function."""
+    test_engine = extraction_engine.ExtractionMultiProcessEngine(
+        number_of_worker_processes=2)
+    test_engine._maximum_number_of_worker_processes = 4
+
+    available_memory = 4 * 1024 * 1024 * 1024
+    worker_used_memory = 256 * 1024 * 1024
+
+    # More pending tasks than worker processes.
+    adjustment = test_engine._GetAutoscalingAdjustment(
+        2, 10, 0, worker_used_memory, available_memory)
+    self.assertEqual(adjustment, 1)
+
+    # Maximum number of worker processes reached.
+    adjustment = test_engine._GetAutoscalingAdjustment(
+        4, 10, 0, worker_used_memory, available_memory)
+    self.assertEqual(adjustment, 0)
+
+    # No more pending tasks than worker processes.
+    adjustment = test_engine._GetAutoscalingAdjustment(
+        3, 2, 0, worker_used_memory, available_memory)
+    self.assertEqual(adjustment, 0)
+
+    # Insufficient memory for another worker process.
+    adjustment = test_engine._GetAutoscalingAdjustment(
+        2, 10, 0, worker_used_memory, 600 * 1024 * 1024)
+    self.assertEqual(adjustment, 0)
+
+    # Merge backlog.
+    adjustment = test_engine._GetAutoscalingAdjustment(
+        3, 10, 7, worker_used_memory, available_memory)
+    self.assertEqual(adjustment, -1)
+
+    # Low on memory.
+    adjustment = test_engine._GetAutoscalingAdjustment(
+        3, 10, 0, worker_used_memory, 256 * 1024 * 1024)
+    self.assertEqual(adjustment, -1)
+
+    # Minimum number of worker processes reached.
+    adjustment = test_engine._GetAutoscalingAdjustment(
+        2, 10, 7, worker_used_memory, available_memory)
+    self.assertEqual(adjustment, 0)
+
+    # Explicitly requested number of worker processes reached.
+    test_engine = extraction_engine.ExtractionMultiProcessEngine(
+        number_of_worker_processes=3)
+
+    adjustment = test_engine._GetAutoscalingAdjustment(
+        3, 10, 7, worker_used_memory, available_memory)
+    self.assertEqual(adjustment, 0)
+
   def testProcessSources(self):
     """Tests the PreprocessSources and ProcessSources function."""
     artifacts_path = shared_test_lib.GetTestFilePath(['artifacts'])
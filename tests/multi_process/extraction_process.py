@@ -24,7 +24,9 @@ class TestEventExtractionWorker(worker.EventExtractionWorker):
   """Event extraction worker for testing."""
 
   # pylint: disable=unused-argument
-  def ProcessPathSpec(self, mediator, path_spec, excluded_find_specs=None):
+  def ProcessPathSpec(
+      self, mediator, path_spec, excluded_find_specs=None, parser_name=None,
+      parse_range=None, event_data_stream=None):
     """Processes a path specification.
 
     Args:
@@ -33,6 +35,13 @@ class TestEventExtractionWorker(worker.EventExtractionWorker):
       path_spec (dfvfs.PathSpec): path specification.
       excluded_find_specs (Optional[list[dfvfs.FindSpec]]): find specifications
          that are excluded from processing.
+      parser_name (Optional[str]): name of the parser to parse the range of
+         the file entry with.
+      parse_range (Optional[tuple[int, int]]): start and end of the range of
+         the file entry to parse, as defined by the parser.
+      event_data_stream (Optional[EventDataStream]): event data stream of
+         the range of the file entry to parse, that contains the results of
+         the analyzers of the file entry.
     """
     return
 
@@ -41,7 +50,9 @@ class TestFailureEventExtractionWorker(worker.EventExtractionWorker):
   """Event extraction worker for testing failure."""
 
   # pylint: disable=unused-argument
-  def ProcessPathSpec(self, mediator, path_spec, excluded_find_specs=None):
+  def ProcessPathSpec(
+      self, mediator, path_spec, excluded_find_specs=None, parser_name=None,
+      parse_range=None, event_data_stream=None):
     """Processes a path specification.
 
     Args:
@@ -50,6 +61,13 @@ class TestFailureEventExtractionWorker(worker.EventExtractionWorker):
       path_spec (dfvfs.PathSpec): path specification.
       excluded_find_specs (Optional[list[dfvfs.FindSpec]]): find specifications
          that are excluded from processing.
+      parser_name (Optional[str]): name of the parser to parse the range of
+         the file entry with.
+      parse_range (Optional[tuple[int, int]]): start and end of the range of
+         the file entry to parse, as defined by the parser.
+      event_data_stream (Optional[EventDataStream]): event data stream of
+         the range of the file entry to parse, that contains the results of
+         the analyzers of the file entry.
 
     Raises:
       dfvfs_errors.CacheFullError: cache full error.
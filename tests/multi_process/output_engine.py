@@ -6,8 +6,10 @@ import io
 import os
 import unittest
 
+from plaso.cli import time_slices
 from plaso.engine import configurations
 from plaso.engine import knowledge_base
+from plaso.filters import event_filter
 from plaso.lib import definitions
 from plaso.multi_process import output_engine
 from plaso.output import dynamic
@@ -79,6 +81,28 @@ class TestOutputModule(output_interface.OutputModule):
     self.macb_groups.append(event_macb_group)
 
 
+class TestOutputModuleWithoutEventDataStreams(TestOutputModule):
+  """Output module that does not require event data streams for testing."""
+
+  NAME = 'psort_test_without_event_data_streams'
+
+  def RequiresEventDataStream(self):
+    """Determines if the output module requires event data streams.
+
+    Returns:
+      bool: True if the output module requires event data streams.
+    """
+    return False
+
+  def RequiresEventTag(self):
+    """Determines if the output module requires event tags.
+
+    Returns:
+      bool: True if the output module requires event tags.
+    """
+    return False
+
+
 class PsortEventHeapTest(test_lib.MultiProcessingTestCase):
   """Tests for the psort events heap."""
 
@@ -346,6 +370,90 @@ class OutputAndFormattingMultiProcessEngineTest(
     self.assertEqual(len(output_module.events), 15)
     self.assertEqual(len(output_module.macb_groups), 3)
 
+  def testInternalExportEventsWithTimeSlicer(self):
+    """Tests the _ExportEvents function with the time slicer."""
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+
+    output_mediator_object = output_mediator.OutputMediator(
+        knowledge_base_object, data_location=shared_test_lib.TEST_DATA_PATH)
+
+    output_module = TestOutputModule(output_mediator_object)
+
+    test_engine = output_engine.OutputAndFormattingMultiProcessEngine()
+
+    test_filter = event_filter.EventObjectFilter()
+    test_filter.CompileFilter('text == "Another text"')
+
+    time_slice = time_slices.TimeSlice(None, duration=2)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFile(temp_file)
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(temp_file))
+
+      test_engine._ExportEvents(
+          storage_reader, output_module, deduplicate_events=False,
+          event_filter=test_filter, time_slice=time_slice,
+          use_time_slicer=True)
+
+    self.assertEqual(len(output_module.events), 7)
+
+    # Every event is exported with its own event data stream.
+    for _, event_data, event_data_stream, _ in output_module.events:
+      event_data_stream_identifier = event_data_stream.GetIdentifier()
+      self.assertEqual(
+          event_data.GetEventDataStreamIdentifier().CopyToString(),
+          event_data_stream_identifier.CopyToString())
+
+  def testInternalExportEventsWithoutEventDataStreams(self):
+    """Tests the _ExportEvents function without event data streams."""
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+
+    output_mediator_object = output_mediator.OutputMediator(
+        knowledge_base_object, data_location=shared_test_lib.TEST_DATA_PATH)
+
+    output_module = TestOutputModuleWithoutEventDataStreams(
+        output_mediator_object)
+
+    test_engine = output_engine.OutputAndFormattingMultiProcessEngine()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFile(temp_file)
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(temp_file))
+
+      test_engine._ExportEvents(
+          storage_reader, output_module, deduplicate_events=False)
+
+    self.assertEqual(len(output_module.events), 17)
+    self.assertEqual(len(output_module.macb_groups), 3)
+
+    for _, _, event_data_stream, event_tag in output_module.events:
+      self.assertIsNone(event_data_stream)
+      self.assertIsNone(event_tag)
+
+    # Events are deduplicated without reading the event data streams.
+    output_module = TestOutputModuleWithoutEventDataStreams(
+        output_mediator_object)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFile(temp_file)
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(temp_file))
+
+      test_engine._ExportEvents(storage_reader, output_module)
+
+    self.assertEqual(len(output_module.events), 15)
+
+    for _, _, event_data_stream, _ in output_module.events:
+      self.assertIsNone(event_data_stream)
+
   # TODO: add test for _FlushExportBuffer.
 
   def testExportEvents(self):
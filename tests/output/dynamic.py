@@ -122,6 +122,32 @@ class DynamicOutputModuleTest(test_lib.OutputModuleTestCase):
        'timestamp': '2012-06-27 18:17:01',
        'timestamp_desc': definitions.TIME_DESCRIPTION_CHANGE}]
 
+  def testRequiresEventDataStream(self):
+    """Tests the RequiresEventDataStream function."""
+    output_mediator = self._CreateOutputMediator()
+    output_module = dynamic.DynamicOutputModule(output_mediator)
+
+    self.assertTrue(output_module.RequiresEventDataStream())
+
+    output_module.SetFields(['datetime', 'hostname', 'message_short'])
+    self.assertTrue(output_module.RequiresEventDataStream())
+
+    output_module.SetFields(['datetime', 'hostname', 'md5_hash'])
+    self.assertTrue(output_module.RequiresEventDataStream())
+
+    output_module.SetFields(['datetime', 'hostname', 'tag', 'text'])
+    self.assertFalse(output_module.RequiresEventDataStream())
+
+  def testRequiresEventTag(self):
+    """Tests the RequiresEventTag function."""
+    output_mediator = self._CreateOutputMediator()
+    output_module = dynamic.DynamicOutputModule(output_mediator)
+
+    self.assertTrue(output_module.RequiresEventTag())
+
+    output_module.SetFields(['datetime', 'hostname', 'message'])
+    self.assertFalse(output_module.RequiresEventTag())
+
   def testWriteEventBody(self):
     """Tests the WriteEventBody function."""
     test_file_object = io.StringIO()
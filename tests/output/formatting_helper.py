@@ -401,6 +401,53 @@ class FieldFormattingHelperTest(test_lib.OutputModuleTestCase):
         event, event_data, event_data_stream)
     self.assertEqual(username_string, '-')
 
+  def testGetDateTimeValues(self):
+    """Tests the _GetDateTimeValues function."""
+    output_mediator = self._CreateOutputMediator()
+    test_helper = formatting_helper.FieldFormattingHelper(output_mediator)
+
+    event, _, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    date_time_values = test_helper._GetDateTimeValues(event)
+    self.assertEqual(date_time_values, (
+        2012, 6, 27, 18, 17, 1, '2012-06-27T18:17:01.000000+00:00'))
+    self.assertEqual(len(test_helper._date_time_values_cache), 1)
+
+    # Events in the same second are retrieved from the cache.
+    event.date_time = None
+    event.timestamp += 500000
+
+    date_time_values = test_helper._GetDateTimeValues(event)
+    self.assertEqual(date_time_values, (
+        2012, 6, 27, 18, 17, 1, '2012-06-27T18:17:01.000000+00:00'))
+    self.assertEqual(len(test_helper._date_time_values_cache), 2)
+
+    date_time_values = test_helper._GetDateTimeValues(event)
+    self.assertEqual(len(test_helper._date_time_values_cache), 2)
+
+    # A change of output time zone invalidates the cache.
+    output_mediator.SetTimezone('Europe/Amsterdam')
+
+    date_time_values = test_helper._GetDateTimeValues(event)
+    self.assertEqual(date_time_values, (
+        2012, 6, 27, 20, 17, 1, '2012-06-27T20:17:01.000000+02:00'))
+    self.assertEqual(len(test_helper._date_time_values_cache), 1)
+
+    test_helper._MAXIMUM_CACHED_DATE_TIME_VALUES = 1
+
+    event.timestamp += 1000000
+
+    date_time_values = test_helper._GetDateTimeValues(event)
+    self.assertEqual(date_time_values, (
+        2012, 6, 27, 20, 17, 2, '2012-06-27T20:17:02.000000+02:00'))
+    self.assertEqual(len(test_helper._date_time_values_cache), 1)
+
+    event.timestamp = -9223372036854775808
+
+    with self.assertRaises(TypeError):
+      test_helper._GetDateTimeValues(event)
+
   # TODO: add coverage for _ReportEventError
 
   def testGetFormattedField(self):
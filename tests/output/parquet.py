@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the Apache Parquet output module."""
+
+import json
+import os
+import unittest
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+
+from plaso.containers import events
+from plaso.lib import definitions
+from plaso.output import parquet
+
+from tests import test_lib as shared_test_lib
+from tests.containers import test_lib as containers_test_lib
+from tests.output import test_lib
+
+
+class ParquetOutputModuleTest(test_lib.OutputModuleTestCase):
+  """Tests for the Apache Parquet output module."""
+
+  # pylint: disable=protected-access
+
+  _OS_PATH_SPEC = path_spec_factory.Factory.NewPathSpec(
+      dfvfs_definitions.TYPE_INDICATOR_OS, location='{0:s}{1:s}'.format(
+          os.path.sep, os.path.join('cases', 'image.dd')))
+
+  _TEST_EVENTS = [
+      {'data_type': 'test:event',
+       'hostname': 'ubuntu',
+       'parser': 'test_parser',
+       'path_spec': path_spec_factory.Factory.NewPathSpec(
+           dfvfs_definitions.TYPE_INDICATOR_TSK, inode=15,
+           location='/var/log/syslog.1', parent=_OS_PATH_SPEC),
+       'text': (
+           'Reporter <CRON> PID: |8442| (pam_unix(cron:session): session\n '
+           'closed for user root)'),
+       'timestamp': '2012-06-27 18:17:01',
+       'timestamp_desc': definitions.TIME_DESCRIPTION_UNKNOWN,
+       'username': 'root'}]
+
+  def _CreateTestOutputModule(self):
+    """Creates an output module for testing.
+
+    Returns:
+      ParquetOutputModule: output module.
+    """
+    output_mediator = self._CreateOutputMediator()
+
+    formatters_directory_path = self._GetTestFilePath(['formatters'])
+    output_mediator.ReadMessageFormattersFromDirectory(
+        formatters_directory_path)
+
+    return parquet.ParquetOutputModule(output_mediator)
+
+  def testGetColumnValues(self):
+    """Tests the _GetColumnValues function."""
+    output_module = self._CreateTestOutputModule()
+
+    event, event_data, event_data_stream = (
+        containers_test_lib.CreateEventFromValues(self._TEST_EVENTS[0]))
+
+    event_tag = events.EventTag()
+    event_tag.AddLabel('Test')
+
+    column_values = output_module._GetColumnValues(
+        event, event_data, event_data_stream, event_tag)
+
+    expected_timestamp = shared_test_lib.CopyTimestampFromString(
+        '2012-06-27 18:17:01')
+
+    attributes = json.loads(column_values.pop('attributes'))
+
+    expected_column_values = {
+        'data_type': 'test:event',
+        'display_name': 'TSK:/var/log/syslog.1',
+        'message': (
+            'Reporter <CRON> PID: |8442| (pam_unix(cron:session): '
+            'session closed for user root)'),
+        'parser': 'test_parser',
+        'tag': ['Test'],
+        'timestamp': expected_timestamp,
+        'timestamp_desc': definitions.TIME_DESCRIPTION_UNKNOWN}
+
+    self.assertEqual(column_values, expected_column_values)
+
+    self.assertEqual(attributes['hostname'], 'ubuntu')
+    self.assertEqual(attributes['pathspec']['location'], '/var/log/syslog.1')
+    self.assertEqual(attributes['username'], 'root')
+    self.assertNotIn('data_type', attributes)
+    self.assertNotIn('path_spec', attributes)
+
+  @unittest.skipIf(parquet.pyarrow is None, 'missing pyarrow')
+  def testWriteEventBody(self):
+    """Tests the WriteEventBody function."""
+    output_module = self._CreateTestOutputModule()
+    output_module._ROW_GROUP_SIZE = 2
+
+    event, event_data, event_data_stream = (
+        containers_test_lib.CreateEventFromValues(self._TEST_EVENTS[0]))
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      output_path = os.path.join(temp_directory, 'timeline.parquet')
+
+      output_module.Open(path=output_path)
+
+      for _ in range(3):
+        output_module.WriteEventBody(
+            event, event_data, event_data_stream, None)
+
+      output_module.Close()
+
+      parquet_file = parquet.pyarrow_parquet.ParquetFile(output_path)
+      number_of_row_groups = parquet_file.num_row_groups
+      table = parquet_file.read()
+
+    self.assertEqual(number_of_row_groups, 2)
+    self.assertEqual(table.num_rows, 3)
+    self.assertEqual(table.column_names, output_module._COLUMN_NAMES)
+
+    self.assertEqual(
+        table.schema.field('timestamp').type, parquet.pyarrow.int64())
+
+    expected_timestamp = shared_test_lib.CopyTimestampFromString(
+        '2012-06-27 18:17:01')
+
+    rows = table.to_pylist()
+    self.assertEqual(rows[0]['timestamp'], expected_timestamp)
+    self.assertEqual(rows[0]['data_type'], 'test:event')
+    self.assertEqual(rows[0]['parser'], 'test_parser')
+    self.assertIsNone(rows[0]['tag'])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -2,6 +2,9 @@
 # -*- coding: utf-8 -*-
 """Tests for the shared functionality for Elasticsearch output modules."""
 
+import http.server
+import json
+import threading
 import unittest
 
 from unittest.mock import MagicMock
@@ -23,6 +26,114 @@ class TestElasticsearchOutputModule(
   def _Connect(self):
     """Connects to an Elasticsearch server."""
     self._client = MagicMock()
+    self._client.bulk.return_value = {'errors': False, 'items': []}
+
+
+class ElasticsearchStubRequestHandler(http.server.BaseHTTPRequestHandler):
+  """HTTP request handler that stands in for an Elasticsearch server."""
+
+  # pylint: disable=invalid-name
+
+  def _WriteResponse(self, status_code, response_values):
+    """Writes a JSON response.
+
+    Args:
+      status_code (int): HTTP status code.
+      response_values (dict[str, object]): values of the response.
+    """
+    response_data = json.dumps(response_values).encode('utf-8')
+
+    self.send_response(status_code)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', '{0:d}'.format(len(response_data)))
+    self.send_header('X-Elastic-Product', 'Elasticsearch')
+    self.end_headers()
+    self.wfile.write(response_data)
+
+  def do_GET(self):
+    """Handles a GET request."""
+    self._WriteResponse(200, {
+        'cluster_name': 'stub', 'tagline': 'You Know, for Search',
+        'version': {'build_flavor': 'default', 'number': '7.17.0'}})
+
+  def do_HEAD(self):
+    """Handles a HEAD request."""
+    self.send_response(404)
+    self.send_header('Content-Length', '0')
+    self.send_header('X-Elastic-Product', 'Elasticsearch')
+    self.end_headers()
+
+  def do_POST(self):
+    """Handles a POST request."""
+    content_length = int(self.headers.get('Content-Length', 0), 10)
+    request_data = self.rfile.read(content_length).decode('utf-8')
+
+    if not self.path.split('?')[0].endswith('/_bulk'):
+      self._WriteResponse(404, {})
+      return
+
+    lines = [line for line in request_data.split('\n') if line]
+    event_values_list = [json.loads(line) for line in lines[1::2]]
+
+    items = []
+    with self.server.lock:
+      self.server.number_of_bulk_requests += 1
+
+      for event_values in event_values_list:
+        message = event_values.get('message', None)
+        status_code = 201
+
+        if message in self.server.rejected_messages:
+          self.server.rejected_messages.remove(message)
+          status_code = 429
+        elif message in self.server.invalid_messages:
+          status_code = 400
+        else:
+          self.server.messages.append(message)
+
+        item_values = {'status': status_code}
+        if status_code >= 300:
+          item_values['error'] = {'type': 'stub_exception'}
+
+        items.append({'index': item_values})
+
+    self._WriteResponse(200, {
+        'errors': any(item['index']['status'] >= 300 for item in items),
+        'items': items, 'took': 1})
+
+  def do_PUT(self):
+    """Handles a PUT request."""
+    self._WriteResponse(200, {'acknowledged': True})
+
+  def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+    """Suppresses logging of requests."""
+    return
+
+
+class ElasticsearchStubServer(http.server.ThreadingHTTPServer):
+  """HTTP server that stands in for an Elasticsearch server.
+
+  Attributes:
+    invalid_messages (set[str]): messages of events that are rejected
+        permanently.
+    lock (threading.Lock): lock to serialize access to the attributes.
+    messages (list[str]): messages of events that were indexed.
+    number_of_bulk_requests (int): number of bulk requests handled.
+    rejected_messages (set[str]): messages of events that are rejected
+        temporarily, once.
+  """
+
+  daemon_threads = True
+
+  def __init__(self):
+    """Initializes an Elasticsearch stub server."""
+    super(ElasticsearchStubServer, self).__init__(
+        ('127.0.0.1', 0), ElasticsearchStubRequestHandler)
+    self.invalid_messages = set()
+    self.lock = threading.Lock()
+    self.messages = []
+    self.number_of_bulk_requests = 0
+    self.rejected_messages = set()
 
 
 @unittest.skipIf(shared_elastic.elasticsearch is None, 'missing elasticsearch')
@@ -263,5 +374,123 @@ class SharedElasticsearchOutputModuleTest(test_lib.OutputModuleTestCase):
     self.assertEqual(output_module._number_of_buffered_events, 1)
 
 
+@unittest.skipIf(shared_elastic.elasticsearch is None, 'missing elasticsearch')
+class SharedElasticsearchOutputModuleWithServerTest(
+    test_lib.OutputModuleTestCase):
+  """Tests the Elasticsearch bulk requests against a stub server."""
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Makes preparations before running an individual test."""
+    self._server = ElasticsearchStubServer()
+    self._server_thread = threading.Thread(target=self._server.serve_forever)
+    self._server_thread.daemon = True
+    self._server_thread.start()
+
+  def tearDown(self):
+    """Cleans up after running an individual test."""
+    self._server.shutdown()
+    self._server.server_close()
+    self._server_thread.join()
+
+  def _CreateTestOutputModule(self):
+    """Creates an output module connected to the stub server.
+
+    Returns:
+      SharedElasticsearchOutputModule: output module.
+    """
+    output_mediator = self._CreateOutputMediator()
+    output_module = shared_elastic.SharedElasticsearchOutputModule(
+        output_mediator)
+
+    output_module.SetServerInformation('127.0.0.1', self._server.server_port)
+    output_module.SetIndexName('test')
+    output_module._retry_wait_time = 0.01
+
+    output_module._Connect()
+
+    return output_module
+
+  def _InsertTestEvents(self, output_module, number_of_events):
+    """Inserts test events.
+
+    Args:
+      output_module (SharedElasticsearchOutputModule): output module.
+      number_of_events (int): number of events to insert.
+    """
+    for index in range(number_of_events):
+      event_values = {'message': 'event {0:d}'.format(index)}
+      output_module._event_documents.append({'index': {'_index': 'test'}})
+      output_module._event_documents.append(event_values)
+      output_module._number_of_buffered_events += 1
+
+      if output_module._number_of_buffered_events >= 10:
+        output_module._FlushEvents()
+
+  def testBulkIndexEvents(self):
+    """Tests the _BulkIndexEvents function."""
+    self._server.rejected_messages = set(['event 1', 'event 3'])
+    self._server.invalid_messages = set(['event 4'])
+
+    output_module = self._CreateTestOutputModule()
+
+    event_documents = []
+    for index in range(5):
+      event_documents.append({'index': {'_index': 'test'}})
+      event_documents.append({'message': 'event {0:d}'.format(index)})
+
+    output_module._BulkIndexEvents(event_documents)
+
+    self.assertEqual(self._server.number_of_bulk_requests, 2)
+    self.assertEqual(
+        self._server.messages, ['event 0', 'event 2', 'event 1', 'event 3'])
+
+    self.assertEqual(output_module._statistics, {
+        'bulk_requests': 2,
+        'failed_events': 1,
+        'indexed_events': 4,
+        'retried_events': 2})
+
+  def testBulkIndexEventsWithMaximumNumberOfRetries(self):
+    """Tests the _BulkIndexEvents function with too many retries."""
+    output_module = self._CreateTestOutputModule()
+    output_module._MAXIMUM_NUMBER_OF_RETRIES = 0
+
+    self._server.rejected_messages = set(['event 0'])
+
+    output_module._BulkIndexEvents([
+        {'index': {'_index': 'test'}}, {'message': 'event 0'}])
+
+    self.assertEqual(self._server.messages, [])
+
+    self.assertEqual(output_module._statistics, {
+        'bulk_requests': 1,
+        'failed_events': 1,
+        'indexed_events': 0,
+        'retried_events': 0})
+
+  def testClose(self):
+    """Tests the Close function with concurrent bulk requests."""
+    self._server.rejected_messages = set(['event 5', 'event 55'])
+
+    output_module = self._CreateTestOutputModule()
+    output_module.SetNumberOfBulkRequests(4)
+
+    self._InsertTestEvents(output_module, 105)
+
+    output_module.Close()
+
+    self.assertIsNone(output_module._client)
+    self.assertEqual(output_module._bulk_request_threads, [])
+
+    expected_messages = ['event {0:d}'.format(index) for index in range(105)]
+    self.assertEqual(sorted(self._server.messages), sorted(expected_messages))
+
+    self.assertEqual(output_module._statistics['failed_events'], 0)
+    self.assertEqual(output_module._statistics['indexed_events'], 105)
+    self.assertEqual(output_module._statistics['retried_events'], 2)
+
+
 if __name__ == '__main__':
   unittest.main()
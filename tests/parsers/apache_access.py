@@ -13,6 +13,11 @@ from tests.parsers import test_lib
 class ApacheAccessUnitTest(test_lib.ParserTestCase):
   """Tests for Apache access log parser."""
 
+  def testLineStructureRegularExpressions(self):
+    """Tests the line structure regular expressions."""
+    parser = apache_access.ApacheAccessParser()
+    self.CheckLineStructureRegularExpressions(['access.log'], parser)
+
   def testParse(self):
     """Tests the Parse function."""
     parser = apache_access.ApacheAccessParser()
@@ -29,7 +29,7 @@ class ChromeCacheParserTest(test_lib.ParserTestCase):
         'original_url': (
             'https://s.ytimg.com/yts/imgbin/player-common-vfliLfqPT.webp')}
 
-    self.CheckEventValues(storage_writer, events[0], expected_event_values)
+    self.CheckEventValues(storage_writer, events[35], expected_event_values)
 
 
 if __name__ == '__main__':
@@ -12,6 +12,11 @@ from tests.parsers import test_lib
 class DpkgParserTest(test_lib.ParserTestCase):
   """Tests for the Dpkg Log parser."""
 
+  def testLineStructureRegularExpressions(self):
+    """Tests the line structure regular expressions."""
+    parser = dpkg.DpkgParser()
+    self.CheckLineStructureRegularExpressions(['dpkg.log'], parser)
+
   def testParse(self):
     """Tests for the Parse method."""
     parser = dpkg.DpkgParser()
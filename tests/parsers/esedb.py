@@ -4,6 +4,10 @@
 
 import unittest
 
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
 from plaso.containers import sessions
 from plaso.containers import warnings
 from plaso.parsers import esedb
@@ -17,6 +21,29 @@ class ESEDBParserTest(test_lib.ParserTestCase):
 
   # pylint: disable=protected-access
 
+  def _CreateTestParserMediator(self, path_segments):
+    """Creates a parser mediator and file object for testing.
+
+    Args:
+      path_segments (list[str]): path segments inside the test data directory.
+
+    Returns:
+      tuple[FakeStorageWriter, ParserMediator, dfvfs.FileIO]: storage writer,
+          parser mediator and file object.
+    """
+    test_file_path = self._GetTestFilePath(path_segments)
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(
+        sessions.Session(), storage_writer, file_entry=file_entry)
+
+    return storage_writer, parser_mediator, file_entry.GetFileObject()
+
   def testEnablePlugins(self):
     """Tests the EnablePlugins function."""
     parser = esedb.ESEDBParser()
@@ -32,6 +59,25 @@ class ESEDBParserTest(test_lib.ParserTestCase):
     parser.EnablePlugins(['file_history'])
     self.assertEqual(len(parser._plugins), 1)
 
+  def testGetParseRanges(self):
+    """Tests the GetParseRanges function."""
+    parser = esedb.ESEDBParser()
+    _, parser_mediator, file_object = self._CreateTestParserMediator(
+        ['Catalog1.edb'])
+
+    parse_ranges = parser.GetParseRanges(
+        parser_mediator, file_object, 1024 * 1024)
+    self.assertEqual(parse_ranges, [(0, 5), (5, 6), (6, 7), (7, 10)])
+
+    parse_ranges = parser.GetParseRanges(
+        parser_mediator, file_object, 4 * 1024 * 1024)
+    self.assertIsNone(parse_ranges)
+
+    parser.EnablePlugins(['msie_webcache'])
+    parse_ranges = parser.GetParseRanges(
+        parser_mediator, file_object, 1024 * 1024)
+    self.assertIsNone(parse_ranges)
+
   def testParse(self):
     """Tests the Parse function."""
     parser = esedb.ESEDBParser()
@@ -68,6 +114,25 @@ class ESEDBParserTest(test_lib.ParserTestCase):
     expected_message = 'unable to open file with error: Missing file object.'
     self.assertEqual(test_warning.message, expected_message)
 
+  def testParseWithParseRange(self):
+    """Tests the Parse function with a parse range."""
+    parser = esedb.ESEDBParser()
+
+    number_of_events = 0
+    for parse_range in ((0, 5), (5, 6), (6, 7), (7, 10)):
+      storage_writer, parser_mediator, file_object = (
+          self._CreateTestParserMediator(['Catalog1.edb']))
+      parser_mediator.SetParseRange(parse_range)
+
+      parser.Parse(parser_mediator, file_object)
+
+      self.assertEqual(storage_writer.number_of_extraction_warnings, 0)
+      number_of_events += storage_writer.number_of_events
+
+    storage_writer = self._ParseFile(['Catalog1.edb'], parser)
+    self.assertEqual(number_of_events, storage_writer.number_of_events)
+    self.assertEqual(number_of_events, 2713)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Tests for the parsers and plugins interface classes."""
 
+import os
 import unittest
 
 from plaso.parsers import interface
@@ -9,6 +10,46 @@ from plaso.parsers import interface
 from tests.parsers import test_lib
 
 
+class FileHeadTest(test_lib.ParserTestCase):
+  """Tests for the head of a file."""
+
+  def testRead(self):
+    """Tests the read function."""
+    file_object = self._CreateFileObject('file.txt', b'0123456789')
+
+    file_head = interface.FileHead(file_object, 4)
+    self.assertEqual(file_head.get_size(), 10)
+
+    self.assertEqual(file_head.read(2), b'01')
+    self.assertEqual(file_head.get_offset(), 2)
+    self.assertEqual(file_head.read(2), b'23')
+
+    with self.assertRaises(IOError):
+      file_head.read(1)
+
+    file_head = interface.FileHead(file_object, 16)
+    self.assertEqual(file_head.read(), b'0123456789')
+    self.assertEqual(file_head.read(), b'')
+
+  def testSeek(self):
+    """Tests the seek function."""
+    file_object = self._CreateFileObject('file.txt', b'0123456789')
+
+    file_head = interface.FileHead(file_object, 4)
+
+    file_head.seek(3, os.SEEK_SET)
+    self.assertEqual(file_head.read(1), b'3')
+
+    file_head.seek(-2, os.SEEK_CUR)
+    self.assertEqual(file_head.get_offset(), 2)
+
+    file_head.seek(0, os.SEEK_END)
+    self.assertEqual(file_head.read(), b'')
+
+    with self.assertRaises(IOError):
+      file_head.seek(-1, os.SEEK_SET)
+
+
 class BaseParserTest(test_lib.ParserTestCase):
   """Tests for the parser interface."""
 
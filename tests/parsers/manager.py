@@ -211,6 +211,17 @@ class ParsersManagerTest(shared_test_lib.BaseTestCase):
       parser_names.append(parser.NAME)
     self.assertEqual(parser_names, ['test_parser_with_plugins'])
 
+    parser = parsers['test_parser_with_plugins']
+    self.assertEqual(len(parser._plugins), 1)
+
+    # Test with a parser name and an excluded plugin name.
+    parsers = manager.ParsersManager.GetParserObjects(
+        parser_filter_expression=(
+            '!test_parser_with_plugins/test_plugin,test_parser_with_plugins'))
+
+    parser = parsers['test_parser_with_plugins']
+    self.assertEqual(len(parser._plugins), 0)
+
     TestParserWithPlugins.DeregisterPlugin(TestPlugin)
     manager.ParsersManager.DeregisterParser(TestParserWithPlugins)
     manager.ParsersManager.DeregisterParser(TestParser)
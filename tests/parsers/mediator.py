@@ -270,6 +270,22 @@ class ParsersMediatorTest(test_lib.ParserTestCase):
 
     parser_mediator.SetFileEntry(None)
 
+  def testSetParseRange(self):
+    """Tests the SetParseRange function."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter()
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+    parser_mediator = mediator.ParserMediator(
+        session, storage_writer, knowledge_base_object)
+
+    self.assertIsNone(parser_mediator.parse_range)
+
+    parser_mediator.SetParseRange((0, 10))
+    self.assertEqual(parser_mediator.parse_range, (0, 10))
+
+    parser_mediator.SetParseRange(None)
+    self.assertIsNone(parser_mediator.parse_range)
+
   def testSetStorageWriter(self):
     """Tests the SetStorageWriter function."""
     session = sessions.Session()
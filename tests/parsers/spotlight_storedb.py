@@ -13,6 +13,8 @@ from tests.parsers import test_lib
 class SpotlightStoreDatabaseParserTest(test_lib.ParserTestCase):
   """Tests for the Apple Spotlight store database parser."""
 
+  # pylint: disable=protected-access
+
   def testParse(self):
     """Tests the Parse function."""
     parser = spotlight_storedb.SpotlightStoreDatabaseParser()
@@ -53,6 +55,17 @@ class SpotlightStoreDatabaseParserTest(test_lib.ParserTestCase):
 
     self.CheckEventValues(storage_writer, events[0], expected_event_values)
 
+  def testParseWithSingleReadAheadRecordPage(self):
+    """Tests the Parse function with a single record page read ahead."""
+    parser = spotlight_storedb.SpotlightStoreDatabaseParser()
+    parser._MAXIMUM_NUMBER_OF_PENDING_RECORD_PAGES = 1
+
+    storage_writer = self._ParseFile(['859631-store.db'], parser)
+
+    self.assertEqual(storage_writer.number_of_events, 1848)
+    self.assertEqual(storage_writer.number_of_extraction_warnings, 0)
+    self.assertEqual(storage_writer.number_of_recovery_warnings, 0)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -2,8 +2,10 @@
 # -*- coding: utf-8 -*-
 """Tests for the SQLite database parser."""
 
+import os
 import unittest
 
+from plaso.lib import errors
 from plaso.parsers import sqlite
 # Register all plugins.
 from plaso.parsers import sqlite_plugins  # pylint: disable=unused-import
@@ -18,6 +20,32 @@ class SQLiteDatabaseTest(test_lib.ParserTestCase):
   # TODO: add tests for _CopyFileObjectToTemporaryFile
   # TODO: add tests for Open and Close
 
+  # pylint: disable=protected-access
+
+  def testGetTableNamesOfPages(self):
+    """Tests the GetTableNamesOfPages function."""
+    database_file_path = self._GetTestFilePath(['wal_database.db'])
+    self._SkipIfPathNotExists(database_file_path)
+
+    database_wal_file_path = self._GetTestFilePath(['wal_database.db-wal'])
+    self._SkipIfPathNotExists(database_wal_file_path)
+
+    database = sqlite.SQLiteDatabase('wal_database.db')
+    with open(database_file_path, 'rb') as database_file_object:
+      with open(database_wal_file_path, 'rb') as wal_file_object:
+        database.Open(database_file_object, wal_file_object=wal_file_object)
+
+    try:
+      table_names = database.GetTableNamesOfPages(set([2, 3]))
+
+    finally:
+      database.Close()
+
+    # Note that the dbstat virtual table is not available in every build of
+    # SQLite.
+    if table_names is not None:
+      self.assertEqual(table_names, set(['MyTable', 'NewTable']))
+
   def testOpenClose(self):
     """Tests the Open and Close functions."""
     database_file_path = self._GetTestFilePath(['contacts2.db'])
@@ -97,13 +125,59 @@ class SQLiteDatabaseTest(test_lib.ParserTestCase):
 
     self.assertEqual(expected_results, row_results)
 
+  def testReopenWithWAL(self):
+    """Tests the ReopenWithWAL function."""
+    database_file_path = self._GetTestFilePath(['wal_database.db'])
+    self._SkipIfPathNotExists(database_file_path)
+
+    database_wal_file_path = self._GetTestFilePath(['wal_database.db-wal'])
+    self._SkipIfPathNotExists(database_wal_file_path)
+
+    database = sqlite.SQLiteDatabase('wal_database.db')
+    with open(database_file_path, 'rb') as database_file_object:
+      database.Open(database_file_object)
+
+    try:
+      temporary_database_file_path = database._temp_db_file_path
+
+      row_results = [
+          row['Field2'] for row in database.Query('SELECT * FROM MyTable')]
+      self.assertEqual(row_results, [1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+
+      with open(database_wal_file_path, 'rb') as wal_file_object:
+        database.ReopenWithWAL(wal_file_object)
+
+      # The temporary copy of the database is reused and the schema is read
+      # again, since the WAL file adds a column.
+      self.assertEqual(
+          database._temp_db_file_path, temporary_database_file_path)
+      self.assertEqual(database.columns_per_table['MyTable'], [
+          'Field1', 'Field2', 'Field3', 'NewField'])
+
+      row_results = [
+          row['Field2'] for row in database.Query('SELECT * FROM MyTable')]
+      self.assertEqual(row_results, [1, 2, 4, 5, 7, 8, 9, 10, 11, 12, 13])
+
+      with open(database_wal_file_path, 'rb') as wal_file_object:
+        with self.assertRaises(IOError):
+          database.ReopenWithWAL(wal_file_object)
+
+    finally:
+      database.Close()
+
+    self.assertFalse(os.path.exists(temporary_database_file_path))
+
+    with open(database_wal_file_path, 'rb') as wal_file_object:
+      with self.assertRaises(IOError):
+        database.ReopenWithWAL(wal_file_object)
+
 
 class SQLiteParserTest(test_lib.ParserTestCase):
   """Tests for the SQLite database parser."""
 
   # pylint: disable=protected-access
 
-  # TODO: add tests for _OpenDatabaseWithWAL
+  # TODO: add tests for _GetWALFileEntry
 
   def testEnablePlugins(self):
     """Tests the EnablePlugins function."""
@@ -120,11 +194,54 @@ class SQLiteParserTest(test_lib.ParserTestCase):
     parser.EnablePlugins(['chrome_27_history'])
     self.assertEqual(len(parser._plugins), 1)
 
+    self.assertEqual(
+        list(parser._plugins_per_required_table.keys()), ['downloads'])
+
+    plugin = parser._plugins[0]
+    schema_key = parser._GetSchemaKey(plugin.SCHEMAS[0])
+    self.assertEqual(
+        parser._plugin_names_per_schema[schema_key],
+        set(['chrome_27_history']))
+
+  def testGetPluginsWithRequiredTables(self):
+    """Tests the _GetPluginsWithRequiredTables function."""
+    database_file_path = self._GetTestFilePath(['contacts2.db'])
+    self._SkipIfPathNotExists(database_file_path)
+
+    parser = sqlite.SQLiteParser()
+
+    database = sqlite.SQLiteDatabase('contacts2.db')
+    with open(database_file_path, 'rb') as database_file_object:
+      database.Open(database_file_object)
+      try:
+        plugins = parser._GetPluginsWithRequiredTables(database)
+      finally:
+        database.Close()
+
+    plugin_names = [plugin.NAME for plugin in plugins]
+    self.assertEqual(plugin_names, ['android_calls'])
+
   def testGetFormatSpecification(self):
     """Tests the GetFormatSpecification function."""
     format_specification = sqlite.SQLiteParser.GetFormatSpecification()
     self.assertIsNotNone(format_specification)
 
+  def testGetWALCommittedPageNumbers(self):
+    """Tests the _GetWALCommittedPageNumbers function."""
+    parser = sqlite.SQLiteParser()
+
+    file_entry = self._GetTestFileEntry(['wal_database.db-wal'])
+    file_object = file_entry.GetFileObject()
+
+    page_numbers = parser._GetWALCommittedPageNumbers(file_object)
+    self.assertEqual(page_numbers, set([1, 2, 3]))
+
+    file_entry = self._GetTestFileEntry(['wal_database.db'])
+    file_object = file_entry.GetFileObject()
+
+    with self.assertRaises(errors.ParseError):
+      parser._GetWALCommittedPageNumbers(file_object)
+
   def testParseFileEntry(self):
     """Tests the ParseFileEntry function."""
     parser = sqlite.SQLiteParser()
@@ -147,6 +264,23 @@ class SQLiteParserTest(test_lib.ParserTestCase):
     self.assertEqual(storage_writer.number_of_extraction_warnings, 0)
     self.assertEqual(storage_writer.number_of_recovery_warnings, 0)
 
+  def testParseFileEntryOnDatabaseWithWAL(self):
+    """Tests ParseFileEntry on a database with a WAL file."""
+    parser = sqlite.SQLiteParser()
+    storage_writer = self._ParseFile(['wal_database.db'], parser)
+
+    self.assertEqual(storage_writer.number_of_events, 0)
+    self.assertEqual(storage_writer.number_of_extraction_warnings, 0)
+    self.assertEqual(storage_writer.number_of_recovery_warnings, 0)
+
+    # The database is parsed again with its WAL file, which produces an event
+    # data stream for the WAL file.
+    event_data_streams = list(storage_writer.GetAttributeContainers(
+        'event_data_stream'))
+    self.assertEqual(len(event_data_streams), 1)
+    self.assertTrue(event_data_streams[0].path_spec.location.endswith(
+        'wal_database.db-wal'))
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -2,8 +2,11 @@
 # -*- coding: utf-8 -*-
 """Tests for the Systemd Journal parser."""
 
+import struct
 import unittest
 
+from unittest import mock
+
 from plaso.containers import sessions
 from plaso.containers import warnings
 from plaso.parsers import systemd_journal
@@ -14,6 +17,65 @@ from tests.parsers import test_lib
 class SystemdJournalParserTest(test_lib.ParserTestCase):
   """Tests for the Systemd Journal parser."""
 
+  # pylint: disable=protected-access
+
+  def _CreateJournalData(self, messages):
+    """Creates the data of a journal file.
+
+    Every entry of the journal file refers to the same _HOSTNAME data object
+    and to a MESSAGE data object of its own.
+
+    Args:
+      messages (list[str]): messages of the entries.
+
+    Returns:
+      bytes: data of the journal file.
+    """
+    header_size = 208
+    entry_array_object_size = 24 + (8 * len(messages))
+
+    data_objects = []
+    data_object_offsets = []
+    data_object_offset = header_size + entry_array_object_size
+    for field in ['_HOSTNAME=test-host'] + [
+        'MESSAGE={0:s}'.format(message) for message in messages]:
+      data = field.encode('utf-8')
+      data_object = struct.pack(
+          '<BB6xQ48x', 1, 0, 64 + len(data)) + data
+      data_object += b'\x00' * (-len(data_object) % 8)
+
+      data_objects.append(data_object)
+      data_object_offsets.append(data_object_offset)
+      data_object_offset += len(data_object)
+
+    entry_objects = []
+    entry_object_offsets = []
+    entry_object_offset = data_object_offset
+    for entry_index in range(len(messages)):
+      entry_object = struct.pack(
+          '<BB6xQQQQ16sQ', 3, 0, 96, entry_index + 1,
+          1485510055913258 + entry_index, 0, b'\x00' * 16, 0)
+      entry_object += struct.pack('<QQ', data_object_offsets[0], 0)
+      entry_object += struct.pack(
+          '<QQ', data_object_offsets[entry_index + 1], 0)
+
+      entry_objects.append(entry_object)
+      entry_object_offsets.append(entry_object_offset)
+      entry_object_offset += len(entry_object)
+
+    file_header = struct.pack(
+        '<8sIIB7x64xQQQQQQQQQQQQQQQ', b'LPKSHHRH', 0, 0, 0, header_size,
+        entry_object_offset - header_size, 0, 0, 0, 0, 0, 0, len(messages),
+        0, 0, header_size, 0, 0, 0)
+
+    entry_array_object = struct.pack(
+        '<BB6xQQ', 6, 0, entry_array_object_size, 0)
+    entry_array_object += struct.pack(
+        '<{0:d}Q'.format(len(messages)), *entry_object_offsets)
+
+    return b''.join(
+        [file_header, entry_array_object] + data_objects + entry_objects)
+
   def testParse(self):
     """Tests the Parse function."""
     parser = systemd_journal.SystemdJournalParser()
@@ -91,6 +153,57 @@ class SystemdJournalParserTest(test_lib.ParserTestCase):
 
     self.CheckEventValues(storage_writer, events[84], expected_event_values)
 
+  def testParseFileObjectWithFieldsCache(self):
+    """Tests the ParseFileObject function with the fields cache."""
+    session = sessions.Session()
+    parser = systemd_journal.SystemdJournalParser()
+
+    journal_data = self._CreateJournalData(['First', 'Second', 'Third'])
+
+    for _ in range(2):
+      storage_writer = self._CreateStorageWriter()
+      parser_mediator = self._CreateParserMediator(session, storage_writer)
+      file_object = self._CreateFileObject('system.journal', journal_data)
+
+      with mock.patch.object(
+          parser, '_ParseDataObject',
+          wraps=parser._ParseDataObject) as parse_data_object:
+        parser.ParseFileObject(parser_mediator, file_object)
+
+      self.assertEqual(storage_writer.number_of_events, 3)
+      self.assertEqual(storage_writer.number_of_extraction_warnings, 0)
+
+      # The shared _HOSTNAME data object is read once per file.
+      self.assertEqual(parse_data_object.call_count, 4)
+
+      # The cached fields are not retained after the file has been parsed.
+      self.assertEqual(parser._fields_cache, {})
+
+    events = list(storage_writer.GetEvents())
+
+    expected_event_values = {
+        'body': 'First',
+        'data_type': 'systemd:journal',
+        'date_time': '2017-01-27 09:40:55.913258',
+        'hostname': 'test-host'}
+
+    self.CheckEventValues(storage_writer, events[0], expected_event_values)
+
+  def testParseJournalEntryWithMaximumCachedFields(self):
+    """Tests the _ParseJournalEntry function with a bounded fields cache."""
+    parser = systemd_journal.SystemdJournalParser()
+    parser._MAXIMUM_CACHED_FIELDS = 2
+
+    journal_data = self._CreateJournalData(['First', 'Second', 'Third'])
+    file_object = self._CreateFileObject('system.journal', journal_data)
+
+    entry_array_object = parser._ParseEntryArrayObject(file_object, 208)
+    for entry_object_offset in entry_array_object.entry_object_offsets:
+      parser._ParseJournalEntry(file_object, entry_object_offset)
+
+      self.assertLessEqual(
+          len(parser._fields_cache), parser._MAXIMUM_CACHED_FIELDS)
+
   def testParseDirty(self):
     """Tests the Parse function on a 'dirty' journal file."""
     session = sessions.Session()
@@ -107,6 +107,29 @@ class ParserTestCase(shared_test_lib.BaseTestCase):
     return storage_writer.GetAttributeContainerByIdentifier(
         events.EventData.CONTAINER_TYPE, event_data_identifier)
 
+  def _GetEventValuesOfEvents(self, storage_writer):
+    """Retrieves the values of the events and their event data.
+
+    Args:
+      storage_writer (FakeStorageWriter): storage writer.
+
+    Returns:
+      list[dict[str, object]]: event and event data attribute values per name,
+          without the attribute container identifiers, per event.
+    """
+    event_values_list = []
+    for event in storage_writer.GetEvents():
+      event_data = self._GetEventDataOfEvent(storage_writer, event)
+
+      event_values = dict(event.GetAttributes())
+      event_values.update(event_data.GetAttributes())
+
+      event_values_list.append({
+          name: value for name, value in event_values.items()
+          if name[0] != '_'})
+
+    return event_values_list
+
   def _ParseFile(
       self, path_segments, parser, collection_filters_helper=None,
       knowledge_base_values=None, timezone='UTC'):
@@ -206,6 +229,65 @@ class ParserTestCase(shared_test_lib.BaseTestCase):
           'event value: "{0:s}" does not match expected value').format(name)
       self.assertEqual(value, expected_value, error_message)
 
+  def CheckLineStructureRegularExpressions(
+      self, path_segments, parser, knowledge_base_values=None):
+    """Asserts that the line structure regular expressions are conformant.
+
+    The events produced with the line structure regular expressions of a text
+    parser must be identical to those produced with its pyparsing line
+    structures only.
+
+    Args:
+      path_segments (list[str]): path segments inside the test data directory.
+      parser (PyparsingSingleLineTextParser): text parser.
+      knowledge_base_values (Optional[dict]): knowledge base values.
+    """
+    # pylint: disable=protected-access
+    test_file_path = self._GetTestFilePath(path_segments)
+    self._SkipIfPathNotExists(test_file_path)
+
+    regular_expressions = parser._line_structure_regular_expressions.values()
+
+    # Ensure the regular expressions are used on the test file.
+    number_of_matched_lines = 0
+    with open(test_file_path, 'r', encoding=parser._ENCODING or 'utf-8',
+              errors='replace') as file_object:
+      for line in file_object:
+        for regular_expression in regular_expressions:
+          try:
+            if regular_expression.Match(line):
+              number_of_matched_lines += 1
+              break
+          except ValueError:
+            pass
+
+    self.assertGreater(number_of_matched_lines, 0)
+
+    storage_writer = self._ParseFile(
+        path_segments, parser, knowledge_base_values=knowledge_base_values)
+
+    reference_parser = parser.__class__()
+    reference_parser._line_structure_regular_expressions = {}
+
+    reference_storage_writer = self._ParseFile(
+        path_segments, reference_parser,
+        knowledge_base_values=knowledge_base_values)
+
+    self.assertEqual(
+        storage_writer.number_of_events,
+        reference_storage_writer.number_of_events)
+    self.assertEqual(
+        storage_writer.number_of_extraction_warnings,
+        reference_storage_writer.number_of_extraction_warnings)
+
+    event_values_list = self._GetEventValuesOfEvents(storage_writer)
+    reference_event_values_list = self._GetEventValuesOfEvents(
+        reference_storage_writer)
+
+    for event_values, reference_event_values in zip(
+        event_values_list, reference_event_values_list):
+      self.assertEqual(event_values, reference_event_values)
+
   def CheckTimestamp(self, timestamp, expected_date_time):
     """Asserts that a timestamp value matches the expected date and time.
 
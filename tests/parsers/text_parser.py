@@ -3,6 +3,8 @@
 """This file contains the tests for the generic text parser."""
 
 import codecs
+import os
+import re
 import unittest
 
 import pyparsing
@@ -13,6 +15,7 @@ from dfvfs.path import fake_path_spec
 from dfvfs.resolver import context as dfvfs_context
 
 from plaso.containers import sessions
+from plaso.parsers import interface
 from plaso.parsers import text_parser
 
 from tests.parsers import test_lib
@@ -59,6 +62,82 @@ class TestPyparsingSingleLineTextParser(
     return True
 
 
+class TestPyparsingSingleLineTextParserWithParseRanges(
+    TestPyparsingSingleLineTextParser):
+  """Single line PyParsing-based text parser with parse ranges for testing."""
+
+  _PARSE_RANGES_SUPPORTED = True
+
+
+class TestPyparsingSingleLineTextParserWithVerificationRegex(
+    TestPyparsingSingleLineTextParser):
+  """Single line PyParsing-based text parser with verification regex."""
+
+  _VERIFICATION_REGEX = re.compile(r'This is')
+
+
+class FileObjectRangeTest(test_lib.ParserTestCase):
+  """Tests for the file-like object of a range."""
+
+  def testRead(self):
+    """Tests the read function."""
+    file_object = self._CreateFileObject('file.txt', b'0123456789')
+
+    range_file_object = text_parser.FileObjectRange(file_object, 2, 5)
+    self.assertEqual(range_file_object.get_size(), 5)
+
+    self.assertEqual(range_file_object.read(2), b'23')
+    self.assertEqual(range_file_object.get_offset(), 2)
+    self.assertEqual(range_file_object.read(), b'456')
+    self.assertEqual(range_file_object.read(), b'')
+
+  def testSeek(self):
+    """Tests the seek function."""
+    file_object = self._CreateFileObject('file.txt', b'0123456789')
+
+    range_file_object = text_parser.FileObjectRange(file_object, 2, 5)
+
+    range_file_object.seek(3, os.SEEK_SET)
+    self.assertEqual(range_file_object.read(1), b'5')
+
+    range_file_object.seek(-2, os.SEEK_END)
+    self.assertEqual(range_file_object.read(), b'56')
+
+    range_file_object.seek(-4, os.SEEK_CUR)
+    self.assertEqual(range_file_object.tell(), 1)
+
+    with self.assertRaises(IOError):
+      range_file_object.seek(-1, os.SEEK_SET)
+
+
+class LineStructureRegularExpressionTest(test_lib.ParserTestCase):
+  """Tests for the line structure regular expression."""
+
+  def testMatch(self):
+    """Tests the Match function."""
+    regular_expression = text_parser.LineStructureRegularExpression(
+        r'(?P<hours>[0-9]{2}):(?P<minutes>[0-9]{2}) (?P<text>[^\n]*)',
+        converters={'hours': int, 'minutes': int},
+        groups={'time': ['hours', 'minutes']})
+
+    structure = regular_expression.Match('12:34 Some text\n')
+    self.assertIsNotNone(structure)
+    self.assertEqual(structure.get('text'), 'Some text')
+    self.assertIsNone(structure.get('hours'))
+
+    time_structure = structure.get('time')
+    self.assertEqual(time_structure, (12, 34))
+    self.assertEqual(time_structure.get('minutes'), 34)
+    self.assertIsNone(time_structure.get('seconds'))
+
+    structure = regular_expression.Match('12:3 Some text\n')
+    self.assertIsNone(structure)
+
+    # Lines with tabs are left to pyparsing, which expands tabs.
+    structure = regular_expression.Match('12:34 Some\ttext\n')
+    self.assertIsNone(structure)
+
+
 class PyparsingConstantsTest(test_lib.ParserTestCase):
   """Tests the PyparsingConstants text parser."""
 
@@ -199,6 +278,80 @@ class PyparsingSingleLineTextParserTest(test_lib.ParserTestCase):
     self.assertEqual(len(self._encoding_errors), 1)
     self.assertEqual(self._encoding_errors[0], (10, 0xba))
 
+  def testCheckFileHead(self):
+    """Tests the CheckFileHead function."""
+    session = sessions.Session()
+
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(session, storage_writer)
+
+    test_parser = TestPyparsingSingleLineTextParserWithVerificationRegex()
+
+    file_object = self._CreateFileObject(
+        'file.txt', b'\n\nThis is another file.\n')
+    file_head = interface.FileHead(file_object, 64)
+    self.assertTrue(test_parser.CheckFileHead(parser_mediator, file_head))
+
+    file_object = self._CreateFileObject('file.txt', b'Another file.\n')
+    file_head = interface.FileHead(file_object, 64)
+    self.assertFalse(test_parser.CheckFileHead(parser_mediator, file_head))
+
+    file_object = self._CreateFileObject('file.txt', b'This is an\xbather.\n')
+    file_head = interface.FileHead(file_object, 64)
+    self.assertFalse(test_parser.CheckFileHead(parser_mediator, file_head))
+
+    file_object = self._CreateFileObject('file.txt', b'')
+    file_head = interface.FileHead(file_object, 64)
+    self.assertFalse(test_parser.CheckFileHead(parser_mediator, file_head))
+
+    # A first line that extends beyond the head of the file is left to
+    # ParseFileObject.
+    file_object = self._CreateFileObject('file.txt', b'\n' * 32 + b'Another')
+    file_head = interface.FileHead(file_object, 16)
+    self.assertTrue(test_parser.CheckFileHead(parser_mediator, file_head))
+
+    # The first line is shared with parsers with the same encoding.
+    test_parser = TestPyparsingSingleLineTextParser()
+
+    file_object = self._CreateFileObject('file.txt', b'Another file.\n')
+    file_head = interface.FileHead(file_object, 64)
+    self.assertTrue(test_parser.CheckFileHead(parser_mediator, file_head))
+    self.assertEqual(len(file_head.cached_values), 1)
+
+    test_parser = TestPyparsingSingleLineTextParserWithVerificationRegex()
+    self.assertFalse(test_parser.CheckFileHead(parser_mediator, file_head))
+    self.assertEqual(len(file_head.cached_values), 1)
+
+  def testGetParseRanges(self):
+    """Tests the GetParseRanges function."""
+    session = sessions.Session()
+
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(session, storage_writer)
+
+    data = b'First line.\nSecond line.\nThird line.\nLast line\n'
+    file_object = self._CreateFileObject('file.txt', data)
+
+    test_parser = TestPyparsingSingleLineTextParserWithParseRanges()
+
+    parse_ranges = test_parser.GetParseRanges(parser_mediator, file_object, 16)
+    self.assertEqual(parse_ranges, [(0, 25), (25, 47)])
+
+    parse_ranges = test_parser.GetParseRanges(parser_mediator, file_object, 64)
+    self.assertIsNone(parse_ranges)
+
+    # No end-of-line character within the maximum line length.
+    data = b'First line.\n' + b'A' * 1024 + b'\nLast line.\n'
+    file_object = self._CreateFileObject('file.txt', data)
+
+    parse_ranges = test_parser.GetParseRanges(parser_mediator, file_object, 16)
+    self.assertIsNone(parse_ranges)
+
+    test_parser = TestPyparsingSingleLineTextParser()
+
+    parse_ranges = test_parser.GetParseRanges(parser_mediator, file_object, 16)
+    self.assertIsNone(parse_ranges)
+
   def testParseFileObject(self):
     """Tests the ParseFileObject function."""
     session = sessions.Session()
@@ -236,6 +389,28 @@ class PyparsingSingleLineTextParserTest(test_lib.ParserTestCase):
     self.assertEqual(storage_writer.number_of_extraction_warnings, 1)
     self.assertEqual(storage_writer.number_of_recovery_warnings, 0)
 
+  def testParseFileObjectWithParseRange(self):
+    """Tests the ParseFileObject function with a parse range."""
+    session = sessions.Session()
+
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(session, storage_writer)
+    parser_mediator.SetParseRange((22, 39))
+
+    data = b'This is another file.\nWith tw\xba lines.\nNot in range.\xba\n'
+    file_object = self._CreateFileObject('file.txt', data)
+
+    test_parser = TestPyparsingSingleLineTextParserWithParseRanges()
+    test_parser.ParseFileObject(parser_mediator, file_object)
+
+    # The test parser does not generate events.
+    self.assertEqual(storage_writer.number_of_events, 0)
+    self.assertEqual(storage_writer.number_of_extraction_warnings, 1)
+    self.assertEqual(storage_writer.number_of_recovery_warnings, 0)
+
+    warnings = list(storage_writer.GetAttributeContainers('extraction_warning'))
+    self.assertEqual(warnings[0].message, 'error decoding 0xba at offset: 29')
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -12,6 +12,11 @@ from tests.parsers import test_lib
 class VsftpdLogParserTest(test_lib.ParserTestCase):
   """Tests for the vsftpd parser."""
 
+  def testLineStructureRegularExpressions(self):
+    """Tests the line structure regular expressions."""
+    parser = vsftpd.VsftpdLogParser()
+    self.CheckLineStructureRegularExpressions(['vsftpd.log'], parser)
+
   def testParse(self):
     """Tests the Parse function."""
     parser = vsftpd.VsftpdLogParser()
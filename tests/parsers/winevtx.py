@@ -4,6 +4,11 @@
 
 import unittest
 
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
+from plaso.containers import sessions
 from plaso.lib import definitions
 from plaso.parsers import winevtx
 
@@ -13,6 +18,60 @@ from tests.parsers import test_lib
 class WinEvtxParserTest(test_lib.ParserTestCase):
   """Tests for the Windows XML EventLog (EVTX) parser."""
 
+  def _CreateTestParserMediator(self, path_segments):
+    """Creates a parser mediator and file object for testing.
+
+    Args:
+      path_segments (list[str]): path segments inside the test data directory.
+
+    Returns:
+      tuple[FakeStorageWriter, ParserMediator, dfvfs.FileIO]: storage writer,
+          parser mediator and file object.
+    """
+    test_file_path = self._GetTestFilePath(path_segments)
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(
+        sessions.Session(), storage_writer, file_entry=file_entry)
+
+    return storage_writer, parser_mediator, file_entry.GetFileObject()
+
+  def testGetParseRanges(self):
+    """Tests the GetParseRanges function."""
+    parser = winevtx.WinEvtxParser()
+    _, parser_mediator, file_object = self._CreateTestParserMediator(
+        ['System.evtx'])
+
+    parse_ranges = parser.GetParseRanges(
+        parser_mediator, file_object, 512 * 1024)
+    self.assertEqual(parse_ranges, [(0, 534), (534, 1068), (1068, 1601)])
+
+    parse_ranges = parser.GetParseRanges(
+        parser_mediator, file_object, 2 * 1024 * 1024)
+    self.assertIsNone(parse_ranges)
+
+  def testParseWithParseRange(self):
+    """Tests the Parse function with a parse range."""
+    parser = winevtx.WinEvtxParser()
+
+    number_of_events = 0
+    for parse_range in ((0, 534), (534, 1068), (1068, 1601)):
+      storage_writer, parser_mediator, file_object = (
+          self._CreateTestParserMediator(['System.evtx']))
+      parser_mediator.SetParseRange(parse_range)
+
+      parser.Parse(parser_mediator, file_object)
+
+      self.assertEqual(storage_writer.number_of_extraction_warnings, 0)
+      number_of_events += storage_writer.number_of_events
+
+    self.assertEqual(number_of_events, 3202)
+
   def testParse(self):
     """Tests the Parse function."""
     parser = winevtx.WinEvtxParser()
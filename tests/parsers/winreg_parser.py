@@ -8,6 +8,12 @@ import unittest
 from artifacts import reader as artifacts_reader
 from artifacts import registry as artifacts_registry
 
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+from dfwinreg import virtual as dfwinreg_virtual
+
+from plaso.containers import sessions
 from plaso.engine import artifact_filters
 from plaso.engine import knowledge_base as knowledge_base_engine
 from plaso.parsers import winreg_parser
@@ -22,6 +28,29 @@ class WinRegistryParserTest(test_lib.ParserTestCase):
 
   # pylint: disable=protected-access
 
+  def _CreateTestParserMediator(self, path_segments):
+    """Creates a parser mediator and file object for testing.
+
+    Args:
+      path_segments (list[str]): path segments inside the test data directory.
+
+    Returns:
+      tuple[FakeStorageWriter, ParserMediator, dfvfs.FileIO]: storage writer,
+          parser mediator and file object.
+    """
+    test_file_path = self._GetTestFilePath(path_segments)
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(
+        sessions.Session(), storage_writer, file_entry=file_entry)
+
+    return storage_writer, parser_mediator, file_entry.GetFileObject()
+
   def _GetParserChains(self, storage_writer):
     """Determines the number of events extracted by a parser plugin.
 
@@ -52,6 +81,37 @@ class WinRegistryParserTest(test_lib.ParserTestCase):
 
   # pylint: disable=protected-access
 
+  def _TestParseWithParseRanges(self, path_segments, maximum_range_size):
+    """Tests the Parse function with parse ranges.
+
+    Args:
+      path_segments (list[str]): path segments inside the test data directory.
+      maximum_range_size (int): maximum size of a range in bytes.
+    """
+    parser = winreg_parser.WinRegistryParser()
+    _, parser_mediator, file_object = self._CreateTestParserMediator(
+        path_segments)
+
+    parse_ranges = parser.GetParseRanges(
+        parser_mediator, file_object, maximum_range_size)
+    self.assertIsNotNone(parse_ranges)
+
+    parser_chains = collections.Counter()
+    for parse_range in parse_ranges:
+      storage_writer, parser_mediator, file_object = (
+          self._CreateTestParserMediator(path_segments))
+      parser_mediator.SetParseRange(parse_range)
+
+      parser.Parse(parser_mediator, file_object)
+
+      self.assertEqual(storage_writer.number_of_extraction_warnings, 0)
+      self.assertGreater(storage_writer.number_of_events, 0)
+      parser_chains.update(self._GetParserChains(storage_writer))
+
+    storage_writer = self._ParseFile(path_segments, parser)
+
+    self.assertEqual(parser_chains, self._GetParserChains(storage_writer))
+
   def testEnablePlugins(self):
     """Tests the EnablePlugins function."""
     parser = winreg_parser.WinRegistryParser()
@@ -68,6 +128,98 @@ class WinRegistryParserTest(test_lib.ParserTestCase):
     parser.EnablePlugins(['appcompatcache'])
     self.assertEqual(len(parser._plugins), 1)
 
+    self.assertEqual(len(parser._plugins_without_key_paths), 0)
+
+    key_path = (
+        'hkey_local_machine\\system\\currentcontrolset\\control\\'
+        'session manager\\appcompatcache')
+    self.assertIn(key_path, parser._plugin_per_key_path)
+    self.assertTrue(parser._path_filter.CheckPath(key_path))
+
+    parser.EnablePlugins(['windows_services'])
+    self.assertEqual(len(parser._plugins_without_key_paths), 1)
+    self.assertEqual(parser._plugin_per_key_path, {})
+    self.assertIsNotNone(parser._default_plugin)
+
+    parser.EnablePlugins(
+        parser.ALL_PLUGINS, plugin_excludes=set(['winreg_default']))
+    self.assertEqual(len(parser._plugins), number_of_plugins - 1)
+    self.assertIsNone(parser._default_plugin)
+
+  def testCanProcessSubkeys(self):
+    """Tests the _CanProcessSubkeys function."""
+    parser = winreg_parser.WinRegistryParser()
+    parser.EnablePlugins(['appcompatcache'])
+
+    registry_key = dfwinreg_virtual.VirtualWinRegistryKey(
+        'ControlSet001',
+        key_path='HKEY_LOCAL_MACHINE\\System\\ControlSet001')
+
+    result = parser._CanProcessSubkeys(registry_key)
+    self.assertTrue(result)
+
+    parser.EnablePlugins(
+        ['appcompatcache'], plugin_excludes=set(['winreg_default']))
+
+    result = parser._CanProcessSubkeys(registry_key)
+    self.assertTrue(result)
+
+    registry_key = dfwinreg_virtual.VirtualWinRegistryKey(
+        'Select', key_path='HKEY_LOCAL_MACHINE\\System\\Select')
+
+    result = parser._CanProcessSubkeys(registry_key)
+    self.assertFalse(result)
+
+  def testGetParseRanges(self):
+    """Tests the GetParseRanges function."""
+    parser = winreg_parser.WinRegistryParser()
+    _, parser_mediator, file_object = self._CreateTestParserMediator(
+        ['NTUSER.DAT'])
+
+    parse_ranges = parser.GetParseRanges(
+        parser_mediator, file_object, 256 * 1024)
+    self.assertEqual(len(parse_ranges), 3)
+    self.assertEqual(parse_ranges[0][0], 0)
+    self.assertEqual(parse_ranges[-1][1], parser._PARSE_RANGE_END)
+
+    for range_index in range(1, len(parse_ranges)):
+      self.assertEqual(
+          parse_ranges[range_index - 1][1], parse_ranges[range_index][0])
+
+    parse_ranges = parser.GetParseRanges(
+        parser_mediator, file_object, 1024 * 1024)
+    self.assertIsNone(parse_ranges)
+
+    # The root key of an AMCache.hve file has a single subkey, which contains
+    # all other keys.
+    _, parser_mediator, file_object = self._CreateTestParserMediator(
+        ['Amcache.hve'])
+
+    parse_ranges = parser.GetParseRanges(
+        parser_mediator, file_object, 512 * 1024)
+    self.assertEqual(len(parse_ranges), 4)
+
+  def testGetSubtreePositions(self):
+    """Tests the _GetSubtreePositions function."""
+    parser = winreg_parser.WinRegistryParser()
+
+    positions = parser._GetSubtreePositions(())
+    self.assertEqual(positions, (0, parser._PARSE_RANGE_END))
+
+    first_position, last_position = parser._GetSubtreePositions((0, ))
+    self.assertEqual(first_position, 1 << 45)
+    self.assertEqual(last_position, 2 << 45)
+
+    first_position, last_position = parser._GetSubtreePositions((0, 5))
+    self.assertEqual(first_position, (1 << 45) | (6 << 30))
+    self.assertEqual(last_position, (1 << 45) | (7 << 30))
+
+    # Positions are ordered as a pre-order traversal of the keys.
+    positions = [
+        parser._GetSubtreePositions(subkey_indexes)[0]
+        for subkey_indexes in ((), (0, ), (0, 0), (0, 1, 3, 2), (1, ))]
+    self.assertEqual(positions, sorted(positions))
+
   def testParse(self):
     """Test the parse function on a Windows NT Registry file."""
     parser = winreg_parser.WinRegistryParser()
@@ -100,6 +252,29 @@ class WinRegistryParserTest(test_lib.ParserTestCase):
 
     self.assertEqual(parser_chains[expected_parser_chain], 14)
 
+  def testParseNTUserDatWithoutDefaultPlugin(self):
+    """Tests the Parse function on a NTUSER.DAT file without default plugin."""
+    parser = winreg_parser.WinRegistryParser()
+    parser.EnablePlugins(
+        ['userassist'], plugin_excludes=set(['winreg_default']))
+
+    storage_writer = self._ParseFile(['NTUSER.DAT'], parser)
+
+    parser_chains = self._GetParserChains(storage_writer)
+
+    expected_parser_chain = self._GetParserChainOfPlugin('userassist')
+    self.assertEqual(list(parser_chains.keys()), [expected_parser_chain])
+
+    self.assertEqual(parser_chains[expected_parser_chain], 14)
+
+  def testParseAMCacheWithParseRange(self):
+    """Tests the Parse function on an AMCache.hve file with a parse range."""
+    self._TestParseWithParseRanges(['Amcache.hve'], 512 * 1024)
+
+  def testParseNTUserDatWithParseRange(self):
+    """Tests the Parse function on a NTUSER.DAT file with a parse range."""
+    self._TestParseWithParseRanges(['NTUSER.DAT'], 256 * 1024)
+
   def testParseNoRootKey(self):
     """Test the parse function on a Registry file with no root key."""
     parser = winreg_parser.WinRegistryParser()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the event prefetcher."""
+
+import os
+import unittest
+
+from plaso.storage import event_prefetcher
+from plaso.storage import reader
+from plaso.storage.fake import fake_store
+from plaso.storage.sqlite import reader as sqlite_file_reader
+from plaso.storage.sqlite import sqlite_file
+
+from tests import test_lib as shared_test_lib
+from tests.containers import test_lib as containers_test_lib
+from tests.storage import test_lib
+
+
+class EventPrefetcherTest(test_lib.StorageTestCase):
+  """Tests for the event prefetcher."""
+
+  # pylint: disable=protected-access
+
+  def _CreateTestStorageFile(self, path):
+    """Creates a storage file for testing.
+
+    Args:
+      path (str): path of the storage file.
+    """
+    storage_file = sqlite_file.SQLiteStorageFile()
+    storage_file.Open(path=path, read_only=False)
+
+    for event, event_data, event_data_stream in (
+        containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS)):
+      storage_file.AddAttributeContainer(event_data_stream)
+
+      event_data.SetEventDataStreamIdentifier(event_data_stream.GetIdentifier())
+      storage_file.AddAttributeContainer(event_data)
+
+      event.SetEventDataIdentifier(event_data.GetIdentifier())
+      storage_file.AddAttributeContainer(event)
+
+    storage_file.Close()
+
+  def testReadBatch(self):
+    """Tests the _ReadBatch function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFile(temp_file)
+
+      storage_reader = sqlite_file_reader.SQLiteStorageFileReader(temp_file)
+
+      test_prefetcher = event_prefetcher.EventPrefetcher(storage_reader)
+
+      batch = list(storage_reader.GetSortedEvents())
+      events_with_event_data = test_prefetcher._ReadBatch(
+          storage_reader, batch)
+
+      storage_reader.Close()
+
+    self.assertEqual(len(events_with_event_data), 4)
+
+    event, event_data, event_data_stream = events_with_event_data[0]
+    self.assertEqual(event.timestamp, 1238934459000000)
+    self.assertEqual(event_data.data_type, 'text:entry')
+    self.assertIsNotNone(event_data_stream)
+
+  def testReadBatchWithoutEventDataStreams(self):
+    """Tests the _ReadBatch function without reading event data streams."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFile(temp_file)
+
+      storage_reader = sqlite_file_reader.SQLiteStorageFileReader(temp_file)
+
+      test_prefetcher = event_prefetcher.EventPrefetcher(
+          storage_reader, read_event_data_streams=False)
+
+      batch = list(storage_reader.GetSortedEvents())
+      events_with_event_data = test_prefetcher._ReadBatch(
+          storage_reader, batch)
+
+      storage_reader.Close()
+
+    self.assertEqual(len(events_with_event_data), 4)
+
+    event, event_data, event_data_stream = events_with_event_data[0]
+    self.assertEqual(event.timestamp, 1238934459000000)
+    self.assertEqual(event_data.data_type, 'text:entry')
+    self.assertIsNone(event_data_stream)
+
+  def testGetEvents(self):
+    """Tests the GetEvents function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFile(temp_file)
+
+      storage_reader = sqlite_file_reader.SQLiteStorageFileReader(temp_file)
+
+      test_prefetcher = event_prefetcher.EventPrefetcher(
+          storage_reader, batch_size=3)
+
+      events_with_event_data = list(test_prefetcher.GetEvents())
+
+      storage_reader.Close()
+
+    self.assertEqual(len(events_with_event_data), 4)
+
+    timestamps = [event.timestamp for event, _, _ in events_with_event_data]
+    self.assertEqual(timestamps, sorted(timestamps))
+
+    for event, event_data, event_data_stream in events_with_event_data:
+      self.assertEqual(
+          event.GetEventDataIdentifier().sequence_number,
+          event_data.GetIdentifier().sequence_number)
+      self.assertEqual(
+          event_data.GetEventDataStreamIdentifier().sequence_number,
+          event_data_stream.GetIdentifier().sequence_number)
+
+  def testGetEventsWithAbort(self):
+    """Tests the GetEvents function when the consumer stops early."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFile(temp_file)
+
+      storage_reader = sqlite_file_reader.SQLiteStorageFileReader(temp_file)
+
+      test_prefetcher = event_prefetcher.EventPrefetcher(
+          storage_reader, batch_size=1)
+
+      generator = test_prefetcher.GetEvents()
+      event, _, _ = next(generator)
+      generator.close()
+
+      storage_reader.Close()
+
+    self.assertEqual(event.timestamp, 1238934459000000)
+
+  def testGetEventsWithoutConcurrentStorageReader(self):
+    """Tests the GetEvents function without a concurrent storage reader."""
+    storage_reader = reader.StorageReader()
+    storage_reader._store = fake_store.FakeStore()
+    storage_reader._store.Open()
+
+    try:
+      for event, event_data, event_data_stream in (
+          containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS)):
+        storage_reader._store.AddAttributeContainer(event_data_stream)
+
+        event_data.SetEventDataStreamIdentifier(
+            event_data_stream.GetIdentifier())
+        storage_reader._store.AddAttributeContainer(event_data)
+
+        event.SetEventDataIdentifier(event_data.GetIdentifier())
+        storage_reader._store.AddAttributeContainer(event)
+
+      test_prefetcher = event_prefetcher.EventPrefetcher(
+          storage_reader, batch_size=3)
+
+      events_with_event_data = list(test_prefetcher.GetEvents())
+
+    finally:
+      storage_reader._store.Close()
+
+    self.assertEqual(len(events_with_event_data), 4)
+
+    for _, event_data, event_data_stream in events_with_event_data:
+      self.assertIsNotNone(event_data)
+      self.assertIsNotNone(event_data_stream)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -3,12 +3,15 @@
 """Tests for the SQLite-based storage."""
 
 import os
+import sqlite3
 import unittest
 
+from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.containers import sessions
 from plaso.containers import tasks
 from plaso.lib import definitions
+from plaso.storage import identifiers
 from plaso.storage.sqlite import sqlite_file
 
 from tests import test_lib as shared_test_lib
@@ -92,6 +95,104 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       with self.assertRaises(IOError):
         test_store._CheckStorageMetadata(metadata_values)
 
+  def testCheckAttributeContainerTableColumns(self):
+    """Tests the _CheckAttributeContainerTableColumns function."""
+    event_source = event_sources.EventSource()
+    event_source.data_type = 'file_entry'
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+      test_store.AddAttributeContainer(event_source)
+      test_store.Close()
+
+      # Recreate the event source table without the parse range columns.
+      connection = sqlite3.connect(test_path)
+      connection.executescript((
+          'ALTER TABLE event_source RENAME TO event_source_copy; '
+          'CREATE TABLE event_source (_identifier INTEGER PRIMARY KEY '
+          'AUTOINCREMENT, data_type TEXT, file_entry_type TEXT, '
+          'path_spec TEXT); '
+          'INSERT INTO event_source (data_type, file_entry_type, path_spec) '
+          'SELECT data_type, file_entry_type, path_spec '
+          'FROM event_source_copy; '
+          'DROP TABLE event_source_copy;'))
+      connection.close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      self.assertEqual(
+          test_store._GetSchemaColumnNames(event_source.CONTAINER_TYPE),
+          ['data_type', 'file_entry_type', 'path_spec'])
+
+      containers = list(test_store.GetAttributeContainers(
+          event_source.CONTAINER_TYPE))
+      self.assertEqual(len(containers), 1)
+      self.assertEqual(containers[0].data_type, 'file_entry')
+      self.assertIsNone(containers[0].parser_name)
+
+      test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      self.assertEqual(
+          test_store._GetSchemaColumnNames(event_source.CONTAINER_TYPE), [
+              'data_type', 'file_entropy', 'file_entry_type', 'file_size',
+              'md5_hash', 'parse_range_end', 'parse_range_start',
+              'parser_name', 'path_spec', 'sha1_hash', 'sha256_hash',
+              'yara_match'])
+
+      event_source = event_sources.EventSource()
+      event_source.parser_name = 'winevtx'
+      test_store.AddAttributeContainer(event_source)
+
+      containers = list(test_store.GetAttributeContainers(
+          event_source.CONTAINER_TYPE))
+      self.assertEqual(len(containers), 2)
+      self.assertEqual(containers[1].parser_name, 'winevtx')
+
+      test_store.Close()
+
+  def testCompressData(self):
+    """Tests the _CompressData and _DecompressData functions."""
+    test_data = (
+        b'{"__container_type__": "event_data", "__type__": '
+        b'"AttributeContainer", "data_type": "test:event"}')
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile(
+          compression_format=definitions.COMPRESSION_FORMAT_LZ4_DICTIONARY)
+      test_store.Open(path=test_path, read_only=False)
+
+      compressed_data = test_store._CompressData('event_data', test_data)
+      self.assertEqual(compressed_data[:1], b'\x00')
+
+      data = test_store._DecompressData('event_data', compressed_data)
+      self.assertEqual(data, test_data)
+
+      test_store._compression_dictionaries['event_data'] = test_data
+
+      compressed_data = test_store._CompressData('event_data', test_data)
+      self.assertEqual(compressed_data[:1], b'\x01')
+      self.assertLess(len(compressed_data), len(test_data))
+
+      data = test_store._DecompressData('event_data', compressed_data)
+      self.assertEqual(data, test_data)
+
+      del test_store._compression_dictionaries['event_data']
+
+      with self.assertRaises(IOError):
+        test_store._DecompressData('event_data', compressed_data)
+
+      with self.assertRaises(IOError):
+        test_store._DecompressData('event_data', b'\xff')
+
+      test_store.Close()
+
   def testCreateAttributeContainerTable(self):
     """Tests the _CreateAttributeContainerTable function."""
     event_data_stream = events.EventDataStream()
@@ -148,6 +249,25 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
   # TODO: add tests for _RaiseIfNotWritable
   # TODO: add tests for _ReadAndCheckStorageMetadata
   # TODO: add tests for _SerializeAttributeContainer
+
+  def testTrainCompressionDictionary(self):
+    """Tests the _TrainCompressionDictionary function."""
+    samples = [
+        b'{"__type__": "AttributeContainer", "data_type": "test:event", '
+        b'"offset": 1}',
+        b'{"__type__": "AttributeContainer", "data_type": "test:event", '
+        b'"offset": 2}']
+
+    compression_dictionary = (
+        sqlite_file.SQLiteStorageFile._TrainCompressionDictionary(samples))
+    self.assertEqual(
+        compression_dictionary,
+        b'"data_type": "test:event", {"__type__": "AttributeContainer", ')
+
+    compression_dictionary = (
+        sqlite_file.SQLiteStorageFile._TrainCompressionDictionary(samples[:1]))
+    self.assertEqual(compression_dictionary, b'')
+
   # TODO: add tests for _UpdateAttributeContainerAfterDeserialize
   # TODO: add tests for _UpdateAttributeContainerBeforeSerialize
   # TODO: add tests for _UpdateEventAfterDeserialize
@@ -310,6 +430,41 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
       test_store.Close()
 
+  def testGetAttributeContainersByIdentifiers(self):
+    """Tests the GetAttributeContainersByIdentifiers function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      for index in range(3):
+        event_data = events.EventData(data_type='test:event')
+        event_data.offset = index
+        test_store.AddAttributeContainer(event_data)
+
+      test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      test_identifiers = [
+          identifiers.SQLTableIdentifier('event_data', sequence_number)
+          for sequence_number in (3, 1, 99, 3)]
+
+      containers = test_store.GetAttributeContainersByIdentifiers(
+          'event_data', test_identifiers)
+      self.assertEqual(len(containers), 4)
+      self.assertEqual(containers[0].offset, 2)
+      self.assertEqual(containers[1].offset, 0)
+      self.assertIsNone(containers[2])
+      self.assertIs(containers[3], containers[0])
+
+      with self.assertRaises(IOError):
+        test_store.GetAttributeContainersByIdentifiers(
+            'event_data', [identifiers.FakeIdentifier(1)])
+
+      test_store.Close()
+
   def testGetEventTagByEventIdentifier(self):
     """Tests the GetEventTagByEventIdentifier function."""
     with shared_test_lib.TempDirectory() as temp_directory:
@@ -391,6 +546,38 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
       test_store.Close()
 
+  def testGetAttributeContainersWithCompressionDictionary(self):
+    """Tests the GetAttributeContainers function with a dictionary."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile(
+          compression_format=definitions.COMPRESSION_FORMAT_LZ4_DICTIONARY)
+      test_store.Open(path=test_path, read_only=False)
+
+      number_of_samples = test_store._COMPRESSION_DICTIONARY_NUMBER_OF_SAMPLES
+      for index in range(number_of_samples + 10):
+        event_data = events.EventData(data_type='test:event')
+        event_data.offset = index
+        test_store.AddAttributeContainer(event_data)
+
+      self.assertIn('event_data', test_store._compression_dictionaries)
+
+      test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      self.assertEqual(
+          test_store.compression_format,
+          definitions.COMPRESSION_FORMAT_LZ4_DICTIONARY)
+      self.assertIn('event_data', test_store._compression_dictionaries)
+
+      containers = list(test_store.GetAttributeContainers('event_data'))
+      self.assertEqual(len(containers), number_of_samples + 10)
+      self.assertEqual(containers[-1].offset, number_of_samples + 9)
+
+      test_store.Close()
+
   # TODO: add tests for GetSessions
 
   def testGetSortedEvents(self):
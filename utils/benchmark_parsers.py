@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to benchmark parsers on individual files."""
+
+import argparse
+import os
+import sys
+import time
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
+from plaso.containers import sessions
+from plaso.engine import knowledge_base
+from plaso.parsers import interface
+from plaso.parsers import manager as parsers_manager
+from plaso.parsers import mediator as parsers_mediator
+from plaso.storage.fake import writer as fake_writer
+
+# Register all parsers and plugins.
+from plaso import parsers  # pylint: disable=unused-import
+
+
+class ParserBenchmark(object):
+  """Parser benchmark."""
+
+  def __init__(self, parser_name):
+    """Initializes a parser benchmark.
+
+    Args:
+      parser_name (str): name of the parser.
+
+    Raises:
+      ValueError: if the parser is not supported.
+    """
+    super(ParserBenchmark, self).__init__()
+    self._parser = parsers_manager.ParsersManager.GetParserObjectByName(
+        parser_name)
+
+    if not isinstance(self._parser, (
+        interface.FileEntryParser, interface.FileObjectParser)):
+      raise ValueError('Unsupported parser: {0:s}'.format(parser_name))
+
+  def Run(self, source_path):
+    """Runs the benchmark on a specific file.
+
+    Args:
+      source_path (str): path of the file to parse.
+
+    Returns:
+      tuple[int, float]: number of events and parse time in seconds.
+    """
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=source_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    parser_mediator = parsers_mediator.ParserMediator(
+        sessions.Session(), storage_writer, knowledge_base_object)
+    parser_mediator.SetFileEntry(file_entry)
+
+    start_time = time.time()
+
+    if isinstance(self._parser, interface.FileEntryParser):
+      self._parser.Parse(parser_mediator)
+    else:
+      file_object = file_entry.GetFileObject()
+      self._parser.Parse(parser_mediator, file_object)
+
+    parse_time = time.time() - start_time
+
+    storage_writer.Close()
+
+    return storage_writer.number_of_events, parse_time
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks a parser on individual files.'))
+
+  argument_parser.add_argument(
+      '--iterations', dest='iterations', type=int, default=3, help=(
+          'number of times to run the benchmark per file, where the best time '
+          'is reported.'))
+
+  argument_parser.add_argument(
+      'parser', type=str, help='name of the parser, such as bsm.')
+
+  argument_parser.add_argument(
+      'source', nargs='+', type=str, help=(
+          'path of the file(s) to parse, such as test_data/apple.bsm.'))
+
+  options = argument_parser.parse_args()
+
+  for source_path in options.source:
+    if not os.path.isfile(source_path):
+      print('No such file: {0:s}'.format(source_path))
+      return False
+
+  try:
+    benchmark = ParserBenchmark(options.parser)
+  except ValueError as exception:
+    print('{0!s}'.format(exception))
+    return False
+
+  print('{0:s}\t{1:s}\t{2:s}\t{3:s}'.format(
+      'source', 'parser', 'events', 'parse (s)'))
+
+  for source_path in options.source:
+    parse_times = []
+
+    for _ in range(max(options.iterations, 1)):
+      number_of_events, parse_time = benchmark.Run(
+          os.path.abspath(source_path))
+      parse_times.append(parse_time)
+
+    print('{0:s}\t{1:s}\t{2:d}\t{3:.3f}'.format(
+        os.path.basename(source_path), options.parser, number_of_events,
+        min(parse_times)))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to benchmark the compression formats of SQLite storage files."""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from plaso.lib import definitions
+from plaso.storage.sqlite import sqlite_file
+
+
+class StorageCompressionBenchmark(object):
+  """Storage compression benchmark."""
+
+  # The attribute container types in order of reference, such that
+  # the identifiers of the copied attribute containers are preserved.
+  _CONTAINER_TYPES = (
+      'session_start',
+      'session_configuration',
+      'system_configuration',
+      'session_completion',
+      'event_source',
+      'event_data_stream',
+      'event_data',
+      'event',
+      'event_tag',
+      'extraction_warning',
+      'recovery_warning',
+      'preprocessing_warning',
+      'analysis_report',
+      'analysis_warning')
+
+  def __init__(self, source_path, number_of_dictionary_samples=None):
+    """Initializes a storage compression benchmark.
+
+    Args:
+      source_path (str): path of the source storage file.
+      number_of_dictionary_samples (Optional[int]): number of attribute
+          containers per container type used to train a compression
+          dictionary, where None represents the default of the storage file.
+    """
+    super(StorageCompressionBenchmark, self).__init__()
+    self._number_of_dictionary_samples = number_of_dictionary_samples
+    self._source_path = source_path
+
+  def _ReadAttributeContainers(self, path):
+    """Reads all attribute containers from a storage file.
+
+    Args:
+      path (str): path of the storage file.
+
+    Returns:
+      int: number of attribute containers read.
+    """
+    number_of_containers = 0
+
+    storage_file = sqlite_file.SQLiteStorageFile()
+    storage_file.Open(path=path)
+
+    try:
+      for container_type in self._CONTAINER_TYPES:
+        if not storage_file.HasAttributeContainers(container_type):
+          continue
+
+        for _ in storage_file.GetAttributeContainers(container_type):
+          number_of_containers += 1
+
+    finally:
+      storage_file.Close()
+
+    return number_of_containers
+
+  def _WriteAttributeContainers(self, path, compression_format):
+    """Writes the attribute containers of the source storage file.
+
+    Args:
+      path (str): path of the storage file to write.
+      compression_format (str): compression format.
+
+    Returns:
+      int: number of attribute containers written.
+    """
+    number_of_containers = 0
+
+    source_storage_file = sqlite_file.SQLiteStorageFile()
+    source_storage_file.Open(path=self._source_path)
+
+    storage_file = sqlite_file.SQLiteStorageFile(
+        compression_format=compression_format)
+
+    # Small storage files, such as the test data, contain fewer attribute
+    # containers per container type than the default number of samples,
+    # in which case no compression dictionary would be trained.
+    if self._number_of_dictionary_samples:
+      # pylint: disable=protected-access
+      storage_file._COMPRESSION_DICTIONARY_NUMBER_OF_SAMPLES = (
+          self._number_of_dictionary_samples)
+
+    storage_file.Open(path=path, read_only=False)
+
+    try:
+      for container_type in self._CONTAINER_TYPES:
+        if not source_storage_file.HasAttributeContainers(container_type):
+          continue
+
+        for container in source_storage_file.GetAttributeContainers(
+            container_type):
+          storage_file.AddAttributeContainer(container)
+          number_of_containers += 1
+
+    finally:
+      storage_file.Close()
+      source_storage_file.Close()
+
+    return number_of_containers
+
+  def Run(self, compression_format, temporary_directory):
+    """Runs the benchmark for a specific compression format.
+
+    Args:
+      compression_format (str): compression format.
+      temporary_directory (str): path of the directory to write the storage
+          file to.
+
+    Returns:
+      tuple[int, float, float, int]: number of attribute containers, write
+          time in seconds, read time in seconds and storage file size in
+          bytes.
+    """
+    path = os.path.join(
+        temporary_directory, '{0:s}.plaso'.format(compression_format))
+
+    start_time = time.time()
+    number_of_containers = self._WriteAttributeContainers(
+        path, compression_format)
+    write_time = time.time() - start_time
+
+    start_time = time.time()
+    self._ReadAttributeContainers(path)
+    read_time = time.time() - start_time
+
+    return number_of_containers, write_time, read_time, os.path.getsize(path)
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the compression formats of SQLite storage files.'))
+
+  argument_parser.add_argument(
+      '--compression_formats', '--compression-formats',
+      dest='compression_formats', type=str, default=','.join(sorted(
+          definitions.COMPRESSION_FORMATS)), help=(
+              'comma separated list of compression formats to benchmark.'))
+
+  argument_parser.add_argument(
+      '--dictionary_samples', '--dictionary-samples',
+      dest='dictionary_samples', type=int, default=16, help=(
+          'number of attribute containers per container type used to train '
+          'a compression dictionary, where 0 represents the default of the '
+          'storage file.'))
+
+  argument_parser.add_argument(
+      '--iterations', dest='iterations', type=int, default=3, help=(
+          'number of times to run the benchmark per compression format, '
+          'where the best time is reported.'))
+
+  argument_parser.add_argument(
+      'source', nargs='+', type=str, help=(
+          'path of the storage file(s) to copy the attribute containers '
+          'from, such as test_data/psort_test.plaso.'))
+
+  options = argument_parser.parse_args()
+
+  compression_formats = options.compression_formats.split(',')
+  for compression_format in compression_formats:
+    if compression_format not in definitions.COMPRESSION_FORMATS:
+      print('Unsupported compression format: {0:s}'.format(compression_format))
+      return False
+
+  for source_path in options.source:
+    if not os.path.isfile(source_path):
+      print('No such file: {0:s}'.format(source_path))
+      return False
+
+  print('{0:s}\t{1:s}\t{2:s}\t{3:s}\t{4:s}\t{5:s}'.format(
+      'source', 'compression format', 'containers', 'write (s)', 'read (s)',
+      'size (bytes)'))
+
+  for source_path in options.source:
+    benchmark = StorageCompressionBenchmark(
+        source_path, number_of_dictionary_samples=options.dictionary_samples)
+
+    for compression_format in compression_formats:
+      read_times = []
+      write_times = []
+
+      for _ in range(max(options.iterations, 1)):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+          number_of_containers, write_time, read_time, size = benchmark.Run(
+              compression_format, temporary_directory)
+
+        read_times.append(read_time)
+        write_times.append(write_time)
+
+      print('{0:s}\t{1:s}\t{2:d}\t{3:.3f}\t{4:.3f}\t{5:d}'.format(
+          os.path.basename(source_path), compression_format,
+          number_of_containers, min(write_times), min(read_times), size))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)